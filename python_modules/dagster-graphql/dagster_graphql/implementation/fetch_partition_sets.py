@@ -8,7 +8,7 @@
     RepositorySelector,
 )
 from dagster.core.storage.pipeline_run import RunsFilter
-from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, TagType, get_tag_type
+from dagster.core.storage.tags import TagType, get_tag_type
 
 from .utils import capture_error
 
@@ -170,16 +170,41 @@ def _apply_cursor_limit_reverse(items, cursor, limit, reverse):
     return items[max(start, 0) : end]
 
 
+def _get_partition_names_page(
+    graphene_info, repository_handle, partition_set_name, cursor, limit, reverse
+):
+    # Returns None if no page was requested, meaning all partitions
+    if not cursor and not limit:
+        return None
+
+    result = graphene_info.context.get_external_partition_names(
+        repository_handle, partition_set_name
+    )
+    return _apply_cursor_limit_reverse(result.partition_names, cursor, limit, reverse)
+
+
 @capture_error
 def get_partition_set_partition_statuses(
-    graphene_info, repository_handle, partition_set_name, job_name
+    graphene_info,
+    repository_handle,
+    partition_set_name,
+    job_name,
+    cursor=None,
+    limit=None,
+    reverse=False,
 ):
     from ..schema.partition_sets import GraphenePartitionStatus, GraphenePartitionStatuses
 
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(partition_set_name, "partition_set_name")
+    partition_names = _get_partition_names_page(
+        graphene_info, repository_handle, partition_set_name, cursor, limit, reverse
+    )
     run_partition_data = graphene_info.context.instance.run_storage.get_run_partition_data(
-        partition_set_name, job_name, repository_handle.get_external_origin().get_id()
+        partition_set_name,
+        job_name,
+        repository_handle.get_external_origin().get_id(),
+        partition_names=partition_names,
     )
     return GraphenePartitionStatuses(
         results=[
@@ -194,25 +219,40 @@ def get_partition_set_partition_statuses(
     )
 
 
-def get_partition_set_partition_runs(graphene_info, partition_set):
+def get_partition_set_partition_runs(
+    graphene_info, repository_handle, partition_set, cursor=None, limit=None, reverse=False
+):
     from ..schema.partition_sets import GraphenePartitionRun
     from ..schema.pipelines.pipeline import GrapheneRun
 
     result = graphene_info.context.get_external_partition_names(
         partition_set.repository_handle, partition_set.name
     )
-    run_records = graphene_info.context.instance.get_run_records(
-        RunsFilter(tags={PARTITION_SET_TAG: partition_set.name})
-    )
+    partition_names = _apply_cursor_limit_reverse(result.partition_names, cursor, limit, reverse)
 
-    by_partition = {}
-    for record in run_records:
-        partition_name = record.pipeline_run.tags.get(PARTITION_NAME_TAG)
-        if not partition_name or partition_name in by_partition:
-            # all_partition_set_runs is in descending order by creation time, we should ignore
-            # runs for the same partition if we've already considered the partition
-            continue
-        by_partition[partition_name] = record
+    # only fetch the latest run for each partition in the page
+    run_partition_data = graphene_info.context.instance.run_storage.get_run_partition_data(
+        partition_set.name,
+        partition_set.pipeline_name,
+        repository_handle.get_external_origin().get_id(),
+        partition_names=partition_names,
+    )
+    run_ids = [data.run_id for data in run_partition_data]
+    records_by_run_id = (
+        {
+            record.pipeline_run.run_id: record
+            for record in graphene_info.context.instance.get_run_records(
+                RunsFilter(run_ids=run_ids)
+            )
+        }
+        if run_ids
+        else {}
+    )
+    by_partition = {
+        data.partition: records_by_run_id[data.run_id]
+        for data in run_partition_data
+        if data.run_id in records_by_run_id
+    }
 
     return [
         GraphenePartitionRun(
@@ -222,6 +262,5 @@ def get_partition_set_partition_runs(graphene_info, partition_set):
             if partition_name in by_partition
             else None,
         )
-        # for partition_name, run_record in by_partition.items()
-        for partition_name in result.partition_names
+        for partition_name in partition_names
     ]
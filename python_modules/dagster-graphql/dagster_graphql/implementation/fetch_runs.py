@@ -190,12 +190,42 @@ def _get_in_progress_runs_for_assets(
     in_progress_run_ids_by_asset = defaultdict(set)
     unstarted_run_ids_by_asset = defaultdict(set)
 
+    # Fetch the execution plans and step stats for all of the runs up front, so that resolving the
+    # asset statuses takes a constant number of storage queries
+    instance = graphene_info.context.instance
+    execution_plan_snapshots = instance.get_execution_plan_snapshots(
+        [record.pipeline_run.execution_plan_snapshot_id for record in in_progress_records]
+    )
+    run_step_keys_by_run_id = {
+        record.pipeline_run.run_id: execution_plan_snapshots[
+            record.pipeline_run.execution_plan_snapshot_id
+        ].step_keys_to_execute
+        for record in in_progress_records
+    }
+    started_run_ids = [
+        record.pipeline_run.run_id
+        for record in in_progress_records
+        if record.pipeline_run.status in IN_PROGRESS_STATUSES
+    ]
+    step_stats_by_run_id = (
+        instance.get_step_stats_for_runs(
+            started_run_ids,
+            list(
+                {
+                    step_key
+                    for run_id in started_run_ids
+                    for step_key in run_step_keys_by_run_id[run_id]
+                }
+            ),
+        )
+        if started_run_ids
+        else {}
+    )
+
     for record in in_progress_records:
         run = record.pipeline_run
         asset_selection = run.asset_selection
-        run_step_keys = graphene_info.context.instance.get_execution_plan_snapshot(
-            run.execution_plan_snapshot_id
-        ).step_keys_to_execute
+        run_step_keys = run_step_keys_by_run_id[run.run_id]
 
         selected_assets = (
             set.union(*[asset_key_by_step_key[run_step_key] for run_step_key in run_step_keys])
@@ -204,9 +234,7 @@ def _get_in_progress_runs_for_assets(
         )  # only display in progress/unstarted indicators for selected assets
 
         if run.status in IN_PROGRESS_STATUSES:
-            step_stats = graphene_info.context.instance.get_run_step_stats(
-                run.run_id, run_step_keys
-            )
+            step_stats = step_stats_by_run_id[run.run_id]
             # Build mapping of asset to all the step stats that generate the asset
             step_stats_by_asset: Dict[AssetKey, List[RunStepKeyStatsSnapshot]] = defaultdict(list)
             for step_stat in step_stats:
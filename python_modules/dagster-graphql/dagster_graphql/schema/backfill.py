@@ -243,13 +243,7 @@ def resolve_numRequested(self, graphene_info):
         records = self._get_records(graphene_info)
 
         run_count = len(records)
-        checkpoint = self._backfill_job.last_submitted_partition_name
-        return max(
-            run_count,
-            self._backfill_job.partition_names.index(checkpoint) + 1
-            if checkpoint and checkpoint in self._backfill_job.partition_names
-            else 0,
-        )
+        return max(run_count, self._backfill_job.partition_cursor)
 
     def resolve_partitionSet(self, graphene_info):
         from ..schema.partition_sets import GraphenePartitionSet
@@ -186,8 +186,18 @@ class GraphenePartitionSet(graphene.ObjectType):
         reverse=graphene.Boolean(),
     )
     partition = graphene.Field(GraphenePartition, partition_name=graphene.NonNull(graphene.String))
-    partitionStatusesOrError = graphene.NonNull(GraphenePartitionStatusesOrError)
-    partitionRuns = non_null_list(GraphenePartitionRun)
+    partitionStatusesOrError = graphene.Field(
+        graphene.NonNull(GraphenePartitionStatusesOrError),
+        cursor=graphene.String(),
+        limit=graphene.Int(),
+        reverse=graphene.Boolean(),
+    )
+    partitionRuns = graphene.Field(
+        non_null_list(GraphenePartitionRun),
+        cursor=graphene.String(),
+        limit=graphene.Int(),
+        reverse=graphene.Boolean(),
+    )
     repositoryOrigin = graphene.NonNull(GrapheneRepositoryOrigin)
     backfills = graphene.Field(
         non_null_list(GraphenePartitionBackfill),
@@ -234,15 +244,25 @@ def resolve_partition(self, graphene_info, partition_name):
             partition_name,
         )
 
-    def resolve_partitionRuns(self, graphene_info):
-        return get_partition_set_partition_runs(graphene_info, self._external_partition_set)
+    def resolve_partitionRuns(self, graphene_info, **kwargs):
+        return get_partition_set_partition_runs(
+            graphene_info,
+            self._external_repository_handle,
+            self._external_partition_set,
+            cursor=kwargs.get("cursor"),
+            limit=kwargs.get("limit"),
+            reverse=kwargs.get("reverse"),
+        )
 
-    def resolve_partitionStatusesOrError(self, graphene_info):
+    def resolve_partitionStatusesOrError(self, graphene_info, **kwargs):
         return get_partition_set_partition_statuses(
             graphene_info,
             self._external_repository_handle,
             self._external_partition_set.name,
             self._external_partition_set.pipeline_name,
+            cursor=kwargs.get("cursor"),
+            limit=kwargs.get("limit"),
+            reverse=kwargs.get("reverse"),
         )
 
     def resolve_repositoryOrigin(self, _):
@@ -45,7 +45,7 @@
       }
     ],
     "name": "csv_hello_world",
-    "pipelineSnapshotId": "49f7e87ba417c7b1511056aaecf9255df9844a81",
+    "pipelineSnapshotId": "da7a281eb4cb7554eeff2a7aea95ef7805647f3f",
     "solidHandles": [
       {
         "handleID": "sum_solid"
@@ -103,7 +103,7 @@
       }
     ],
     "name": "noop_pipeline",
-    "pipelineSnapshotId": "7ffd65ba8633d4c172a7b15dfee5927bed301724",
+    "pipelineSnapshotId": "afeb5d4943a3ba0be259550fb8b2a763e77d243f",
     "solidHandles": [
       {
         "handleID": "noop_solid"
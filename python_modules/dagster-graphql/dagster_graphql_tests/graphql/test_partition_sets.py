@@ -129,6 +129,35 @@
     }
 """
 
+GET_PARTITION_SET_PARTITION_RUNS_QUERY = """
+    query PartitionSetQuery(
+        $repositorySelector: RepositorySelector!
+        $partitionSetName: String!
+        $cursor: String
+        $limit: Int
+    ) {
+        partitionSetOrError(repositorySelector: $repositorySelector, partitionSetName: $partitionSetName) {
+            ...on PartitionSet {
+                partitionRuns(cursor: $cursor, limit: $limit) {
+                    partitionName
+                    run {
+                        runId
+                        status
+                    }
+                }
+                partitionStatusesOrError(cursor: $cursor, limit: $limit) {
+                    ... on PartitionStatuses {
+                        results {
+                            partitionName
+                            runStatus
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
 
 class TestPartitionSets(NonLaunchableGraphQLContextTestMatrix):
     def test_get_partition_sets_for_pipeline(self, graphql_context, snapshot):
@@ -312,3 +341,48 @@ def test_get_partition_status(self, graphql_context):
         assert len(partitionStatuses) == 10
         for partitionStatus in partitionStatuses:
             assert partitionStatus["runStatus"] == "SUCCESS"
+
+    def test_get_partition_runs_paginated(self, graphql_context):
+        repository_selector = infer_repository_selector(graphql_context)
+        result = execute_dagster_graphql_and_finish_runs(
+            graphql_context,
+            LAUNCH_PARTITION_BACKFILL_MUTATION,
+            variables={
+                "backfillParams": {
+                    "selector": {
+                        "repositorySelector": repository_selector,
+                        "partitionSetName": "integer_partition",
+                    },
+                    "partitionNames": ["2", "5"],
+                    "forceSynchronousSubmission": True,
+                }
+            },
+        )
+        assert not result.errors
+        assert len(result.data["launchPartitionBackfill"]["launchedRunIds"]) == 2
+
+        result = execute_dagster_graphql(
+            graphql_context,
+            query=GET_PARTITION_SET_PARTITION_RUNS_QUERY,
+            variables={
+                "partitionSetName": "integer_partition",
+                "repositorySelector": repository_selector,
+                "cursor": "0",
+                "limit": 3,
+            },
+        )
+        assert not result.errors
+        partition_set = result.data["partitionSetOrError"]
+
+        partition_runs = partition_set["partitionRuns"]
+        assert [partition_run["partitionName"] for partition_run in partition_runs] == [
+            "1",
+            "2",
+            "3",
+        ]
+        assert partition_runs[0]["run"] is None
+        assert partition_runs[1]["run"]["status"] == "SUCCESS"
+        assert partition_runs[2]["run"] is None
+
+        partition_statuses = partition_set["partitionStatusesOrError"]["results"]
+        assert [status["partitionName"] for status in partition_statuses] == ["2"]
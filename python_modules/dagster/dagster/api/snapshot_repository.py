@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Mapping, Optional
 
 import dagster._check as check
 from dagster.core.errors import DagsterUserCodeProcessError
@@ -7,12 +9,41 @@
     ExternalRepositoryErrorData,
 )
 from dagster.serdes import deserialize_as
+from dagster.serdes.utils import hash_str
 
 if TYPE_CHECKING:
     from dagster.core.host_representation import RepositoryLocation
     from dagster.grpc.client import DagsterGrpcClient
 
 
+# Process-wide cache of deserialized repository snapshots, keyed by the content hash reported by the
+# gRPC server, so that reloading a location whose code has not changed skips the full transfer.
+EXTERNAL_REPOSITORY_DATA_CACHE_SIZE = 32
+_external_repository_data_cache: "OrderedDict[str, ExternalRepositoryData]" = OrderedDict()
+_external_repository_data_cache_lock = threading.Lock()
+
+
+def _get_cached_external_repository_data(snapshot_id: str) -> Optional[ExternalRepositoryData]:
+    with _external_repository_data_cache_lock:
+        repo_data = _external_repository_data_cache.get(snapshot_id)
+        if repo_data is not None:
+            _external_repository_data_cache.move_to_end(snapshot_id)
+        return repo_data
+
+
+def _cache_external_repository_data(snapshot_id: str, repo_data: ExternalRepositoryData) -> None:
+    with _external_repository_data_cache_lock:
+        _external_repository_data_cache[snapshot_id] = repo_data
+        _external_repository_data_cache.move_to_end(snapshot_id)
+        while len(_external_repository_data_cache) > EXTERNAL_REPOSITORY_DATA_CACHE_SIZE:
+            _external_repository_data_cache.popitem(last=False)
+
+
+def clear_external_repository_data_cache() -> None:
+    with _external_repository_data_cache_lock:
+        _external_repository_data_cache.clear()
+
+
 def sync_get_streaming_external_repositories_data_grpc(
     api_client: "DagsterGrpcClient", repository_location: "RepositoryLocation"
 ) -> Mapping[str, ExternalRepositoryData]:
@@ -22,27 +53,41 @@ def sync_get_streaming_external_repositories_data_grpc(
 
     repo_datas = {}
     for repository_name in repository_location.repository_names:  # type: ignore
+        external_repository_origin = ExternalRepositoryOrigin(
+            repository_location.origin,
+            repository_name,
+        )
+
+        # None if the server does not implement the call, in which case fall back to the full
+        # transfer
+        snapshot_id = api_client.external_repository_snapshot_id(external_repository_origin)
+        if snapshot_id:
+            cached_repo_data = _get_cached_external_repository_data(snapshot_id)
+            if cached_repo_data is not None:
+                repo_datas[repository_name] = cached_repo_data
+                continue
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    repository_location.origin,
-                    repository_name,
-                )
+                external_repository_origin=external_repository_origin
             )
         )
 
+        serialized_external_repository_data = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
         result = deserialize_as(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
+            serialized_external_repository_data,
             (ExternalRepositoryData, ExternalRepositoryErrorData),
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        # only cache data that matches the reported snapshot id, repositories with dynamic
+        # definitions may have changed between the two calls
+        if snapshot_id and hash_str(serialized_external_repository_data) == snapshot_id:
+            _cache_external_repository_data(snapshot_id, result)
+
         repo_datas[repository_name] = result
     return repo_datas
@@ -15,7 +15,7 @@
 from dagster.core.definitions.reconstruct import ReconstructablePipeline
 from dagster.core.errors import DagsterExecutionInterruptedError
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster.core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster.core.instance import DagsterInstance
 from dagster.core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
@@ -356,11 +356,11 @@ def _execute_step_command_body(
             pipeline_run.solids_to_execute, pipeline_run.asset_selection
         )
 
-        execution_plan = create_execution_plan(
+        execution_plan = create_execution_plan_for_steps(
             recon_pipeline,
-            run_config=pipeline_run.run_config,
+            pipeline_run,
+            instance,
             step_keys_to_execute=args.step_keys_to_execute,
-            mode=pipeline_run.mode,
             known_state=args.known_state,
         )
 
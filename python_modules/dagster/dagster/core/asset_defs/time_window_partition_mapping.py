@@ -59,7 +59,7 @@ def _map_partitions(
         from_partition_key_range: PartitionKeyRange,
     ) -> PartitionKeyRange:
         if not isinstance(from_partitions_def, TimeWindowPartitionsDefinition) or not isinstance(
-            from_partitions_def, TimeWindowPartitionsDefinition
+            to_partitions_def, TimeWindowPartitionsDefinition
         ):
             raise DagsterInvalidDefinitionError(
                 "TimeWindowPartitionMappings can only operate on TimeWindowPartitionsDefinitions"
@@ -70,25 +70,20 @@ def _map_partitions(
         if to_partitions_def.timezone != from_partitions_def.timezone:
             raise DagsterInvalidDefinitionError("Timezones don't match")
 
-        to_period = to_partitions_def.schedule_type
-        from_period = from_partitions_def.schedule_type
-
-        from_start_dt = datetime.strptime(from_partition_key_range.start, from_partitions_def.fmt)
-        from_end_dt = datetime.strptime(from_partition_key_range.end, from_partitions_def.fmt)
-
-        if to_period > from_period:
-            to_start_dt = round_datetime_to_period(from_start_dt, to_period)
-            to_end_dt = round_datetime_to_period(from_end_dt, to_period)
-        elif to_period < from_period:
-            to_start_dt = from_start_dt
-            to_end_dt = (from_end_dt + from_period.delta) - to_period.delta
-        else:
-            to_start_dt = from_start_dt
-            to_end_dt = from_end_dt
+        from_start_window = from_partitions_def.time_window_for_partition_key(
+            from_partition_key_range.start
+        )
+        from_end_window = from_partitions_def.time_window_for_partition_key(
+            from_partition_key_range.end
+        )
 
+        # the last partition that overlaps the range is the one containing the instant before the
+        # end of the range
         return PartitionKeyRange(
-            to_start_dt.strftime(to_partitions_def.fmt),
-            to_end_dt.strftime(to_partitions_def.fmt),
+            to_partitions_def.get_partition_key_for_time(from_start_window.start),
+            to_partitions_def.get_partition_key_for_time(
+                from_end_window.end - timedelta(microseconds=1)
+            ),
         )
 
 
@@ -16,6 +16,7 @@
 from dagster.core.definitions.reconstruct import ReconstructablePipeline
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
 from dagster.core.execution.retries import RetryMode, get_retries_config
+from dagster.core.execution.step_scheduling import StepSchedulingPolicy, get_step_scheduling_config
 
 from .definition_config_schema import (
     IDefinitionConfigSchema,
@@ -299,11 +300,18 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    worker_pool_cfg = check.opt_dict_elem(config, "worker_pool")
+    scheduling_cfg = check.opt_dict_elem(config, "step_scheduling")
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool="worker_pool" in config,
+        max_tasks_per_worker=check.opt_int_elem(worker_pool_cfg, "max_tasks_per_worker") or None,
+        scheduling_policy=StepSchedulingPolicy.from_config(scheduling_cfg),
+        slot_limits=check.opt_dict_elem(scheduling_cfg, "slot_limits"),
     )
 
 
@@ -333,7 +341,29 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods"
         ),
     ),
+    "worker_pool": Field(
+        {
+            "max_tasks_per_worker": Field(
+                Int,
+                is_required=False,
+                default_value=100,
+                description=(
+                    "The number of steps a worker process executes before it is replaced by a "
+                    "new one, which bounds any memory that builds up in it. Set to 0 to keep "
+                    "workers for the whole run."
+                ),
+            ),
+        },
+        is_required=False,
+        description=(
+            "Execute steps in a pool of up to max_concurrent long-lived worker processes, instead "
+            "of starting a new process for each step. Workers load the job once and then execute "
+            "steps one at a time, which avoids paying process startup and import costs for every "
+            "step."
+        ),
+    ),
     "retries": get_retries_config(),
+    "step_scheduling": get_step_scheduling_config(),
 }
 
 
@@ -360,6 +390,16 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    The optional ``worker_pool`` config executes steps in a pool of long-lived worker processes
+    instead of starting a new process for every step, which helps jobs with many short steps.
+    Workers are replaced after ``max_tasks_per_worker`` steps (100 by default).
+
+    The optional ``step_scheduling`` config controls which ready steps are launched first. With
+    ``policy: critical_path``, steps of equal priority are ordered by the length of the longest
+    chain of steps downstream of them. ``slot_limits`` caps the slots of named resources that the
+    steps in flight may claim, where steps declare what they need with tags such as
+    ``dagster/slots/memory_gb: 8``.
+
     Execution priority can be configured using the ``dagster/priority`` tag via solid/op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -178,6 +178,22 @@ def __str__(self) -> str:
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> List[str]:
         return [partition.name for partition in self.get_partitions(current_time)]
 
+    def get_partitions_for_keys(
+        self, partition_keys: List[str], current_time: Optional[datetime] = None
+    ) -> List[Partition[T]]:
+        """The partitions with the given keys, in partition order. Keys that don't belong to any
+        partition are ignored."""
+        partition_keys_set = set(partition_keys)
+        return [
+            partition
+            for partition in self.get_partitions(current_time)
+            if partition.name in partition_keys_set
+        ]
+
+    def get_last_partition(self, current_time: Optional[datetime] = None) -> Optional[Partition[T]]:
+        partitions = self.get_partitions(current_time)
+        return partitions[-1] if partitions else None
+
     def get_default_partition_mapping(self):
         from dagster.core.asset_defs.partition_mapping import IdentityPartitionMapping
 
@@ -513,11 +529,19 @@ def get_partitions(self, current_time: Optional[datetime] = None) -> List[Partit
         return self._partitions_def.get_partitions(current_time)
 
     def get_partition(self, name: str) -> Partition[T]:
-        for partition in self.get_partitions():
-            if partition.name == name:
-                return partition
+        partitions = self.get_partitions_for_names([name])
+        if not partitions:
+            raise DagsterUnknownPartitionError(f"Could not find a partition with key `{name}`")
+
+        return partitions[0]
+
+    def get_partitions_for_names(
+        self, names: List[str], current_time: Optional[datetime] = None
+    ) -> List[Partition[T]]:
+        return self._partitions_def.get_partitions_for_keys(names, current_time)
 
-        raise DagsterUnknownPartitionError(f"Could not find a partition with key `{name}`")
+    def get_last_partition(self, current_time: Optional[datetime] = None) -> Optional[Partition[T]]:
+        return self._partitions_def.get_last_partition(current_time)
 
     def get_partition_names(self, current_time: Optional[datetime] = None) -> List[str]:
         return [part.name for part in self.get_partitions(current_time)]
@@ -781,8 +805,7 @@ def get_run_config_for_partition_key(self, partition_key: str) -> Dict[str, Any]
         Args:
             partition_key (str): the key for a partition that should be used to generate a run config.
         """
-        partitions = self.partitions_def.get_partitions()
-        partition = [p for p in partitions if p.name == partition_key]
+        partition = self.partitions_def.get_partitions_for_keys([partition_key])
         if len(partition) == 0:
             raise DagsterInvalidInvocationError(f"No partition for partition key {partition_key}.")
         return self.run_config_for_partition_fn(partition[0])
@@ -104,8 +104,8 @@ def latest_window_partition_selector(
     """Creates a selector for partitions that are time windows. Selects the latest partition that
     exists as of the schedule tick time.
     """
-    partitions = partition_set_def.get_partitions(context.scheduled_execution_time)
-    if len(partitions) == 0:
+    partition = partition_set_def.get_last_partition(context.scheduled_execution_time)
+    if partition is None:
         return SkipReason()
     else:
-        return partitions[-1]
+        return partition
@@ -1181,6 +1181,12 @@ def has_sensor_def(self, name: str) -> bool:
     def source_assets_by_key(self) -> Dict[AssetKey, SourceAsset]:
         return self._repository_data.get_source_assets_by_key()
 
+    @property
+    def has_static_definitions(self) -> bool:
+        """bool: Whether the set of definitions in this repository is fixed once loaded. Repositories
+        backed by a custom RepositoryData may return different definitions on each call."""
+        return isinstance(self._repository_data, CachingRepositoryData)
+
     # If definition comes from the @repository decorator, then the __call__ method will be
     # overwritten. Therefore, we want to maintain the call-ability of repository definitions.
     def __call__(self, *args, **kwargs):
@@ -1,4 +1,5 @@
 from datetime import datetime, time
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union, cast
 
 import pendulum
@@ -15,6 +16,7 @@
     ScheduleType,
     get_cron_schedule,
 )
+from .partition_key_range import PartitionKeyRange
 
 
 class TimeWindow(NamedTuple):
@@ -71,56 +73,81 @@ def __new__(  # pylint: disable=arguments-differ
     def get_partitions(
         self, current_time: Optional[datetime] = None
     ) -> List[Partition[TimeWindow]]:
-        current_timestamp = (
+        return self._get_partitions_in_index_range(0, self.get_num_partitions(current_time))
+
+    def get_num_partitions(self, current_time: Optional[datetime] = None) -> int:
+        """The number of partitions that exist at the given time, computed without enumerating them.
+
+        Args:
+            current_time (Optional[datetime]): The time to count partitions at. Defaults to now.
+        """
+        current = (
             pendulum.instance(current_time, tz=self.timezone)
             if current_time
             else pendulum.now(self.timezone)
-        ).timestamp()
-
-        time_of_day = time(self.hour_offset, self.minute_offset)
-
-        start_timestamp = pendulum.instance(self.start, tz=self.timezone).timestamp()
-        iterator = schedule_execution_time_iterator(
-            start_timestamp=start_timestamp,
-            cron_schedule=get_cron_schedule(
-                schedule_type=self.schedule_type,
-                time_of_day=time_of_day,
-                execution_day=self.day_offset,
-            ),
-            execution_timezone=self.timezone,
         )
 
-        partitions: List[Partition[TimeWindow]] = []
-        prev_time = next(iterator)
-        while prev_time.timestamp() < start_timestamp:
-            prev_time = next(iterator)
+        # every partition before the one containing the current time has ended
+        num_complete_partitions = max(0, self._get_partition_index_for_time(current))
+        return max(0, num_complete_partitions + self.end_offset)
+
+    def get_partition_key_index(self, partition_key: str) -> int:
+        """The position of the partition with the given key, counting from the first partition.
 
-        end_offset = self.end_offset
-        partitions_past_current_time = 0
-        while True:
-            next_time = next(iterator)
+        A key that doesn't fall on a partition boundary refers to the first partition after it.
+        """
+        start_time = self.start_time_for_partition_key(partition_key)
+        index = self._get_partition_index_for_time(start_time)
+        if self._get_partition_start_for_index(index).timestamp() < start_time.timestamp():
+            index += 1
+        return index
+
+    def get_partition_key_for_index(self, index: int) -> str:
+        """The key of the partition at the given position, counting from the first partition."""
+        return self._get_partition_start_for_index(index).strftime(self.fmt)
+
+    def get_partition_keys_in_range(self, partition_key_range: PartitionKeyRange) -> List[str]:
+        """The keys of the partitions between the start and end of the range, inclusive."""
+        start_index = self.get_partition_key_index(partition_key_range.start)
+        end_index = self.get_partition_key_index(partition_key_range.end)
+        return [
+            partition.name
+            for partition in self._get_partitions_in_index_range(start_index, end_index + 1)
+        ]
+
+    def get_partitions_for_keys(
+        self, partition_keys: List[str], current_time: Optional[datetime] = None
+    ) -> List[Partition[TimeWindow]]:
+        num_partitions = self.get_num_partitions(current_time)
+        indices = set()
+        for partition_key in partition_keys:
+            try:
+                index = self.get_partition_key_index(partition_key)
+            except ValueError:
+                # the key doesn't match the partition key format
+                continue
+
+            # keys that don't fall on a partition boundary don't belong to any partition
             if (
-                next_time.timestamp() <= current_timestamp
-                or partitions_past_current_time < end_offset
+                0 <= index < num_partitions
+                and self.get_partition_key_for_index(index) == partition_key
             ):
-                partitions.append(
-                    Partition(
-                        value=TimeWindow(prev_time, next_time),
-                        name=prev_time.strftime(self.fmt),
-                    )
-                )
+                indices.add(index)
 
-                if next_time.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
+        return [self._get_partition_for_index(index) for index in sorted(indices)]
 
-            prev_time = next_time
-
-        if end_offset < 0:
-            partitions = partitions[:end_offset]
+    def get_last_partition(
+        self, current_time: Optional[datetime] = None
+    ) -> Optional[Partition[TimeWindow]]:
+        num_partitions = self.get_num_partitions(current_time)
+        if num_partitions == 0:
+            return None
+        return self._get_partition_for_index(num_partitions - 1)
 
-        return partitions
+    def get_partition_key_for_time(self, dt: datetime) -> str:
+        """The key of the partition whose time window contains the given time."""
+        index = self._get_partition_index_for_time(pendulum.instance(dt, tz=self.timezone))
+        return self.get_partition_key_for_index(index)
 
     def __str__(self) -> str:
         partition_def_str = f"{self.schedule_type.value.capitalize()}, starting {self.start.strftime(self.fmt)} {self.timezone}."
@@ -129,22 +156,108 @@ def __str__(self) -> str:
         return partition_def_str
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
-        start = self.start_time_for_partition_key(partition_key)
-        time_of_day = time(self.hour_offset, self.minute_offset)
+        return self._get_time_window_for_index(self.get_partition_key_index(partition_key))
+
+    def start_time_for_partition_key(self, partition_key: str) -> datetime:
+        return pendulum.instance(datetime.strptime(partition_key, self.fmt), tz=self.timezone)
+
+    # every index lookup is relative to the first partition, which is found by walking the schedule
+    @lru_cache(maxsize=64)
+    def _get_first_partition_start(self) -> datetime:
+        start_timestamp = pendulum.instance(self.start, tz=self.timezone).timestamp()
         iterator = schedule_execution_time_iterator(
-            start_timestamp=start.timestamp(),
+            start_timestamp=start_timestamp,
             cron_schedule=get_cron_schedule(
                 schedule_type=self.schedule_type,
-                time_of_day=time_of_day,
+                time_of_day=time(self.hour_offset, self.minute_offset),
                 execution_day=self.day_offset,
             ),
             execution_timezone=self.timezone,
         )
+        return next(iterator)
+
+    def _get_partition_index_for_start(self, partition_start: datetime) -> int:
+        # Partitions are counted in local calendar units rather than elapsed seconds, so that days
+        # that are shortened or lengthened by a DST transition still count as a single partition.
+        # Hourly partitions are counted in elapsed hours, since DST transitions skip or repeat an
+        # entire local hour.
+        first_start = self._get_first_partition_start()
+        partition_start = pendulum.instance(partition_start, tz=self.timezone).in_timezone(
+            self.timezone
+        )
 
-        return TimeWindow(next(iterator), next(iterator))
+        if self.schedule_type == ScheduleType.HOURLY:
+            return int(round((partition_start.timestamp() - first_start.timestamp()) / 3600))
+        elif self.schedule_type == ScheduleType.DAILY:
+            return (partition_start.date() - first_start.date()).days
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            return (partition_start.date() - first_start.date()).days // 7
+        elif self.schedule_type == ScheduleType.MONTHLY:
+            return (partition_start.year - first_start.year) * 12 + (
+                partition_start.month - first_start.month
+            )
+        else:
+            check.failed(f"Unexpected schedule type {self.schedule_type}")
+
+    def _get_partition_start_for_index(self, index: int) -> datetime:
+        first_start = self._get_first_partition_start()
+
+        if self.schedule_type == ScheduleType.HOURLY:
+            return pendulum.from_timestamp(first_start.timestamp() + index * 3600, tz=self.timezone)
+        elif self.schedule_type == ScheduleType.DAILY:
+            partition_date = first_start.date().add(days=index)
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            partition_date = first_start.date().add(weeks=index)
+        elif self.schedule_type == ScheduleType.MONTHLY:
+            partition_date = first_start.date().add(months=index)
+        else:
+            check.failed(f"Unexpected schedule type {self.schedule_type}")
+
+        partition_start = pendulum.datetime(
+            partition_date.year,
+            partition_date.month,
+            partition_date.day,
+            self.hour_offset,
+            self.minute_offset,
+            tz=self.timezone,
+        )
+        if partition_start.hour != self.hour_offset:
+            # the time was skipped by a DST transition, so the partition starts at the beginning of
+            # the hour that does exist, matching schedule_execution_time_iterator
+            partition_start = partition_start.replace(minute=0)
+        return partition_start
+
+    def _get_partition_index_for_time(self, dt: datetime) -> int:
+        # the index of the partition whose time window contains the given time, which is negative
+        # if the time is before the start of the first partition
+        index = self._get_partition_index_for_start(dt)
+        while self._get_partition_start_for_index(index).timestamp() > dt.timestamp():
+            index -= 1
+        while self._get_partition_start_for_index(index + 1).timestamp() <= dt.timestamp():
+            index += 1
+        return index
+
+    def _get_time_window_for_index(self, index: int) -> TimeWindow:
+        return TimeWindow(
+            self._get_partition_start_for_index(index),
+            self._get_partition_start_for_index(index + 1),
+        )
 
-    def start_time_for_partition_key(self, partition_key: str) -> datetime:
-        return pendulum.instance(datetime.strptime(partition_key, self.fmt), tz=self.timezone)
+    def _get_partition_for_index(self, index: int) -> Partition[TimeWindow]:
+        time_window = self._get_time_window_for_index(index)
+        return Partition(value=time_window, name=time_window.start.strftime(self.fmt))
+
+    def _get_partitions_in_index_range(
+        self, start_index: int, end_index: int
+    ) -> List[Partition[TimeWindow]]:
+        partition_starts = [
+            self._get_partition_start_for_index(index)
+            for index in range(start_index, end_index + 1)
+        ]
+        return [
+            Partition(value=TimeWindow(start, end), name=start.strftime(self.fmt))
+            for start, end in zip(partition_starts[:-1], partition_starts[1:])
+        ]
 
     def get_default_partition_mapping(self):
         from dagster.core.asset_defs.time_window_partition_mapping import TimeWindowPartitionMapping
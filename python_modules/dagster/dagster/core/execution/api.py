@@ -763,6 +763,51 @@ def _get_execution_plan_from_run(
     )
 
 
+def create_execution_plan_for_steps(
+    pipeline: IPipeline,
+    pipeline_run: PipelineRun,
+    instance: DagsterInstance,
+    step_keys_to_execute: Optional[List[str]],
+    known_state: Optional[KnownExecutionState] = None,
+) -> ExecutionPlan:
+    """Build the plan for executing some of the steps of an existing run, e.g. in a step worker.
+
+    When possible, the plan is rebuilt from the run's stored execution plan snapshot rather than
+    traversing the pipeline definition and resolving the run config again for every step.
+    """
+    from dagster.core.execution.plan.snapshot_cache import get_execution_plan_snapshot_from_instance
+
+    check.inst_param(pipeline, "pipeline", IPipeline)
+    check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+
+    if (
+        # need to rebuild execution plan so it matches the subsetted graph
+        pipeline.solids_to_execute is None
+        and pipeline_run.execution_plan_snapshot_id
+    ):
+        execution_plan_snapshot = get_execution_plan_snapshot_from_instance(
+            instance, pipeline_run.execution_plan_snapshot_id
+        )
+        if execution_plan_snapshot and execution_plan_snapshot.can_reconstruct_plan:
+            return ExecutionPlan.rebuild_from_snapshot(
+                pipeline_run.pipeline_name,
+                execution_plan_snapshot,
+                step_keys_to_execute=step_keys_to_execute,
+                known_state=known_state,
+            )
+
+    return create_execution_plan(
+        pipeline,
+        run_config=pipeline_run.run_config,
+        mode=pipeline_run.mode,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+    )
+
+
 def create_execution_plan(
     pipeline: Union[IPipeline, PipelineDefinition],
     run_config: Optional[Mapping[str, object]] = None,
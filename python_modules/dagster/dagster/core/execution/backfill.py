@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, List, NamedTuple, Optional
 
@@ -57,6 +58,7 @@ class PartitionBackfill(
             ("backfill_timestamp", float),
             ("last_submitted_partition_name", Optional[str]),
             ("error", Optional[SerializableErrorInfo]),
+            ("last_submitted_partition_index", Optional[int]),
         ],
     ),
 ):
@@ -72,6 +74,7 @@ def __new__(
         backfill_timestamp: float,
         last_submitted_partition_name: Optional[str] = None,
         error: Optional[SerializableErrorInfo] = None,
+        last_submitted_partition_index: Optional[int] = None,
     ):
         return super(PartitionBackfill, cls).__new__(
             cls,
@@ -87,8 +90,24 @@ def __new__(
             check.float_param(backfill_timestamp, "backfill_timestamp"),
             check.opt_str_param(last_submitted_partition_name, "last_submitted_partition_name"),
             check.opt_inst_param(error, "error", SerializableErrorInfo),
+            check.opt_int_param(last_submitted_partition_index, "last_submitted_partition_index"),
         )
 
+    @property
+    def partition_cursor(self) -> int:
+        """The index in partition_names of the first partition that has not been submitted yet"""
+        if self.last_submitted_partition_index is not None:
+            return self.last_submitted_partition_index + 1
+
+        # backfills checkpointed by older versions only store the name of the last partition
+        if (
+            self.last_submitted_partition_name
+            and self.last_submitted_partition_name in self.partition_names
+        ):
+            return self.partition_names.index(self.last_submitted_partition_name) + 1
+
+        return 0
+
     def with_status(self, status):
         check.inst_param(status, "status", BulkActionStatus)
         return PartitionBackfill(
@@ -102,10 +121,14 @@ def with_status(self, status):
             self.backfill_timestamp,
             self.last_submitted_partition_name,
             self.error,
+            self.last_submitted_partition_index,
         )
 
-    def with_partition_checkpoint(self, last_submitted_partition_name):
+    def with_partition_checkpoint(
+        self, last_submitted_partition_name, last_submitted_partition_index=None
+    ):
         check.str_param(last_submitted_partition_name, "last_submitted_partition_name")
+        check.opt_int_param(last_submitted_partition_index, "last_submitted_partition_index")
         return PartitionBackfill(
             self.backfill_id,
             self.partition_set_origin,
@@ -117,6 +140,7 @@ def with_partition_checkpoint(self, last_submitted_partition_name):
             self.backfill_timestamp,
             last_submitted_partition_name,
             self.error,
+            last_submitted_partition_index,
         )
 
     def with_error(self, error):
@@ -132,14 +156,27 @@ def with_error(self, error):
             self.backfill_timestamp,
             self.last_submitted_partition_name,
             error,
+            self.last_submitted_partition_index,
         )
 
 
-def submit_backfill_runs(instance, workspace, repo_location, backfill_job, partition_names=None):
+def submit_backfill_runs(
+    instance,
+    workspace,
+    repo_location,
+    backfill_job,
+    partition_names=None,
+    threadpool_executor=None,
+):
+    """Create and submit a run for each of the given partitions of a backfill, yielding the id of
+    each submitted run. If a threadpool_executor is passed, the runs are created and submitted on
+    its worker threads, and yielded in partition order as they finish.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(repo_location, "repo_location", RepositoryLocation)
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
+    check.opt_inst_param(threadpool_executor, "threadpool_executor", ThreadPoolExecutor)
 
     repository_origin = backfill_job.partition_set_origin.external_repository_origin
     repo_name = repository_origin.repository_name
@@ -164,7 +201,8 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
     external_pipeline = external_repo.get_full_external_pipeline(
         external_partition_set.pipeline_name
     )
-    for partition_data in result.partition_data:
+
+    def _submit_backfill_run(partition_data):
         pipeline_run = create_backfill_run(
             instance,
             repo_location,
@@ -173,13 +211,38 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
             backfill_job,
             partition_data,
         )
-        if pipeline_run:
+        if not pipeline_run:
             # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
             # and the partition has had a successful run since the time the backfill was
             # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
-        yield None
+            return None
+
+        instance.submit_run(pipeline_run.run_id, workspace)
+        return pipeline_run.run_id
+
+    if not threadpool_executor:
+        for partition_data in result.partition_data:
+            run_id = _submit_backfill_run(partition_data)
+            if run_id:
+                yield run_id
+            yield None
+        return
+
+    futures = [
+        threadpool_executor.submit(_submit_backfill_run, partition_data)
+        for partition_data in result.partition_data
+    ]
+    try:
+        for future in futures:
+            run_id = future.result()
+            if run_id:
+                yield run_id
+            yield None
+    finally:
+        # if the caller stops early, e.g. because the backfill was canceled, do not submit any
+        # runs that have not started yet
+        for future in futures:
+            future.cancel()
 
 
 def create_backfill_run(
@@ -241,36 +241,43 @@ def execution_context_event_generator(
         instance,
     )
 
-    log_manager = create_log_manager(context_creation_data)
-    resource_defs = pipeline_def.get_required_resource_defs_for_mode(
-        context_creation_data.resolved_run_config.mode
-    )
+    log_manager = create_log_manager(context_creation_data, batch_events=True)
 
-    resources_manager = scoped_resources_builder_cm(
-        resource_defs=resource_defs,
-        resource_configs=context_creation_data.resolved_run_config.resources,
-        log_manager=log_manager,
-        execution_plan=execution_plan,
-        pipeline_run=context_creation_data.pipeline_run,
-        resource_keys_to_init=context_creation_data.resource_keys_to_init,
-        instance=instance,
-        emit_persistent_events=True,
-        pipeline_def_for_backwards_compat=pipeline_def,
-    )
-    yield from resources_manager.generate_setup_events()
-    scoped_resources_builder = check.inst(resources_manager.get_object(), ScopedResourcesBuilder)
-
-    execution_context = PlanExecutionContext(
-        plan_data=create_plan_data(context_creation_data, raise_on_error, retry_mode),
-        execution_data=create_execution_data(context_creation_data, scoped_resources_builder),
-        log_manager=log_manager,
-        output_capture=output_capture,
-    )
+    # write out any events buffered for batching once the context is torn down, even on failure
+    try:
+        resource_defs = pipeline_def.get_required_resource_defs_for_mode(
+            context_creation_data.resolved_run_config.mode
+        )
 
-    _validate_plan_with_context(execution_context, execution_plan)
+        resources_manager = scoped_resources_builder_cm(
+            resource_defs=resource_defs,
+            resource_configs=context_creation_data.resolved_run_config.resources,
+            log_manager=log_manager,
+            execution_plan=execution_plan,
+            pipeline_run=context_creation_data.pipeline_run,
+            resource_keys_to_init=context_creation_data.resource_keys_to_init,
+            instance=instance,
+            emit_persistent_events=True,
+            pipeline_def_for_backwards_compat=pipeline_def,
+        )
+        yield from resources_manager.generate_setup_events()
+        scoped_resources_builder = check.inst(
+            resources_manager.get_object(), ScopedResourcesBuilder
+        )
 
-    yield execution_context
-    yield from resources_manager.generate_teardown_events()
+        execution_context = PlanExecutionContext(
+            plan_data=create_plan_data(context_creation_data, raise_on_error, retry_mode),
+            execution_data=create_execution_data(context_creation_data, scoped_resources_builder),
+            log_manager=log_manager,
+            output_capture=output_capture,
+        )
+
+        _validate_plan_with_context(execution_context, execution_plan)
+
+        yield execution_context
+        yield from resources_manager.generate_teardown_events()
+    finally:
+        log_manager.flush()
 
 
 class PlanOrchestrationContextManager(ExecutionContextManager[PlanOrchestrationContext]):
@@ -473,8 +480,10 @@ def scoped_pipeline_context(
 
 def create_log_manager(
     context_creation_data: ContextCreationData,
+    batch_events: bool = False,
 ) -> DagsterLogManager:
     check.inst_param(context_creation_data, "context_creation_data", ContextCreationData)
+    check.bool_param(batch_events, "batch_events")
 
     pipeline_def, mode_def, resolved_run_config, pipeline_run = (
         context_creation_data.pipeline_def,
@@ -515,8 +524,18 @@ def create_log_manager(
                 )
             )
 
+    # only the events emitted while executing steps are batched, and only on instances that
+    # configure event_batching
+    event_batching_settings = (
+        context_creation_data.instance.event_batching_settings if batch_events else {}
+    )
+
     return DagsterLogManager.create(
-        loggers=loggers, pipeline_run=pipeline_run, instance=context_creation_data.instance
+        loggers=loggers,
+        pipeline_run=pipeline_run,
+        instance=context_creation_data.instance,
+        event_batch_size=event_batching_settings.get("max_batch_size"),
+        event_batch_interval=event_batching_settings.get("max_batch_interval_seconds"),
     )
 
 
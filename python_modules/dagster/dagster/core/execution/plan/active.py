@@ -1,5 +1,5 @@
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple, cast
 
 import dagster._check as check
 from dagster.core.errors import (
@@ -11,7 +11,12 @@
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.execution.retries import RetryMode
-from dagster.core.storage.tags import PRIORITY_TAG
+from dagster.core.execution.step_scheduling import (
+    StepSchedulingPolicy,
+    StepSlotTracker,
+    get_downstream_path_lengths,
+    get_step_priority,
+)
 from dagster.utils.interrupts import pop_captured_interrupt
 
 from .outputs import StepOutputData, StepOutputHandle
@@ -20,7 +25,7 @@
 
 
 def _default_sort_key(step: ExecutionStep) -> float:
-    return int(step.tags.get(PRIORITY_TAG, 0)) * -1
+    return get_step_priority(step) * -1
 
 
 class ActiveExecution:
@@ -31,6 +36,8 @@ def __init__(
         execution_plan: ExecutionPlan,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        scheduling_policy: Optional[StepSchedulingPolicy] = None,
+        slot_limits: Optional[Mapping[str, int]] = None,
     ):
         self._plan: ExecutionPlan = check.inst_param(
             execution_plan, "execution_plan", ExecutionPlan
@@ -38,12 +45,29 @@ def __init__(
         self._retry_mode = check.inst_param(retry_mode, "retry_mode", RetryMode)
         self._retry_state = self._plan.known_state.get_retry_state()
 
-        self._sort_key_fn: Callable[[ExecutionStep], float] = (
-            check.opt_callable_param(
-                sort_key_fn,
-                "sort_key_fn",
-            )
-            or _default_sort_key
+        self._scheduling_policy = check.opt_inst_param(
+            scheduling_policy,
+            "scheduling_policy",
+            StepSchedulingPolicy,
+            default=StepSchedulingPolicy.PRIORITY,
+        )
+        check.invariant(
+            sort_key_fn is None or self._scheduling_policy == StepSchedulingPolicy.PRIORITY,
+            "Can not set both sort_key_fn and a scheduling_policy",
+        )
+
+        self._sort_key_fn: Callable[[ExecutionStep], Any] = check.opt_callable_param(
+            sort_key_fn,
+            "sort_key_fn",
+        ) or (
+            self._critical_path_sort_key
+            if self._scheduling_policy == StepSchedulingPolicy.CRITICAL_PATH
+            else _default_sort_key
+        )
+
+        # claimed by steps while they are in flight, see get_steps_to_execute
+        self._slot_tracker = StepSlotTracker(
+            check.opt_mapping_param(slot_limits, "slot_limits", key_type=str, value_type=int)
         )
 
         self._context_guard: bool = False  # Prevent accidental direct use
@@ -54,6 +78,13 @@ def __init__(
         # All steps to be executed start out here in _pending
         self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
 
+        # only computed for the critical path policy, updated as dynamic outputs resolve
+        self._downstream_path_lengths: Dict[str, int] = (
+            get_downstream_path_lengths(self._pending)
+            if self._scheduling_policy == StepSchedulingPolicy.CRITICAL_PATH
+            else {}
+        )
+
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
         self._gathering_dynamic_outputs: Dict[str, Dict[str, List[str]]] = {}
@@ -157,6 +188,11 @@ def _update(self) -> None:
             for step_key, deps in new_step_deps.items():
                 self._pending[step_key] = deps
 
+            if self._scheduling_policy == StepSchedulingPolicy.CRITICAL_PATH:
+                self._downstream_path_lengths = get_downstream_path_lengths(
+                    self._plan.get_executable_step_deps()
+                )
+
             self._new_dynamic_mappings = False
 
         for step_key, requirements in self._pending.items():
@@ -239,21 +275,38 @@ def get_step_by_key(self, step_key: str) -> ExecutionStep:
         step = self._plan.get_step_by_key(step_key)
         return cast(ExecutionStep, check.inst(step, ExecutionStep))
 
-    def get_steps_to_execute(self, limit: Optional[int] = None) -> List[ExecutionStep]:
+    def _critical_path_sort_key(self, step: ExecutionStep) -> Tuple[int, int]:
+        return (
+            get_step_priority(step) * -1,
+            self._downstream_path_lengths.get(step.key, 1) * -1,
+        )
+
+    def get_steps_to_execute(
+        self, limit: Optional[int] = None, enforce_slot_limits: bool = True
+    ) -> List[ExecutionStep]:
         check.invariant(
             self._context_guard,
             "ActiveExecution must be used as a context manager",
         )
         check.opt_int_param(limit, "limit")
+        check.bool_param(enforce_slot_limits, "enforce_slot_limits")
         self._update()
 
-        steps = sorted(
+        steps = []
+        for step in sorted(
             [self.get_step_by_key(key) for key in self._executable],
             key=self._sort_key_fn,
-        )
+        ):
+            if limit is not None and len(steps) >= limit:
+                break
 
-        if limit is not None:
-            steps = steps[:limit]
+            # steps that can not claim their slots stay executable, but do not hold up the
+            # lower priority steps behind them
+            if enforce_slot_limits and not self._slot_tracker.can_claim(step):
+                continue
+
+            self._slot_tracker.claim(step)
+            steps.append(step)
 
         for step in steps:
             self._in_flight.add(step.key)
@@ -391,6 +444,7 @@ def _mark_complete(self, step_key: str) -> None:
             ),
         )
         self._in_flight.remove(step_key)
+        self._slot_tracker.release(step_key)
 
     def handle_event(self, dagster_event: DagsterEvent) -> None:
         check.inst_param(dagster_event, "dagster_event", DagsterEvent)
@@ -486,10 +540,12 @@ def rebuild_from_events(self, dagster_events: List[DagsterEvent]) -> List[Execut
         launched them but they have yet to report a STEP_START event.
         """
 
-        self.get_steps_to_execute()
+        # the previous run worker may have launched any step that was ready, so slot limits are
+        # not applied while replaying - the slots are still claimed for the steps in flight
+        self.get_steps_to_execute(enforce_slot_limits=False)
 
         for event in dagster_events:
             self.handle_event(event)
-            self.get_steps_to_execute()
+            self.get_steps_to_execute(enforce_slot_limits=False)
 
         return [self.get_step_by_key(step_key) for step_key in self._in_flight]
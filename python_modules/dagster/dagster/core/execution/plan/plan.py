@@ -5,6 +5,7 @@
     Dict,
     FrozenSet,
     List,
+    Mapping,
     NamedTuple,
     Optional,
     Set,
@@ -74,6 +75,7 @@
 )
 
 if TYPE_CHECKING:
+    from dagster.core.execution.step_scheduling import StepSchedulingPolicy
     from dagster.core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 
     from .active import ActiveExecution
@@ -950,6 +952,8 @@ def start(
         self,
         retry_mode: RetryMode,
         sort_key_fn: Optional[Callable[[ExecutionStep], float]] = None,
+        scheduling_policy: Optional["StepSchedulingPolicy"] = None,
+        slot_limits: Optional[Mapping[str, int]] = None,
     ) -> "ActiveExecution":
         from .active import ActiveExecution
 
@@ -957,6 +961,8 @@ def start(
             self,
             retry_mode,
             sort_key_fn,
+            scheduling_policy,
+            slot_limits,
         )
 
     def step_handle_for_single_step_plans(
@@ -1053,7 +1059,20 @@ def rebuild_step_input(step_input_snap):
     def rebuild_from_snapshot(
         pipeline_name: str,
         execution_plan_snapshot: "ExecutionPlanSnapshot",
+        step_keys_to_execute: Optional[List[str]] = None,
+        known_state: Optional[KnownExecutionState] = None,
     ):
+        """Rebuild an ExecutionPlan from a snapshot, without needing the pipeline definition or
+        resolving the run config again.
+
+        If step_keys_to_execute is provided, the plan is subset to those steps, which may include
+        steps resolved from dynamic outputs in the given known state (e.g. the plan for a single
+        step in a step worker). The rest of the plan, such as artifacts_persisted, is taken from the
+        snapshot as is.
+        """
+        check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+
         if not execution_plan_snapshot.can_reconstruct_plan:
             raise DagsterInvariantViolationError(
                 "Tried to reconstruct an old ExecutionPlanSnapshot that was created before snapshots "
@@ -1120,6 +1139,10 @@ def rebuild_from_snapshot(
             step_dict[step.handle] = step
             step_dict_by_key[step.key] = step
 
+        if known_state is None:
+            # default to empty known execution state if initial was not persisted
+            known_state = execution_plan_snapshot.initial_known_state or KnownExecutionState()
+
         step_handles_to_execute = [
             StepHandle.parse_from_key(key) for key in execution_plan_snapshot.step_keys_to_execute
         ]
@@ -1128,16 +1151,28 @@ def rebuild_from_snapshot(
             step_dict,
             step_dict_by_key,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
         )
 
+        if step_keys_to_execute is not None:
+            # the steps resolved from dynamic outputs in the known state were added to the step dict
+            # above, so the subset may refer to them
+            step_handles_to_execute = [
+                StepHandle.parse_from_key(key) for key in step_keys_to_execute
+            ]
+            executable_map, resolvable_map = _compute_step_maps(
+                step_dict,
+                step_dict_by_key,
+                step_handles_to_execute,
+                known_state,
+            )
+
         return ExecutionPlan(
             step_dict,
             executable_map,
             resolvable_map,
             step_handles_to_execute,
-            # default to empty known execution state if initial was not persisted
-            execution_plan_snapshot.initial_known_state or KnownExecutionState(),
+            known_state,
             execution_plan_snapshot.artifacts_persisted,
             executor_name=execution_plan_snapshot.executor_name,
         )
@@ -1268,14 +1303,10 @@ def should_skip_step(execution_plan: ExecutionPlan, instance: DagsterInstance, r
         # do not skip when all the inputs come from non-optional outputs
         return False
 
-    # find all yielded step outputs
-    all_logs = instance.all_logs(run_id)
-    yielded_step_output_handles = set()
-    for event_record in all_logs:
-        if event_record.dagster_event and event_record.dagster_event.is_successful_output:
-            yielded_step_output_handles.add(
-                event_record.dagster_event.event_specific_data.step_output_handle
-            )
+    # find the step outputs yielded by the upstream steps, without loading the whole run's logs
+    yielded_step_output_handles = instance.get_successful_step_output_handles(
+        run_id, sorted({source_handle.step_key for source_handle in optional_source_handles})
+    )
 
     # If there is at least one of the step's inputs, none of whose upstream steps has
     # yielded an output, we should skip that step.
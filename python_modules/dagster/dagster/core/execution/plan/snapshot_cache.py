@@ -0,0 +1,97 @@
+"""
+In-process caches of execution plan snapshots.
+
+Building an ExecutionPlan requires traversing the pipeline definition and resolving the run config,
+which is slow for large pipelines. Snapshots are immutable, so a process that is asked for the same
+plan many times (e.g. a code server handling launches, or a pool of step workers executing the steps
+of one run) can keep them around and rebuild plans from them with
+``ExecutionPlan.rebuild_from_snapshot``.
+"""
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
+
+import dagster._check as check
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster.serdes.utils import hash_str
+
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.snap import ExecutionPlanSnapshot
+    from dagster.grpc.types import ExecutionPlanSnapshotArgs
+
+EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE = 16
+
+T = TypeVar("T")
+
+
+class _LRUCache(Generic[T]):
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[T]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: T) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# keyed by the hash of the request that built the snapshot
+_snapshots_by_args_key: _LRUCache["ExecutionPlanSnapshot"] = _LRUCache(
+    EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE
+)
+# keyed by execution plan snapshot id, which is a hash of the snapshot contents
+_snapshots_by_id: _LRUCache["ExecutionPlanSnapshot"] = _LRUCache(EXECUTION_PLAN_SNAPSHOT_CACHE_SIZE)
+
+
+def execution_plan_snapshot_args_key(args: "ExecutionPlanSnapshotArgs") -> str:
+    """The cache key for the snapshot built for a request, from the pipeline snapshot id, the
+    op / asset selection, the run config and mode, the step selection and the known state. The
+    instance ref is excluded since it is only used to build memoized plans, which are not cached.
+    """
+    from dagster.grpc.types import ExecutionPlanSnapshotArgs
+
+    check.inst_param(args, "args", ExecutionPlanSnapshotArgs)
+    return hash_str(serialize_dagster_namedtuple(args._replace(instance_ref=None)))
+
+
+def get_cached_execution_plan_snapshot(key: str) -> Optional["ExecutionPlanSnapshot"]:
+    return _snapshots_by_args_key.get(key)
+
+
+def cache_execution_plan_snapshot(key: str, snapshot: "ExecutionPlanSnapshot") -> None:
+    _snapshots_by_args_key.set(key, snapshot)
+
+
+def get_execution_plan_snapshot_from_instance(
+    instance: "DagsterInstance", snapshot_id: str
+) -> Optional["ExecutionPlanSnapshot"]:
+    """Fetch an execution plan snapshot from instance storage, caching it in-process since stored
+    snapshots are never modified."""
+    check.str_param(snapshot_id, "snapshot_id")
+
+    snapshot = _snapshots_by_id.get(snapshot_id)
+    if snapshot is None:
+        snapshot = instance.get_execution_plan_snapshot(snapshot_id)
+        if snapshot is not None:
+            _snapshots_by_id.set(snapshot_id, snapshot)
+    return snapshot
+
+
+def clear_execution_plan_snapshot_cache() -> None:
+    _snapshots_by_args_key.clear()
+    _snapshots_by_id.clear()
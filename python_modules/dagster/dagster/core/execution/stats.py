@@ -1,4 +1,3 @@
-from collections import defaultdict
 from enum import Enum
 from typing import Any, Dict, Iterable, List, NamedTuple, Optional, cast
 
@@ -78,6 +77,7 @@ def build_run_stats_from_events(run_id, records):
     )
 
 
+@whitelist_for_serdes
 class StepEventStatus(Enum):
     SKIPPED = "SKIPPED"
     SUCCESS = "SUCCESS"
@@ -85,101 +85,43 @@ class StepEventStatus(Enum):
     IN_PROGRESS = "IN_PROGRESS"
 
 
+STEP_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.ENGINE_EVENT,
+]
+
+# the step stats event types that are collected into lists in the step stats, rather than folded
+# into a fixed set of fields
+STEP_STATS_COLLECTED_EVENT_TYPES = [
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+]
+
+
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> List["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    accumulators: Dict[str, StepStatsAccumulator] = {}
     for event in records:
         if not event.is_dagster_event:
             continue
-        dagster_event = event.get_dagster_event()
 
-        step_key = dagster_event.step_key
+        step_key = event.get_dagster_event().step_key
         if not step_key:
             continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type == DagsterEventType.ENGINE_EVENT:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
+        accumulator = accumulators.get(step_key) or StepStatsAccumulator(run_id, step_key)
+        accumulators[step_key] = accumulator.with_event(event)
 
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
-            )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
-
-    return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
-        )
-        for step_key, value in by_step_key.items()
-    ]
+    step_stats = [accumulator.to_snapshot() for accumulator in accumulators.values()]
+    return [stats for stats in step_stats if stats]
 
 
 @whitelist_for_serdes
@@ -251,3 +193,158 @@ def __new__(
             attempts_list=check.opt_list_param(attempts_list, "attempts_list", RunStepMarker),
             markers=check.opt_list_param(markers, "markers", RunStepMarker),
         )
+
+
+@whitelist_for_serdes
+class StepStatsAccumulator(
+    NamedTuple(
+        "_StepStatsAccumulator",
+        [
+            ("run_id", str),
+            ("step_key", str),
+            ("has_stats", bool),
+            ("status", Optional[StepEventStatus]),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+            ("attempts", Optional[int]),
+            ("materialization_events", List[EventLogEntry]),
+            ("expectation_results", List[ExpectationResult]),
+            ("attempt_events", List[RunStepMarker]),
+            ("markers", Dict[str, RunStepMarker]),
+        ],
+    )
+):
+    """The intermediate state used to build the RunStepKeyStatsSnapshot for a single step.
+
+    Events are folded in one at a time, in storage order, via ``with_event``.  This lets the step
+    stats be maintained incrementally as events are stored, rather than rebuilt from every event in
+    the run on read.  Retry events are kept in ``attempt_events``, with up-for-retry events stored as
+    markers with only an end time and restart events as markers with only a start time.
+    """
+
+    def __new__(
+        cls,
+        run_id: str,
+        step_key: str,
+        has_stats: bool = False,
+        status: Optional[StepEventStatus] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        attempts: Optional[int] = None,
+        materialization_events: Optional[List[EventLogEntry]] = None,
+        expectation_results: Optional[List[ExpectationResult]] = None,
+        attempt_events: Optional[List[RunStepMarker]] = None,
+        markers: Optional[Dict[str, RunStepMarker]] = None,
+    ):
+        return super(StepStatsAccumulator, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, "run_id"),
+            step_key=check.str_param(step_key, "step_key"),
+            has_stats=check.bool_param(has_stats, "has_stats"),
+            status=check.opt_inst_param(status, "status", StepEventStatus),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+            attempts=check.opt_int_param(attempts, "attempts"),
+            materialization_events=check.opt_list_param(
+                materialization_events, "materialization_events", EventLogEntry
+            ),
+            expectation_results=check.opt_list_param(
+                expectation_results, "expectation_results", ExpectationResult
+            ),
+            attempt_events=check.opt_list_param(attempt_events, "attempt_events", RunStepMarker),
+            markers=check.opt_dict_param(
+                markers, "markers", key_type=str, value_type=RunStepMarker
+            ),
+        )
+
+    def with_event(self, event: EventLogEntry) -> "StepStatsAccumulator":
+        check.inst_param(event, "event", EventLogEntry)
+        if not event.is_dagster_event:
+            return self
+
+        dagster_event = event.get_dagster_event()
+        event_type = dagster_event.event_type
+        if event_type not in STEP_STATS_EVENT_TYPES:
+            return self
+
+        timestamp = event.timestamp
+        updates: Dict[str, Any] = {}
+        if event_type == DagsterEventType.STEP_START:
+            updates = {"start_time": timestamp, "attempts": 1}
+        elif event_type == DagsterEventType.STEP_FAILURE:
+            updates = {"end_time": timestamp, "status": StepEventStatus.FAILURE}
+        elif event_type == DagsterEventType.STEP_RESTARTED:
+            updates = {"attempts": int(self.attempts or 0) + 1}
+        elif event_type == DagsterEventType.STEP_SUCCESS:
+            updates = {"end_time": timestamp, "status": StepEventStatus.SUCCESS}
+        elif event_type == DagsterEventType.STEP_SKIPPED:
+            updates = {"end_time": timestamp, "status": StepEventStatus.SKIPPED}
+        elif event_type == DagsterEventType.ASSET_MATERIALIZATION:
+            updates = {"materialization_events": self.materialization_events + [event]}
+        elif event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
+            updates = {
+                "expectation_results": self.expectation_results
+                + [expectation_data.expectation_result]
+            }
+
+        if updates:
+            updates["has_stats"] = True
+
+        if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+            updates["attempt_events"] = self.attempt_events + [RunStepMarker(end_time=timestamp)]
+        elif event_type == DagsterEventType.STEP_RESTARTED:
+            updates["attempt_events"] = self.attempt_events + [RunStepMarker(start_time=timestamp)]
+
+        if event_type == DagsterEventType.ENGINE_EVENT:
+            markers = dict(self.markers)
+            engine_event_data = dagster_event.engine_event_data
+            if engine_event_data.marker_start:
+                key = engine_event_data.marker_start
+                markers[key] = RunStepMarker(
+                    start_time=timestamp,
+                    end_time=markers[key].end_time if key in markers else None,
+                )
+            if engine_event_data.marker_end:
+                key = engine_event_data.marker_end
+                markers[key] = RunStepMarker(
+                    start_time=markers[key].start_time if key in markers else None,
+                    end_time=timestamp,
+                )
+            updates["markers"] = markers
+
+        return self._replace(**updates)
+
+    def to_snapshot(self) -> Optional[RunStepKeyStatsSnapshot]:
+        if not self.has_stats:
+            return None
+
+        status = self.status
+        step_attempts = []
+        attempt_start = self.start_time
+        for attempt_event in self.attempt_events:
+            if attempt_event.end_time is not None:
+                # the step was marked up for retry
+                step_attempts.append(
+                    RunStepMarker(start_time=attempt_start, end_time=attempt_event.end_time)
+                )
+            else:
+                # the step was restarted
+                attempt_start = attempt_event.start_time
+        if self.end_time:
+            step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=self.end_time))
+        else:
+            status = StepEventStatus.IN_PROGRESS
+
+        return RunStepKeyStatsSnapshot(
+            run_id=self.run_id,
+            step_key=self.step_key,
+            status=status,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            materialization_events=self.materialization_events,
+            expectation_results=self.expectation_results,
+            attempts=self.attempts,
+            attempts_list=step_attempts,
+            markers=list(self.markers.values()),
+        )
@@ -0,0 +1,143 @@
+from collections import defaultdict
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Mapping, Set
+
+from dagster import Field, Int, Map
+from dagster import _check as check
+from dagster.config.config_type import Enum as ConfigEnum
+from dagster.config.config_type import EnumValue
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.storage.tags import PRIORITY_TAG, STEP_SLOTS_TAG_PREFIX
+from dagster.core.utils import toposort
+
+if TYPE_CHECKING:
+    from dagster.core.execution.plan.step import ExecutionStep
+
+
+STEP_SCHEDULING_POLICY_CONFIG = ConfigEnum(
+    "StepSchedulingPolicy",
+    [
+        EnumValue("priority", description="Order ready steps by their dagster/priority tag."),
+        EnumValue(
+            "critical_path",
+            description=(
+                "Order ready steps by their dagster/priority tag, then by the length of the "
+                "longest chain of steps downstream of them."
+            ),
+        ),
+    ],
+)
+
+
+def get_step_scheduling_config():
+    return Field(
+        {
+            "policy": Field(
+                STEP_SCHEDULING_POLICY_CONFIG,
+                is_required=False,
+                default_value="priority",
+            ),
+            "slot_limits": Field(
+                Map(str, Int),
+                is_required=False,
+                description=(
+                    "The number of slots of each named resource available to the steps of a run, "
+                    "e.g. {memory_gb: 16, db-connections: 4}. Steps claim slots with tags of the "
+                    "form dagster/slots/<name>: <amount>, and are held back while the slots "
+                    "they need are taken by other steps."
+                ),
+            ),
+        },
+        is_required=False,
+        description="Configure the order in which ready steps are launched.",
+    )
+
+
+class StepSchedulingPolicy(Enum):
+    PRIORITY = "priority"
+    # Among steps of equal priority, prefer the ones that head the longest chain of downstream
+    # steps, so that the end of the run is not held up by a long chain started late.
+    CRITICAL_PATH = "critical_path"
+
+    @staticmethod
+    def from_config(config_value: Mapping[str, object]) -> "StepSchedulingPolicy":
+        return StepSchedulingPolicy(config_value.get("policy", StepSchedulingPolicy.PRIORITY.value))
+
+
+def get_step_priority(step: "ExecutionStep") -> int:
+    return int(step.tags.get(PRIORITY_TAG, 0))
+
+
+def get_step_slots(step: "ExecutionStep") -> Dict[str, int]:
+    """The number of slots of each named resource that a step claims while it executes, as
+    declared by its dagster/slots/<name> tags."""
+    slots = {}
+    for key, value in step.tags.items():
+        if not key.startswith(STEP_SLOTS_TAG_PREFIX):
+            continue
+
+        name = key[len(STEP_SLOTS_TAG_PREFIX) :]
+        try:
+            slots[name] = int(value)
+        except ValueError:
+            raise DagsterInvariantViolationError(
+                f'Invalid value for tag "{key}" on step {step.key}: expected an integer, got '
+                f'"{value}".'
+            )
+
+    return slots
+
+
+def get_downstream_path_lengths(step_deps: Mapping[str, Set[str]]) -> Dict[str, int]:
+    """Maps each step key to the number of steps in the longest chain of steps that starts with
+    it, following the given dependencies downstream."""
+    downstream = defaultdict(set)
+    for step_key, upstream_keys in step_deps.items():
+        for upstream_key in upstream_keys:
+            downstream[upstream_key].add(step_key)
+
+    lengths: Dict[str, int] = {}
+    for level in reversed(toposort(step_deps)):
+        for step_key in level:
+            lengths[step_key] = 1 + max(
+                (lengths[key] for key in downstream[step_key] if key in lengths), default=0
+            )
+
+    return lengths
+
+
+class StepSlotTracker:
+    """Tracks how many slots of each limited resource are claimed by the steps in flight."""
+
+    def __init__(self, slot_limits: Mapping[str, int]):
+        self._limits = dict(check.mapping_param(slot_limits, "slot_limits", str, int))
+        self._in_use: Dict[str, int] = defaultdict(int)
+        self._claims: Dict[str, Dict[str, int]] = {}
+
+    def _limited_slots(self, step: "ExecutionStep") -> Dict[str, int]:
+        return {
+            name: amount
+            for name, amount in get_step_slots(step).items()
+            if name in self._limits and amount > 0
+        }
+
+    def can_claim(self, step: "ExecutionStep") -> bool:
+        for name, amount in self._limited_slots(step).items():
+            # a step that needs more than the whole limit may still run on its own
+            if self._in_use[name] and self._in_use[name] + amount > self._limits[name]:
+                return False
+
+        return True
+
+    def claim(self, step: "ExecutionStep") -> None:
+        slots = self._limited_slots(step)
+        if not slots:
+            return
+
+        for name, amount in slots.items():
+            self._in_use[name] += amount
+        self._claims[step.key] = slots
+
+    def release(self, step_key: str) -> None:
+        for name, amount in self._claims.pop(step_key, {}).items():
+            self._in_use[name] -= amount
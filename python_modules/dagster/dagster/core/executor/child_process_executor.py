@@ -5,10 +5,12 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from contextlib import ExitStack
+from typing import NamedTuple, Optional
 
 import dagster._check as check
 from dagster.core.errors import DagsterExecutionInterruptedError
+from dagster.utils import start_termination_thread
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster.utils.interrupts import capture_interrupts
 
@@ -59,7 +61,8 @@ def __init__(self, exit_code=None):
 def _execute_command_in_child_process(event_queue, command):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process."""
+    Handles errors and communicates across a queue with the parent process. Returns whether the
+    command completed without errors."""
 
     check.inst_param(command, "command", ChildProcessCommand)
 
@@ -70,6 +73,7 @@ def _execute_command_in_child_process(event_queue, command):
             for step_event in command.execute():
                 event_queue.put(step_event)
             event_queue.put(ChildProcessDoneEvent(pid=pid))
+            return True
 
         except (
             Exception,
@@ -81,6 +85,7 @@ def _execute_command_in_child_process(event_queue, command):
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+            return False
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -165,3 +170,165 @@ def execute_child_process_command(multiprocessing_ctx, command):
         process.join()
     finally:
         event_queue.close()
+
+
+# the contexts entered by the commands executed in a worker process, exited when the worker exits
+_worker_exit_stack: Optional[ExitStack] = None
+
+
+def enter_worker_context(context_manager):
+    """Enters a context manager for the remaining lifetime of the current worker process, returning
+    its value. Lets the commands executed in a ChildProcessWorker keep state (e.g. an open instance)
+    for the commands the worker executes after them.
+    """
+    check.invariant(
+        _worker_exit_stack is not None,
+        "enter_worker_context can only be called from a command executing in a worker process",
+    )
+    return _worker_exit_stack.enter_context(context_manager)
+
+
+def _execute_commands_in_worker_process(command_queue, event_queue, term_event, max_tasks):
+    """Executes ChildProcessCommands received over the command queue one at a time, until it
+    receives None, has executed max_tasks commands, a command fails with a system error, or the
+    termination event is set."""
+    global _worker_exit_stack  # pylint: disable=global-statement
+
+    with capture_interrupts(), ExitStack() as exit_stack:
+        _worker_exit_stack = exit_stack
+        start_termination_thread(term_event)
+        num_tasks = 0
+        while True:
+            command = command_queue.get()
+            if command is None:
+                return
+
+            succeeded = _execute_command_in_child_process(event_queue, command)
+            num_tasks += 1
+
+            if not succeeded or term_event.is_set() or (max_tasks and num_tasks >= max_tasks):
+                return
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time.
+
+    Reusing the process across commands avoids paying for process startup and imports on every
+    command. The worker exits after executing max_tasks commands (if set) to bound the memory that
+    can build up in it, after a command fails with a system error, or after a command is
+    interrupted through its termination event.
+    """
+
+    def __init__(self, multiprocessing_ctx, max_tasks=None):
+        self._max_tasks = check.opt_int_param(max_tasks, "max_tasks")
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_queue = multiprocessing_ctx.Queue()
+        self._term_event = multiprocessing_ctx.Event()
+        self._num_tasks = 0
+        self._failed = False
+        self._process = multiprocessing_ctx.Process(
+            target=_execute_commands_in_worker_process,
+            args=(self._command_queue, self._event_queue, self._term_event, self._max_tasks),
+        )
+        self._process.start()
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def term_event(self):
+        return self._term_event
+
+    @property
+    def num_tasks(self):
+        """The number of commands that have been sent to the worker process."""
+        return self._num_tasks
+
+    @property
+    def can_accept_command(self):
+        return (
+            self._process.is_alive()
+            and not self._failed
+            and not self._term_event.is_set()
+            and not (self._max_tasks and self._num_tasks >= self._max_tasks)
+        )
+
+    def execute_command(self, command):
+        """Execute a ChildProcessCommand in the worker process.
+
+        Yields the same objects as execute_child_process_command, and likewise raises
+        ChildProcessCrashException if the worker process dies before the command completes.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(self.can_accept_command, "Worker process can not accept more commands")
+
+        self._num_tasks += 1
+        self._command_queue.put(command)
+
+        while True:
+            event = _poll_for_event(self._process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+            yield event
+
+            if isinstance(event, ChildProcessSystemErrorEvent):
+                self._failed = True
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                return
+
+    def shutdown(self):
+        if self._process.is_alive():
+            self._command_queue.put(None)
+        self._process.join()
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """A pool of ChildProcessWorkers. Workers are started as they are needed, up to max_workers,
+    and replaced once they can no longer accept commands."""
+
+    def __init__(self, multiprocessing_ctx, max_workers, max_tasks_per_worker=None):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_workers = check.int_param(max_workers, "max_workers")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._idle_workers = []
+        self._num_busy_workers = 0
+
+    def acquire(self):
+        check.invariant(
+            self._num_busy_workers < self._max_workers, "All workers in the pool are busy"
+        )
+
+        worker = None
+        while self._idle_workers and not worker:
+            candidate = self._idle_workers.pop()
+            if candidate.can_accept_command:
+                worker = candidate
+            else:
+                candidate.shutdown()
+
+        if not worker:
+            worker = ChildProcessWorker(self._multiprocessing_ctx, self._max_tasks_per_worker)
+
+        self._num_busy_workers += 1
+        return worker
+
+    def release(self, worker):
+        check.inst_param(worker, "worker", ChildProcessWorker)
+        self._num_busy_workers -= 1
+        if worker.can_accept_command:
+            self._idle_workers.append(worker)
+        else:
+            worker.shutdown()
+
+    def shutdown(self):
+        for worker in self._idle_workers:
+            worker.shutdown()
+        self._idle_workers = []
@@ -1,23 +1,27 @@
 import multiprocessing
 import os
 import sys
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 from dagster import MetadataEntry
 from dagster import _check as check
+from dagster.core.definitions.reconstruct import ReconstructablePipeline
 from dagster.core.errors import (
     DagsterExecutionInterruptedError,
     DagsterSubprocessError,
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster.core.events import DagsterEvent, EngineEventData
-from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster.core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster.core.execution.context.system import PlanOrchestrationContext
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_scheduling import StepSchedulingPolicy
 from dagster.core.executor.base import Executor
-from dagster.core.instance import DagsterInstance
+from dagster.core.instance import DagsterInstance, InstanceRef
+from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.utils import start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -27,6 +31,8 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
+    enter_worker_context,
     execute_child_process_command,
 )
 
@@ -55,39 +61,114 @@ def __init__(
         self.known_state = known_state
 
     def execute(self):
-        pipeline = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                pipeline=pipeline,
-                run_config=self.run_config,
-                mode=self.pipeline_run.mode,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-            )
-
-            yield instance.report_engine_event(
-                "Executing step {} in subprocess".format(self.step_key),
+            yield from _execute_step(
+                instance,
+                self.recon_pipeline,
                 self.pipeline_run,
-                EngineEventData(
-                    [
-                        MetadataEntry("pid", value=str(os.getpid())),
-                        MetadataEntry("step_key", value=self.step_key),
-                    ],
-                    marker_end=DELEGATE_MARKER,
-                ),
-                MultiprocessExecutor,
+                self.run_config,
+                self.retry_mode,
                 self.step_key,
+                self.known_state,
             )
 
-            yield from execute_plan_iterator(
-                execution_plan,
-                pipeline,
-                self.pipeline_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
+
+class _MultiprocessWorkerRunArgs(NamedTuple):
+    """The arguments a worker pool process loads the run it executes steps for with."""
+
+    run_config: Mapping[str, object]
+    pipeline_run: PipelineRun
+    instance_ref: InstanceRef
+    recon_pipeline: ReconstructablePipeline
+    retry_mode: RetryMode
+
+
+class _MultiprocessWorkerRunState(NamedTuple):
+    instance: DagsterInstance
+    recon_pipeline: ReconstructablePipeline
+    pipeline_run: PipelineRun
+    run_config: Mapping[str, object]
+    retry_mode: RetryMode
+
+
+# the runs loaded by this process when it is a worker pool process, keyed by the pipeline origin id
+# and the run id
+_worker_run_states: Dict[Tuple[str, str], _MultiprocessWorkerRunState] = {}
+
+
+class MultiprocessExecutorWorkerCommand(ChildProcessCommand):
+    """Executes a step in a worker pool process.
+
+    The first command a worker executes carries the arguments to load the run with. The worker
+    keeps the instance, the reconstructable pipeline (and so the pipeline definition it loads) and
+    the run, so the later commands only carry the step key and the known execution state.
+    """
+
+    def __init__(self, run_key, step_key, known_state, run_args=None):
+        self.run_key = run_key
+        self.step_key = step_key
+        self.known_state = known_state
+        self.run_args = run_args
+
+    def execute(self):
+        run_state = _worker_run_states.get(self.run_key)
+        if run_state is None:
+            check.invariant(
+                self.run_args is not None,
+                f"Worker process (pid: {os.getpid()}) has not loaded run {self.run_key[1]}",
+            )
+            run_state = _MultiprocessWorkerRunState(
+                instance=enter_worker_context(DagsterInstance.from_ref(self.run_args.instance_ref)),
+                recon_pipeline=self.run_args.recon_pipeline,
+                pipeline_run=self.run_args.pipeline_run,
+                run_config=self.run_args.run_config,
+                retry_mode=self.run_args.retry_mode,
             )
+            _worker_run_states[self.run_key] = run_state
+
+        yield from _execute_step(
+            run_state.instance,
+            run_state.recon_pipeline,
+            run_state.pipeline_run,
+            run_state.run_config,
+            run_state.retry_mode,
+            self.step_key,
+            self.known_state,
+        )
+
+
+def _execute_step(instance, pipeline, pipeline_run, run_config, retry_mode, step_key, known_state):
+    execution_plan = create_execution_plan_for_steps(
+        pipeline,
+        pipeline_run,
+        instance,
+        step_keys_to_execute=[step_key],
+        known_state=known_state,
+    )
+
+    yield instance.report_engine_event(
+        "Executing step {} in subprocess".format(step_key),
+        pipeline_run,
+        EngineEventData(
+            [
+                MetadataEntry("pid", value=str(os.getpid())),
+                MetadataEntry("step_key", value=step_key),
+            ],
+            marker_end=DELEGATE_MARKER,
+        ),
+        MultiprocessExecutor,
+        step_key,
+    )
+
+    yield from execute_plan_iterator(
+        execution_plan,
+        pipeline,
+        pipeline_run,
+        run_config=run_config,
+        retry_mode=retry_mode.for_inner_plan(),
+        instance=instance,
+    )
 
 
 class MultiprocessExecutor(Executor):
@@ -97,6 +178,10 @@ def __init__(
         max_concurrent: int,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[List[str]] = None,
+        use_worker_pool: bool = False,
+        max_tasks_per_worker: Optional[int] = None,
+        scheduling_policy: Optional[StepSchedulingPolicy] = None,
+        slot_limits: Optional[Mapping[str, int]] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
@@ -114,6 +199,16 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
+        self._scheduling_policy = check.opt_inst_param(
+            scheduling_policy, "scheduling_policy", StepSchedulingPolicy
+        )
+        self._slot_limits = check.opt_mapping_param(
+            slot_limits, "slot_limits", key_type=str, value_type=int
+        )
 
     @property
     def retries(self):
@@ -161,8 +256,18 @@ def execute(self, plan_context, execution_plan):
         # It would be good to implement a reference tracking algorithm here so we could
         # garbage collect results that are no longer needed by any steps
         # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
-            with execution_plan.start(retry_mode=self.retries) as active_execution:
+        worker_pool = (
+            ChildProcessWorkerPool(multiproc_ctx, limit, self._max_tasks_per_worker)
+            if self._use_worker_pool
+            else None
+        )
+
+        with time_execution_scope() as timer_result, _shutdown_on_exit(worker_pool):
+            with execution_plan.start(
+                retry_mode=self.retries,
+                scheduling_policy=self._scheduling_policy,
+                slot_limits=self._slot_limits,
+            ) as active_execution:
                 active_iters = {}
                 errors = {}
                 term_events = {}
@@ -192,17 +297,31 @@ def execute(self, plan_context, execution_plan):
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                pipeline,
-                                step_context,
-                                step,
-                                errors,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                            )
+                            if worker_pool:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker_process(
+                                    worker_pool,
+                                    worker,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    pipeline,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                )
 
                     # process active iterators
                     empty_iters = []
@@ -293,6 +412,15 @@ def execute(self, plan_context, execution_plan):
         )
 
 
+@contextmanager
+def _shutdown_on_exit(worker_pool: Optional[ChildProcessWorkerPool]):
+    try:
+        yield
+    finally:
+        if worker_pool:
+            worker_pool.shutdown()
+
+
 def execute_step_out_of_process(
     multiproc_ctx,
     pipeline,
@@ -329,3 +457,51 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed("Unexpected return value from child process {}".format(type(ret)))
+
+
+def execute_step_in_worker_process(
+    worker_pool,
+    worker,
+    pipeline,
+    step_context,
+    step,
+    errors,
+    retries,
+    known_state,
+):
+    # only a worker's first command carries the run, which the worker keeps for the later ones
+    command = MultiprocessExecutorWorkerCommand(
+        run_key=(pipeline.get_python_origin_id(), step_context.pipeline_run.run_id),
+        step_key=step.key,
+        known_state=known_state,
+        run_args=_MultiprocessWorkerRunArgs(
+            run_config=step_context.run_config,
+            pipeline_run=step_context.pipeline_run,
+            instance_ref=step_context.instance.get_ref(),
+            recon_pipeline=pipeline,
+            retry_mode=retries,
+        )
+        if worker.num_tasks == 0
+        else None,
+    )
+
+    yield DagsterEvent.engine_event(
+        step_context,
+        "Executing {step_key} in worker process (pid: {pid})".format(
+            step_key=step.key, pid=worker.pid
+        ),
+        EngineEventData(marker_start=DELEGATE_MARKER),
+        step_handle=step.handle,
+    )
+
+    try:
+        for ret in worker.execute_command(command):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            else:
+                check.failed("Unexpected return value from child process {}".format(type(ret)))
+    finally:
+        worker_pool.release(worker)
@@ -1,6 +1,8 @@
 import os
+import threading
 import time
-from typing import Dict, List, Optional, cast
+from contextlib import contextmanager
+from typing import Dict, List, Mapping, Optional, Tuple, cast
 
 import pendulum
 
@@ -16,6 +18,7 @@
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.plan.step import ExecutionStep
 from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_scheduling import StepSchedulingPolicy
 from dagster.core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
 from dagster.grpc.types import ExecuteStepArgs
 
@@ -35,6 +38,10 @@ def __init__(
         check_step_health_interval_seconds: Optional[int] = None,
         max_concurrent: Optional[int] = None,
         should_verify_step: bool = False,
+        scheduling_policy: Optional[StepSchedulingPolicy] = None,
+        slot_limits: Optional[Mapping[str, int]] = None,
+        wait_for_events: bool = False,
+        steps_per_launch: int = 1,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -54,18 +61,64 @@ def __init__(
             ),
         )
         self._should_verify_step = should_verify_step
+        self._scheduling_policy = check.opt_inst_param(
+            scheduling_policy, "scheduling_policy", StepSchedulingPolicy
+        )
+        self._slot_limits = check.opt_mapping_param(
+            slot_limits, "slot_limits", key_type=str, value_type=int
+        )
+        # when set, block on the instance's event watcher between iterations instead of sleeping
+        # for the full sleep_seconds, waking up as soon as a step reports a new event
+        self._wait_for_events = check.bool_param(wait_for_events, "wait_for_events")
+        # steps that are ready at the same time are launched in groups of up to this size, each
+        # group executing in the same step worker (e.g. one k8s pod for several small steps)
+        self._steps_per_launch = check.int_param(steps_per_launch, "steps_per_launch")
+        check.invariant(self._steps_per_launch > 0, "steps_per_launch must be > 0")
 
     @property
     def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> List[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        # The cursor returned by the storage points after the last record read (a storage id for
+        # sql storages), so each poll only reads the events that were stored since the last one
+        connection = instance.get_records_for_run(
+            run_id, self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = connection.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in connection.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
+    def _wait(self, instance, run_id):
+        if not self._wait_for_events:
+            time.sleep(self._sleep_seconds)
+            return
+
+        if self._watch_callback is None:
+            new_events = threading.Event()
+
+            def _on_event(_event, _cursor):
+                new_events.set()
+
+            self._new_events = new_events  # pylint: disable=attribute-defined-outside-init
+            self._watch_callback = _on_event  # pylint: disable=attribute-defined-outside-init
+            instance.watch_event_logs(run_id, self._event_cursor, self._watch_callback)
+
+        # sleep_seconds still bounds the wait, so that health checks and interrupts are handled
+        self._new_events.wait(timeout=self._sleep_seconds)
+        self._new_events.clear()
+
+    @contextmanager
+    def _event_watch(self, instance, run_id):
+        # the watch is started lazily by _wait, and ended once execution finishes
+        try:
+            yield
+        finally:
+            if self._watch_callback is not None:
+                instance.end_watch_event_logs(run_id, self._watch_callback)
+                self._watch_callback = None  # pylint: disable=attribute-defined-outside-init
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -84,6 +137,25 @@ def _get_step_handler_context(
             pipeline_run=plan_context.pipeline_run,
         )
 
+    def _launch_groups(self, steps: List[ExecutionStep]) -> List[List[ExecutionStep]]:
+        return [
+            steps[i : i + self._steps_per_launch]
+            for i in range(0, len(steps), self._steps_per_launch)
+        ]
+
+    def _running_launch_groups(
+        self,
+        running_steps: Dict[str, ExecutionStep],
+        launch_groups: Dict[str, List[ExecutionStep]],
+    ) -> List[List[ExecutionStep]]:
+        # the groups that were launched together and still have running steps, each group is
+        # checked on (or terminated) with the same step keys it was launched with
+        groups: Dict[Tuple[str, ...], List[ExecutionStep]] = {}
+        for step_key in running_steps:
+            group = launch_groups[step_key]
+            groups[tuple(step.key for step in group)] = group
+        return list(groups.values())
+
     def _log_new_events(self, events, plan_context, running_steps):
         # Note: this could lead to duplicated events if the returned events were already logged
         # (they shouldn't be)
@@ -97,7 +169,8 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1  # pylint: disable=attribute-defined-outside-init
+        self._event_cursor: Optional[str] = None  # pylint: disable=attribute-defined-outside-init
+        self._watch_callback = None  # pylint: disable=attribute-defined-outside-init
 
         yield DagsterEvent.engine_event(
             plan_context,
@@ -105,8 +178,13 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
             EngineEventData(),
         )
 
-        with execution_plan.start(retry_mode=self.retries) as active_execution:
+        with execution_plan.start(
+            retry_mode=self.retries,
+            scheduling_policy=self._scheduling_policy,
+            slot_limits=self._slot_limits,
+        ) as active_execution, self._event_watch(plan_context.instance, plan_context.run_id):
             running_steps: Dict[str, ExecutionStep] = {}
+            launch_groups: Dict[str, List[ExecutionStep]] = {}
 
             if plan_context.resume_from_failure:
                 yield DagsterEvent.engine_event(
@@ -149,6 +227,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         )
 
                     running_steps[step.key] = step
+                    launch_groups[step.key] = [step]
 
             last_check_step_health_time = pendulum.now("UTC")
 
@@ -165,11 +244,11 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             EngineEventData.interrupted(list(running_steps.keys())),
                         )
                         active_execution.mark_interrupted()
-                        for _, step in running_steps.items():
+                        for group in self._running_launch_groups(running_steps, launch_groups):
                             self._log_new_events(
                                 self._step_handler.terminate_step(
                                     self._get_step_handler_context(
-                                        plan_context, [step], active_execution
+                                        plan_context, group, active_execution
                                     )
                                 ),
                                 plan_context,
@@ -211,6 +290,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         if dagster_event.is_step_success or dagster_event.is_step_failure:
                             assert isinstance(dagster_event.step_key, str)
                             del running_steps[dagster_event.step_key]
+                            del launch_groups[dagster_event.step_key]
                             active_execution.verify_complete(plan_context, dagster_event.step_key)
 
                 # process skips from failures or uncovered inputs
@@ -222,16 +302,18 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     curr_time - last_check_step_health_time
                 ).total_seconds() >= self._check_step_health_interval_seconds:
                     last_check_step_health_time = curr_time
-                    for _, step in running_steps.items():
-                        self._log_new_events(
-                            self._step_handler.check_step_health(
-                                self._get_step_handler_context(
-                                    plan_context, [step], active_execution
-                                )
-                            ),
-                            plan_context,
-                            running_steps,
-                        )
+                    health_check_events = self._step_handler.check_steps_health(
+                        [
+                            self._get_step_handler_context(plan_context, group, active_execution)
+                            for group in self._running_launch_groups(running_steps, launch_groups)
+                        ]
+                    )
+                    self._log_new_events(
+                        # a launch group may report on steps that already completed
+                        [event for event in health_check_events if event.step_key in running_steps],
+                        plan_context,
+                        running_steps,
+                    )
 
                 if self._max_concurrent is not None:
                     max_steps_to_run = self._max_concurrent - len(running_steps)
@@ -241,14 +323,26 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                 else:
                     max_steps_to_run = None  # disables limit
 
-                for step in active_execution.get_steps_to_execute(max_steps_to_run):
-                    running_steps[step.key] = step
+                groups_to_launch = self._launch_groups(
+                    active_execution.get_steps_to_execute(max_steps_to_run)
+                )
+                for group in groups_to_launch:
+                    for step in group:
+                        running_steps[step.key] = step
+                        launch_groups[step.key] = group
+
+                if groups_to_launch:
                     self._log_new_events(
-                        self._step_handler.launch_step(
-                            self._get_step_handler_context(plan_context, [step], active_execution)
+                        self._step_handler.launch_steps(
+                            [
+                                self._get_step_handler_context(
+                                    plan_context, group, active_execution
+                                )
+                                for group in groups_to_launch
+                            ]
                         ),
                         plan_context,
                         running_steps,
                     )
 
-                time.sleep(self._sleep_seconds)
+                self._wait(plan_context.instance, plan_context.run_id)
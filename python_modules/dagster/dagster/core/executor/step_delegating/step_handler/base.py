@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
 
 from dagster import DagsterEvent, DagsterInstance
 from dagster import _check as check
@@ -46,6 +47,10 @@ def instance(self) -> DagsterInstance:
 
 
 class StepHandler(ABC):  # pylint: disable=no-init
+    # The maximum number of launches or health checks that launch_steps and check_steps_health
+    # issue at the same time
+    max_concurrent_requests = 16
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -62,3 +67,39 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
     @abstractmethod
     def terminate_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         pass
+
+    def launch_steps(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> List[DagsterEvent]:
+        """Launch a batch of steps. Each context is a single launch, which may execute several
+        steps. The default implementation calls launch_step for each context concurrently, handlers
+        that can launch several steps in a single request can override it."""
+        return self._map_contexts(self.launch_step, step_handler_contexts)
+
+    def check_steps_health(
+        self, step_handler_contexts: Sequence[StepHandlerContext]
+    ) -> List[DagsterEvent]:
+        """Check the health of a batch of launched steps. The default implementation calls
+        check_step_health for each context concurrently, handlers that can check several steps in
+        a single request can override it."""
+        return self._map_contexts(self.check_step_health, step_handler_contexts)
+
+    def _map_contexts(
+        self,
+        fn: Callable[[StepHandlerContext], List[DagsterEvent]],
+        step_handler_contexts: Sequence[StepHandlerContext],
+    ) -> List[DagsterEvent]:
+        check.sequence_param(step_handler_contexts, "step_handler_contexts", StepHandlerContext)
+
+        if len(step_handler_contexts) <= 1 or self.max_concurrent_requests <= 1:
+            events_by_context = [fn(context) for context in step_handler_contexts]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrent_requests, len(step_handler_contexts)),
+                thread_name_prefix=f"{self.name}_worker",
+            ) as executor:
+                # results are returned in the order of the contexts, and the first exception raised
+                # by a call is re-raised here
+                events_by_context = list(executor.map(fn, step_handler_contexts))
+
+        return [event for events in events_by_context for event in events]
@@ -2,6 +2,7 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
@@ -82,6 +83,7 @@
     from dagster.core.debug import DebugRunPayload
     from dagster.core.events import DagsterEvent, DagsterEventType
     from dagster.core.events.log import EventLogEntry
+    from dagster.core.execution.plan.outputs import StepOutputHandle
     from dagster.core.execution.plan.resume_retry import ReexecutionStrategy
     from dagster.core.execution.stats import RunStepKeyStatsSnapshot
     from dagster.core.host_representation import (
@@ -143,11 +145,10 @@ def __init__(self, instance):
         self._instance = instance
         super(_EventListenerLogHandler, self).__init__()
 
-    def emit(self, record):
-        from dagster.core.events import EngineEventData
+    def _construct_event(self, record):
         from dagster.core.events.log import StructuredLoggerMessage, construct_event_record
 
-        event = construct_event_record(
+        return construct_event_record(
             StructuredLoggerMessage(
                 name=record.name,
                 message=record.msg,
@@ -157,6 +158,11 @@ def emit(self, record):
             )
         )
 
+    def emit(self, record):
+        from dagster.core.events import EngineEventData
+
+        event = self._construct_event(record)
+
         try:
             self._instance.handle_new_event(event)
         except Exception as e:
@@ -178,6 +184,124 @@ def emit(self, record):
                 )
 
 
+class _BatchingEventListenerLogHandler(_EventListenerLogHandler):
+    """Buffers the events it receives and writes them to the instance in batches.
+
+    A batch is written once it holds ``max_batch_size`` events, once the oldest buffered event is
+    older than ``max_batch_interval`` seconds, or immediately upon receiving a run or step
+    lifecycle event, so that run status and step boundaries are never held back. The interval is
+    enforced by a timer, so that events are not held back while a step computes without logging.
+    """
+
+    def __init__(self, instance, max_batch_size, max_batch_interval):
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        self._max_batch_interval = check.numeric_param(max_batch_interval, "max_batch_interval")
+        self._buffer = []
+        self._buffer_start_time = None
+        self._flush_timer = None
+        self._flush_timer_error = None
+        super(_BatchingEventListenerLogHandler, self).__init__(instance)
+
+    def emit(self, record):
+        self._raise_flush_timer_error()
+        event = self._construct_event(record)
+
+        if not self._buffer:
+            self._buffer_start_time = time.time()
+            self._start_flush_timer()
+        self._buffer.append(event)
+
+        if (
+            len(self._buffer) >= self._max_batch_size
+            or time.time() - self._buffer_start_time >= self._max_batch_interval
+            or _is_lifecycle_event(event)
+        ):
+            self._flush_buffer()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._flush_buffer()
+            self._raise_flush_timer_error()
+        finally:
+            self.release()
+
+    def close(self):
+        self.flush()
+        super(_BatchingEventListenerLogHandler, self).close()
+
+    def _start_flush_timer(self):
+        self._flush_timer = threading.Timer(self._max_batch_interval, self._flush_on_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush_on_timer(self):
+        self.acquire()
+        try:
+            self._flush_buffer()
+        except Exception as e:  # pylint: disable=broad-except
+            # failures to write system events fail the step, so raise them on the logging thread
+            self._flush_timer_error = e
+        finally:
+            self.release()
+
+    def _raise_flush_timer_error(self):
+        if self._flush_timer_error:
+            error = self._flush_timer_error
+            self._flush_timer_error = None
+            raise error
+
+    def _flush_buffer(self):
+        from dagster.core.events import EngineEventData
+
+        if not self._buffer:
+            return
+
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        events = self._buffer
+        self._buffer = []
+        self._buffer_start_time = None
+
+        try:
+            self._instance.handle_new_events(events)
+        except Exception as e:
+            sys.stderr.write(f"Exception while writing logger calls to event log: {str(e)}\n")
+            if any(event.dagster_event for event in events):
+                # system-generated events are the source of truth for the state of the run, so
+                # failing to write any of them fails the batch
+                raise
+
+            for run_id, event in {event.run_id: event for event in events if event.run_id}.items():
+                self._instance.report_engine_event(
+                    "Exception while writing logger calls to event log",
+                    pipeline_name=event.pipeline_name,
+                    run_id=run_id,
+                    engine_event_data=EngineEventData(
+                        error=serializable_error_info_from_exc_info(sys.exc_info()),
+                    ),
+                )
+
+
+def _is_lifecycle_event(event):
+    from dagster.core.events import DagsterEventType
+
+    return event.is_dagster_event and (
+        event.dagster_event.is_pipeline_event
+        or event.dagster_event.event_type
+        in {
+            DagsterEventType.STEP_START,
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.STEP_FAILURE,
+            DagsterEventType.STEP_SKIPPED,
+            DagsterEventType.STEP_UP_FOR_RETRY,
+            DagsterEventType.STEP_RESTARTED,
+        }
+    )
+
+
 class InstanceType(Enum):
     PERSISTENT = "PERSISTENT"
     EPHEMERAL = "EPHEMERAL"
@@ -641,6 +765,14 @@ def code_server_process_startup_timeout(self) -> int:
             "local_startup_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_max_concurrent_loads(self) -> Optional[int]:
+        return self.code_server_settings.get("max_concurrent_loads")
+
+    @property
+    def code_server_load_timeout(self) -> Optional[int]:
+        return self.code_server_settings.get("load_timeout")
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         default_max_resume_run_attempts = 3 if self.run_launcher.supports_resume_run else 0
@@ -658,6 +790,32 @@ def cancellation_thread_poll_interval_seconds(self) -> int:
             "cancellation_thread_poll_interval_seconds", 10
         )
 
+    # sensors
+
+    @property
+    def sensor_settings(self) -> Dict:
+        return self.get_settings("sensors")
+
+    # backfills
+
+    @property
+    def backfill_settings(self) -> Dict:
+        return self.get_settings("backfills")
+
+    # event batching
+
+    @property
+    def event_batching_settings(self) -> Dict:
+        return self.get_settings("event_batching")
+
+    @property
+    def serialization_settings(self) -> Dict:
+        return self.get_settings("serialization")
+
+    @property
+    def use_binary_snapshots(self) -> bool:
+        return self.serialization_settings.get("binary_snapshots", False)
+
     # python logs
 
     @property
@@ -748,6 +906,12 @@ def has_historical_pipeline(self, snapshot_id: str) -> bool:
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    @traced
+    def get_execution_plan_snapshots(
+        self, snapshot_ids: Sequence[str]
+    ) -> Dict[str, "ExecutionPlanSnapshot"]:
+        return self._run_storage.get_execution_plan_snapshots(snapshot_ids)
+
     @traced
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
@@ -756,6 +920,18 @@ def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_step_stats_for_runs(
+        self, run_ids: List[str], step_keys=None
+    ) -> Mapping[str, List["RunStepKeyStatsSnapshot"]]:
+        return self._event_storage.get_step_stats_for_runs(run_ids, step_keys)
+
+    @traced
+    def get_successful_step_output_handles(
+        self, run_id: str, step_keys: Sequence[str]
+    ) -> Set["StepOutputHandle"]:
+        return self._event_storage.get_successful_step_output_handles(run_id, step_keys)
+
     @traced
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
@@ -870,6 +1046,7 @@ def _construct_run_with_snapshots(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        snapshot_id_cache=None,
     ):
 
         # https://github.com/dagster-io/dagster/issues/2403
@@ -884,19 +1061,32 @@ def _construct_run_with_snapshots(
             "that do not successfully compile execution plans in the scheduled case.",
         )
 
-        pipeline_snapshot_id = (
-            self._ensure_persisted_pipeline_snapshot(pipeline_snapshot, parent_pipeline_snapshot)
-            if pipeline_snapshot
-            else None
-        )
-
-        execution_plan_snapshot_id = (
-            self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+        # when creating several runs, snapshot_id_cache maps the snapshot objects that were already
+        # persisted to their ids, so that snapshots shared by the runs are hashed and written once
+        if snapshot_id_cache is None:
+            snapshot_id_cache = {}
+
+        pipeline_snapshot_id = None
+        if pipeline_snapshot:
+            cache_key = (id(pipeline_snapshot), id(parent_pipeline_snapshot))
+            if cache_key not in snapshot_id_cache:
+                snapshot_id_cache[cache_key] = self._ensure_persisted_pipeline_snapshot(
+                    pipeline_snapshot, parent_pipeline_snapshot
+                )
+            pipeline_snapshot_id = snapshot_id_cache[cache_key]
+
+        execution_plan_snapshot_id = None
+        if execution_plan_snapshot and pipeline_snapshot_id:
+            cache_key = (
+                id(execution_plan_snapshot),
+                pipeline_snapshot_id,
+                tuple(step_keys_to_execute) if step_keys_to_execute is not None else None,
             )
-            if execution_plan_snapshot and pipeline_snapshot_id
-            else None
-        )
+            if cache_key not in snapshot_id_cache:
+                snapshot_id_cache[cache_key] = self._ensure_persisted_execution_plan_snapshot(
+                    execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+                )
+            execution_plan_snapshot_id = snapshot_id_cache[cache_key]
 
         return DagsterRun(
             pipeline_name=pipeline_name,
@@ -985,21 +1175,47 @@ def _ensure_persisted_execution_plan_snapshot(
 
         return execution_plan_snapshot_id
 
-    def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan_snapshot):
+    def _asset_materialization_planned_events(
+        self, pipeline_run, execution_plan_snapshot
+    ) -> List["EventLogEntry"]:
         from dagster.core.events import DagsterEvent
+        from dagster.core.events.log import EventLogEntry
         from dagster.core.execution.context_creation_pipeline import initialize_console_manager
 
         pipeline_name = pipeline_run.pipeline_name
+        step_keys_to_execute = set(execution_plan_snapshot.step_keys_to_execute)
+        # logs the events to the console only, they are stored by the caller
+        console_manager = None
 
+        events = []
         for step in execution_plan_snapshot.steps:
-            if step.key in execution_plan_snapshot.step_keys_to_execute:
+            if step.key in step_keys_to_execute:
                 for output in step.outputs:
                     asset_key = output.properties.asset_key
                     if asset_key:
-                        # Logs and stores asset_materialization_planned event
-                        DagsterEvent.asset_materialization_planned(
-                            pipeline_name, asset_key, initialize_console_manager(pipeline_run, self)
+                        if console_manager is None:
+                            console_manager = initialize_console_manager(pipeline_run)
+                        event = DagsterEvent.asset_materialization_planned(
+                            pipeline_name, asset_key, console_manager
+                        )
+                        events.append(
+                            EventLogEntry(
+                                error_info=None,
+                                level=logging.DEBUG,
+                                user_message=event.message,
+                                run_id=pipeline_run.run_id,
+                                timestamp=time.time(),
+                                job_name=pipeline_name,
+                                dagster_event=event,
+                            )
                         )
+        return events
+
+    def _log_asset_materialization_planned_events(self, pipeline_run, execution_plan_snapshot):
+        # the events of a run are written together, rather than one at a time through a log manager
+        events = self._asset_materialization_planned_events(pipeline_run, execution_plan_snapshot)
+        if events:
+            self.handle_new_events(events)
 
     def create_run(
         self,
@@ -1049,6 +1265,39 @@ def create_run(
 
         return pipeline_run
 
+    def create_runs(self, runs: Sequence[Mapping[str, Any]]) -> List[PipelineRun]:
+        """Create several runs at once, e.g. the runs of a backfill.
+
+        Each mapping holds the keyword arguments that :py:meth:`create_run` takes for one run.
+        Snapshots shared by several runs are persisted once, the runs and their tags are added to
+        run storage together, and the planned asset materialization events of all the runs are
+        written in a single batch.
+        """
+        check.sequence_param(runs, "runs", of_type=Mapping)
+
+        snapshot_id_cache: Dict[Tuple, str] = {}
+        pipeline_runs = self._run_storage.add_runs(
+            [
+                self._construct_run_with_snapshots(
+                    **run_kwargs, snapshot_id_cache=snapshot_id_cache
+                )
+                for run_kwargs in runs
+            ]
+        )
+
+        events = [
+            event
+            for pipeline_run, run_kwargs in zip(pipeline_runs, runs)
+            if run_kwargs.get("execution_plan_snapshot")
+            for event in self._asset_materialization_planned_events(
+                pipeline_run, run_kwargs["execution_plan_snapshot"]
+            )
+        ]
+        if events:
+            self.handle_new_events(events)
+
+        return pipeline_runs
+
     def create_reexecuted_run(
         self,
         parent_run: DagsterRun,
@@ -1236,6 +1485,25 @@ def get_runs(
     ) -> Iterable[PipelineRun]:
         return self._run_storage.get_runs(filters, cursor, limit, bucket_by)
 
+    @traced
+    def get_latest_runs_by_tag_values(
+        self,
+        tag_key: str,
+        tag_values: Sequence[str],
+        filters: Optional[RunsFilter] = None,
+    ) -> Dict[str, PipelineRun]:
+        return self._run_storage.get_latest_runs_by_tag_values(tag_key, tag_values, filters)
+
+    @traced
+    def get_run_ids_with_tags(
+        self,
+        filters: Optional[RunsFilter] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        priority_tag_key: Optional[str] = None,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        return self._run_storage.get_run_ids_with_tags(filters, tag_keys, limit, priority_tag_key)
+
     @traced
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
@@ -1281,11 +1549,15 @@ def supports_bucket_queries(self):
 
     @traced
     def get_run_partition_data(
-        self, partition_set_name: str, job_name: str, repository_label: str
+        self,
+        partition_set_name: str,
+        job_name: str,
+        repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
     ) -> List[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
         return self._run_storage.get_run_partition_data(
-            partition_set_name, job_name, repository_label
+            partition_set_name, job_name, repository_label, partition_names
         )
 
     def wipe(self):
@@ -1472,13 +1744,34 @@ def _get_yaml_python_handlers(self):
             return dummy_logger.handlers
         return []
 
-    def _get_event_log_handler(self):
-        event_log_handler = _EventListenerLogHandler(self)
+    def _get_event_log_handler(self, event_batch_size=None, event_batch_interval=None):
+        if event_batch_size and event_batch_size > 1:
+            event_log_handler = _BatchingEventListenerLogHandler(
+                self, event_batch_size, event_batch_interval
+            )
+        else:
+            event_log_handler = _EventListenerLogHandler(self)
         event_log_handler.setLevel(10)
         return event_log_handler
 
-    def get_handlers(self):
-        handlers = [self._get_event_log_handler()]
+    def get_handlers(self, event_batch_size=None, event_batch_interval=None):
+        """Get the logging handlers that route log calls to this instance.
+
+        Args:
+            event_batch_size (Optional[int]): If greater than 1, buffer events and write them to the
+                event log storage in batches of up to this many events.
+            event_batch_interval (Optional[float]): When batching, the maximum number of seconds to
+                hold an event in the buffer before writing it.
+        """
+        check.opt_int_param(event_batch_size, "event_batch_size")
+        check.opt_numeric_param(event_batch_interval, "event_batch_interval")
+
+        handlers = [
+            self._get_event_log_handler(
+                event_batch_size=event_batch_size,
+                event_batch_interval=event_batch_interval if event_batch_interval else 0,
+            )
+        ]
         handlers.extend(self._get_yaml_python_handlers())
         return handlers
 
@@ -1496,6 +1789,23 @@ def handle_new_event(self, event):
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events):
+        """Store a batch of events in a single write to the event log storage, then process each
+        event in order as :py:meth:`handle_new_event` would.
+        """
+        from dagster.core.events.log import EventLogEntry
+
+        events = check.list_param(events, "events", of_type=EventLogEntry)
+
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event.is_pipeline_event:
+                self._run_storage.handle_run_event(event.run_id, event.dagster_event)
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id, cb):
         self._subscribers[run_id].append(cb)
 
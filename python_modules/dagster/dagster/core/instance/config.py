@@ -132,7 +132,38 @@ def dagster_instance_config_schema():
             },
         ),
         "code_servers": Field(
-            {"local_startup_timeout": Field(int, is_required=False)},
+            {
+                "local_startup_timeout": Field(int, is_required=False),
+                "max_concurrent_loads": Field(int, is_required=False),
+                "load_timeout": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "sensors": Field(
+            {
+                "use_threads": Field(Bool, is_required=False, default_value=False),
+                "num_workers": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "backfills": Field(
+            {
+                "use_threads": Field(Bool, is_required=False, default_value=False),
+                "num_workers": Field(int, is_required=False),
+            },
+            is_required=False,
+        ),
+        "event_batching": Field(
+            {
+                "max_batch_size": Field(int, is_required=False, default_value=100),
+                "max_batch_interval_seconds": Field(float, is_required=False, default_value=1.0),
+            },
+            is_required=False,
+        ),
+        "serialization": Field(
+            {
+                "binary_snapshots": Field(Bool, is_required=False, default_value=False),
+            },
             is_required=False,
         ),
     }
@@ -214,7 +214,16 @@ def from_dir(base_dir, config_filename=DAGSTER_CONFIG_YAML_FILENAME, overrides=N
             defaults["run_launcher"],
         )
 
-        settings_keys = {"telemetry", "python_logs", "run_monitoring", "code_servers"}
+        settings_keys = {
+            "telemetry",
+            "python_logs",
+            "run_monitoring",
+            "code_servers",
+            "sensors",
+            "backfills",
+            "event_batching",
+            "serialization",
+        }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
         return InstanceRef(
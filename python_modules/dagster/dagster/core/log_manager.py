@@ -268,6 +268,11 @@ def emit(self, record: logging.LogRecord):
         finally:
             self._should_capture = True
 
+    def flush(self):
+        """Flush any records buffered by the built-in handlers, e.g. batched event log writes."""
+        for handler in self._handlers:
+            handler.flush()
+
 
 class DagsterLogManager(logging.Logger):
     """Centralized dispatch for logging from user code.
@@ -312,8 +317,14 @@ def create(
         handlers: Optional[List[logging.Handler]] = None,
         instance: Optional["DagsterInstance"] = None,
         pipeline_run: Optional["PipelineRun"] = None,
+        event_batch_size: Optional[int] = None,
+        event_batch_interval: Optional[float] = None,
     ) -> "DagsterLogManager":
-        """Create a DagsterLogManager with a set of subservient loggers."""
+        """Create a DagsterLogManager with a set of subservient loggers.
+
+        If ``event_batch_size`` is greater than 1, events are written to the instance's event log
+        storage in batches rather than one at a time. See :py:meth:`flush`.
+        """
 
         handlers = check.opt_list_param(handlers, "handlers", of_type=logging.Handler)
 
@@ -321,7 +332,9 @@ def create(
         python_log_level = logging.NOTSET
 
         if instance:
-            handlers += instance.get_handlers()
+            handlers += instance.get_handlers(
+                event_batch_size=event_batch_size, event_batch_interval=event_batch_interval
+            )
             managed_loggers += [
                 logging.getLogger(lname) if lname != "root" else logging.getLogger()
                 for lname in instance.managed_python_loggers
@@ -364,6 +377,10 @@ def end_python_log_capture(self):
         for logger in self._managed_loggers:
             logger.removeHandler(self._dagster_handler)
 
+    def flush(self):
+        """Write out any events that are buffered for batched writes to the event log storage."""
+        self._dagster_handler.flush()
+
     def log_dagster_event(self, level: Union[str, int], msg: str, dagster_event: "DagsterEvent"):
         """Log a DagsterEvent at the given level. Attributes about the context it was logged in
         (such as the solid name or pipeline name) will be automatically attached to the created record.
@@ -0,0 +1,22 @@
+"""add step stats table
+
+Revision ID: 308a9ef924e6
+Revises: 721d858e1dda
+Create Date: 2022-06-14 10:12:03.114418
+
+"""
+from dagster.core.storage.migration.utils import create_step_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "308a9ef924e6"
+down_revision = "721d858e1dda"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_step_stats_table()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add step stats table
+
+Revision ID: 3e56e6c01da5
+Revises: 308a9ef924e6
+Create Date: 2022-06-14 10:12:26.592104
+
+"""
+from dagster.core.storage.migration.utils import create_step_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "3e56e6c01da5"
+down_revision = "308a9ef924e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_step_stats_table()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,22 @@
+"""add step stats table
+
+Revision ID: 4305e345633f
+Revises: 3e56e6c01da5
+Create Date: 2022-06-14 10:12:48.270011
+
+"""
+from dagster.core.storage.migration.utils import create_step_stats_table
+
+# revision identifiers, used by Alembic.
+revision = "4305e345633f"
+down_revision = "3e56e6c01da5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_step_stats_table()
+
+
+def downgrade():
+    pass
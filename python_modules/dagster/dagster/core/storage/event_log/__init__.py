@@ -6,7 +6,7 @@
     RunShardedEventsCursor,
 )
 from .in_memory import InMemoryEventLogStorage
-from .polling_event_watcher import SqlPollingEventWatcher
+from .polling_event_watcher import SqlMultiplexedPollingEventWatcher, SqlPollingEventWatcher
 from .schema import AssetKeyTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from .sql_event_log import SqlEventLogStorage
 from .sqlite import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
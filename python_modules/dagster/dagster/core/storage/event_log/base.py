@@ -21,6 +21,7 @@
 from dagster.core.definitions.events import AssetKey
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.execution.stats import (
     RunStepKeyStatsSnapshot,
     build_run_stats_from_events,
@@ -275,6 +276,36 @@ def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKey
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_step_stats_for_runs(
+        self, run_ids: List[str], step_keys=None
+    ) -> Mapping[str, List[RunStepKeyStatsSnapshot]]:
+        """Get per-step stats for several pipeline runs, keyed by run id.
+
+        Storages that can fetch the stats for many runs in a single query should override this
+        method. The default implementation fetches the stats one run at a time.
+        """
+        return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
+    def get_successful_step_output_handles(
+        self, run_id: str, step_keys: Sequence[str]
+    ) -> Set[StepOutputHandle]:
+        """Get the handles of the step outputs that were successfully yielded by the given steps
+        of a run.
+
+        Args:
+            run_id (str): The id of the run.
+            step_keys (Sequence[str]): The keys of the steps whose outputs should be returned.
+        """
+        check.str_param(run_id, "run_id")
+        check.sequence_param(step_keys, "step_keys", of_type=str)
+
+        step_key_set = set(step_keys)
+        return {
+            event.dagster_event.event_specific_data.step_output_handle
+            for event in self.get_logs_for_run(run_id, of_type=DagsterEventType.STEP_OUTPUT)
+            if event.dagster_event.step_key in step_key_set
+        }
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -283,6 +314,19 @@ def store_event(self, event: EventLogEntry):
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence[EventLogEntry]):
+        """Store a batch of events, possibly spanning multiple pipeline runs.
+
+        Storages that can write several events in a single round trip should override this
+        method. The default implementation stores the events one at a time, in order.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str):
         """Remove events for a given run id"""
@@ -1,13 +1,22 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from collections import defaultdict
+from typing import Callable, Dict, List, Mapping, MutableMapping, NamedTuple, Optional
+
+import sqlalchemy as db
 
 import dagster._check as check
+import dagster.seven as seven
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log.base import EventLogCursor
+from dagster.core.storage.event_log.base import EventLogCursor, EventLogRecord
+from dagster.serdes import deserialize_as
+from dagster.serdes.errors import DeserializationError
 
+from .schema import SqlEventLogStorageTable
 from .sql_event_log import SqlEventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
+MAX_POLLING_CADENCE = 2.0  # 2 s, upper bound for the multiplexed watcher's idle backoff
 
 
 class CallbackAfterCursor(NamedTuple):
@@ -170,3 +179,186 @@ def run(self):
                                 event_record.event_log_entry,
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
+
+
+class SqlMultiplexedPollingEventWatcher:
+    """Event Log Watcher that polls for new events for every watched run_id from a single thread
+
+    Each poll issues one query for the events past each watched run's high water mark, so the load
+    on the event log DB does not scale with the number of watchers. The polling interval starts at
+    POLLING_CADENCE and backs off exponentially up to MAX_POLLING_CADENCE while no new events
+    arrive, resetting as soon as new events are found or a new run_id is watched.
+
+    Requires a storage that keeps the events for all runs in its index connection (e.g. MySQL), since
+    a single query is issued across run_ids.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _run_id_to_callbacks, _run_id_to_high_water_mark and _thread
+    """
+
+    def __init__(self, event_log_storage: SqlEventLogStorage):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", SqlEventLogStorage
+        )
+
+        self._lock: threading.Lock = threading.Lock()
+        self._run_id_to_callbacks: Dict[str, List[CallbackAfterCursor]] = {}
+        self._run_id_to_high_water_mark: Dict[str, Optional[int]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            _has_run_id = run_id in self._run_id_to_callbacks
+        return _has_run_id
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        with self._lock:
+            if run_id not in self._run_id_to_callbacks:
+                self._run_id_to_callbacks[run_id] = []
+                self._run_id_to_high_water_mark[run_id] = _storage_id_for_cursor(cursor)
+            self._run_id_to_callbacks[run_id].append(CallbackAfterCursor(cursor, callback))
+
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._poll_loop, name="sql-event-log-watcher", daemon=True
+                )
+                self._thread.start()
+
+        # poll immediately so that the new watcher does not wait out a backed off interval
+        self._wakeup.set()
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id in self._run_id_to_callbacks:
+                self._run_id_to_callbacks[run_id] = [
+                    callback_with_cursor
+                    for callback_with_cursor in self._run_id_to_callbacks[run_id]
+                    if callback_with_cursor.callback != handler
+                ]
+                if not self._run_id_to_callbacks[run_id]:
+                    del self._run_id_to_callbacks[run_id]
+                    del self._run_id_to_high_water_mark[run_id]
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            self._wakeup.set()
+            with self._lock:
+                thread = self._thread
+            if thread:
+                thread.join()
+
+    def _poll_loop(self):
+        """Polling function to update Observers with EventLogEntrys from Event Log DB.
+        Wakes every polling interval (or when a new run_id is watched) &
+            1. executes a single SELECT query to get new EventLogEntrys for all watched run_ids
+            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
+            3. doubles the polling interval if there were no new EventLogEntrys, otherwise resets it
+        """
+        interval = POLLING_CADENCE
+        while not self._should_thread_exit.is_set():
+            if self._wakeup.wait(interval):
+                self._wakeup.clear()
+                interval = POLLING_CADENCE
+            if self._should_thread_exit.is_set():
+                break
+
+            with self._lock:
+                high_water_marks = dict(self._run_id_to_high_water_mark)
+
+            try:
+                has_new_records = self._poll(high_water_marks) if high_water_marks else False
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Error polling for new events for watched runs")
+                has_new_records = False
+
+            interval = (
+                POLLING_CADENCE if has_new_records else min(interval * 2, MAX_POLLING_CADENCE)
+            )
+
+    def _poll(self, high_water_marks: Mapping[str, Optional[int]]) -> bool:
+        records_by_run_id = self._fetch_records_by_run_id(high_water_marks)
+
+        for run_id, records in records_by_run_id.items():
+            with self._lock:
+                if run_id not in self._run_id_to_callbacks:
+                    continue
+                self._run_id_to_high_water_mark[run_id] = records[-1].storage_id
+                callbacks = list(self._run_id_to_callbacks[run_id])
+
+            for event_record in records:
+                for callback_with_cursor in callbacks:
+                    if (
+                        callback_with_cursor.cursor is None
+                        or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                        < event_record.storage_id
+                    ):
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+
+        return bool(records_by_run_id)
+
+    def _fetch_records_by_run_id(
+        self, high_water_marks: Mapping[str, Optional[int]]
+    ) -> Mapping[str, List[EventLogRecord]]:
+        clauses = [
+            SqlEventLogStorageTable.c.run_id == run_id
+            if high_water_mark is None
+            else db.and_(
+                SqlEventLogStorageTable.c.run_id == run_id,
+                SqlEventLogStorageTable.c.id > high_water_mark,
+            )
+            for run_id, high_water_mark in high_water_marks.items()
+        ]
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(db.or_(*clauses))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self._event_log_storage.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records_by_run_id: Dict[str, List[EventLogRecord]] = defaultdict(list)
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_as(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError):
+                logging.warning("Could not parse event record id `%s`.", record_id)
+                continue
+
+            records_by_run_id[run_id].append(
+                EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+            )
+
+        return records_by_run_id
+
+
+def _storage_id_for_cursor(cursor: Optional[str]) -> Optional[int]:
+    if cursor is None:
+        return None
+    cursor_obj = EventLogCursor.parse(cursor)
+    return cursor_obj.storage_id() if cursor_obj.is_id_cursor() else None
@@ -52,6 +52,19 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# The StepStatsTable holds the step stats for each step of a run, maintained incrementally as step
+# events are stored, so that step stats can be read without deserializing every step event.
+StepStatsTable = db.Table(
+    "step_stats",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("step_key", db.Text, nullable=False),
+    db.Column("stats_body", db.Text, nullable=False),
+    db.Column("version", db.Integer, nullable=False),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -75,3 +88,10 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_step_stats_run_step",
+    StepStatsTable.c.run_id,
+    StepStatsTable.c.step_key,
+    unique=True,
+    mysql_length={"step_key": 512},
+)
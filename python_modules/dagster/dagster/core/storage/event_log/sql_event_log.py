@@ -15,7 +15,13 @@
 from dagster.core.errors import DagsterEventLogInvalidForRun
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.execution.stats import build_run_step_stats_from_events
+from dagster.core.execution.stats import (
+    STEP_STATS_COLLECTED_EVENT_TYPES,
+    STEP_STATS_EVENT_TYPES,
+    RunStepKeyStatsSnapshot,
+    StepStatsAccumulator,
+    build_run_step_stats_from_events,
+)
 from dagster.serdes import (
     deserialize_as,
     deserialize_json_to_dagster_namedtuple,
@@ -36,11 +42,59 @@
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    STEP_STATS_TABLE,
+)
+from .schema import (
+    AssetKeyTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+    StepStatsTable,
+)
 
 MIN_ASSET_ROWS = 25
 
+# the number of step stats rows each storage remembers the version of
+STEP_STATS_ROW_CACHE_SIZE = 1000
+
+
+def is_asset_index_event(event):
+    return (
+        event.is_dagster_event
+        and (
+            event.dagster_event.is_step_materialization
+            or event.dagster_event.is_asset_observation
+            or event.dagster_event.is_asset_materialization_planned
+        )
+        and event.dagster_event.asset_key
+    )
+
+
+def is_step_stats_event(event):
+    return (
+        event.is_dagster_event
+        and event.dagster_event.step_key
+        and event.dagster_event.event_type in STEP_STATS_EVENT_TYPES
+    )
+
+
+def _fold_step_stats_events(accumulator, events):
+    for event in events:
+        accumulator = accumulator.with_event(event)
+    # the step's materialization and expectation events are read from the event log instead
+    return accumulator._replace(materialization_events=[], expectation_results=[])
+
+
+def group_events_by_run_id(events):
+    """Group a sequence of events by run id, preserving the order of the events within each run."""
+    events_by_run_id = OrderedDict()
+    for event in events:
+        events_by_run_id.setdefault(event.run_id, []).append(event)
+    return events_by_run_id
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -81,6 +135,12 @@ def prepare_insert_event(self, event):
         `store_event`.
         """
 
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._get_event_insert_values(event)
+        )
+
+    def _get_event_insert_values(self, event):
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -95,8 +155,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        return dict(
             run_id=event.run_id,
             event=serialize_dagster_namedtuple(event),
             dagster_event_type=dagster_event_type,
@@ -130,7 +189,14 @@ def store_asset_event(self, event):
         #
         # https://github.com/dagster-io/dagster/issues/3945
 
-        values = self._get_asset_entry_values(event, self.has_asset_key_index_cols())
+        values = self._get_asset_entry_values(event, self._should_write_asset_key_index_cols())
+        with self.index_connection() as conn:
+            self._update_asset_entry(conn, event, values)
+
+    def _should_write_asset_key_index_cols(self):
+        return self.has_asset_key_index_cols()
+
+    def _update_asset_entry(self, conn, event, values):
         insert_statement = AssetKeyTable.insert().values(
             asset_key=event.dagster_event.asset_key.to_string(), **values
         )
@@ -142,11 +208,10 @@ def store_asset_event(self, event):
             )
         )
 
-        with self.index_connection() as conn:
-            try:
-                conn.execute(insert_statement)
-            except db.exc.IntegrityError:
-                conn.execute(update_statement)
+        try:
+            conn.execute(insert_statement)
+        except db.exc.IntegrityError:
+            conn.execute(update_statement)
 
     def _get_asset_entry_values(self, event, has_asset_key_index_cols):
         # The AssetKeyTable contains a `last_materialization_timestamp` column that is exclusively
@@ -217,21 +282,67 @@ def store_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
+        write_step_stats = is_step_stats_event(event) and self._should_write_step_stats()
 
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
+            if write_step_stats:
+                self._cache_step_stats_rows(self._update_step_stats(conn, run_id, [event]))
 
-        if (
-            event.is_dagster_event
-            and (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
-            )
-            and event.dagster_event.asset_key
-        ):
+        if is_asset_index_event(event):
             self.store_asset_event(event)
 
+    def store_events(self, events):
+        """Store a batch of events, writing the event rows, step stats, and any asset key index
+        updates for each run in a single transaction.
+
+        Storages that shard the asset key index apart from the run events (e.g.
+        `SqliteEventLogStorage`) must override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        write_asset_key_index_cols = (
+            self._should_write_asset_key_index_cols()
+            if any(is_asset_index_event(event) for event in events)
+            else False
+        )
+        write_step_stats = (
+            self._should_write_step_stats()
+            if any(is_step_stats_event(event) for event in events)
+            else False
+        )
+
+        for run_id, run_events in group_events_by_run_id(events).items():
+            step_stats_rows = {}
+            with self.run_connection(run_id) as conn:
+                conn = self._transaction_connection(conn)
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [self._get_event_insert_values(event) for event in run_events],
+                    )
+                    if write_step_stats:
+                        step_stats_rows = self._update_step_stats(conn, run_id, run_events)
+                    for event in run_events:
+                        if is_asset_index_event(event):
+                            self._update_asset_entry(
+                                conn,
+                                event,
+                                self._get_asset_entry_values(event, write_asset_key_index_cols),
+                            )
+            self._cache_step_stats_rows(step_stats_rows)
+
+    def _transaction_connection(self, conn):
+        """Returns the connection to run the statements of a transaction on. Storages whose engines
+        autocommit every statement must override this, so that `conn.begin()` starts a transaction.
+        """
+        return conn
+
     def get_records_for_run(
         self,
         run_id,
@@ -382,6 +493,9 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.has_secondary_index(STEP_STATS_TABLE):
+            return self._get_step_stats_from_table([run_id], step_keys)[run_id]
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -391,27 +505,75 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         #
         # For simplicity, we now just do the second type of query and derive the stats in Python
         # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
+        # being able to share code with the in-memory event log storage implementation.  Once the
+        # step stats table has been built (see `migrate_step_stats_data`), the stats are instead
+        # maintained as events are stored and read back directly.
+        records = self._get_step_stats_events(run_id, step_keys)
+        return build_run_step_stats_from_events(run_id, records)
+
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        check.opt_list_param(step_keys, "step_keys", of_type=str)
+
+        if not run_ids:
+            return {}
+
+        if self.has_secondary_index(STEP_STATS_TABLE):
+            return self._get_step_stats_from_table(run_ids, step_keys)
+
+        records_by_run_id = self._get_step_stats_events_for_runs(run_ids, step_keys)
+        return {
+            run_id: build_run_step_stats_from_events(run_id, records_by_run_id[run_id])
+            for run_id in run_ids
+        }
+
+    def get_successful_step_output_handles(self, run_id, step_keys):
+        check.str_param(run_id, "run_id")
+        check.sequence_param(step_keys, "step_keys", of_type=str)
+
+        if not step_keys:
+            return set()
+
+        query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type == DagsterEventType.STEP_OUTPUT.value
+            )
+            .where(SqlEventLogStorageTable.c.step_key.in_(list(step_keys)))
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        try:
+            return {
+                deserialize_as(
+                    json_str, EventLogEntry
+                ).dagster_event.event_specific_data.step_output_handle
+                for (json_str,) in results
+            }
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+    def _get_step_stats_events(self, run_id, step_keys=None):
+        return self._get_step_stats_events_for_runs([run_id], step_keys)[run_id]
+
+    def _multi_run_connection(self, run_ids):
+        # queries spanning several runs are only issued against storages that keep every run in
+        # the same database, see the sharded sqlite storage
+        return self.run_connection(run_ids[0] if len(run_ids) == 1 else None)
+
+    def _get_step_stats_events_for_runs(
+        self, run_ids, step_keys=None, event_types=STEP_STATS_EVENT_TYPES
+    ):
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                        DagsterEventType.ENGINE_EVENT.value,
-                    ]
+                    [event_type.value for event_type in event_types]
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
@@ -421,19 +583,217 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
                 SqlEventLogStorageTable.c.step_key.in_(step_keys)
             )
 
-        with self.run_connection(run_id) as conn:
+        with self._multi_run_connection(run_ids) as conn:
             results = conn.execute(raw_event_query).fetchall()
 
+        records_by_run_id: Dict[str, List[EventLogEntry]] = {run_id: [] for run_id in run_ids}
+        for (run_id, json_str) in results:
+            try:
+                records_by_run_id[run_id].append(
+                    check.inst_param(
+                        deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+                    )
+                )
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        return records_by_run_id
+
+    def _get_step_stats_from_table(self, run_ids, step_keys=None):
+        query = (
+            db.select([StepStatsTable.c.run_id, StepStatsTable.c.stats_body])
+            .where(StepStatsTable.c.run_id.in_(run_ids))
+            .order_by(StepStatsTable.c.id.asc())
+        )
+        if step_keys:
+            query = query.where(StepStatsTable.c.step_key.in_(step_keys))
+
+        with self._multi_run_connection(run_ids) as conn:
+            results = conn.execute(query).fetchall()
+
+        accumulators_by_run_id: Dict[str, Dict[str, StepStatsAccumulator]] = {
+            run_id: OrderedDict() for run_id in run_ids
+        }
+        for (run_id, stats_body) in results:
+            try:
+                accumulator = deserialize_as(stats_body, StepStatsAccumulator)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            accumulators_by_run_id[run_id][accumulator.step_key] = accumulator
+
+        # the step stats rows leave out the materialization and expectation events, which are read
+        # from the event log instead
+        records_by_run_id = self._get_step_stats_events_for_runs(
+            run_ids, step_keys, event_types=STEP_STATS_COLLECTED_EVENT_TYPES
+        )
+        for run_id, records in records_by_run_id.items():
+            accumulators = accumulators_by_run_id[run_id]
+            for record in records:
+                step_key = record.dagster_event.step_key
+                if step_key in accumulators:
+                    accumulators[step_key] = accumulators[step_key].with_event(record)
+
+        step_stats_by_run_id: Dict[str, List[RunStepKeyStatsSnapshot]] = {}
+        for run_id, accumulators in accumulators_by_run_id.items():
+            step_stats = [accumulator.to_snapshot() for accumulator in accumulators.values()]
+            step_stats_by_run_id[run_id] = [stats for stats in step_stats if stats]
+
+        return step_stats_by_run_id
+
+    def _should_write_step_stats(self):
+        return self.has_secondary_index(STEP_STATS_TABLE)
+
+    def _update_step_stats(self, conn, run_id, events):
+        """Folds the given events into the step stats rows for the run, using the given connection
+        so that the update can share a transaction with the event inserts.
+
+        Rows are updated with a compare-and-swap on the version column, so concurrent writers for
+        the same step (e.g. an orchestrating process and a step worker) do not drop each other's
+        updates. The last row this storage wrote for a step is cached, so that a step's first
+        events are a single insert and its later events a single conditional update. Only a writer
+        that loses a race reads the row before retrying.
+
+        The materialization and expectation events of the step are not kept in the row, so that the
+        size of each update does not grow with the number of events the step has emitted.
+
+        Returns the rows that were written, to pass to `_cache_step_stats_rows` once the
+        transaction they were written in has committed.
+        """
+        events_by_step_key: Dict[str, List[EventLogEntry]] = OrderedDict()
+        for event in events:
+            if is_step_stats_event(event):
+                events_by_step_key.setdefault(event.dagster_event.step_key, []).append(event)
+
+        written_rows = {}
+        for step_key, step_events in events_by_step_key.items():
+            cached_row = self._step_stats_row_cache.get((run_id, step_key))
+            if cached_row:
+                row_id, version, accumulator = cached_row
+                written_row = self._swap_step_stats_row(
+                    conn, row_id, version, accumulator, step_events
+                )
+            else:
+                written_row = self._insert_new_step_stats_row(conn, run_id, step_key, step_events)
+
+            lost_insert = not cached_row and not written_row
+            while not written_row:
+                row = conn.execute(
+                    db.select(
+                        [StepStatsTable.c.id, StepStatsTable.c.stats_body, StepStatsTable.c.version]
+                    )
+                    .where(StepStatsTable.c.run_id == run_id)
+                    .where(StepStatsTable.c.step_key == step_key)
+                    .limit(1)
+                ).fetchone()
+                if row:
+                    row_id, stats_body, version = row
+                    written_row = self._swap_step_stats_row(
+                        conn,
+                        row_id,
+                        version,
+                        deserialize_as(stats_body, StepStatsAccumulator),
+                        step_events,
+                    )
+                else:
+                    check.invariant(
+                        not lost_insert,
+                        f"Could not insert or find the step stats row for step {step_key} of run "
+                        f"{run_id}",
+                    )
+                    written_row = self._insert_new_step_stats_row(
+                        conn, run_id, step_key, step_events
+                    )
+                    lost_insert = not written_row
+
+            written_rows[(run_id, step_key)] = written_row
+
+        return written_rows
+
+    def _swap_step_stats_row(self, conn, row_id, version, accumulator, events):
+        accumulator = _fold_step_stats_events(accumulator, events)
+        result = conn.execute(
+            StepStatsTable.update()  # pylint: disable=no-value-for-parameter
+            .where(StepStatsTable.c.id == row_id)
+            .where(StepStatsTable.c.version == version)
+            .values(
+                stats_body=serialize_dagster_namedtuple(accumulator),
+                version=version + 1,
+                update_timestamp=pendulum.now("UTC"),
+            )
+        )
+        if not result.rowcount:
+            return None
+
+        return (row_id, version + 1, accumulator)
+
+    def _insert_new_step_stats_row(self, conn, run_id, step_key, events):
+        accumulator = _fold_step_stats_events(StepStatsAccumulator(run_id, step_key), events)
+        row_id = self._insert_step_stats_row(
+            conn, run_id, step_key, serialize_dagster_namedtuple(accumulator)
+        )
+        if row_id is None:
+            return None
+
+        return (row_id, 0, accumulator)
+
+    def _insert_step_stats_row(self, conn, run_id, step_key, stats_body):
+        """Inserts the first step stats row for a step, returning its id, or None if another writer
+        inserted it first.
+
+        Storages that write step stats inside a transaction that a failed statement aborts (e.g.
+        Postgres) must override this method to insert without raising on conflict.
+        """
         try:
-            records = [
-                check.inst_param(
-                    deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
+            result = conn.execute(
+                StepStatsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                    run_id=run_id,
+                    step_key=step_key,
+                    stats_body=stats_body,
+                    version=0,
                 )
-                for (json_str,) in results
-            ]
-            return build_run_step_stats_from_events(run_id, records)
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            )
+        except db.exc.IntegrityError:
+            return None
+
+        return result.inserted_primary_key[0]
+
+    @property
+    def _step_stats_row_cache(self):
+        # created on first use, since storages do not call a base class initializer
+        if "_step_stats_rows" not in self.__dict__:
+            self.__dict__["_step_stats_rows"] = OrderedDict()
+        return self.__dict__["_step_stats_rows"]
+
+    def _cache_step_stats_rows(self, written_rows):
+        """Caches the step stats rows written by `_update_step_stats`, once they are committed."""
+        cache = self._step_stats_row_cache
+        for key, written_row in written_rows.items():
+            cache.pop(key, None)
+            cache[key] = written_row
+        while len(cache) > STEP_STATS_ROW_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def rebuild_step_stats_for_run(self, run_id):
+        """Rebuilds the step stats table rows for a run from its stored step events."""
+        check.str_param(run_id, "run_id")
+        records = self._get_step_stats_events(run_id)
+
+        with self.run_connection(run_id) as conn:
+            # runs stored before the step stats table was added may be missing the table
+            StepStatsTable.create(conn, checkfirst=True)
+            with conn.begin():
+                conn.execute(
+                    StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        StepStatsTable.c.run_id == run_id
+                    )
+                )
+                step_stats_rows = self._update_step_stats(conn, run_id, records)
+        self._cache_step_stats_rows(step_stats_rows)
+
+    def get_all_run_ids(self):
+        query = db.select([SqlEventLogStorageTable.c.run_id]).distinct()
+        with self.index_connection() as conn:
+            return [run_id for (run_id,) in conn.execute(query).fetchall() if run_id]
 
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
@@ -464,13 +824,18 @@ def wipe(self):
         # run_id
 
         # https://stackoverflow.com/a/54386260/324449
+        wipe_step_stats = self.has_secondary_index(STEP_STATS_TABLE)
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if wipe_step_stats:
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if wipe_step_stats:
+                conn.execute(StepStatsTable.delete())  # pylint: disable=no-value-for-parameter
 
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
@@ -496,6 +861,12 @@ def delete_events_for_run(self, conn, run_id):
             for row in conn.execute(removed_asset_key_query).fetchall()
         ]
         conn.execute(delete_statement)
+        if self.has_secondary_index(STEP_STATS_TABLE):
+            conn.execute(
+                StepStatsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                    StepStatsTable.c.run_id == run_id
+                )
+            )
         if len(removed_asset_keys) > 0:
             keys_to_check = []
             keys_to_check.extend([key.to_string() for key in removed_asset_keys])
@@ -117,10 +117,12 @@ def upgrade(self):
             run_alembic_upgrade(alembic_config, conn)
 
     def has_secondary_index(self, name):
+        # only applied migrations are cached, so that a migration applied by another process (e.g.
+        # `dagster instance reindex`) is picked up without restarting this one
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                ConsolidatedSqliteEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(ConsolidatedSqliteEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):
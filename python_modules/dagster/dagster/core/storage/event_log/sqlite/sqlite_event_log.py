@@ -36,8 +36,14 @@
 )
 from dagster.utils import mkdir_p
 
+from ..migration import EVENT_LOG_DATA_MIGRATIONS, SECONDARY_INDEX_ASSET_KEY
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import (
+    RunShardedEventsCursor,
+    SqlEventLogStorage,
+    group_events_by_run_id,
+    is_step_stats_event,
+)
 
 INDEX_SHARD_NAME = "index"
 
@@ -83,13 +89,25 @@ def __init__(self, base_dir, inst_data=None):
         self._initialized_dbs = set()
 
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
-        self._db_lock = threading.Lock()
+        self._db_lock = threading.RLock()
+
+        self._secondary_index_cache = {}
 
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
             conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
             engine = create_engine(conn_string, poolclass=NullPool)
             self._initdb(engine)
-            self.reindex_events()
+            if self.get_all_run_ids():
+                # run shards that predate the index shard may need a schema upgrade before their
+                # step stats can be rebuilt, so leave that migration to `dagster instance reindex`
+                self._apply_migration(
+                    SECONDARY_INDEX_ASSET_KEY,
+                    EVENT_LOG_DATA_MIGRATIONS[SECONDARY_INDEX_ASSET_KEY],
+                    print_fn=None,
+                    force=False,
+                )
+            else:
+                self.reindex_events()
             self.reindex_assets()
 
         super().__init__()
@@ -184,6 +202,15 @@ def _initdb(self, engine):
                     time.sleep(0.2)
                     retry_limit -= 1
 
+    def has_secondary_index(self, name):
+        # only applied migrations are cached, so that a migration applied by another process (e.g.
+        # `dagster instance reindex`) is picked up without restarting this one
+        if name not in self._secondary_index_cache:
+            if not super(SqliteEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
+        return self._secondary_index_cache[name]
+
     @contextmanager
     def _connect(self, shard):
         with self._db_lock:
@@ -221,9 +248,12 @@ def store_event(self, event):
         check.inst_param(event, "event", EventLogEntry)
         insert_event_statement = self.prepare_insert_event(event)
         run_id = event.run_id
+        write_step_stats = is_step_stats_event(event) and self._should_write_step_stats()
 
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
+            if write_step_stats:
+                self._cache_step_stats_rows(self._update_step_stats(conn, run_id, [event]))
 
         if event.is_dagster_event and event.dagster_event.asset_key:
             check.invariant(
@@ -244,6 +274,68 @@ def store_event(self, event):
             ):
                 self.store_asset_event(event)
 
+    def store_events(self, events):
+        """
+        Overridden method to write each run's events to its own shard in a single transaction, and
+        to mirror the batch's asset events into the central assets.db shard in a second one.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        write_step_stats = (
+            self._should_write_step_stats()
+            if any(is_step_stats_event(event) for event in events)
+            else False
+        )
+        for run_id, run_events in group_events_by_run_id(events).items():
+            step_stats_rows = {}
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                        [self._get_event_insert_values(event) for event in run_events],
+                    )
+                    if write_step_stats:
+                        step_stats_rows = self._update_step_stats(conn, run_id, run_events)
+            self._cache_step_stats_rows(step_stats_rows)
+
+        asset_events = [
+            event for event in events if event.is_dagster_event and event.dagster_event.asset_key
+        ]
+        if not asset_events:
+            return
+
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+                or event.dagster_event_type == DagsterEventType.ASSET_OBSERVATION
+                or event.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                "Can only store asset materializations, materialization_planned, and observations in index database",
+            )
+
+        write_asset_key_index_cols = self._should_write_asset_key_index_cols()
+        with self.index_connection() as conn:
+            with conn.begin():
+                # mirror the events in the cross-run index database
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),  # pylint: disable=no-value-for-parameter
+                    [self._get_event_insert_values(event) for event in asset_events],
+                )
+                for event in asset_events:
+                    self._update_asset_entry(
+                        conn,
+                        event,
+                        self._get_asset_entry_values(event, write_asset_key_index_cols),
+                    )
+
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        """Overridden method to fetch the step stats from each run's shard in turn, since the
+        events for different runs are stored in separate databases."""
+        check.list_param(run_ids, "run_ids", of_type=str)
+        return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
     def get_event_records(
         self,
         event_records_filter: Optional[EventRecordsFilter] = None,
@@ -363,6 +455,7 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
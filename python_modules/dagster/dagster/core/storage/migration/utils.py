@@ -307,3 +307,28 @@ def create_tick_selector_index():
     op.create_index(
         "idx_tick_selector_timestamp", "job_ticks", ["selector_id", "timestamp"], unique=False
     )
+
+
+def create_step_stats_table():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("step_stats"):
+        op.create_table(
+            "step_stats",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("step_key", db.Text, nullable=False),
+            db.Column("stats_body", db.Text, nullable=False),
+            db.Column("version", db.Integer, nullable=False),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index("step_stats", "idx_step_stats_run_step"):
+        op.create_index(
+            "idx_step_stats_run_step",
+            "step_stats",
+            ["run_id", "step_key"],
+            unique=True,
+            mysql_length={"step_key": 512},
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -39,6 +39,19 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: Sequence[PipelineRun]) -> List[PipelineRun]:
+        """Add several runs to storage, e.g. when creating the runs of a backfill.
+
+        Raises DagsterRunAlreadyExists or DagsterSnapshotDoesNotExist as add_run does. Storages
+        that can write several runs in a single transaction should override this method, in which
+        case none of the runs are added if one of them can not be. The default implementation adds
+        the runs one at a time.
+
+        Args:
+            pipeline_runs (Sequence[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         """Update run storage in accordance to a pipeline run related DagsterEvent
@@ -69,6 +82,85 @@ def get_runs(
             List[PipelineRun]
         """
 
+    def get_latest_runs_by_tag_values(
+        self,
+        tag_key: str,
+        tag_values: Sequence[str],
+        filters: Optional[RunsFilter] = None,
+    ) -> Dict[str, PipelineRun]:
+        """Return the most recent run for each of the given values of a tag, e.g. the latest run
+        launched for each of a set of run keys.
+
+        Storages should override this to resolve all of the values in a single query. The default
+        implementation issues one query per tag value.
+
+        Args:
+            tag_key (str): The tag to look up.
+            tag_values (Sequence[str]): The tag values to fetch the latest run for.
+            filters (Optional[RunsFilter]): Additional filters that the runs must match.
+
+        Returns:
+            Dict[str, PipelineRun]: The latest matching run, keyed by tag value. Tag values with no
+                matching runs are omitted.
+        """
+        filters = filters if filters else RunsFilter()
+        latest_runs = {}
+        for tag_value in tag_values:
+            runs = self.get_runs(
+                filters=filters._replace(tags={**filters.tags, tag_key: tag_value}), limit=1
+            )
+            if runs:
+                latest_runs[tag_value] = list(runs)[0]
+        return latest_runs
+
+    def get_run_ids_with_tags(
+        self,
+        filters: Optional[RunsFilter] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        priority_tag_key: Optional[str] = None,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """Return the ids of the runs that match the given filters, most recent first, along with
+        each run's values for the given tag keys.
+
+        This lets callers that only need run ids and a handful of tags, like the run queue, scan
+        many runs without loading their bodies. Storages should override this to read the run ids
+        and tags directly. The default implementation loads the matching runs.
+
+        Args:
+            filters (Optional[RunsFilter]): The filters that the runs must match.
+            tag_keys (Optional[Sequence[str]]): The tags to fetch for each run.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            priority_tag_key (Optional[str]): If set, order the runs by the integer value of this
+                tag, highest first, and then oldest first. Runs without the tag, or with a value
+                that is not an integer, have a priority of 0.
+
+        Returns:
+            List[Tuple[str, Dict[str, str]]]: The run ids, each with a dict of the requested tags
+                that are set on that run.
+        """
+        tag_keys = tag_keys or []
+        if not priority_tag_key:
+            runs = list(self.get_runs(filters=filters, limit=limit))
+        else:
+
+            def get_priority(run):
+                try:
+                    return int(run.tags.get(priority_tag_key, "0"))
+                except ValueError:
+                    return 0
+
+            # sorted is stable, so runs of the same priority stay oldest first
+            runs = sorted(
+                reversed(list(self.get_runs(filters=filters))), key=get_priority, reverse=True
+            )
+            runs = runs[:limit] if limit else runs
+
+        return [
+            (run.run_id, {key: run.tags[key] for key in tag_keys if key in run.tags})
+            for run in runs
+        ]
+
     @abstractmethod
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         """Return the number of runs present in the storage that match the given filters.
@@ -311,6 +403,24 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        """Fetch several execution plan snapshots by ID. Ids that are not found are omitted from
+        the result.
+
+        Args:
+            execution_plan_snapshot_ids (Sequence[str])
+
+        Returns:
+            Dict[str, ExecutionPlanSnapshot]
+        """
+        snapshots = {}
+        for snapshot_id in set(execution_plan_snapshot_ids):
+            if self.has_execution_plan_snapshot(snapshot_id):
+                snapshots[snapshot_id] = self.get_execution_plan_snapshot(snapshot_id)
+        return snapshots
+
     @abstractmethod
     def wipe(self):
         """Clears the run storage."""
@@ -329,8 +439,20 @@ def get_run_partition_data(
         partition_set_name: str,
         job_name: str,
         repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
     ) -> List[RunPartitionData]:
-        """Get run partition data for a given partitioned job."""
+        """Get the latest run for each partition of a given partitioned job.
+
+        Args:
+            partition_set_name (str): The name of the partition set.
+            job_name (str): The name of the partitioned job.
+            repository_label (str): The origin id of the repository containing the job.
+            partition_names (Optional[Sequence[str]]): If set, only return data for these
+                partitions, e.g. to fetch a single page of partitions.
+
+        Returns:
+            List[RunPartitionData]: One entry per partition that has runs, most recent first.
+        """
 
     def migrate(self, print_fn: Optional[Callable] = None, force_rebuild_all: bool = False):
         """Call this method to run any required data migrations"""
@@ -1,5 +1,5 @@
 from collections import OrderedDict, defaultdict
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union, cast
 
 import dagster._check as check
 from dagster.core.errors import (
@@ -151,6 +151,28 @@ def get_runs(
             results.append(run)
         return results
 
+    def get_latest_runs_by_tag_values(
+        self,
+        tag_key: str,
+        tag_values: Sequence[str],
+        filters: Optional[RunsFilter] = None,
+    ) -> Dict[str, PipelineRun]:
+        check.str_param(tag_key, "tag_key")
+        check.sequence_param(tag_values, "tag_values", of_type=str)
+        check.opt_inst_param(filters, "filters", RunsFilter)
+
+        remaining = set(tag_values)
+        latest_runs = {}
+        run_filter = build_run_filter(filters)
+        for run in reversed(self._runs.values()):
+            if not remaining:
+                break
+            tag_value = run.tags.get(tag_key)
+            if tag_value in remaining and run_filter(run):
+                latest_runs[tag_value] = run
+                remaining.remove(tag_value)
+        return latest_runs
+
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         check.opt_inst_param(filters, "filters", RunsFilter)
 
@@ -339,11 +361,16 @@ def get_run_groups(
         }
 
     def get_run_partition_data(
-        self, partition_set_name: str, job_name: str, repository_label: str
+        self,
+        partition_set_name: str,
+        job_name: str,
+        repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
     ) -> List[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
         check.str_param(partition_set_name, "partition_set_name")
         check.str_param(job_name, "job_name")
+        check.opt_sequence_param(partition_names, "partition_names", of_type=str)
 
         run_filter = build_run_filter(
             RunsFilter(pipeline_name=job_name, tags={PARTITION_SET_TAG: partition_set_name})
@@ -354,6 +381,8 @@ def get_run_partition_data(
             partition = run.tags.get(PARTITION_NAME_TAG)
             if not partition or partition in _partition_data_by_partition:
                 continue
+            if partition_names is not None and partition not in partition_names:
+                continue
 
             _partition_data_by_partition[partition] = RunPartitionData(
                 run_id=run.run_id,
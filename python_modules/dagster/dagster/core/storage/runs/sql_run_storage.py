@@ -5,7 +5,7 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import pendulum
 import sqlalchemy as db
@@ -29,9 +29,13 @@
 from dagster.daemon.types import DaemonHeartbeat
 from dagster.serdes import (
     deserialize_as,
+    deserialize_dagster_namedtuple_from_bytes,
     deserialize_json_to_dagster_namedtuple,
+    is_binary_serialized,
     serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_to_bytes,
 )
+from dagster.serdes.errors import DeserializationError
 from dagster.seven import JSONDecodeError
 from dagster.utils import merge_dicts, utc_datetime_from_timestamp
 
@@ -56,6 +60,9 @@
     SnapshotsTable,
 )
 
+# the maximum number of tag values bound in a single query
+TAG_VALUES_QUERY_CHUNK_SIZE = 900
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -134,6 +141,78 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
 
         return pipeline_run
 
+    def add_runs(self, pipeline_runs: Sequence[PipelineRun]) -> List[PipelineRun]:
+        check.sequence_param(pipeline_runs, "pipeline_runs", of_type=PipelineRun)
+        if not pipeline_runs:
+            return []
+
+        snapshot_ids = {
+            pipeline_run.pipeline_snapshot_id
+            for pipeline_run in pipeline_runs
+            if pipeline_run.pipeline_snapshot_id
+        }
+        if snapshot_ids:
+            existing_snapshot_ids = {
+                row[0]
+                for row in self.fetchall(
+                    db.select([SnapshotsTable.c.snapshot_id]).where(
+                        SnapshotsTable.c.snapshot_id.in_(list(snapshot_ids))
+                    )
+                )
+            }
+            missing_snapshot_ids = snapshot_ids - existing_snapshot_ids
+            if missing_snapshot_ids:
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(
+                        ss_id=sorted(missing_snapshot_ids)[0]
+                    )
+                )
+
+        run_rows = []
+        tag_rows = []
+        for pipeline_run in pipeline_runs:
+            has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
+            run_rows.append(
+                dict(
+                    run_id=pipeline_run.run_id,
+                    pipeline_name=pipeline_run.pipeline_name,
+                    status=pipeline_run.status.value,
+                    run_body=serialize_dagster_namedtuple(pipeline_run),
+                    snapshot_id=pipeline_run.pipeline_snapshot_id,
+                    partition=pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None,
+                    partition_set=pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None,
+                )
+            )
+            tag_rows.extend(
+                dict(run_id=pipeline_run.run_id, key=k, value=v)
+                for k, v in pipeline_run.tags_for_storage().items()
+            )
+
+        with self.connect() as conn:
+            conn = self._transaction_connection(conn)
+            with conn.begin():
+                try:
+                    conn.execute(
+                        RunsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        run_rows,
+                    )
+                except db.exc.IntegrityError as exc:
+                    raise DagsterRunAlreadyExists from exc
+
+                if tag_rows:
+                    conn.execute(
+                        RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
+                        tag_rows,
+                    )
+
+        return list(pipeline_runs)
+
+    def _transaction_connection(self, conn):
+        """Returns the connection to run the statements of a transaction on. Storages whose engines
+        autocommit every statement must override this, so that `conn.begin()` starts a transaction.
+        """
+        return conn
+
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -379,6 +458,124 @@ def get_runs(
         rows = self.fetchall(query)
         return self._rows_to_runs(rows)
 
+    def get_latest_runs_by_tag_values(
+        self,
+        tag_key: str,
+        tag_values: Sequence[str],
+        filters: Optional[RunsFilter] = None,
+    ) -> Dict[str, PipelineRun]:
+        check.str_param(tag_key, "tag_key")
+        check.sequence_param(tag_values, "tag_values", of_type=str)
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+
+        if not tag_values:
+            return {}
+
+        # query the tag values in chunks, to stay under the bound parameter limits of the
+        # supported databases
+        latest_runs = {}
+        for i in range(0, len(tag_values), TAG_VALUES_QUERY_CHUNK_SIZE):
+            chunk = tag_values[i : i + TAG_VALUES_QUERY_CHUNK_SIZE]
+            latest_ids = self._latest_run_ids_by_tag_value_query(tag_key, chunk, filters)
+            query = db.select([latest_ids.c.tag_value, RunsTable.c.run_body]).select_from(
+                RunsTable.join(latest_ids, RunsTable.c.id == latest_ids.c.id)
+            )
+            for tag_value, run_body in self.fetchall(query):
+                latest_runs[tag_value] = deserialize_as(run_body, PipelineRun)
+        return latest_runs
+
+    def _latest_run_ids_by_tag_value_query(
+        self, tag_key: str, tag_values: Optional[Sequence[str]], filters: RunsFilter
+    ):
+        # find the max run id for each tag value using the (key, value) run tags index, without
+        # relying on window functions so that this works on every supported database version. If
+        # tag_values is None, every value of the tag is included.
+        latest_ids_query = (
+            db.select(
+                [RunTagsTable.c.value.label("tag_value"), db.func.max(RunsTable.c.id).label("id")]
+            )
+            .select_from(RunsTable.join(RunTagsTable, RunsTable.c.run_id == RunTagsTable.c.run_id))
+            .where(RunTagsTable.c.key == tag_key)
+        )
+        if tag_values is not None:
+            latest_ids_query = latest_ids_query.where(RunTagsTable.c.value.in_(list(tag_values)))
+        latest_ids_query = self._add_filters_to_query(latest_ids_query, filters._replace(tags={}))
+        for key, value in filters.tags.items():
+            filter_tags = RunTagsTable.alias()
+            latest_ids_query = latest_ids_query.where(
+                RunsTable.c.run_id.in_(
+                    db.select([filter_tags.c.run_id]).where(
+                        db.and_(filter_tags.c.key == key, filter_tags.c.value == value)
+                    )
+                )
+            )
+        return latest_ids_query.group_by(RunTagsTable.c.value).alias("latest_ids")
+
+    def get_run_ids_with_tags(
+        self,
+        filters: Optional[RunsFilter] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        priority_tag_key: Optional[str] = None,
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        tag_keys = check.opt_sequence_param(tag_keys, "tag_keys", of_type=str)
+        check.opt_str_param(priority_tag_key, "priority_tag_key")
+
+        if not priority_tag_key:
+            run_ids_query = self._runs_query(filters=filters, limit=limit, columns=["run_id"])
+        else:
+            filtered_runs = (
+                self._runs_query(filters=filters, columns=["id", "run_id"])
+                .order_by(None)
+                .alias("filtered_runs")
+            )
+            priority_tags = RunTagsTable.alias("priority_tags")
+            run_ids_query = (
+                db.select([filtered_runs.c.run_id])
+                .select_from(
+                    filtered_runs.outerjoin(
+                        priority_tags,
+                        db.and_(
+                            priority_tags.c.run_id == filtered_runs.c.run_id,
+                            priority_tags.c.key == priority_tag_key,
+                        ),
+                    )
+                )
+                .order_by(
+                    self._tag_value_as_integer(priority_tags.c.value).desc(),
+                    filtered_runs.c.id.asc(),
+                )
+            )
+            if limit:
+                run_ids_query = run_ids_query.limit(limit)
+
+        run_ids = [row[0] for row in self.fetchall(run_ids_query)]
+        if not run_ids or not tag_keys:
+            return [(run_id, {}) for run_id in run_ids]
+
+        # join against the run ids query rather than listing the ids, which may be many
+        run_ids_subquery = run_ids_query.alias("run_ids")
+        tags_query = (
+            db.select([RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value])
+            .select_from(
+                RunTagsTable.join(
+                    run_ids_subquery, RunTagsTable.c.run_id == run_ids_subquery.c.run_id
+                )
+            )
+            .where(RunTagsTable.c.key.in_(list(tag_keys)))
+        )
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for run_id, key, value in self.fetchall(tags_query):
+            tags_by_run_id[run_id][key] = value
+
+        return [(run_id, tags_by_run_id.get(run_id, {})) for run_id in run_ids]
+
+    def _tag_value_as_integer(self, value):
+        """Returns an expression for a tag value as an integer, which is 0 for values that are not
+        integers."""
+        as_integer = db.cast(value, db.BigInteger)
+        return db.case([(db.cast(as_integer, db.Text) == value, as_integer)], else_=0)
+
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         subquery = self._runs_query(filters=filters).alias("subquery")
 
@@ -754,22 +951,56 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        check.sequence_param(
+            execution_plan_snapshot_ids, "execution_plan_snapshot_ids", of_type=str
+        )
+        if not execution_plan_snapshot_ids:
+            return {}
+
+        query = db.select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+            SnapshotsTable.c.snapshot_id.in_(set(execution_plan_snapshot_ids))
+        )
+
+        with self.connect() as conn:
+            rows = conn.execute(query).fetchall()
+
+        snapshots = {}
+        for row in rows:
+            snapshot = defensively_unpack_pipeline_snapshot_query(logging, [row.snapshot_body])
+            if snapshot:
+                snapshots[row.snapshot_id] = snapshot
+        return snapshots
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        # snapshots are written in the binary serdes format if the instance opts in; reads handle
+        # either format
+        serialized_snapshot = (
+            serialize_dagster_namedtuple_to_bytes(snapshot_obj)
+            if self._instance and self._instance.use_binary_snapshots
+            else serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
+        )
+
         with self.connect() as conn:
             snapshot_insert = (
                 SnapshotsTable.insert().values(  # pylint: disable=no-value-for-parameter
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(
-                        serialize_dagster_namedtuple(snapshot_obj).encode("utf-8")
-                    ),
+                    snapshot_body=zlib.compress(serialized_snapshot),
                     snapshot_type=snapshot_type.value,
                 )
             )
-            conn.execute(snapshot_insert)
+            try:
+                conn.execute(snapshot_insert)
+            except db.exc.IntegrityError:
+                # snapshot ids are content hashes, so a concurrent writer that added the same id,
+                # e.g. while creating runs for a backfill on several threads, wrote the same body
+                pass
             return snapshot_id
 
     def get_run_storage_id(self) -> str:
@@ -802,61 +1033,91 @@ def _get_snapshot(self, snapshot_id: str):
         return defensively_unpack_pipeline_snapshot_query(logging, row) if row else None
 
     def get_run_partition_data(
-        self, partition_set_name: str, job_name: str, repository_label: str
+        self,
+        partition_set_name: str,
+        job_name: str,
+        repository_label: str,
+        partition_names: Optional[Sequence[str]] = None,
     ) -> List[RunPartitionData]:
+        check.str_param(partition_set_name, "partition_set_name")
+        check.str_param(job_name, "job_name")
+        check.opt_sequence_param(partition_names, "partition_names", of_type=str)
+
+        if partition_names is not None and not partition_names:
+            return []
+
+        # Only the latest run for each partition is fetched, by grouping on the partition and
+        # joining back against the max run id, rather than scanning every run in the partition set
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
-            query = self._runs_query(
-                filters=RunsFilter(
-                    pipeline_name=job_name,
-                    tags={
-                        PARTITION_SET_TAG: partition_set_name,
-                    },
-                ),
-                columns=["run_id", "status", "start_time", "end_time", "partition"],
+            latest_ids_query = (
+                db.select([db.func.max(RunsTable.c.id).label("id")])
+                .where(RunsTable.c.partition_set == partition_set_name)
+                .where(RunsTable.c.pipeline_name == job_name)
+                .where(RunsTable.c.partition != None)
             )
-            rows = self.fetchall(query)
+            if partition_names is not None:
+                latest_ids_query = latest_ids_query.where(
+                    RunsTable.c.partition.in_(list(partition_names))
+                )
+            latest_ids = latest_ids_query.group_by(RunsTable.c.partition).alias("latest_ids")
 
-            # dedup by partition
-            _partition_data_by_partition = {}
-            for row in rows:
-                if not row["partition"] or row["partition"] in _partition_data_by_partition:
-                    continue
+            query = (
+                db.select(
+                    [
+                        RunsTable.c.run_id,
+                        RunsTable.c.status,
+                        RunsTable.c.start_time,
+                        RunsTable.c.end_time,
+                        RunsTable.c.partition,
+                    ]
+                )
+                .select_from(RunsTable.join(latest_ids, RunsTable.c.id == latest_ids.c.id))
+                .order_by(RunsTable.c.id.desc())
+            )
+            rows = self.fetchall(query)
 
-                _partition_data_by_partition[row["partition"]] = RunPartitionData(
+            return [
+                RunPartitionData(
                     run_id=row["run_id"],
                     partition=row["partition"],
                     status=DagsterRunStatus[row["status"]],
                     start_time=row["start_time"],
                     end_time=row["end_time"],
                 )
-
-            return list(_partition_data_by_partition.values())
+                for row in rows
+                if row["partition"]
+            ]
         else:
-            query = self._runs_query(
-                filters=RunsFilter(
-                    pipeline_name=job_name,
-                    tags={
-                        PARTITION_SET_TAG: partition_set_name,
-                    },
-                ),
+            latest_ids = self._latest_run_ids_by_tag_value_query(
+                PARTITION_NAME_TAG,
+                partition_names,
+                RunsFilter(pipeline_name=job_name, tags={PARTITION_SET_TAG: partition_set_name}),
+            )
+            query = (
+                db.select([RunsTable.c.run_body, latest_ids.c.tag_value])
+                .select_from(RunsTable.join(latest_ids, RunsTable.c.id == latest_ids.c.id))
+                .order_by(RunsTable.c.id.desc())
             )
             rows = self.fetchall(query)
-            _partition_data_by_partition = {}
+
+            partition_data = []
             for row in rows:
                 run = self._row_to_run(row)
-                partition = run.tags.get(PARTITION_NAME_TAG)
-                if not partition or partition in _partition_data_by_partition:
+                partition = row[1]
+                if not partition:
                     continue
 
-                _partition_data_by_partition[partition] = RunPartitionData(
-                    run_id=run.run_id,
-                    partition=partition,
-                    status=run.status,
-                    start_time=None,
-                    end_time=None,
+                partition_data.append(
+                    RunPartitionData(
+                        run_id=run.run_id,
+                        partition=partition,
+                        status=run.status,
+                        start_time=None,
+                        end_time=None,
+                    )
                 )
 
-            return list(_partition_data_by_partition.values())
+            return partition_data
 
     def _get_partition_runs(
         self, partition_set_name: str, partition_name: str
@@ -1068,6 +1329,13 @@ def _warn(msg):
         _warn("Could not decompress bytes stored in snapshot table.")
         return None
 
+    if is_binary_serialized(uncompressed_bytes):
+        try:
+            return deserialize_dagster_namedtuple_from_bytes(uncompressed_bytes)
+        except DeserializationError:
+            _warn("Could not parse binary serialized snapshot in snapshot table.")
+            return None
+
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
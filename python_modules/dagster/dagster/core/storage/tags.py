@@ -39,6 +39,8 @@
 
 PRIORITY_TAG = "{prefix}priority".format(prefix=SYSTEM_TAG_PREFIX)
 
+STEP_SLOTS_TAG_PREFIX = "{prefix}slots/".format(prefix=SYSTEM_TAG_PREFIX)
+
 DOCKER_IMAGE_TAG = "{prefix}image".format(prefix=SYSTEM_TAG_PREFIX)
 
 USER_EDITABLE_SYSTEM_TAGS = [PRIORITY_TAG]
@@ -4,6 +4,8 @@
 import warnings
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import ExitStack
 from typing import TYPE_CHECKING, Dict, List, Optional, Union, cast
 
@@ -11,6 +13,7 @@
 from dagster.core.errors import (
     DagsterRepositoryLocationLoadError,
     DagsterRepositoryLocationNotFoundError,
+    DagsterUserCodeUnreachableError,
 )
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.host_representation import (
@@ -367,6 +370,12 @@ def __exit__(self, exception_type, exception_value, traceback):
         pass
 
 
+def _cleanup_timed_out_location_entry(future: "Future[WorkspaceLocationEntry]") -> None:
+    entry = future.result()
+    if entry.repository_location:
+        entry.repository_location.cleanup()
+
+
 class WorkspaceProcessContext(IWorkspaceProcessContext):
     """
     This class is a process-scoped object that:
@@ -458,17 +467,88 @@ def _load_workspace(self):
 
         self._location_entry_dict = OrderedDict()
 
+        location_names = set()
         for origin in repository_location_origins:
             check.invariant(
-                self._location_entry_dict.get(origin.location_name) is None,
+                origin.location_name not in location_names,
                 'Cannot have multiple locations with the same name, got multiple "{name}"'.format(
                     name=origin.location_name,
                 ),
             )
+            location_names.add(origin.location_name)
+
+        if not repository_location_origins:
+            return
+
+        # Locations are loaded concurrently, since each load may need to start a gRPC server and
+        # fetch its repository data. Entries are still added in the order of the workspace.
+        executor = ThreadPoolExecutor(
+            max_workers=self._instance.code_server_max_concurrent_loads,
+            thread_name_prefix="workspace_location_loader",
+        )
+        try:
+            load_start_times: Dict[str, float] = {}
+            futures = {}
+            for origin in repository_location_origins:
+                if origin.supports_server_watch:
+                    self._start_watch_thread(origin)
+                futures[origin.location_name] = executor.submit(
+                    self._load_location, origin, load_start_times
+                )
+
+            for origin in repository_location_origins:
+                self._location_entry_dict[origin.location_name] = self._get_loaded_location_entry(
+                    origin, futures[origin.location_name], load_start_times
+                )
+        finally:
+            # don't wait on loads that timed out, they are cleaned up once they finish
+            executor.shutdown(wait=False)
+
+    def _get_loaded_location_entry(
+        self,
+        origin: RepositoryLocationOrigin,
+        future: "Future[WorkspaceLocationEntry]",
+        load_start_times: Dict[str, float],
+    ) -> WorkspaceLocationEntry:
+        load_timeout = self._instance.code_server_load_timeout
+        if load_timeout is None:
+            return future.result()
 
-            if origin.supports_server_watch:
-                self._start_watch_thread(origin)
-            self._location_entry_dict[origin.location_name] = self._load_location(origin)
+        location_name = origin.location_name
+        while True:
+            # the timeout applies from when the location starts loading, not from when it is queued
+            load_start_time = load_start_times.get(location_name)
+            remaining = (
+                load_timeout
+                if load_start_time is None
+                else load_start_time + load_timeout - time.time()
+            )
+            try:
+                return future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                if load_start_time is not None:
+                    break
+
+        future.add_done_callback(_cleanup_timed_out_location_entry)
+        error = SerializableErrorInfo(
+            message=f"Timed out after {load_timeout} seconds loading repository location "
+            f"{location_name}.",
+            stack=[],
+            cls_name=DagsterUserCodeUnreachableError.__name__,
+        )
+        warnings.warn(
+            "Error loading repository location {location_name}:{error_string}".format(
+                location_name=location_name, error_string=error.to_string()
+            )
+        )
+        return WorkspaceLocationEntry(
+            origin=origin,
+            repository_location=None,
+            load_error=error,
+            load_status=WorkspaceLocationLoadStatus.LOADED,
+            display_metadata=origin.get_display_metadata(),
+            update_timestamp=time.time(),
+        )
 
     def _create_location_from_origin(
         self, origin: RepositoryLocationOrigin
@@ -542,11 +622,13 @@ def _start_watch_thread(self, origin: GrpcServerRepositoryLocationOrigin) -> Non
         self._watch_threads[location_name] = watch_thread
         watch_thread.start()
 
-    def _load_location(self, origin):
+    def _load_location(self, origin, load_start_times=None):
         assert self._lock.locked()
         location_name = origin.location_name
         location = None
         error = None
+        if load_start_times is not None:
+            load_start_times[location_name] = time.time()
         try:
             location = self._create_location_from_origin(origin)
         except Exception:
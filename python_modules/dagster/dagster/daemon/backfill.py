@@ -1,6 +1,8 @@
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 
 import dagster._check as check
 from dagster.core.errors import DagsterBackfillFailedError
@@ -35,6 +37,12 @@ def _check_for_debug_crash(debug_crash_flags, key):
 
 
 def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=None):
+    """
+    Submits the runs of requested backfills, one chunk of partitions at a time.
+
+    If the instance is configured with ``backfills: use_threads: true``, the runs in each chunk are
+    created and submitted concurrently on a pool of worker threads.
+    """
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(workspace, "workspace", IWorkspace)
 
@@ -45,6 +53,26 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
         yield
         return
 
+    with ExitStack() as stack:
+        settings = instance.get_settings("backfills")
+        if settings.get("use_threads"):
+            threadpool_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=settings.get("num_workers"),
+                    thread_name_prefix="backfill_daemon_worker",
+                )
+            )
+        else:
+            threadpool_executor = None
+
+        yield from _execute_backfills(
+            instance, workspace, logger, backfill_jobs, debug_crash_flags, threadpool_executor
+        )
+
+
+def _execute_backfills(
+    instance, workspace, logger, backfill_jobs, debug_crash_flags, threadpool_executor
+):
     for backfill_job in backfill_jobs:
         backfill_id = backfill_job.backfill_id
 
@@ -89,7 +117,12 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
 
                 if chunk:
                     for _run_id in submit_backfill_runs(
-                        instance, workspace, repo_location, backfill_job, chunk
+                        instance,
+                        workspace,
+                        repo_location,
+                        backfill_job,
+                        chunk,
+                        threadpool_executor=threadpool_executor,
                     ):
                         yield
                         # before submitting, refetch the backfill job to check for status changes
@@ -101,8 +134,12 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
 
                 if has_more:
                     # refetch, in case the backfill was updated in the meantime
-                    backfill_job = instance.get_backfill(backfill_job.backfill_id)
-                    instance.update_backfill(backfill_job.with_partition_checkpoint(checkpoint))
+                    backfill_job = instance.get_backfill(
+                        backfill_job.backfill_id
+                    ).with_partition_checkpoint(
+                        backfill_job.partition_names[checkpoint], checkpoint
+                    )
+                    instance.update_backfill(backfill_job)
                     yield
                     time.sleep(CHECKPOINT_INTERVAL)
                 else:
@@ -123,36 +160,29 @@ def execute_backfill_iteration(instance, workspace, logger, debug_crash_flags=No
 def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
     partition_names = backfill_job.partition_names
-    checkpoint = backfill_job.last_submitted_partition_name
-
-    if (
-        backfill_job.last_submitted_partition_name
-        and backfill_job.last_submitted_partition_name in partition_names
-    ):
-        index = partition_names.index(backfill_job.last_submitted_partition_name)
-        partition_names = partition_names[index + 1 :]
-
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        RunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
-    initial_checkpoint = (
-        partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
-    )
-    partition_names = partition_names[initial_checkpoint:]
-    has_more = chunk_size < len(partition_names)
-    partitions_chunk = partition_names[:chunk_size]
-    next_checkpoint = partitions_chunk[-1]
 
-    to_skip = set(partitions_chunk).intersection(completed_partitions)
-    if to_skip:
+    start = backfill_job.partition_cursor
+    partitions_chunk = partition_names[start : start + chunk_size]
+    end = start + len(partitions_chunk)
+    has_more = end < len(partition_names)
+    if not partitions_chunk:
+        return [], None, has_more
+
+    # for idempotence, fetch any runs already created for this chunk of the backfill
+    completed_partitions = instance.get_latest_runs_by_tag_values(
+        PARTITION_NAME_TAG,
+        partitions_chunk,
+        filters=RunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id)),
+    )
+    if completed_partitions:
         logger.info(
-            f"Found {len(to_skip)} existing runs for backfill {backfill_job.backfill_id}, skipping"
+            f"Found {len(completed_partitions)} existing runs for backfill "
+            f"{backfill_job.backfill_id}, skipping"
         )
     to_submit = [
         partition_name
         for partition_name in partitions_chunk
         if partition_name not in completed_partitions
     ]
-    return to_submit, next_checkpoint, has_more
+    # the checkpoint is the index of the last partition in the chunk
+    return to_submit, end - 1, has_more
@@ -2,7 +2,7 @@
 import sys
 import time
 from collections import defaultdict
-from typing import Dict
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 
 from dagster import DagsterEvent, DagsterEventType
 from dagster import _check as check
@@ -22,15 +22,21 @@
 
 class _TagConcurrencyLimitsCounter:
     """
-    Helper object that keeps track of when the tag concurrency limits are met
+    Helper object that keeps track of when the tag concurrency limits are met. It is kept up to
+    date across daemon iterations by adding and removing runs as they enter and leave the in
+    progress statuses, rather than being rebuilt from every in progress run.
     """
 
-    def __init__(self, tag_concurrency_limits, in_progress_runs):
-        check.opt_list_param(tag_concurrency_limits, "tag_concurrency_limits", of_type=dict)
-        check.list_param(in_progress_runs, "in_progress_runs", of_type=PipelineRun)
+    def __init__(self, tag_concurrency_limits, in_progress_runs=None):
+        tag_concurrency_limits = check.opt_list_param(
+            tag_concurrency_limits, "tag_concurrency_limits", of_type=dict
+        )
+        in_progress_runs = check.opt_list_param(
+            in_progress_runs, "in_progress_runs", of_type=PipelineRun
+        )
 
         self._key_limits: Dict[str, int] = {}
-        self._key_value_limits: Dict[(str, str), int] = {}
+        self._key_value_limits: Dict[Tuple[str, str], int] = {}
         self._unique_value_limits: Dict[str, int] = {}
 
         for tag_limit in tag_concurrency_limits:
@@ -45,19 +51,40 @@ def __init__(self, tag_concurrency_limits, in_progress_runs):
             else:
                 self._unique_value_limits[key] = limit
 
+        self._tag_keys: Set[str] = (
+            set(self._key_limits)
+            | {key for key, _ in self._key_value_limits}
+            | set(self._unique_value_limits)
+        )
+
         self._key_counts: Dict[str, int] = defaultdict(lambda: 0)
-        self._key_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
-        self._unique_value_counts: Dict[(str, str), int] = defaultdict(lambda: 0)
+        self._key_value_counts: Dict[Tuple[str, str], int] = defaultdict(lambda: 0)
+        self._unique_value_counts: Dict[Tuple[str, str], int] = defaultdict(lambda: 0)
+
+        # the limited tags of each run counted towards the limits, by run id
+        self._in_progress_run_tags: Dict[str, Dict[str, str]] = {}
 
         # initialize counters based on current in progress runs
         for run in in_progress_runs:
             self.update_counters_with_launched_run(run)
 
+    @property
+    def tag_keys(self) -> List[str]:
+        """The tags that any of the limits apply to"""
+        return sorted(self._tag_keys)
+
+    @property
+    def in_progress_run_ids(self) -> Set[str]:
+        return set(self._in_progress_run_tags)
+
     def is_run_blocked(self, run):
         """
         True if there are in progress runs which are blocking this run based on tag limits
         """
-        for key, value in run.tags.items():
+        return self.are_tags_blocked(run.tags)
+
+    def are_tags_blocked(self, tags: Mapping[str, str]) -> bool:
+        for key, value in tags.items():
             if key in self._key_limits and self._key_counts[key] >= self._key_limits[key]:
                 return True
 
@@ -80,16 +107,38 @@ def update_counters_with_launched_run(self, run):
         """
         Add a new in progress run to the counters
         """
-        for key, value in run.tags.items():
+        self.add_run(run.run_id, run.tags)
+
+    def add_run(self, run_id: str, tags: Mapping[str, str]) -> None:
+        """
+        Add an in progress run to the counters. Runs that are already counted are ignored.
+        """
+        if run_id in self._in_progress_run_tags:
+            return
+
+        limited_tags = {key: value for key, value in tags.items() if key in self._tag_keys}
+        self._in_progress_run_tags[run_id] = limited_tags
+        self._update_counts(limited_tags, 1)
+
+    def remove_run(self, run_id: str) -> None:
+        """
+        Remove a run that is no longer in progress from the counters
+        """
+        limited_tags = self._in_progress_run_tags.pop(run_id, None)
+        if limited_tags is not None:
+            self._update_counts(limited_tags, -1)
+
+    def _update_counts(self, tags: Mapping[str, str], delta: int) -> None:
+        for key, value in tags.items():
             if key in self._key_limits:
-                self._key_counts[key] += 1
+                self._key_counts[key] += delta
 
             tag_tuple = (key, value)
             if tag_tuple in self._key_value_limits:
-                self._key_value_counts[tag_tuple] += 1
+                self._key_value_counts[tag_tuple] += delta
 
             if key in self._unique_value_limits:
-                self._unique_value_counts[tag_tuple] += 1
+                self._unique_value_counts[tag_tuple] += delta
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
@@ -102,6 +151,11 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     def daemon_type(cls):
         return "QUEUED_RUN_COORDINATOR"
 
+    def __init__(self, interval_seconds):
+        super().__init__(interval_seconds)
+        self._tag_concurrency_limits_counter: Optional[_TagConcurrencyLimitsCounter] = None
+        self._tag_concurrency_limits: Optional[List[Dict]] = None
+
     def run_iteration(self, instance, workspace):
         check.inst_param(instance, "instance", DagsterInstance)
         check.inst_param(workspace, "workspace", IWorkspace)
@@ -111,104 +165,150 @@ def run_iteration(self, instance, workspace):
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        tag_concurrency_limits_counter = self._get_tag_concurrency_limits_counter(
+            instance, tag_concurrency_limits
+        )
+        num_in_progress_runs = len(tag_concurrency_limits_counter.in_progress_run_ids)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         if max_concurrent_runs_enabled:
-            max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+            max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
 
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return
 
-        queued_runs = self._get_queued_runs(instance)
-
-        if not queued_runs:
-            self._logger.debug("Poll returned no queued runs.")
-        else:
-            self._logger.info("Retrieved %d queued runs, checking limits.", len(queued_runs))
-
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
-
         # launch until blocked by limit rules
         num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
-        )
+        considered_run_ids = set()
+
+        # fetch the next runs in priority order, enough to fill the open slots. If runs are skipped
+        # because their tags are blocked, fetch further down the queue, doubling the batch each time
+        batch_size = max_runs_to_launch if max_concurrent_runs_enabled else None
+        while True:
+            queued_runs = self._get_queued_runs(
+                instance, tag_concurrency_limits_counter.tag_keys, batch_size
+            )
+            new_queued_runs = [
+                (run_id, tags) for run_id, tags in queued_runs if run_id not in considered_run_ids
+            ]
+
+            if not considered_run_ids:
+                if not queued_runs:
+                    self._logger.debug("Poll returned no queued runs.")
+                else:
+                    self._logger.info(
+                        "Retrieved %d queued runs, checking limits.", len(queued_runs)
+                    )
 
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
-                break
+            for run_id, tags in new_queued_runs:
+                if max_concurrent_runs_enabled and num_dequeued_runs >= max_runs_to_launch:
+                    break
 
-            if tag_concurrency_limits_counter.is_run_blocked(run):
-                continue
+                considered_run_ids.add(run_id)
+                if tag_concurrency_limits_counter.are_tags_blocked(tags):
+                    continue
 
-            error_info = None
+                error_info = None
 
-            try:
-                self._dequeue_run(instance, run, workspace)
-            except Exception:
-                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+                try:
+                    self._dequeue_run(instance, run_id, workspace)
+                except Exception:
+                    error_info = serializable_error_info_from_exc_info(sys.exc_info())
 
-                message = (
-                    f"Caught an error for run {run.run_id} while removing it from the queue."
-                    " Marking the run as failed and dropping it from the queue"
-                )
-                message_with_full_error = f"{message}: {error_info.to_string()}"
+                    message = (
+                        f"Caught an error for run {run_id} while removing it from the queue."
+                        " Marking the run as failed and dropping it from the queue"
+                    )
+                    message_with_full_error = f"{message}: {error_info.to_string()}"
 
-                self._logger.error(message_with_full_error)
-                instance.report_run_failed(run, message_with_full_error)
+                    self._logger.error(message_with_full_error)
+                    instance.report_run_failed(
+                        instance.get_run_by_id(run_id), message_with_full_error
+                    )
 
-                # modify the original error, so that the extra message appears in heartbeats
-                error_info = error_info._replace(message=f"{message}: {error_info.message}")
+                    # modify the original error, so that the extra message appears in heartbeats
+                    error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
-            else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
-                num_dequeued_runs += 1
+                else:
+                    tag_concurrency_limits_counter.add_run(run_id, tags)
+                    num_dequeued_runs += 1
 
-            yield error_info
+                yield error_info
+
+            if (
+                batch_size is None
+                or len(queued_runs) < batch_size
+                or num_dequeued_runs >= max_runs_to_launch
+                or not new_queued_runs
+            ):
+                break
+
+            batch_size *= 2
 
         if num_dequeued_runs > 0:
             self._logger.info("Launched %d runs.", num_dequeued_runs)
 
-    def _get_queued_runs(self, instance):
-        queued_runs_filter = RunsFilter(statuses=[PipelineRunStatus.QUEUED])
+    def _get_tag_concurrency_limits_counter(self, instance, tag_concurrency_limits):
+        # the counter is kept across iterations, and only rebuilt if the limits change
+        tag_concurrency_limits = tag_concurrency_limits or []
+        if (
+            self._tag_concurrency_limits_counter is None
+            or self._tag_concurrency_limits != tag_concurrency_limits
+        ):
+            self._tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
+                tag_concurrency_limits
+            )
+            self._tag_concurrency_limits = tag_concurrency_limits
 
-        # Reversed for fifo ordering
-        # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+        counter = self._tag_concurrency_limits_counter
 
-    def _get_in_progress_runs(self, instance):
         # Note: should add a maximum fetch limit https://github.com/dagster-io/dagster/issues/3339
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        in_progress_run_ids = {
+            run_id
+            for run_id, _ in instance.get_run_ids_with_tags(
+                filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+            )
+        }
 
-    def _priority_sort(self, runs):
-        def get_priority(run):
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        # only the runs that changed status since the last iteration update the counts
+        for run_id in counter.in_progress_run_ids - in_progress_run_ids:
+            counter.remove_run(run_id)
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        new_run_ids = in_progress_run_ids - counter.in_progress_run_ids
+        if new_run_ids:
+            for run_id, tags in instance.get_run_ids_with_tags(
+                filters=RunsFilter(run_ids=list(new_run_ids)), tag_keys=counter.tag_keys
+            ):
+                counter.add_run(run_id, tags)
+
+        return counter
+
+    def _get_queued_runs(self, instance, tag_keys, limit):
+        # Only the tags needed to check the limits are fetched, so the queue can be scanned without
+        # loading every queued run. Runs are ordered by priority in the run storage, with runs of
+        # the same priority in fifo order.
+        return instance.get_run_ids_with_tags(
+            filters=RunsFilter(statuses=[PipelineRunStatus.QUEUED]),
+            tag_keys=tag_keys,
+            limit=limit,
+            priority_tag_key=PRIORITY_TAG,
+        )
 
-    def _dequeue_run(self, instance, run, workspace):
+    def _dequeue_run(self, instance, run_id, workspace):
         # double check that the run is still queued before dequeing
-        reloaded_run = instance.get_run_by_id(run.run_id)
+        run = instance.get_run_by_id(run_id)
 
-        if reloaded_run.status != PipelineRunStatus.QUEUED:
+        if run.status != PipelineRunStatus.QUEUED:
             self._logger.info(
                 "Run %s is now %s instead of QUEUED, skipping",
-                reloaded_run.run_id,
-                reloaded_run.status,
+                run.run_id,
+                run.status,
             )
             return
 
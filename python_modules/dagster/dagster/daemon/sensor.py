@@ -1,6 +1,8 @@
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from typing import Dict, NamedTuple, Optional
 
 import pendulum
@@ -20,7 +22,7 @@
     TickData,
     TickStatus,
 )
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter, TagBucket
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, RunsFilter
 from dagster.core.storage.tags import RUN_KEY_TAG
 from dagster.core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster.core.workspace import IWorkspace
@@ -175,38 +177,76 @@ def execute_sensor_iteration_loop(instance, workspace, logger, until=None):
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
     iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
     each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+
+    If the instance is configured with ``sensors: use_threads: true``, each sensor tick is
+    evaluated on a worker thread so that a slow sensor does not hold up the evaluation of the
+    others.
     """
-    workspace_loaded_time = pendulum.now("UTC").timestamp()
+    sensor_tick_futures: Dict[str, Future] = {}
+    with ExitStack() as stack:
+        settings = instance.sensor_settings
+        if settings.get("use_threads"):
+            threadpool_executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=settings.get("num_workers"),
+                    thread_name_prefix="sensor_daemon_worker",
+                )
+            )
+        else:
+            threadpool_executor = None
 
-    workspace_iteration = 0
-    start_time = pendulum.now("UTC").timestamp()
-    while True:
-        start_time = pendulum.now("UTC").timestamp()
-        if until and start_time >= until:
-            # provide a way of organically ending the loop to support test environment
-            break
+        workspace_loaded_time = pendulum.now("UTC").timestamp()
 
-        if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
-            workspace.cleanup()
-            workspace_loaded_time = pendulum.now("UTC").timestamp()
-            workspace_iteration = 0
+        workspace_iteration = 0
+        start_time = pendulum.now("UTC").timestamp()
+        while True:
+            start_time = pendulum.now("UTC").timestamp()
+            if until and start_time >= until:
+                # provide a way of organically ending the loop to support test environment
+                break
+
+            if start_time - workspace_loaded_time > RELOAD_WORKSPACE:
+                # let in-flight ticks finish before tearing down the locations they are using
+                wait(sensor_tick_futures.values())
+                workspace.cleanup()
+                workspace_loaded_time = pendulum.now("UTC").timestamp()
+                workspace_iteration = 0
+
+            yield from execute_sensor_iteration(
+                instance,
+                logger,
+                workspace,
+                log_verbose_checks=(workspace_iteration == 0),
+                threadpool_executor=threadpool_executor,
+                sensor_tick_futures=sensor_tick_futures,
+            )
 
-        yield from execute_sensor_iteration(
-            instance, logger, workspace, log_verbose_checks=(workspace_iteration == 0)
-        )
+            loop_duration = pendulum.now("UTC").timestamp() - start_time
+            sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+            time.sleep(sleep_time)
+            yield
+            workspace_iteration += 1
 
-        loop_duration = pendulum.now("UTC").timestamp() - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-        time.sleep(sleep_time)
-        yield
-        workspace_iteration += 1
+        # surface the errors of the ticks that were still in flight when the loop ended
+        wait(sensor_tick_futures.values())
+        yield from _finished_tick_errors(sensor_tick_futures)
 
 
 def execute_sensor_iteration(
-    instance, logger, workspace, log_verbose_checks=True, debug_crash_flags=None
+    instance,
+    logger,
+    workspace,
+    log_verbose_checks=True,
+    debug_crash_flags=None,
+    threadpool_executor=None,
+    sensor_tick_futures=None,
 ):
     check.inst_param(workspace, "workspace", IWorkspace)
     check.inst_param(instance, "instance", DagsterInstance)
+    check.opt_inst_param(threadpool_executor, "threadpool_executor", ThreadPoolExecutor)
+    if threadpool_executor:
+        check.dict_param(sensor_tick_futures, "sensor_tick_futures")
+        yield from _finished_tick_errors(sensor_tick_futures)
 
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
@@ -284,53 +324,113 @@ def execute_sensor_iteration(
     for external_sensor in sensors.values():
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        error_info = None
-        try:
-            sensor_state = all_sensor_states.get(external_sensor.selector_id)
-            if not sensor_state:
-                assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-                sensor_state = InstigatorState(
-                    external_sensor.get_external_origin(),
-                    InstigatorType.SENSOR,
-                    InstigatorStatus.AUTOMATICALLY_RUNNING,
-                    SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
-                )
-                instance.add_instigator_state(sensor_state)
-            elif _is_under_min_interval(sensor_state, external_sensor, now):
+        sensor_state = all_sensor_states.get(external_sensor.selector_id)
+
+        if threadpool_executor:
+            selector_id = external_sensor.selector_id
+            previous_future = sensor_tick_futures.get(selector_id)
+            if previous_future and not previous_future.done():
+                # the previous tick for this sensor is still being evaluated
                 continue
 
-            tick = instance.create_tick(
-                TickData(
-                    instigator_origin_id=sensor_state.instigator_origin_id,
-                    instigator_name=sensor_state.instigator_name,
-                    instigator_type=InstigatorType.SENSOR,
-                    status=TickStatus.STARTED,
-                    timestamp=now.timestamp(),
-                    selector_id=external_sensor.selector_id,
-                )
+            sensor_tick_futures[selector_id] = threadpool_executor.submit(
+                _process_tick,
+                instance,
+                logger,
+                workspace,
+                external_sensor,
+                sensor_state,
+                now,
+                sensor_debug_crash_flags,
+            )
+            yield
+        else:
+            yield from _process_tick_generator(
+                instance,
+                logger,
+                workspace,
+                external_sensor,
+                sensor_state,
+                now,
+                sensor_debug_crash_flags,
             )
 
-            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
-
-            with SensorLaunchContext(external_sensor, tick, instance, logger) as tick_context:
-                _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
-                yield from _evaluate_sensor(
-                    tick_context,
-                    instance,
-                    workspace,
-                    external_sensor,
-                    sensor_state,
-                    sensor_debug_crash_flags,
-                )
-        except Exception:
-            error_info = serializable_error_info_from_exc_info(sys.exc_info())
-            logger.error(
-                "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
-                    sensor_name=external_sensor.name,
-                    error_info=error_info.to_string(),
-                )
+
+def _finished_tick_errors(sensor_tick_futures):
+    # yield the outcome of each tick that finished on a worker thread, like the serial path does
+    for selector_id, future in list(sensor_tick_futures.items()):
+        if future.done():
+            del sensor_tick_futures[selector_id]
+            yield future.result()
+
+
+def _process_tick(
+    instance, logger, workspace, external_sensor, sensor_state, now, sensor_debug_crash_flags
+):
+    # consume the tick generator on a worker thread, returning the error info it ends with
+    error_info = None
+    for error_info in _process_tick_generator(
+        instance,
+        logger,
+        workspace,
+        external_sensor,
+        sensor_state,
+        now,
+        sensor_debug_crash_flags,
+    ):
+        pass
+    return error_info
+
+
+def _process_tick_generator(
+    instance, logger, workspace, external_sensor, sensor_state, now, sensor_debug_crash_flags
+):
+    error_info = None
+    try:
+        if not sensor_state:
+            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+            sensor_state = InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.AUTOMATICALLY_RUNNING,
+                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
             )
-        yield error_info
+            instance.add_instigator_state(sensor_state)
+        elif _is_under_min_interval(sensor_state, external_sensor, now):
+            return
+
+        tick = instance.create_tick(
+            TickData(
+                instigator_origin_id=sensor_state.instigator_origin_id,
+                instigator_name=sensor_state.instigator_name,
+                instigator_type=InstigatorType.SENSOR,
+                status=TickStatus.STARTED,
+                timestamp=now.timestamp(),
+                selector_id=external_sensor.selector_id,
+            )
+        )
+
+        _check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
+
+        with SensorLaunchContext(external_sensor, tick, instance, logger) as tick_context:
+            _check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
+            yield from _evaluate_sensor(
+                tick_context,
+                instance,
+                workspace,
+                external_sensor,
+                sensor_state,
+                sensor_debug_crash_flags,
+            )
+    except Exception:
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        logger.error(
+            "Sensor daemon caught an error for sensor {sensor_name} : {error_info}".format(
+                sensor_name=external_sensor.name,
+                error_info=error_info.to_string(),
+            )
+        )
+    yield error_info
 
 
 def _evaluate_sensor(
@@ -512,39 +612,11 @@ def _fetch_existing_runs(instance, external_sensor, run_requests):
     if not run_keys:
         return {}
 
-    existing_runs = {}
-
-    if instance.supports_bucket_queries:
-        runs = instance.get_runs(
-            filters=RunsFilter(
-                tags=PipelineRun.tags_for_sensor(external_sensor),
-            ),
-            bucket_by=TagBucket(
-                tag_key=RUN_KEY_TAG,
-                bucket_limit=1,
-                tag_values=run_keys,
-            ),
-        )
-        for run in runs:
-            tags = run.tags or {}
-            run_key = tags.get(RUN_KEY_TAG)
-            existing_runs[run_key] = run
-        return existing_runs
-
-    else:
-        for run_key in run_keys:
-            runs = instance.get_runs(
-                filters=RunsFilter(
-                    tags=merge_dicts(
-                        PipelineRun.tags_for_sensor(external_sensor),
-                        {RUN_KEY_TAG: run_key},
-                    )
-                ),
-                limit=1,
-            )
-            if runs:
-                existing_runs[run_key] = runs[0]
-    return existing_runs
+    return instance.get_latest_runs_by_tag_values(
+        RUN_KEY_TAG,
+        run_keys,
+        filters=RunsFilter(tags=PipelineRun.tags_for_sensor(external_sensor)),
+    )
 
 
 def _get_or_create_sensor_run(
@@ -256,6 +256,34 @@ def external_repository(self, external_repository_origin):
 
         return res.serialized_external_repository_data
 
+    def external_repository_snapshot_id(self, external_repository_origin):
+        check.inst_param(
+            external_repository_origin,
+            "external_repository_origin",
+            ExternalRepositoryOrigin,
+        )
+
+        try:
+            res = self._query(
+                "ExternalRepositorySnapshotId",
+                api_pb2.ExternalRepositoryRequest,
+                serialized_repository_python_origin=serialize_dagster_namedtuple(
+                    external_repository_origin
+                ),
+            )
+        except DagsterUserCodeUnreachableError as e:
+            # servers running an older version of dagster do not implement this call
+            cause = e.__cause__
+            if (
+                isinstance(cause, grpc.RpcError)
+                and cause.code() == grpc.StatusCode.UNIMPLEMENTED  # pylint: disable=no-member
+            ):
+                return None
+            raise
+
+        # empty if the server could not compute a snapshot id for the repository
+        return res.snapshot_id or None
+
     def streaming_external_repository(self, external_repository_origin):
         for res in self._streaming_query(
             "StreamingExternalRepository",
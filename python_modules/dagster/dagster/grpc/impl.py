@@ -21,6 +21,11 @@
 )
 from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_run_iterator
+from dagster.core.execution.plan.snapshot_cache import (
+    cache_execution_plan_snapshot,
+    execution_plan_snapshot_args_key,
+    get_cached_execution_plan_snapshot,
+)
 from dagster.core.host_representation import external_pipeline_data_from_def
 from dagster.core.host_representation.external_data import (
     ExternalPartitionConfigData,
@@ -368,7 +373,18 @@ def get_external_execution_plan_snapshot(recon_pipeline, args):
                 solid_selection=args.solid_selection, asset_selection=args.asset_selection
             )
 
-        return snapshot_from_execution_plan(
+        # memoized plans depend on the outputs already in storage, so they are always rebuilt
+        cache_key = (
+            execution_plan_snapshot_args_key(args)
+            if not pipeline.get_definition().is_using_memoization({})
+            else None
+        )
+        if cache_key:
+            cached_snapshot = get_cached_execution_plan_snapshot(cache_key)
+            if cached_snapshot:
+                return cached_snapshot
+
+        execution_plan_snapshot = snapshot_from_execution_plan(
             create_execution_plan(
                 pipeline=pipeline,
                 run_config=args.run_config,
@@ -379,6 +395,10 @@ def get_external_execution_plan_snapshot(recon_pipeline, args):
             ),
             args.pipeline_snapshot_id,
         )
+        if cache_key:
+            cache_execution_plan_snapshot(cache_key, execution_plan_snapshot)
+
+        return execution_plan_snapshot
     except:
         return ExecutionPlanSnapshotErrorData(
             error=serializable_error_info_from_exc_info(sys.exc_info())
@@ -394,10 +414,7 @@ def get_partition_set_execution_param_data(recon_repo, partition_set_name, parti
             lambda: "Error occurred during the partition generation for "
             f"{_get_target_for_partition_execution_error(partition_set_def)}",
         ):
-            all_partitions = partition_set_def.get_partitions()
-        partitions = [
-            partition for partition in all_partitions if partition.name in partition_names
-        ]
+            partitions = partition_set_def.get_partitions_for_names(partition_names)
 
         partition_data = []
         for partition in partitions:
@@ -33,6 +33,7 @@
     whitelist_for_serdes,
 )
 from dagster.serdes.ipc import IPCErrorMessage, ipc_write_stream, open_ipc_subprocess
+from dagster.serdes.utils import hash_str
 from dagster.utils import find_free_port, frozenlist, safe_tempfile_path_unmanaged
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -211,6 +212,12 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Serialized external repository data is expensive to build, so it is computed once per
+        # repository and keyed by a hash of its contents.
+        # Dict[str, Tuple[str, str]]: repository name -> (snapshot id, serialized data)
+        self._external_repository_snapshots = {}
+        self._external_repository_snapshot_lock = threading.Lock()
+
         self._entry_point = (
             frozenlist(check.list_param(entry_point, "entry_point", of_type=str))
             if entry_point != None
@@ -473,28 +480,70 @@ def ExternalPipelineSubsetSnapshot(self, request, _context):
             )
         )
 
-    def _get_serialized_external_repository_data(self, request):
+    def _get_external_repository_snapshot(self, request, static_only=False):
+        # Returns a (snapshot_id, serialized_external_repository_data) tuple. The snapshot id is
+        # None if the repository could not be loaded, and both are None if static_only is set and
+        # the repository has dynamic definitions.
         try:
             repository_origin = deserialize_json_to_dagster_namedtuple(
                 request.serialized_repository_python_origin
             )
 
             check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+            repository_name = repository_origin.repository_name
+
+            with self._external_repository_snapshot_lock:
+                if repository_name in self._external_repository_snapshots:
+                    return self._external_repository_snapshots[repository_name]
+
             recon_repo = self._recon_repository_from_origin(repository_origin)
-            return serialize_dagster_namedtuple(
-                external_repository_data_from_def(recon_repo.get_definition())
+            repo_def = recon_repo.get_definition()
+            if static_only and not repo_def.has_static_definitions:
+                return (None, None)
+
+            serialized_external_repository_data = serialize_dagster_namedtuple(
+                external_repository_data_from_def(repo_def)
             )
+            snapshot = (
+                hash_str(serialized_external_repository_data),
+                serialized_external_repository_data,
+            )
+
+            # Repositories with dynamic definitions are rebuilt on every request
+            if repo_def.has_static_definitions:
+                with self._external_repository_snapshot_lock:
+                    self._external_repository_snapshots[repository_name] = snapshot
+
+            return snapshot
         except Exception:
-            return serialize_dagster_namedtuple(
-                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            return (
+                None,
+                serialize_dagster_namedtuple(
+                    ExternalRepositoryErrorData(
+                        serializable_error_info_from_exc_info(sys.exc_info())
+                    )
+                ),
             )
 
+    def _get_serialized_external_repository_data(self, request):
+        _snapshot_id, serialized_external_repository_data = self._get_external_repository_snapshot(
+            request
+        )
+        return serialized_external_repository_data
+
     def ExternalRepository(self, request, _context):
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
         )
 
+    def ExternalRepositorySnapshotId(self, request, _context):
+        # Repositories with dynamic definitions have no stable snapshot id, so avoid building them
+        snapshot_id, _serialized_data = self._get_external_repository_snapshot(
+            request, static_only=True
+        )
+        return api_pb2.ExternalRepositorySnapshotIdReply(snapshot_id=snapshot_id or "")
+
     def StreamingExternalRepository(self, request, _context):
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
 
@@ -2,13 +2,18 @@
 from .serdes import (
     DefaultNamedTupleSerializer,
     deserialize_as,
+    deserialize_dagster_namedtuple_from_bytes,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
+    deserialize_value_from_bytes,
+    is_binary_serialized,
     pack_inner_value,
     pack_value,
     register_serdes_tuple_fallbacks,
     serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_to_bytes,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_inner_value,
     unpack_value,
     whitelist_for_serdes,
@@ -54,6 +54,10 @@ class WhitelistMap(NamedTuple):
     enums: Dict[str, EnumEntry]
     serialized_names: Dict[str, str]
     deserialized_names: Dict[str, str]
+    # compiled pack functions keyed by class, and unpack functions keyed by serialized class name,
+    # built lazily from the entries above and cleared whenever an entry changes
+    packers: Dict[type, Callable[[Any], Any]]
+    unpackers: Dict[str, Callable[[Dict[str, Any]], Any]]
 
     def register_tuple(
         self,
@@ -71,6 +75,7 @@ def register_tuple(
             args_for_class: the inspect.signature paramaters for __new__
         """
         self.tuples[name] = (nt, serializer or DefaultNamedTupleSerializer, args_for_class)
+        self.clear_compiled()
 
     def has_tuple_entry(self, name: str) -> bool:
         return name in self.tuples
@@ -85,6 +90,7 @@ def register_enum(
         serializer: Optional[Type["EnumSerializer"]],
     ):
         self.enums[name] = (enum, serializer or DefaultEnumSerializer)
+        self.clear_compiled()
 
     def has_enum_entry(self, name: str) -> bool:
         return name in self.enums
@@ -94,6 +100,7 @@ def get_enum_entry(self, name: str) -> EnumEntry:
 
     def register_serialized_name(self, name: str, serialized_name: str):
         self.serialized_names[name] = serialized_name
+        self.clear_compiled()
 
     def has_serialized_name(self, name: str) -> bool:
         return name in self.serialized_names
@@ -103,6 +110,7 @@ def get_serialized_name(self, name: str) -> str:
 
     def register_deserialized_name(self, name: str, deserialized_name: str):
         self.deserialized_names[name] = deserialized_name
+        self.clear_compiled()
 
     def has_deserialized_name(self, name: str) -> bool:
         return name in self.deserialized_names
@@ -110,9 +118,20 @@ def has_deserialized_name(self, name: str) -> bool:
     def get_deserialized_name(self, name: str) -> str:
         return self.deserialized_names[name]
 
+    def clear_compiled(self):
+        self.packers.clear()
+        self.unpackers.clear()
+
     @staticmethod
     def create():
-        return WhitelistMap(tuples={}, enums={}, serialized_names={}, deserialized_names={})
+        return WhitelistMap(
+            tuples={},
+            enums={},
+            serialized_names={},
+            deserialized_names={},
+            packers={},
+            unpackers={},
+        )
 
 
 _WHITELIST_MAP = WhitelistMap.create()
@@ -366,9 +385,130 @@ def pack_value(val: Any) -> Any:
 
 
 def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _pack(val, whitelist_map)
+    except SerializationError:
+        # The compiled walk does not track where it is in the tree, so walk again tracking the
+        # descent path to raise an error that points at the offending value.
+        return _pack_inner_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+_PRIMITIVE_TYPES = frozenset([str, int, float, bool, type(None)])
+
+
+def _pack(val: Any, whitelist_map: WhitelistMap) -> Any:
+    val_type = type(val)
+    if val_type in _PRIMITIVE_TYPES:
+        return val
+    if val_type is list:
+        return [_pack(item, whitelist_map) for item in val]
+    if val_type is dict:
+        return {key: _pack(value, whitelist_map) for key, value in val.items()}
+
+    packer = whitelist_map.packers.get(val_type)
+    if packer is None:
+        packer = _compile_packer(val_type, whitelist_map)
+    return packer(val)
+
+
+def _compile_packer(val_type: type, whitelist_map: WhitelistMap) -> Callable[[Any], Any]:
+    """Build and cache the function that packs values of the given type. Raises SerializationError
+    for types that can not be serialized, leaving it to the caller to produce an error message
+    with the descent path."""
+    packer: Callable[[Any], Any]
+    if issubclass(val_type, list):
+        packer = lambda val: [_pack(item, whitelist_map) for item in val]
+    elif issubclass(val_type, tuple):
+        klass_name = val_type.__name__
+        if not whitelist_map.has_tuple_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted namedtuples, received {val_type}."
+            )
+        _, serializer, _ = whitelist_map.get_tuple_entry(klass_name)
+        if _is_default_method(serializer, "value_to_storage_dict"):
+            packer = _compile_namedtuple_packer(
+                val_type, cast(Type[DefaultNamedTupleSerializer], serializer), whitelist_map
+            )
+        else:
+            root = f"<root:{klass_name}>"
+            packer = lambda val: serializer.value_to_storage_dict(val, whitelist_map, root)
+    elif issubclass(val_type, Enum):
+        klass_name = val_type.__name__
+        if not whitelist_map.has_enum_entry(klass_name):
+            raise SerializationError(
+                f"Can only serialize whitelisted Enums, received {klass_name}."
+            )
+        _, enum_serializer = whitelist_map.get_enum_entry(klass_name)
+        root = f"<root:{klass_name}>"
+        packer = lambda val: {
+            "__enum__": enum_serializer.value_to_storage_str(val, whitelist_map, root)
+        }
+    elif issubclass(val_type, set):
+        packer = lambda val: {
+            "__set__": [_pack(item, whitelist_map) for item in sorted(list(val), key=str)]
+        }
+    elif issubclass(val_type, frozenset):
+        packer = lambda val: {
+            "__frozenset__": [_pack(item, whitelist_map) for item in sorted(list(val), key=str)]
+        }
+    elif issubclass(val_type, dict):
+        packer = lambda val: {key: _pack(value, whitelist_map) for key, value in val.items()}
+    else:
+        packer = lambda val: val
+
+    whitelist_map.packers[val_type] = packer
+    return packer
+
+
+def _compile_namedtuple_packer(
+    klass: type, serializer: Type["DefaultNamedTupleSerializer"], whitelist_map: WhitelistMap
+) -> Callable[[Any], Dict[str, Any]]:
+    """Specialization of DefaultNamedTupleSerializer.value_to_storage_dict for one class"""
+    fields = klass._fields  # type: ignore[attr-defined]
+    skip_when_empty_fields = serializer.skip_when_empty()
+    klass_name = klass.__name__
+    storage_name = (
+        whitelist_map.get_serialized_name(klass_name)
+        if whitelist_map.has_serialized_name(klass_name)
+        else klass_name
+    )
+
+    if not skip_when_empty_fields:
+
+        def _pack_namedtuple(val):
+            base_dict = {
+                key: _pack(inner_value, whitelist_map) for key, inner_value in zip(fields, val)
+            }
+            base_dict["__class__"] = storage_name
+            return base_dict
+
+        return _pack_namedtuple
+
+    def _pack_namedtuple_skip_empty(val):
+        base_dict = {}
+        for key, inner_value in zip(fields, val):
+            if key in skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                continue
+            base_dict[key] = _pack(inner_value, whitelist_map)
+        base_dict["__class__"] = storage_name
+        return base_dict
+
+    return _pack_namedtuple_skip_empty
+
+
+def _is_default_method(serializer: Type[Serializer], method_name: str) -> bool:
+    return (
+        getattr(serializer, method_name).__func__
+        is getattr(DefaultNamedTupleSerializer, method_name).__func__
+    )
+
+
+def _pack_inner_value_with_descent_path(
+    val: Any, whitelist_map: WhitelistMap, descent_path: str
+) -> Any:
     if isinstance(val, list):
         return [
-            pack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _pack_inner_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, tuple):
@@ -392,7 +532,7 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         set_path = descent_path + "{}"
         return {
             "__set__": [
-                pack_inner_value(item, whitelist_map, set_path)
+                _pack_inner_value_with_descent_path(item, whitelist_map, set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
@@ -400,19 +540,100 @@ def pack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -
         frz_set_path = descent_path + "{}"
         return {
             "__frozenset__": [
-                pack_inner_value(item, whitelist_map, frz_set_path)
+                _pack_inner_value_with_descent_path(item, whitelist_map, frz_set_path)
                 for item in sorted(list(val), key=str)
             ]
         }
     if isinstance(val, dict):
         return {
-            key: pack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _pack_inner_value_with_descent_path(value, whitelist_map, f"{descent_path}.{key}")
             for key, value in val.items()
         }
 
     return val
 
 
+###################################################################################################
+# Binary
+###################################################################################################
+
+# Values serialized in the binary format are prefixed with this header, followed by a single byte
+# for the format version. The leading NUL byte ensures the header can never be mistaken for the
+# start of a json document.
+BINARY_SERDES_HEADER = b"\x00DGS"
+BINARY_SERDES_VERSION = 1
+
+
+def _import_msgpack():
+    try:
+        import msgpack  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise SerdesUsageError(
+            "The binary serdes format requires the msgpack package. Install it with "
+            "`pip install dagster[msgpack]`."
+        ) from exc
+    return msgpack
+
+
+def serialize_dagster_namedtuple_to_bytes(nt: tuple) -> bytes:
+    """Serialize a whitelisted named tuple to the binary serdes format"""
+    check.tuple_param(nt, "nt")
+    return serialize_value_to_bytes(nt)
+
+
+def serialize_value_to_bytes(val: Any, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> bytes:
+    """Serialize a value to the binary serdes format.
+
+    The value is packed the same way as for json serialization, so custom serializers apply
+    unchanged, and the packed form is then encoded with msgpack behind a versioned header.
+    """
+    msgpack = _import_msgpack()
+    packed = pack_inner_value(val, whitelist_map=whitelist_map, descent_path=_root(val))
+    return (
+        BINARY_SERDES_HEADER
+        + bytes([BINARY_SERDES_VERSION])
+        + msgpack.packb(packed, use_bin_type=True)
+    )
+
+
+def is_binary_serialized(data: bytes) -> bool:
+    """Whether the given bytes were produced by the binary serdes format"""
+    return data.startswith(BINARY_SERDES_HEADER)
+
+
+def deserialize_dagster_namedtuple_from_bytes(data: bytes) -> tuple:
+    """Deserialize bytes in the binary serdes format in to a whitelisted named tuple"""
+    dagster_namedtuple = deserialize_value_from_bytes(data)
+    if not isinstance(dagster_namedtuple, tuple):
+        raise DeserializationError(
+            f"Output of deserialized bytes was not expected type of tuple. Received type {type(dagster_namedtuple)}."
+        )
+
+    return dagster_namedtuple
+
+
+def deserialize_value_from_bytes(data: bytes, whitelist_map: WhitelistMap = _WHITELIST_MAP) -> Any:
+    """Deserialize bytes in the binary serdes format in to its original value"""
+    check.inst_param(data, "data", bytes)
+    if not is_binary_serialized(data):
+        raise DeserializationError("Bytes were not serialized with the binary serdes format.")
+
+    header_length = len(BINARY_SERDES_HEADER)
+    version = data[header_length]
+    if version != BINARY_SERDES_VERSION:
+        raise DeserializationError(
+            f"Unsupported binary serdes format version {version}. This error can occur due to "
+            "version skew, verify processes are running expected versions."
+        )
+
+    msgpack = _import_msgpack()
+    try:
+        value = msgpack.unpackb(data[header_length + 1 :], raw=False, strict_map_key=False)
+    except ValueError as err:
+        raise DeserializationError("Could not decode binary serialized value.") from err
+    return unpack_inner_value(value, whitelist_map=whitelist_map, descent_path=_root(value))
+
+
 ###################################################################################################
 # Deserialize
 ###################################################################################################
@@ -484,13 +705,103 @@ def unpack_value(val: Any) -> Any:
 
 
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
+    try:
+        return _unpack(val, whitelist_map)
+    except DeserializationError:
+        # The compiled walk does not track where it is in the tree, so walk again tracking the
+        # descent path to raise an error that points at the offending value.
+        return _unpack_inner_value_with_descent_path(val, whitelist_map, descent_path)
+
+
+def _unpack(val: Any, whitelist_map: WhitelistMap) -> Any:
+    if type(val) is not dict:  # pylint: disable=unidiomatic-typecheck
+        if isinstance(val, list):
+            return [_unpack(item, whitelist_map) for item in val]
+        if not isinstance(val, dict):
+            return val
+
+    klass_name = val.get("__class__")
+    if klass_name:
+        unpacker = whitelist_map.unpackers.get(klass_name)
+        if unpacker is None:
+            unpacker = _compile_unpacker(klass_name, whitelist_map)
+        return unpacker(val)
+    if val.get("__enum__"):
+        name, member = val["__enum__"].split(".")
+        if not whitelist_map.has_enum_entry(name):
+            raise DeserializationError(
+                f"Attempted to deserialize enum {name} which was not in the whitelist."
+            )
+        enum_class, enum_serializer = whitelist_map.get_enum_entry(name)
+        return enum_serializer.value_from_storage_str(member, enum_class)
+    if val.get("__set__") is not None:
+        return set([_unpack(item, whitelist_map) for item in val["__set__"]])
+    if val.get("__frozenset__") is not None:
+        return frozenset([_unpack(item, whitelist_map) for item in val["__frozenset__"]])
+    return {key: _unpack(value, whitelist_map) for key, value in val.items()}
+
+
+def _compile_unpacker(
+    klass_name: str, whitelist_map: WhitelistMap
+) -> Callable[[Dict[str, Any]], Any]:
+    """Build and cache the function that unpacks storage dicts with the given serialized class
+    name. Raises DeserializationError for classes that are not whitelisted, leaving it to the
+    caller to produce an error message with the descent path."""
+    lookup_name = (
+        whitelist_map.get_deserialized_name(klass_name)
+        if whitelist_map.has_deserialized_name(klass_name)
+        else klass_name
+    )
+    if not whitelist_map.has_tuple_entry(lookup_name):
+        raise DeserializationError(
+            f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.'
+        )
+
+    klass, serializer, args_for_class = whitelist_map.get_tuple_entry(lookup_name)
+    unpacker: Callable[[Dict[str, Any]], Any]
+    if klass is None:
+        unpacker = lambda storage_dict: None
+    elif _is_default_method(serializer, "value_from_storage_dict"):
+        value_from_unpacked = cast(
+            Type[DefaultNamedTupleSerializer], serializer
+        ).value_from_unpacked
+
+        def _unpack_namedtuple(storage_dict):
+            return value_from_unpacked(
+                {
+                    key: _unpack(value, whitelist_map)
+                    for key, value in storage_dict.items()
+                    if key in args_for_class
+                },
+                klass,
+            )
+
+        unpacker = _unpack_namedtuple
+    else:
+        root = f"<root:{lookup_name}>"
+        unpacker = lambda storage_dict: serializer.value_from_storage_dict(
+            {key: value for key, value in storage_dict.items() if key != "__class__"},
+            klass,
+            args_for_class,
+            whitelist_map,
+            root,
+        )
+
+    whitelist_map.unpackers[klass_name] = unpacker
+    return unpacker
+
+
+def _unpack_inner_value_with_descent_path(
+    val: Any, whitelist_map: WhitelistMap, descent_path: str
+) -> Any:
     if isinstance(val, list):
         return [
-            unpack_inner_value(item, whitelist_map, f"{descent_path}[{idx}]")
+            _unpack_inner_value_with_descent_path(item, whitelist_map, f"{descent_path}[{idx}]")
             for idx, item in enumerate(val)
         ]
     if isinstance(val, dict) and val.get("__class__"):
-        klass_name = cast(str, val.pop("__class__"))
+        # read the class name without popping it, to leave the caller's dict intact
+        klass_name = cast(str, val["__class__"])
         lookup_name = (
             whitelist_map.get_deserialized_name(klass_name)
             if whitelist_map.has_deserialized_name(klass_name)
@@ -515,7 +826,11 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
             return None
 
         return serializer.value_from_storage_dict(
-            val, klass, args_for_class, whitelist_map, descent_path
+            {key: value for key, value in val.items() if key != "__class__"},
+            klass,
+            args_for_class,
+            whitelist_map,
+            descent_path,
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
@@ -529,15 +844,25 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         return enum_serializer.value_from_storage_str(member, enum_class)
     if isinstance(val, dict) and val.get("__set__") is not None:
         set_path = descent_path + "{}"
-        return set([unpack_inner_value(item, whitelist_map, set_path) for item in val["__set__"]])
+        return set(
+            [
+                _unpack_inner_value_with_descent_path(item, whitelist_map, set_path)
+                for item in val["__set__"]
+            ]
+        )
     if isinstance(val, dict) and val.get("__frozenset__") is not None:
         frz_set_path = descent_path + "{}"
         return frozenset(
-            [unpack_inner_value(item, whitelist_map, frz_set_path) for item in val["__frozenset__"]]
+            [
+                _unpack_inner_value_with_descent_path(item, whitelist_map, frz_set_path)
+                for item in val["__frozenset__"]
+            ]
         )
     if isinstance(val, dict):
         return {
-            key: unpack_inner_value(value, whitelist_map, f"{descent_path}.{key}")
+            key: _unpack_inner_value_with_descent_path(
+                value, whitelist_map, f"{descent_path}.{key}"
+            )
             for key, value in val.items()
         }
 
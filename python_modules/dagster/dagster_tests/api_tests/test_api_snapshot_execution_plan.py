@@ -1,11 +1,17 @@
 import re
+from unittest import mock
 
 import pytest
 
+from dagster import file_relative_path
 from dagster.api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
+from dagster.core.definitions.reconstruct import ReconstructableRepository
 from dagster.core.errors import DagsterUserCodeProcessError
+from dagster.core.execution.plan.snapshot_cache import clear_execution_plan_snapshot_cache
 from dagster.core.host_representation.handle import PipelineHandle
 from dagster.core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster.grpc.impl import get_external_execution_plan_snapshot
+from dagster.grpc.types import ExecutionPlanSnapshotArgs
 
 from .utils import get_bar_repo_repository_location
 
@@ -97,3 +103,42 @@ def test_execution_plan_with_subset_snapshot_api_grpc(instance):
             "do_input",
         ]
         assert len(execution_plan_snapshot.steps) == 1
+
+
+def test_execution_plan_snapshot_cached(instance):
+    clear_execution_plan_snapshot_cache()
+    recon_pipeline = ReconstructableRepository.for_file(
+        file_relative_path(__file__, "api_tests_repo.py"), "bar_repo"
+    ).get_reconstructable_pipeline("foo")
+
+    with get_bar_repo_repository_location(instance) as repository_location:
+        pipeline_origin = PipelineHandle(
+            "foo", repository_location.get_repository("bar_repo").handle
+        ).get_external_origin()
+
+    def _get_snapshot(step_keys_to_execute=None):
+        return get_external_execution_plan_snapshot(
+            recon_pipeline,
+            ExecutionPlanSnapshotArgs(
+                pipeline_origin=pipeline_origin,
+                solid_selection=None,
+                run_config={},
+                mode="default",
+                step_keys_to_execute=step_keys_to_execute,
+                pipeline_snapshot_id="12345",
+            ),
+        )
+
+    execution_plan_snapshot = _get_snapshot()
+    assert isinstance(execution_plan_snapshot, ExecutionPlanSnapshot)
+
+    with mock.patch(
+        "dagster.grpc.impl.create_execution_plan", side_effect=Exception("should not be called")
+    ):
+        assert _get_snapshot() is execution_plan_snapshot
+
+    # a different step selection is a different plan
+    subset_snapshot = _get_snapshot(step_keys_to_execute=["do_something"])
+    assert subset_snapshot.step_keys_to_execute == ["do_something"]
+
+    clear_execution_plan_snapshot_cache()
@@ -1,17 +1,25 @@
 import sys
 from contextlib import contextmanager
+from unittest import mock
 
+import grpc
 import pytest
 
 from dagster import lambda_solid, pipeline, repository
-from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
-from dagster.core.errors import DagsterUserCodeProcessError
+from dagster.api.snapshot_repository import (
+    clear_external_repository_data_cache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
+from dagster.core.errors import DagsterUserCodeProcessError, DagsterUserCodeUnreachableError
 from dagster.core.host_representation import (
     ExternalRepositoryData,
+    ExternalRepositoryOrigin,
     ManagedGrpcPythonEnvRepositoryLocationOrigin,
 )
 from dagster.core.test_utils import instance_for_test
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.serdes import serialize_dagster_namedtuple
+from dagster.serdes.utils import hash_str
 
 from .utils import get_bar_repo_repository_location
 
@@ -43,6 +51,85 @@ def test_streaming_external_repositories_error(instance):
             )
 
 
+def test_external_repository_snapshot_id(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        origin = ExternalRepositoryOrigin(repository_location.origin, "bar_repo")
+        snapshot_id = repository_location.client.external_repository_snapshot_id(origin)
+
+        assert snapshot_id
+        assert repository_location.client.external_repository_snapshot_id(origin) == snapshot_id
+        assert snapshot_id == hash_str(
+            serialize_dagster_namedtuple(
+                repository_location.get_repository("bar_repo").external_repository_data
+            )
+        )
+
+        assert (
+            repository_location.client.external_repository_snapshot_id(
+                ExternalRepositoryOrigin(repository_location.origin, "does_not_exist")
+            )
+            is None
+        )
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        super().__init__()
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def _unreachable_query(code):
+    def _query(*_args, **_kwargs):
+        try:
+            raise _RpcError(code)
+        except _RpcError as e:
+            raise DagsterUserCodeUnreachableError("Could not reach user code server") from e
+
+    return _query
+
+
+def test_external_repository_snapshot_id_errors(instance):
+    with get_bar_repo_repository_location(instance) as repository_location:
+        client = repository_location.client
+        origin = ExternalRepositoryOrigin(repository_location.origin, "bar_repo")
+
+        # servers that do not implement the call have no snapshot id
+        with mock.patch.object(
+            client, "_query", side_effect=_unreachable_query(grpc.StatusCode.UNIMPLEMENTED)
+        ):
+            assert client.external_repository_snapshot_id(origin) is None
+
+        with mock.patch.object(
+            client, "_query", side_effect=_unreachable_query(grpc.StatusCode.UNAVAILABLE)
+        ):
+            with pytest.raises(DagsterUserCodeUnreachableError):
+                client.external_repository_snapshot_id(origin)
+
+
+def test_streaming_external_repositories_cached_by_snapshot_id(instance):
+    clear_external_repository_data_cache()
+    with get_bar_repo_repository_location(instance) as repository_location:
+        external_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+            repository_location.client, repository_location
+        )
+
+        with mock.patch.object(
+            repository_location.client,
+            "streaming_external_repository",
+            side_effect=Exception("should not be called"),
+        ):
+            cached_repo_datas = sync_get_streaming_external_repositories_data_grpc(
+                repository_location.client, repository_location
+            )
+
+        assert cached_repo_datas["bar_repo"] is external_repo_datas["bar_repo"]
+
+    clear_external_repository_data_cache()
+
+
 @lambda_solid
 def do_something():
     return 1
@@ -0,0 +1,133 @@
+"""Benchmarks the json and binary serdes formats for commonly stored objects.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.serdes_benchmark [--iterations N]
+"""
+import argparse
+import time
+
+from dagster import In, Out, graph, op, repository
+from dagster.core.definitions.events import AssetMaterialization
+from dagster.core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.host_representation.external_data import external_repository_data_from_def
+from dagster.core.snap import snapshot_from_execution_plan
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.serdes import (
+    deserialize_json_to_dagster_namedtuple,
+    deserialize_value_from_bytes,
+    serialize_dagster_namedtuple,
+    serialize_value_to_bytes,
+)
+
+
+def _event_log_entry():
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id="a1b2c3d4",
+        timestamp=time.time(),
+        step_key="my_op",
+        pipeline_name="my_job",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "my_job",
+            step_key="my_op",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(
+                    asset_key=["my", "asset"],
+                    metadata={"rows": 1000, "path": "/tmp/my/asset"},
+                )
+            ),
+        ),
+    )
+
+
+def _pipeline_run():
+    return PipelineRun(
+        pipeline_name="my_job",
+        run_id="a1b2c3d4",
+        run_config={"ops": {f"op_{i}": {"config": {"value": i}} for i in range(20)}},
+        mode="default",
+        status=PipelineRunStatus.STARTED,
+        tags={"dagster/partition": "2022-01-01", "dagster/schedule_name": "my_schedule"},
+    )
+
+
+@op(ins={"num": In(int)}, out=Out(int))
+def add_one(num):
+    return num + 1
+
+
+@op(out=Out(int))
+def emit():
+    return 1
+
+
+def _chain_job(name="chain", length=100):
+    @graph(name=name)
+    def chain():
+        value = emit()
+        for _ in range(length):
+            value = add_one(value)
+
+    return chain.to_job()
+
+
+def _pipeline_snapshot():
+    return _chain_job().get_pipeline_snapshot()
+
+
+def _execution_plan_snapshot():
+    job = _chain_job()
+    return snapshot_from_execution_plan(create_execution_plan(job), job.get_pipeline_snapshot_id())
+
+
+def _external_repository_data():
+    @repository
+    def large_repo():
+        return [_chain_job(name=f"chain_{i}", length=50) for i in range(10)]
+
+    return external_repository_data_from_def(large_repo)
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def benchmark(name, value, iterations):
+    json_str = serialize_dagster_namedtuple(value)
+    binary = serialize_value_to_bytes(value)
+    assert deserialize_value_from_bytes(binary) == deserialize_json_to_dagster_namedtuple(json_str)
+
+    print(f"{name} ({iterations} iterations)")  # pylint: disable=print-call
+    print(  # pylint: disable=print-call
+        f"  size         json: {len(json_str.encode('utf-8'))}B  binary: {len(binary)}B"
+    )
+    print(  # pylint: disable=print-call
+        f"  serialize    json: {_time(lambda: serialize_dagster_namedtuple(value), iterations):.1f}us"
+        f"  binary: {_time(lambda: serialize_value_to_bytes(value), iterations):.1f}us"
+    )
+    print(  # pylint: disable=print-call
+        f"  deserialize  json: "
+        f"{_time(lambda: deserialize_json_to_dagster_namedtuple(json_str), iterations):.1f}us"
+        f"  binary: {_time(lambda: deserialize_value_from_bytes(binary), iterations):.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    benchmark("EventLogEntry", _event_log_entry(), args.iterations)
+    benchmark("PipelineRun", _pipeline_run(), args.iterations)
+    benchmark("PipelineSnapshot", _pipeline_snapshot(), max(args.iterations // 100, 1))
+    benchmark("ExecutionPlanSnapshot", _execution_plan_snapshot(), max(args.iterations // 100, 1))
+    benchmark("ExternalRepositoryData", _external_repository_data(), max(args.iterations // 500, 1))
@@ -0,0 +1,139 @@
+"""Benchmarks should_skip_step against the event log of a large run, where each step has yielded an
+output and logged a few messages.
+
+Run with:
+
+    python -m dagster_tests.benchmarks.should_skip_step_benchmark [--steps N] [--iterations N]
+"""
+import argparse
+import time
+
+from dagster import DagsterInstance, In, Out, graph, op
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.objects import StepSuccessData
+from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster.core.execution.plan.plan import should_skip_step
+from dagster.core.test_utils import instance_for_test
+from dagster.core.utils import make_new_run_id
+
+LOGS_PER_STEP = 3
+
+
+@op(out=Out(int, is_required=False))
+def maybe_emit():
+    yield 1
+
+
+@op(ins={"num": In(int)})
+def consume(num):
+    return num
+
+
+def _fan_out_job(steps):
+    @graph(name="fan_out")
+    def fan_out():
+        for _ in range(steps // 2):
+            consume(maybe_emit())
+
+    return fan_out.to_job()
+
+
+def _event(run_id, step_key, event_type, event_specific_data=None):
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key=step_key,
+        pipeline_name="fan_out",
+        dagster_event=DagsterEvent(
+            event_type.value,
+            "fan_out",
+            step_key=step_key,
+            event_specific_data=event_specific_data,
+        ),
+    )
+
+
+def _store_run_events(instance: DagsterInstance, run_id, step_keys):
+    for step_key in step_keys:
+        instance.store_event(_event(run_id, step_key, DagsterEventType.STEP_START))
+        for _ in range(LOGS_PER_STEP):
+            instance.store_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="info",
+                    user_message="working",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    step_key=step_key,
+                    pipeline_name="fan_out",
+                )
+            )
+        if step_key.startswith("maybe_emit"):
+            instance.store_event(
+                _event(
+                    run_id,
+                    step_key,
+                    DagsterEventType.STEP_OUTPUT,
+                    StepOutputData(StepOutputHandle(step_key, "result")),
+                )
+            )
+        instance.store_event(
+            _event(
+                run_id, step_key, DagsterEventType.STEP_SUCCESS, StepSuccessData(duration_ms=1.0)
+            )
+        )
+
+
+def _time(fn, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def _all_logs_yielded_handles(instance, run_id):
+    # the previous implementation of should_skip_step, which scanned every event of the run
+    return {
+        event_record.dagster_event.event_specific_data.step_output_handle
+        for event_record in instance.all_logs(run_id)
+        if event_record.dagster_event and event_record.dagster_event.is_successful_output
+    }
+
+
+def benchmark(steps, iterations):
+    job = _fan_out_job(steps)
+    run_id = make_new_run_id()
+
+    with instance_for_test() as instance:
+        full_plan = create_execution_plan(job)
+        _store_run_events(instance, run_id, full_plan.step_keys_to_execute)
+
+        step_plan = create_execution_plan(job, step_keys_to_execute=["consume"])
+        assert not should_skip_step(step_plan, instance, run_id)
+
+        print(  # pylint: disable=print-call
+            f"should_skip_step, {len(full_plan.step_keys_to_execute)} step run "
+            f"({iterations} iterations)"
+        )
+        print(  # pylint: disable=print-call
+            f"  scan all logs:  "
+            f"{_time(lambda: _all_logs_yielded_handles(instance, run_id), iterations):.2f}ms"
+        )
+        print(  # pylint: disable=print-call
+            f"  indexed query:  "
+            f"{_time(lambda: should_skip_step(step_plan, instance, run_id), iterations):.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    benchmark(args.steps, args.iterations)
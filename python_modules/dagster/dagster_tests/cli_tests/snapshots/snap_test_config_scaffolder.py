@@ -35,6 +35,14 @@
                     },
                     'spawn': {
                     }
+                },
+                'step_scheduling': {
+                    'policy': 'critical_path|priority',
+                    'slot_limits': {
+                    }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -93,6 +101,14 @@
                     },
                     'spawn': {
                     }
+                },
+                'step_scheduling': {
+                    'policy': 'critical_path|priority',
+                    'slot_limits': {
+                    }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
@@ -151,6 +167,14 @@
                     },
                     'spawn': {
                     }
+                },
+                'step_scheduling': {
+                    'policy': 'critical_path|priority',
+                    'slot_limits': {
+                    }
+                },
+                'worker_pool': {
+                    'max_tasks_per_worker': 0
                 }
             }
         }
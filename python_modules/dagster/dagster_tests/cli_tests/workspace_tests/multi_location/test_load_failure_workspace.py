@@ -1,4 +1,7 @@
+import time
+
 from dagster import DagsterInstance
+from dagster.core.test_utils import instance_for_test
 from dagster.core.workspace.context import WorkspaceProcessContext
 from dagster.core.workspace.load import load_workspace_process_context_from_yaml_paths
 from dagster.utils import file_relative_path
@@ -48,3 +51,42 @@ def test_workspace_with_only_error():
             "No module named"
             in request_context.get_repository_location_error("broken_location").message
         )
+
+
+def test_location_load_timeout(monkeypatch):
+    create_location_from_origin = WorkspaceProcessContext._create_location_from_origin
+
+    def _slow_create_location_from_origin(self, origin):
+        if origin.location_name == "loaded_from_module":
+            time.sleep(5)
+        return create_location_from_origin(self, origin)
+
+    monkeypatch.setattr(
+        WorkspaceProcessContext,
+        "_create_location_from_origin",
+        _slow_create_location_from_origin,
+    )
+
+    with instance_for_test(
+        overrides={"code_servers": {"max_concurrent_loads": 2, "load_timeout": 2}}
+    ) as instance:
+        with load_workspace_process_context_from_yaml_paths(
+            instance,
+            [file_relative_path(__file__, "multi_location.yaml")],
+        ) as cli_workspace:
+            # locations keep the order of the workspace, even though they load concurrently
+            assert cli_workspace.repository_location_names == [
+                "loaded_from_file",
+                "loaded_from_module",
+                "loaded_from_package",
+            ]
+            assert cli_workspace.has_repository_location("loaded_from_file")
+            assert cli_workspace.has_repository_location("loaded_from_package")
+            assert not cli_workspace.has_repository_location("loaded_from_module")
+
+            request_context = cli_workspace.create_request_context()
+            assert len(request_context.repository_location_errors()) == 1
+            assert (
+                "Timed out after 2 seconds"
+                in request_context.get_repository_location_error("loaded_from_module").message
+            )
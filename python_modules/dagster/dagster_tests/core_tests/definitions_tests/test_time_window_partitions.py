@@ -13,6 +13,7 @@
     monthly_partitioned_config,
     weekly_partitioned_config,
 )
+from dagster.core.definitions.partition_key_range import PartitionKeyRange
 from dagster.core.definitions.time_window_partitions import TimeWindow
 from dagster.utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
@@ -275,3 +276,67 @@ def my_partitioned_config(_start, _end):
     assert partitions_def.time_window_for_partition_key("2021-05-01") == time_window(
         "2021-05-05T04:15:00", "2021-05-12T04:15:00"
     )
+
+
+def test_indexed_partitions():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05", hour_offset=2)
+    current_time = datetime.strptime("2021-06-10", DATE_FORMAT)
+
+    partitions = partitions_def.get_partitions(current_time)
+    assert partitions_def.get_num_partitions(current_time) == len(partitions) == 35
+    assert partitions_def.get_last_partition(current_time) == partitions[-1]
+
+    for index, partition in enumerate(partitions):
+        assert partitions_def.get_partition_key_for_index(index) == partition.name
+        assert partitions_def.get_partition_key_index(partition.name) == index
+
+    assert partitions_def.get_partition_keys_in_range(
+        PartitionKeyRange("2021-05-30", "2021-06-02")
+    ) == ["2021-05-30", "2021-05-31", "2021-06-01", "2021-06-02"]
+
+    assert [
+        partition.name
+        for partition in partitions_def.get_partitions_for_keys(
+            ["2021-06-02", "2021-05-06", "2021-06-30", "2021-04-01", "not-a-date"],
+            current_time,
+        )
+    ] == ["2021-05-06", "2021-06-02"]
+
+    assert (
+        partitions_def.get_partition_key_for_time(pendulum.parse("2021-05-07T01:00:00"))
+        == "2021-05-06"
+    )
+
+
+def test_indexed_partitions_across_dst():
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-03-13-22:00", timezone="US/Central"
+    )
+    current_time = pendulum.datetime(2021, 3, 14, 5, tz="US/Central")
+
+    partitions = partitions_def.get_partitions(current_time)
+    # 2AM is skipped by the DST transition
+    assert [partition.name for partition in partitions] == [
+        "2021-03-13-22:00",
+        "2021-03-13-23:00",
+        "2021-03-14-00:00",
+        "2021-03-14-01:00",
+        "2021-03-14-03:00",
+        "2021-03-14-04:00",
+    ]
+    assert partitions_def.get_num_partitions(current_time) == 6
+    assert partitions_def.get_partition_key_index("2021-03-14-03:00") == 4
+    assert partitions_def.time_window_for_partition_key("2021-03-14-01:00") == TimeWindow(
+        pendulum.datetime(2021, 3, 14, 1, tz="US/Central"),
+        pendulum.datetime(2021, 3, 14, 3, tz="US/Central"),
+    )
+
+    daily_partitions_def = DailyPartitionsDefinition(
+        start_date="2021-03-01", hour_offset=2, minute_offset=30, timezone="US/Central"
+    )
+    daily_partitions = daily_partitions_def.get_partitions(
+        pendulum.datetime(2021, 3, 20, tz="US/Central")
+    )
+    for index, partition in enumerate(daily_partitions):
+        assert daily_partitions_def.get_partition_key_index(partition.name) == index
+        assert daily_partitions_def.time_window_for_partition_key(partition.name) == partition.value
@@ -1,6 +1,8 @@
 import re
+import zlib
 
 import pytest
+import sqlalchemy as db
 import yaml
 from dagster_tests.api_tests.utils import get_bar_workspace
 
@@ -24,8 +26,9 @@
     create_pipeline_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster.core.storage.runs.schema import SnapshotsTable
 from dagster.core.test_utils import create_run_for_test, environ, instance_for_test
-from dagster.serdes import ConfigurableClass
+from dagster.serdes import ConfigurableClass, is_binary_serialized
 from dagster.serdes.config_class import ConfigurableClassData
 
 
@@ -108,6 +111,49 @@ def noop_pipeline():
         assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
 
 
+def test_binary_snapshots():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    pipeline_snapshot = noop_pipeline.get_pipeline_snapshot()
+
+    with instance_for_test() as json_instance:
+        json_snapshot_id = json_instance.run_storage.add_pipeline_snapshot(pipeline_snapshot)
+
+        with instance_for_test(
+            overrides={"serialization": {"binary_snapshots": True}}
+        ) as binary_instance:
+            assert binary_instance.use_binary_snapshots
+            binary_snapshot_id = binary_instance.run_storage.add_pipeline_snapshot(
+                pipeline_snapshot
+            )
+
+            row = binary_instance.run_storage.fetchone(
+                db.select([SnapshotsTable.c.snapshot_body]).where(
+                    SnapshotsTable.c.snapshot_id == binary_snapshot_id
+                )
+            )
+            assert is_binary_serialized(zlib.decompress(row[0]))
+
+            # snapshot ids are content hashes of the json serialization, regardless of format
+            assert binary_snapshot_id == json_snapshot_id
+            assert (
+                binary_instance.get_pipeline_snapshot(binary_snapshot_id)
+                == json_instance.get_pipeline_snapshot(json_snapshot_id)
+                == pipeline_snapshot
+            )
+
+            result = execute_pipeline(noop_pipeline, instance=binary_instance)
+            assert result.success
+            run = binary_instance.get_run_by_id(result.run_id)
+            assert binary_instance.get_execution_plan_snapshot(run.execution_plan_snapshot_id)
+
+
 def test_submit_run():
     with instance_for_test(
         overrides={
@@ -126,6 +126,22 @@
           },
           "type_param_keys": null
         },
+        "Map.String.Int": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": null,
+          "given_name": null,
+          "key": "Map.String.Int",
+          "kind": {
+            "__enum__": "ConfigTypeKind.MAP"
+          },
+          "scalar_kind": null,
+          "type_param_keys": [
+            "String",
+            "Int"
+          ]
+        },
         "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -190,6 +206,38 @@
             "Selector.e04723c9d9937e3ab21206435b22247cfbe58269"
           ]
         },
+        "Selector.07bbcfacb660c8bcb1f09fefddd668806cc98952": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "in_process",
+              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+              "description": null,
+              "is_required": false,
+              "name": "multiprocess",
+              "type_key": "Shape.66ea610fce90f598a2fee11298dfe1bb23453d5d"
+            }
+          ],
+          "given_name": null,
+          "key": "Selector.07bbcfacb660c8bcb1f09fefddd668806cc98952",
+          "kind": {
+            "__enum__": "ConfigTypeKind.SELECTOR"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
         "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -491,38 +539,6 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "in_process",
-              "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-              "description": null,
-              "is_required": false,
-              "name": "multiprocess",
-              "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-            }
-          ],
-          "given_name": null,
-          "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-          "kind": {
-            "__enum__": "ConfigTypeKind.SELECTOR"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
         "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
           "__class__": "ConfigTypeSnap",
           "description": null,
@@ -546,60 +562,39 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
+        "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
-          "field_aliases": {
-            "solids": "ops"
-          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"in_process\\": {}}",
-              "description": null,
-              "is_required": false,
-              "name": "execution",
-              "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{}",
-              "description": null,
-              "is_required": false,
-              "name": "loggers",
-              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-            },
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"io_manager\\": {}}",
+              "default_value_as_json_str": "\\"INFO\\"",
               "description": null,
               "is_required": false,
-              "name": "resources",
-              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+              "name": "log_level",
+              "type_key": "String"
             },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "default_value_as_json_str": "\\"dagster\\"",
               "description": null,
               "is_required": false,
-              "name": "solids",
-              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+              "name": "name",
+              "type_key": "String"
             }
           ],
           "given_name": null,
-          "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
+          "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+        "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -607,22 +602,22 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+              "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
               "description": null,
               "is_required": false,
               "name": "config",
-              "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+              "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
             }
           ],
           "given_name": null,
-          "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+          "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+        "Shape.3e8f5f6187f6453e21469c73c6fc3cb6c9f753a3": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -630,54 +625,68 @@
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": true,
-              "default_value_as_json_str": "\\"INFO\\"",
-              "description": null,
+              "default_value_as_json_str": "100",
+              "description": "The number of steps a worker process executes before it is replaced by a new one, which bounds any memory that builds up in it. Set to 0 to keep workers for the whole run.",
               "is_required": false,
-              "name": "log_level",
-              "type_key": "String"
-            },
+              "name": "max_tasks_per_worker",
+              "type_key": "Int"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.3e8f5f6187f6453e21469c73c6fc3cb6c9f753a3",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "\\"dagster\\"",
+              "default_provided": false,
+              "default_value_as_json_str": null,
               "description": null,
               "is_required": false,
-              "name": "name",
-              "type_key": "String"
+              "name": "result",
+              "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
             }
           ],
           "given_name": null,
-          "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
+          "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
+        "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
-              "description": null,
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Explicit modules to preload in the forkserver.",
               "is_required": false,
-              "name": "config",
-              "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+              "name": "preload_modules",
+              "type_key": "Array.String"
             }
           ],
           "given_name": null,
-          "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+          "key": "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+        "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -687,59 +696,68 @@
               "default_provided": false,
               "default_value_as_json_str": null,
               "description": null,
-              "is_required": false,
-              "name": "result",
-              "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+              "is_required": true,
+              "name": "path",
+              "type_key": "String"
             }
           ],
           "given_name": null,
-          "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+          "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef": {
+        "Shape.620c49416f01bda6a950c6b220dbd7d7d0b1095f": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "\\"priority\\"",
+              "description": null,
+              "is_required": false,
+              "name": "policy",
+              "type_key": "StepSchedulingPolicy"
+            },
             {
               "__class__": "ConfigFieldSnap",
               "default_provided": false,
               "default_value_as_json_str": null,
-              "description": "Explicit modules to preload in the forkserver.",
+              "description": "The number of slots of each named resource available to the steps of a run, e.g. {memory_gb: 16, db-connections: 4}. Steps claim slots with tags of the form dagster/slots/<name>: <amount>, and are held back while the slots they need are taken by other steps.",
               "is_required": false,
-              "name": "preload_modules",
-              "type_key": "Array.String"
+              "name": "slot_limits",
+              "type_key": "Map.String.Int"
             }
           ],
           "given_name": null,
-          "key": "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef",
+          "key": "Shape.620c49416f01bda6a950c6b220dbd7d7d0b1095f",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
+        "Shape.66ea610fce90f598a2fee11298dfe1bb23453d5d": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
               "description": null,
-              "is_required": true,
-              "name": "path",
-              "type_key": "String"
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.b71061b497b43eddef8a3ea9857add0493d11fff"
             }
           ],
           "given_name": null,
-          "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
+          "key": "Shape.66ea610fce90f598a2fee11298dfe1bb23453d5d",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
@@ -862,43 +880,7 @@
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [
-            {
-              "__class__": "ConfigFieldSnap",
-              "default_provided": true,
-              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-              "description": null,
-              "is_required": false,
-              "name": "config",
-              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
-          "__class__": "ConfigTypeSnap",
-          "description": null,
-          "enum_values": null,
-          "fields": [],
-          "given_name": null,
-          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
+        "Shape.b71061b497b43eddef8a3ea9857add0493d11fff": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
@@ -929,41 +911,172 @@
               "is_required": false,
               "name": "start_method",
               "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Configure the order in which ready steps are launched.",
+              "is_required": false,
+              "name": "step_scheduling",
+              "type_key": "Shape.620c49416f01bda6a950c6b220dbd7d7d0b1095f"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": "Execute steps in a pool of up to max_concurrent long-lived worker processes, instead of starting a new process for each step. Workers load the job once and then execute steps one at a time, which avoids paying process startup and import costs for every step.",
+              "is_required": false,
+              "name": "worker_pool",
+              "type_key": "Shape.3e8f5f6187f6453e21469c73c6fc3cb6c9f753a3"
             }
           ],
           "given_name": null,
-          "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+          "key": "Shape.b71061b497b43eddef8a3ea9857add0493d11fff",
           "kind": {
             "__enum__": "ConfigTypeKind.STRICT_SHAPE"
           },
           "scalar_kind": null,
           "type_param_keys": null
         },
-        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+        "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614": {
           "__class__": "ConfigTypeSnap",
           "description": null,
           "enum_values": null,
+          "field_aliases": {
+            "solids": "ops"
+          },
           "fields": [
             {
               "__class__": "ConfigFieldSnap",
-              "default_provided": false,
-              "default_value_as_json_str": null,
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"in_process\\": {}}",
               "description": null,
               "is_required": false,
-              "name": "console",
-              "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
-            }
-          ],
-          "given_name": null,
-          "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
-          "kind": {
-            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
-          },
-          "scalar_kind": null,
-          "type_param_keys": null
-        },
-        "String": {
-          "__class__": "ConfigTypeSnap",
+              "name": "execution",
+              "type_key": "Selector.07bbcfacb660c8bcb1f09fefddd668806cc98952"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{}",
+              "description": null,
+              "is_required": false,
+              "name": "loggers",
+              "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"io_manager\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "resources",
+              "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+            },
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"a_solid\\": {}}",
+              "description": null,
+              "is_required": false,
+              "name": "solids",
+              "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": true,
+              "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+              "description": null,
+              "is_required": false,
+              "name": "config",
+              "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [],
+          "given_name": null,
+          "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": null,
+          "fields": [
+            {
+              "__class__": "ConfigFieldSnap",
+              "default_provided": false,
+              "default_value_as_json_str": null,
+              "description": null,
+              "is_required": false,
+              "name": "console",
+              "type_key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb"
+            }
+          ],
+          "given_name": null,
+          "key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c",
+          "kind": {
+            "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "StepSchedulingPolicy": {
+          "__class__": "ConfigTypeSnap",
+          "description": null,
+          "enum_values": [
+            {
+              "__class__": "ConfigEnumValueSnap",
+              "description": "Order ready steps by their dagster/priority tag.",
+              "value": "priority"
+            },
+            {
+              "__class__": "ConfigEnumValueSnap",
+              "description": "Order ready steps by their dagster/priority tag, then by the length of the longest chain of steps downstream of them.",
+              "value": "critical_path"
+            }
+          ],
+          "fields": null,
+          "given_name": "StepSchedulingPolicy",
+          "key": "StepSchedulingPolicy",
+          "kind": {
+            "__enum__": "ConfigTypeKind.ENUM"
+          },
+          "scalar_kind": null,
+          "type_param_keys": null
+        },
+        "String": {
+          "__class__": "ConfigTypeSnap",
           "description": "",
           "enum_values": null,
           "fields": null,
@@ -1121,7 +1234,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614"
       },
       {
         "__class__": "ModeDefSnap",
@@ -1159,7 +1272,7 @@
             "name": "io_manager"
           }
         ],
-        "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+        "root_config_key": "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614"
       }
     ],
     "name": "a_pipeline",
@@ -1333,6 +1446,22 @@
               },
               "type_param_keys": null
             },
+            "Map.String.Int": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": null,
+              "given_name": null,
+              "key": "Map.String.Int",
+              "kind": {
+                "__enum__": "ConfigTypeKind.MAP"
+              },
+              "scalar_kind": null,
+              "type_param_keys": [
+                "String",
+                "Int"
+              ]
+            },
             "ScalarUnion.Bool-Selector.be5d518b39e86a43c5f2eecaf538c1f6c7711b59": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1397,6 +1526,38 @@
                 "Selector.e04723c9d9937e3ab21206435b22247cfbe58269"
               ]
             },
+            "Selector.07bbcfacb660c8bcb1f09fefddd668806cc98952": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "in_process",
+                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "multiprocess",
+                  "type_key": "Shape.66ea610fce90f598a2fee11298dfe1bb23453d5d"
+                }
+              ],
+              "given_name": null,
+              "key": "Selector.07bbcfacb660c8bcb1f09fefddd668806cc98952",
+              "kind": {
+                "__enum__": "ConfigTypeKind.SELECTOR"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1698,38 +1859,6 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
-              "fields": [
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "in_process",
-                  "type_key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"config\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "multiprocess",
-                  "type_key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7"
-                }
-              ],
-              "given_name": null,
-              "key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f",
-              "kind": {
-                "__enum__": "ConfigTypeKind.SELECTOR"
-              },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
             "Shape.0bb49540f1708dcf5378009c9571eba999502e19": {
               "__class__": "ConfigTypeSnap",
               "description": null,
@@ -1753,60 +1882,39 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.1b89f17c57460ee6db612e2a543579b48100564d": {
+            "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "field_aliases": {
-                "solids": "ops"
-              },
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"in_process\\": {}}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "execution",
-                  "type_key": "Selector.fd22b7b986baf6998a8c16e63e78f44dd5e3f78f"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{}",
-                  "description": null,
-                  "is_required": false,
-                  "name": "loggers",
-                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
-                },
-                {
-                  "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
+                  "default_value_as_json_str": "\\"INFO\\"",
                   "description": null,
                   "is_required": false,
-                  "name": "resources",
-                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                  "name": "log_level",
+                  "type_key": "String"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "default_value_as_json_str": "\\"dagster\\"",
                   "description": null,
                   "is_required": false,
-                  "name": "solids",
-                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
+                  "name": "name",
+                  "type_key": "String"
                 }
               ],
               "given_name": null,
-              "key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d",
+              "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7": {
+            "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1814,22 +1922,22 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
                   "description": null,
                   "is_required": false,
                   "name": "config",
-                  "type_key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4"
+                  "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
                 }
               ],
               "given_name": null,
-              "key": "Shape.21277960d85eafb5579d7a10d7a715e444c5a1f7",
+              "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.241ac489ffa5f718db6444bae7849fb86a62e441": {
+            "Shape.3e8f5f6187f6453e21469c73c6fc3cb6c9f753a3": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1837,54 +1945,68 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "\\"INFO\\"",
-                  "description": null,
+                  "default_value_as_json_str": "100",
+                  "description": "The number of steps a worker process executes before it is replaced by a new one, which bounds any memory that builds up in it. Set to 0 to keep workers for the whole run.",
                   "is_required": false,
-                  "name": "log_level",
-                  "type_key": "String"
-                },
+                  "name": "max_tasks_per_worker",
+                  "type_key": "Int"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.3e8f5f6187f6453e21469c73c6fc3cb6c9f753a3",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "\\"dagster\\"",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
                   "description": null,
                   "is_required": false,
-                  "name": "name",
-                  "type_key": "String"
+                  "name": "result",
+                  "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
                 }
               ],
               "given_name": null,
-              "key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441",
+              "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.3baab16166bacfaf4705811e64d356112fd733cb": {
+            "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": true,
-                  "default_value_as_json_str": "{\\"log_level\\": \\"INFO\\", \\"name\\": \\"dagster\\"}",
-                  "description": null,
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Explicit modules to preload in the forkserver.",
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.241ac489ffa5f718db6444bae7849fb86a62e441"
+                  "name": "preload_modules",
+                  "type_key": "Array.String"
                 }
               ],
               "given_name": null,
-              "key": "Shape.3baab16166bacfaf4705811e64d356112fd733cb",
+              "key": "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b": {
+            "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -1894,59 +2016,68 @@
                   "default_provided": false,
                   "default_value_as_json_str": null,
                   "description": null,
-                  "is_required": false,
-                  "name": "result",
-                  "type_key": "Selector.e52fa3afbe531d9522fae1206f3ae9d248775742"
+                  "is_required": true,
+                  "name": "path",
+                  "type_key": "String"
                 }
               ],
               "given_name": null,
-              "key": "Shape.41de0e2d7b75524510155d0bdab8723c6feced3b",
+              "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef": {
+            "Shape.620c49416f01bda6a950c6b220dbd7d7d0b1095f": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "\\"priority\\"",
+                  "description": null,
+                  "is_required": false,
+                  "name": "policy",
+                  "type_key": "StepSchedulingPolicy"
+                },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": false,
                   "default_value_as_json_str": null,
-                  "description": "Explicit modules to preload in the forkserver.",
+                  "description": "The number of slots of each named resource available to the steps of a run, e.g. {memory_gb: 16, db-connections: 4}. Steps claim slots with tags of the form dagster/slots/<name>: <amount>, and are held back while the slots they need are taken by other steps.",
                   "is_required": false,
-                  "name": "preload_modules",
-                  "type_key": "Array.String"
+                  "name": "slot_limits",
+                  "type_key": "Map.String.Int"
                 }
               ],
               "given_name": null,
-              "key": "Shape.45a8f1f21db73ecbfa5b4e07b9aedc1835cef1ef",
+              "key": "Shape.620c49416f01bda6a950c6b220dbd7d7d0b1095f",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2": {
+            "Shape.66ea610fce90f598a2fee11298dfe1bb23453d5d": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
                   "description": null,
-                  "is_required": true,
-                  "name": "path",
-                  "type_key": "String"
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.b71061b497b43eddef8a3ea9857add0493d11fff"
                 }
               ],
               "given_name": null,
-              "key": "Shape.4b53b73df342381d0d05c5f36183dc99cb9676e2",
+              "key": "Shape.66ea610fce90f598a2fee11298dfe1bb23453d5d",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2069,7 +2200,7 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+            "Shape.b71061b497b43eddef8a3ea9857add0493d11fff": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
@@ -2077,69 +2208,140 @@
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "default_value_as_json_str": "0",
                   "description": null,
                   "is_required": false,
-                  "name": "config",
-                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                  "name": "max_concurrent",
+                  "type_key": "Int"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "retries",
+                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+                  "is_required": false,
+                  "name": "start_method",
+                  "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Configure the order in which ready steps are launched.",
+                  "is_required": false,
+                  "name": "step_scheduling",
+                  "type_key": "Shape.620c49416f01bda6a950c6b220dbd7d7d0b1095f"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": false,
+                  "default_value_as_json_str": null,
+                  "description": "Execute steps in a pool of up to max_concurrent long-lived worker processes, instead of starting a new process for each step. Workers load the job once and then execute steps one at a time, which avoids paying process startup and import costs for every step.",
+                  "is_required": false,
+                  "name": "worker_pool",
+                  "type_key": "Shape.3e8f5f6187f6453e21469c73c6fc3cb6c9f753a3"
                 }
               ],
               "given_name": null,
-              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "key": "Shape.b71061b497b43eddef8a3ea9857add0493d11fff",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
               "scalar_kind": null,
               "type_param_keys": null
             },
-            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+            "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614": {
               "__class__": "ConfigTypeSnap",
               "description": null,
               "enum_values": null,
-              "fields": [],
-              "given_name": null,
-              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
-              "kind": {
-                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              "field_aliases": {
+                "solids": "ops"
               },
-              "scalar_kind": null,
-              "type_param_keys": null
-            },
-            "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4": {
-              "__class__": "ConfigTypeSnap",
-              "description": null,
-              "enum_values": null,
               "fields": [
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "0",
+                  "default_value_as_json_str": "{\\"in_process\\": {}}",
                   "description": null,
                   "is_required": false,
-                  "name": "max_concurrent",
-                  "type_key": "Int"
+                  "name": "execution",
+                  "type_key": "Selector.07bbcfacb660c8bcb1f09fefddd668806cc98952"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
                   "default_provided": true,
-                  "default_value_as_json_str": "{\\"enabled\\": {}}",
+                  "default_value_as_json_str": "{}",
                   "description": null,
                   "is_required": false,
-                  "name": "retries",
-                  "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+                  "name": "loggers",
+                  "type_key": "Shape.ebeaf4550c200fb540f2e1f3f2110debd8c4157c"
                 },
                 {
                   "__class__": "ConfigFieldSnap",
-                  "default_provided": false,
-                  "default_value_as_json_str": null,
-                  "description": "Select how subprocesses are created. Defaults to spawn.\\nWhen forkserver is selected, set_forkserver_preload will be called with either:\\n* the preload_modules list if provided by config\\n* the module containing the Job if it was loaded from a module\\n* dagster\\nhttps://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"io_manager\\": {}}",
+                  "description": null,
                   "is_required": false,
-                  "name": "start_method",
-                  "type_key": "Selector.0f5471adc2ad814d1c9fd94e2fa73c07217dea47"
+                  "name": "resources",
+                  "type_key": "Shape.0bb49540f1708dcf5378009c9571eba999502e19"
+                },
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"a_solid\\": {}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "solids",
+                  "type_key": "Shape.b25df6ff575a5177ad6130bc61f4d62097c2a29b"
                 }
               ],
               "given_name": null,
-              "key": "Shape.e248cccc2d2206bf427e9bc9c2d22833f2aeb6d4",
+              "key": "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [
+                {
+                  "__class__": "ConfigFieldSnap",
+                  "default_provided": true,
+                  "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+                  "description": null,
+                  "is_required": false,
+                  "name": "config",
+                  "type_key": "Shape.979b3d2fece4f3eb92e90f2ec9fb4c85efe9ea5c"
+                }
+              ],
+              "given_name": null,
+              "key": "Shape.ca5906d9a0377218b4ee7d940ad55957afa73d1b",
+              "kind": {
+                "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
+            "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": null,
+              "fields": [],
+              "given_name": null,
+              "key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709",
               "kind": {
                 "__enum__": "ConfigTypeKind.STRICT_SHAPE"
               },
@@ -2169,6 +2371,30 @@
               "scalar_kind": null,
               "type_param_keys": null
             },
+            "StepSchedulingPolicy": {
+              "__class__": "ConfigTypeSnap",
+              "description": null,
+              "enum_values": [
+                {
+                  "__class__": "ConfigEnumValueSnap",
+                  "description": "Order ready steps by their dagster/priority tag.",
+                  "value": "priority"
+                },
+                {
+                  "__class__": "ConfigEnumValueSnap",
+                  "description": "Order ready steps by their dagster/priority tag, then by the length of the longest chain of steps downstream of them.",
+                  "value": "critical_path"
+                }
+              ],
+              "fields": null,
+              "given_name": "StepSchedulingPolicy",
+              "key": "StepSchedulingPolicy",
+              "kind": {
+                "__enum__": "ConfigTypeKind.ENUM"
+              },
+              "scalar_kind": null,
+              "type_param_keys": null
+            },
             "String": {
               "__class__": "ConfigTypeSnap",
               "description": "",
@@ -2328,7 +2554,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614"
           },
           {
             "__class__": "ModeDefSnap",
@@ -2366,7 +2592,7 @@
                 "name": "io_manager"
               }
             ],
-            "root_config_key": "Shape.1b89f17c57460ee6db612e2a543579b48100564d"
+            "root_config_key": "Shape.bb4596f664399b6014f70c83efbad9b1c25c1614"
           }
         ],
         "name": "a_pipeline",
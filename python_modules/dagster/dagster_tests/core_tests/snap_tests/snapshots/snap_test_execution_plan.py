@@ -20,7 +20,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "330e31c23c3edacaa7a9224039b53a703f011788",
+  "pipeline_snapshot_id": "0100a781d7a103b689dbffdcefec010bad6a31e1",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "solid_one",
@@ -154,7 +154,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7ffd65ba8633d4c172a7b15dfee5927bed301724",
+  "pipeline_snapshot_id": "afeb5d4943a3ba0be259550fb8b2a763e77d243f",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -217,7 +217,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "b96bfd4d61336a6ed2016679d1467c3e1daa3285",
+  "pipeline_snapshot_id": "b475e94a1f383d46e9d5c5256e7274974731bb95",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_solid"
@@ -294,7 +294,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "7bb46b4373672e250386288663f7eca81f0a0a02",
+  "pipeline_snapshot_id": "4baf2bb23874ea5625a6edf4da15ac496ea841ba",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
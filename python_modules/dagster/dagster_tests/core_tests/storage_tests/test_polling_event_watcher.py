@@ -6,7 +6,12 @@
 import dagster._check as check
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log import SqlPollingEventWatcher, SqliteEventLogStorage
+from dagster.core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqlMultiplexedPollingEventWatcher,
+    SqlPollingEventWatcher,
+    SqliteEventLogStorage,
+)
 from dagster.core.storage.event_log.base import EventLogCursor
 
 
@@ -49,6 +54,28 @@ def dispose(self):
             self._watcher.close()
 
 
+class ConsolidatedSqliteMultiplexedPollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite-backed event log storage that uses SqlMultiplexedPollingEventWatcher for
+    watching runs, since the multiplexed watcher requires the events of all runs to be in one table.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(ConsolidatedSqliteMultiplexedPollingEventLogStorage, self).__init__(*args, **kwargs)
+        self._watcher = SqlMultiplexedPollingEventWatcher(self)
+        self._disposed = False
+
+    def watch(self, run_id, cursor, callback):
+        self._watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(self, run_id, handler):
+        self._watcher.unwatch_run(run_id, handler)
+
+    def dispose(self):
+        if not self._disposed:
+            self._disposed = True
+            self._watcher.close()
+
+
 RUN_ID = "foo"
 
 
@@ -129,3 +156,46 @@ def watch_two(event, _cursor):
 
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
+
+
+def test_multiplexed_watcher():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteMultiplexedPollingEventLogStorage(tmpdir_path)
+        other_run_id = "bar"
+        watched_1 = []
+        watched_2 = []
+        watched_other = []
+
+        storage.store_event(create_event(1))
+        storage.watch(
+            RUN_ID, str(EventLogCursor.from_storage_id(1)), lambda e, _c: watched_1.append(e)
+        )
+        storage.watch(other_run_id, None, lambda e, _c: watched_other.append(e))
+
+        storage.store_event(create_event(2))
+        storage.store_event(create_event(3, run_id=other_run_id))
+
+        attempts = 20
+        while (len(watched_1) < 1 or len(watched_other) < 1) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        def watch_two(event, _cursor):
+            watched_2.append(event)
+
+        storage.watch(RUN_ID, str(EventLogCursor.from_storage_id(2)), watch_two)
+        storage.store_event(create_event(4))
+
+        attempts = 20
+        while (len(watched_1) < 2 or len(watched_2) < 1) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        storage.end_watch(RUN_ID, watch_two)
+        assert storage._watcher.has_run_id(other_run_id)  # pylint: disable=protected-access
+
+        assert [int(evt.message) for evt in watched_1] == [2, 4]
+        assert [int(evt.message) for evt in watched_2] == [4]
+        assert [int(evt.message) for evt in watched_other] == [3]
+
+        storage.dispose()
@@ -9,6 +9,7 @@
 import mock
 import pendulum
 import pytest
+import sqlalchemy as db
 
 from dagster import (
     AssetGroup,
@@ -40,7 +41,12 @@
 from dagster.core.execution.api import execute_run
 from dagster.core.execution.plan.handle import StepHandle
 from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster.core.execution.stats import StepEventStatus
+from dagster.core.execution.plan.outputs import StepOutputHandle
+from dagster.core.execution.stats import (
+    StepEventStatus,
+    StepStatsAccumulator,
+    build_run_step_stats_from_events,
+)
 from dagster.core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster.core.storage.event_log.base import (
     EventLogRecord,
@@ -49,13 +55,16 @@
 )
 from dagster.core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    STEP_STATS_TABLE,
     migrate_asset_key_data,
+    migrate_step_stats_data,
 )
+from dagster.core.storage.event_log.schema import StepStatsTable
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import create_run_for_test, instance_for_test
 from dagster.core.utils import make_new_run_id
 from dagster.loggers import colored_console_logger
-from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.serdes import deserialize_as, deserialize_json_to_dagster_namedtuple
 from dagster.utils import datetime_as_float
 
 TEST_TIMEOUT = 5
@@ -403,6 +412,49 @@ def test_event_log_storage_store_with_multiple_runs(self, instance, storage):
             for run in runs:
                 instance.delete_run(run)
 
+    def test_event_log_storage_store_events_batch(self, instance, storage):
+        runs = ["foo", "bar"]
+        with create_and_delete_test_runs(instance, runs):
+            events = [
+                create_test_event_log_record(str(i), run_id) for i in range(3) for run_id in runs
+            ]
+            storage.store_events(events)
+
+            for run_id in runs:
+                run_events = storage.get_logs_for_run(run_id)
+                assert [event.user_message for event in run_events] == ["0", "1", "2"]
+
+            storage.store_events([])
+            for run_id in runs:
+                assert len(storage.get_logs_for_run(run_id)) == 3
+
+    def test_asset_materialization_store_events_batch(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+
+        @solid
+        def materialize_one(_):
+            yield AssetMaterialization(asset_key=asset_key)
+            yield Output(1)
+
+        def _solids():
+            materialize_one()
+
+        with instance_for_test() as created_instance:
+            if not storage._instance:  # pylint: disable=protected-access
+                storage.register_instance(created_instance)
+
+            events_one, _ = _synthesize_events(
+                _solids, instance=created_instance, run_id=test_run_id
+            )
+            storage.store_events(events_one)
+
+            assert len(storage.get_logs_for_run(test_run_id)) == len(events_one)
+            assert asset_key in set(storage.all_asset_keys())
+            assert len(storage.get_asset_events(asset_key)) == 1
+            asset_records = storage.get_asset_records([asset_key])
+            assert len(asset_records) == 1
+            assert asset_records[0].asset_entry.last_run_id == test_run_id
+
     def test_event_log_storage_watch(self, test_run_id, storage):
         if not self.can_watch():
             pytest.skip("storage cannot watch runs")
@@ -581,6 +633,12 @@ def test_secondary_index(self, storage):
         assert storage.has_secondary_index("_A")
         assert storage.has_secondary_index("_B")
 
+        # test that an index enabled by another process (e.g. `dagster instance reindex`) is picked
+        # up, by marking it complete without going through this storage's cache
+        assert not storage.has_secondary_index("_C")
+        SqlEventLogStorage.enable_secondary_index(storage, "_C")
+        assert storage.has_secondary_index("_C")
+
     def test_basic_event_store(self, test_run_id, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -1062,6 +1120,60 @@ def _one():
         assert step_stats[1].attempts == 1
         assert len(step_stats[1].attempts_list) == 1
 
+    def test_run_step_stats_for_runs(self, instance, storage):
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_fail(context, _input):
+            raise Exception("booo")
+
+        def _one():
+            should_fail(should_succeed())
+
+        def _two():
+            should_succeed()
+
+        run_id_one = make_new_run_id()
+        run_id_two = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_one, run_id_two]):
+            events_one, _ = _synthesize_events(_one, check_success=False, run_id=run_id_one)
+            events_two, _ = _synthesize_events(_two, run_id=run_id_two)
+            for event in events_one + events_two:
+                storage.store_event(event)
+
+            step_stats_by_run_id = storage.get_step_stats_for_runs([run_id_one, run_id_two])
+            assert set(step_stats_by_run_id.keys()) == {run_id_one, run_id_two}
+            for run_id in [run_id_one, run_id_two]:
+                assert sorted(step_stats_by_run_id[run_id], key=lambda x: x.step_key) == sorted(
+                    storage.get_step_stats_for_run(run_id), key=lambda x: x.step_key
+                )
+            assert len(step_stats_by_run_id[run_id_one]) == 2
+            assert len(step_stats_by_run_id[run_id_two]) == 1
+
+            step_stats_by_run_id = storage.get_step_stats_for_runs(
+                [run_id_one, run_id_two], step_keys=["should_fail"]
+            )
+            assert [stats.step_key for stats in step_stats_by_run_id[run_id_one]] == ["should_fail"]
+            assert step_stats_by_run_id[run_id_two] == []
+
+        assert storage.get_step_stats_for_runs([]) == {}
+
+    def test_get_successful_step_output_handles(self, storage, test_run_id):
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_fail(context, _input):
+            raise Exception("booo")
+
+        def _one():
+            should_fail(should_succeed())
+
+        events, _ = _synthesize_events(_one, check_success=False, run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        assert storage.get_successful_step_output_handles(
+            test_run_id, ["should_succeed", "should_fail"]
+        ) == {StepOutputHandle("should_succeed", "result")}
+        assert storage.get_successful_step_output_handles(test_run_id, ["should_fail"]) == set()
+        assert storage.get_successful_step_output_handles(test_run_id, []) == set()
+
     def test_run_step_stats_with_retries(self, storage, test_run_id):
         @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
         def should_retry(context, _input):
@@ -1082,6 +1194,111 @@ def _one():
         assert step_stats[0].attempts == 4
         assert len(step_stats[0].attempts_list) == 4
 
+    def test_run_step_stats_table(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("step stats table only applies to sql storages")
+
+        if not storage.has_secondary_index(STEP_STATS_TABLE):
+            pytest.skip("step stats table has not been built for this storage")
+
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_retry(context, _input):
+            raise RetryRequested(max_retries=2)
+
+        @solid
+        def materialize_and_expect(_):
+            yield AssetMaterialization(asset_key="foo")
+            yield ExpectationResult(success=True, label="bar")
+            yield Output(1)
+
+        def _pipeline():
+            should_retry(should_succeed())
+            materialize_and_expect()
+
+        events, result = _synthesize_events(_pipeline, check_success=False, run_id=test_run_id)
+        storage.store_events(events[:10])
+        for event in events[10:]:
+            storage.store_event(event)
+
+        expected_step_stats = build_run_step_stats_from_events(result.run_id, events)
+        assert len(expected_step_stats) == 3
+
+        def _by_step_key(step_stats):
+            return {stats.step_key: stats for stats in step_stats}
+
+        assert _by_step_key(storage.get_step_stats_for_run(result.run_id)) == _by_step_key(
+            expected_step_stats
+        )
+
+        step_stats = storage.get_step_stats_for_run(result.run_id, step_keys=["should_retry"])
+        assert len(step_stats) == 1
+        assert step_stats[0].attempts == 3
+        assert len(step_stats[0].attempts_list) == 3
+
+        # rebuilding the table from the event log yields the same stats
+        migrate_step_stats_data(storage)
+        assert _by_step_key(storage.get_step_stats_for_run(result.run_id)) == _by_step_key(
+            expected_step_stats
+        )
+
+        # the stats rows leave out the materializations and expectation results of the step
+        with storage.run_connection(result.run_id) as conn:
+            stats_bodies = [
+                stats_body
+                for (stats_body,) in conn.execute(
+                    db.select([StepStatsTable.c.stats_body]).where(
+                        StepStatsTable.c.run_id == result.run_id
+                    )
+                ).fetchall()
+            ]
+        assert len(stats_bodies) == 3
+        assert all(
+            not accumulator.materialization_events and not accumulator.expectation_results
+            for accumulator in (
+                deserialize_as(stats_body, StepStatsAccumulator) for stats_body in stats_bodies
+            )
+        )
+
+        # a writer that loses the race to insert a step's row does not insert a duplicate row
+        with storage.run_connection(result.run_id) as conn:
+            # pylint: disable=protected-access
+            assert not storage._insert_step_stats_row(
+                conn, result.run_id, "should_retry", stats_bodies[0]
+            )
+        assert len(storage.get_step_stats_for_run(result.run_id)) == 3
+
+    def test_run_step_stats_table_interleaved_writers(self, storage, test_run_id):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("step stats table only applies to sql storages")
+
+        if not storage.has_secondary_index(STEP_STATS_TABLE):
+            pytest.skip("step stats table has not been built for this storage")
+
+        @solid(input_defs=[InputDefinition("_input", str)], output_defs=[OutputDefinition(str)])
+        def should_retry(context, _input):
+            raise RetryRequested(max_retries=2)
+
+        def _pipeline():
+            should_retry(should_succeed())
+
+        events, result = _synthesize_events(_pipeline, check_success=False, run_id=test_run_id)
+
+        # every other event is written as if by another process, by restoring the storage's cache
+        # of step stats rows afterwards, which leaves the cached rows behind the rows in the table
+        step_stats_row_cache = storage._step_stats_row_cache  # pylint: disable=protected-access
+        for i, event in enumerate(events):
+            cached_rows = dict(step_stats_row_cache)
+            storage.store_event(event)
+            if i % 2:
+                step_stats_row_cache.clear()
+                step_stats_row_cache.update(cached_rows)
+
+        expected_step_stats = build_run_step_stats_from_events(result.run_id, events)
+        assert len(expected_step_stats) == 2
+        assert {
+            stats.step_key: stats for stats in storage.get_step_stats_for_run(result.run_id)
+        } == {stats.step_key: stats for stats in expected_step_stats}
+
     # After adding the IN_PROGRESS field to the StepEventStatus enum, tests in internal fail
     # Temporarily skipping this test
     @pytest.mark.skip
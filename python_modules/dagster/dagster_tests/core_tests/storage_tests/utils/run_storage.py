@@ -520,6 +520,126 @@ def test_fetch_by_tags(self, storage):
         some_runs = storage.get_runs(RunsFilter(tags={}))
         assert len(some_runs) == 3
 
+    def test_fetch_latest_runs_by_tag_values(self, storage):
+        assert storage
+        one, two, three, four = [make_new_run_id() for _ in range(4)]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one, pipeline_name="some_pipeline", tags={"run_key": "a", "sensor": "foo"}
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two, pipeline_name="some_pipeline", tags={"run_key": "a", "sensor": "foo"}
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three, pipeline_name="some_pipeline", tags={"run_key": "b", "sensor": "foo"}
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=four, pipeline_name="some_pipeline", tags={"run_key": "b", "sensor": "bar"}
+            )
+        )
+
+        latest_runs = storage.get_latest_runs_by_tag_values("run_key", ["a", "b", "c"])
+        assert {tag_value: run.run_id for tag_value, run in latest_runs.items()} == {
+            "a": two,
+            "b": four,
+        }
+
+        latest_runs = storage.get_latest_runs_by_tag_values(
+            "run_key", ["a", "b", "c"], filters=RunsFilter(tags={"sensor": "foo"})
+        )
+        assert {tag_value: run.run_id for tag_value, run in latest_runs.items()} == {
+            "a": two,
+            "b": three,
+        }
+
+        latest_runs = storage.get_latest_runs_by_tag_values(
+            "run_key", ["a", "b"], filters=RunsFilter(job_name="other_pipeline")
+        )
+        assert latest_runs == {}
+
+        assert storage.get_latest_runs_by_tag_values("run_key", []) == {}
+
+        # more tag values than fit in a single query
+        many_tag_values = [str(i) for i in range(2000)] + ["b", "a"]
+        latest_runs = storage.get_latest_runs_by_tag_values("run_key", many_tag_values)
+        assert {tag_value: run.run_id for tag_value, run in latest_runs.items()} == {
+            "a": two,
+            "b": four,
+        }
+
+    def test_fetch_run_ids_with_tags(self, storage):
+        assert storage
+        one, two, three = [make_new_run_id() for _ in range(3)]
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                pipeline_name="some_pipeline",
+                tags={"priority": "1", "team": "a", "other": "x"},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                pipeline_name="some_pipeline",
+                tags={"team": "b"},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three,
+                pipeline_name="some_pipeline",
+                tags={"team": "a"},
+                status=PipelineRunStatus.SUCCESS,
+            )
+        )
+
+        assert storage.get_run_ids_with_tags() == [(three, {}), (two, {}), (one, {})]
+
+        assert storage.get_run_ids_with_tags(
+            filters=RunsFilter(statuses=[PipelineRunStatus.FAILURE]),
+            tag_keys=["priority", "team"],
+        ) == [(two, {"team": "b"}), (one, {"priority": "1", "team": "a"})]
+
+        assert storage.get_run_ids_with_tags(
+            filters=RunsFilter(tags={"team": "a"}), tag_keys=["team"], limit=1
+        ) == [(three, {"team": "a"})]
+
+        assert storage.get_run_ids_with_tags(filters=RunsFilter(job_name="other_pipeline")) == []
+
+    def test_fetch_run_ids_by_priority(self, storage):
+        assert storage
+        run_ids = [make_new_run_id() for _ in range(5)]
+        priorities = [None, "-1", "3", "foobar", "3"]
+        for run_id, priority in zip(run_ids, priorities):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    tags={"priority": priority} if priority else {},
+                    status=PipelineRunStatus.NOT_STARTED,
+                )
+            )
+
+        # highest priority first, then oldest first, with missing and malformed priorities as 0
+        assert [
+            run_id for run_id, _ in storage.get_run_ids_with_tags(priority_tag_key="priority")
+        ] == [run_ids[2], run_ids[4], run_ids[0], run_ids[3], run_ids[1]]
+
+        assert storage.get_run_ids_with_tags(
+            filters=RunsFilter(statuses=[PipelineRunStatus.NOT_STARTED]),
+            tag_keys=["priority"],
+            limit=2,
+            priority_tag_key="priority",
+        ) == [(run_ids[2], {"priority": "3"}), (run_ids[4], {"priority": "3"})]
+
     def test_paginated_fetch(self, storage):
         assert storage
         one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
@@ -774,6 +894,48 @@ def test_write_conflicting_run_id(self, storage):
         with pytest.raises(DagsterRunAlreadyExists):
             storage.add_run(run)
 
+    def test_add_runs(self, storage):
+        pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
+        pipeline_snapshot_id = storage.add_pipeline_snapshot(pipeline_def.get_pipeline_snapshot())
+
+        run_ids = [make_new_run_id() for _ in range(3)]
+        runs = [
+            TestRunStorage.build_run(
+                run_id=run_id,
+                pipeline_name="some_pipeline",
+                tags={"foo": "bar", PARTITION_NAME_TAG: str(i), PARTITION_SET_TAG: "set"},
+                pipeline_snapshot_id=pipeline_snapshot_id,
+            )
+            for i, run_id in enumerate(run_ids)
+        ]
+        assert storage.add_runs(runs) == runs
+        assert storage.add_runs([]) == []
+
+        assert {run.run_id for run in storage.get_runs()} == set(run_ids)
+        for run in runs:
+            assert storage.get_run_by_id(run.run_id) == run
+        assert {
+            run.run_id for run in storage.get_runs(RunsFilter(tags={PARTITION_NAME_TAG: "1"}))
+        } == {run_ids[1]}
+
+        new_run_id = make_new_run_id()
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [TestRunStorage.build_run(run_id=new_run_id, pipeline_name="foo"), runs[0]]
+            )
+        if isinstance(storage, SqlRunStorage):
+            # sql storages add the runs in a single transaction
+            assert not storage.has_run(new_run_id)
+
+        with pytest.raises(DagsterSnapshotDoesNotExist):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=make_new_run_id(), pipeline_name="foo", pipeline_snapshot_id="nope"
+                    )
+                ]
+            )
+
     def test_add_get_snapshot(self, storage):
         pipeline_def = PipelineDefinition(name="some_pipeline", solid_defs=[])
         pipeline_snapshot = pipeline_def.get_pipeline_snapshot()
@@ -860,6 +1022,27 @@ def test_add_get_execution_snapshot(self, storage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    def test_get_execution_plan_snapshots(self, storage):
+        from dagster.core.execution.api import create_execution_plan
+        from dagster.core.snap import snapshot_from_execution_plan
+
+        snapshot_ids = []
+        for pipeline_name in ["pipeline_one", "pipeline_two"]:
+            pipeline_def = PipelineDefinition(name=pipeline_name, solid_defs=[])
+            ep_snapshot = snapshot_from_execution_plan(
+                create_execution_plan(pipeline_def), pipeline_def.get_pipeline_snapshot_id()
+            )
+            snapshot_ids.append(storage.add_execution_plan_snapshot(ep_snapshot))
+
+        assert storage.get_execution_plan_snapshots([]) == {}
+
+        fetched = storage.get_execution_plan_snapshots(snapshot_ids + ["nope"])
+        assert set(fetched.keys()) == set(snapshot_ids)
+        for snapshot_id in snapshot_ids:
+            assert serialize_pp(fetched[snapshot_id]) == serialize_pp(
+                storage.get_execution_plan_snapshot(snapshot_id)
+            )
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1107,6 +1290,24 @@ def test_partition_status(self, storage):
         assert len(partition_data) == 3
         assert {_.partition for _ in partition_data} == {"one", "two", "three"}
         assert {_.run_id for _ in partition_data} == {one.run_id, two_retried.run_id, three.run_id}
+        assert [_.partition for _ in partition_data] == ["three", "two", "one"]
+        assert {_.partition: _.status for _ in partition_data} == {
+            "one": PipelineRunStatus.FAILURE,
+            "two": PipelineRunStatus.SUCCESS,
+            "three": PipelineRunStatus.SUCCESS,
+        }
+
+        partition_data = storage.get_run_partition_data(
+            "foo_set", "foo_pipeline", "fake@fake", partition_names=["two", "four"]
+        )
+        assert [(_.partition, _.run_id) for _ in partition_data] == [("two", two_retried.run_id)]
+        assert (
+            storage.get_run_partition_data(
+                "foo_set", "foo_pipeline", "fake@fake", partition_names=[]
+            )
+            == []
+        )
+        assert storage.get_run_partition_data("foo_set", "other_pipeline", "fake@fake") == []
 
     def _skip_in_memory(self, storage):
         from dagster.core.storage.runs import InMemoryRunStorage
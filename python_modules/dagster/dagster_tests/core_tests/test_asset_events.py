@@ -10,6 +10,8 @@
     multi_asset,
     op,
 )
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.snap import snapshot_from_execution_plan
 from dagster.core.test_utils import instance_for_test
 
 
@@ -86,3 +88,53 @@ def my_asset():
 
         assert instance.run_ids_for_asset_key(AssetKey("my_asset_name")) == [run_id]
         assert instance.run_ids_for_asset_key(AssetKey("my_other_asset")) == [run_id]
+
+
+def test_create_runs_asset_materialization_planned_events():
+    @asset
+    def upstream_asset():
+        return 1
+
+    @asset
+    def downstream_asset(upstream_asset):
+        return upstream_asset
+
+    asset_job = build_assets_job("asset_job", [upstream_asset, downstream_asset])
+    pipeline_snapshot = asset_job.get_pipeline_snapshot()
+    execution_plan_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(asset_job), asset_job.get_pipeline_snapshot_id()
+    )
+
+    with instance_for_test() as instance:
+        runs = instance.create_runs(
+            [
+                dict(
+                    pipeline_name="asset_job",
+                    run_id=None,
+                    run_config={},
+                    mode="default",
+                    solids_to_execute=None,
+                    step_keys_to_execute=None,
+                    status=None,
+                    tags={"run_number": str(i)},
+                    root_run_id=None,
+                    parent_run_id=None,
+                    pipeline_snapshot=pipeline_snapshot,
+                    execution_plan_snapshot=execution_plan_snapshot,
+                    parent_pipeline_snapshot=None,
+                )
+                for i in range(3)
+            ]
+        )
+        assert len(runs) == 3
+        assert len({run.run_id for run in runs}) == 3
+        assert len({run.execution_plan_snapshot_id for run in runs}) == 1
+        for i, run in enumerate(runs):
+            assert instance.get_run_by_id(run.run_id).tags == {"run_number": str(i)}
+
+        run_ids = {run.run_id for run in runs}
+        for asset_key in [AssetKey("upstream_asset"), AssetKey("downstream_asset")]:
+            records = instance.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION_PLANNED, asset_key)
+            )
+            assert {record.event_log_entry.run_id for record in records} == run_ids
@@ -308,6 +308,86 @@ def test_simple_backfill():
         assert three.tags[PARTITION_NAME_TAG] == "three"
 
 
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_chunked_backfill(use_threads, monkeypatch):
+    monkeypatch.setattr("dagster.daemon.backfill.CHECKPOINT_COUNT", 2)
+    monkeypatch.setattr("dagster.daemon.backfill.CHECKPOINT_INTERVAL", 0)
+
+    overrides = {"backfills": {"use_threads": True, "num_workers": 2}} if use_threads else None
+    with instance_for_context(default_repo, overrides) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+            )
+        )
+
+        iterator = execute_backfill_iteration(
+            instance, workspace, get_default_daemon_logger("BackfillDaemon")
+        )
+        # consume the first chunk, up to the checkpoint
+        while instance.get_backfill("simple").last_submitted_partition_index is None:
+            next(iterator)
+
+        backfill = instance.get_backfill("simple")
+        assert backfill.last_submitted_partition_name == "two"
+        assert backfill.last_submitted_partition_index == 1
+        assert backfill.partition_cursor == 2
+        assert instance.get_runs_count() == 2
+
+        list(iterator)
+
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+        runs = instance.get_runs()
+        # runs within a chunk may be created in any order when submitted on threads
+        assert sorted(run.tags[PARTITION_NAME_TAG] for run in runs) == ["one", "three", "two"]
+        assert runs[0].tags[PARTITION_NAME_TAG] == "three"
+
+
+def test_resume_backfill_from_partition_name():
+    with instance_for_context(default_repo) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        # backfills checkpointed by older versions only store the last submitted partition name
+        instance.add_backfill(
+            PartitionBackfill(
+                backfill_id="simple",
+                partition_set_origin=external_partition_set.get_external_origin(),
+                status=BulkActionStatus.REQUESTED,
+                partition_names=["one", "two", "three"],
+                from_failure=False,
+                reexecution_steps=None,
+                tags=None,
+                backfill_timestamp=pendulum.now().timestamp(),
+                last_submitted_partition_name="one",
+            )
+        )
+
+        list(
+            execute_backfill_iteration(
+                instance, workspace, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+        runs = instance.get_runs()
+        assert [run.tags[PARTITION_NAME_TAG] for run in reversed(runs)] == ["two", "three"]
+
+
 def test_canceled_backfill():
     with instance_for_context(default_repo) as (
         instance,
@@ -235,6 +235,31 @@ def test_tag_limits(workspace, daemon):
         assert get_run_ids(instance.run_launcher.queue()) == ["tiny-1", "large-1"]
 
 
+def test_tag_limits_beyond_first_batch(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=2,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        # the runs at the front of the queue are blocked, so the daemon has to look past them
+        for i in range(5):
+            create_run(
+                instance,
+                run_id=f"tiny-{i}",
+                status=PipelineRunStatus.QUEUED,
+                tags={"database": "tiny"},
+            )
+        create_run(
+            instance,
+            run_id="large-1",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "large"},
+        )
+
+        list(daemon.run_iteration(instance, workspace))
+
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-0", "large-1"]
+
+
 def test_tag_limits_just_key(workspace, daemon):
     with instance_for_queued_run_coordinator(
         max_concurrent_runs=10,
@@ -563,3 +588,34 @@ def test_key_limit_with_extra_tags(workspace, daemon):
 
         list(daemon.run_iteration(instance, workspace))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_tag_limits_across_iterations(workspace, daemon):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        create_run(
+            instance,
+            run_id="tiny-in-progress",
+            status=PipelineRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        create_run(
+            instance,
+            run_id="tiny-queued",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "tiny"},
+        )
+
+        list(daemon.run_iteration(instance, workspace))
+        assert instance.run_launcher.queue() == []
+
+        # the counts carry over between iterations until the in progress run finishes
+        list(daemon.run_iteration(instance, workspace))
+        assert instance.run_launcher.queue() == []
+
+        instance.report_run_failed(instance.get_run_by_id("tiny-in-progress"))
+
+        list(daemon.run_iteration(instance, workspace))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-queued"]
@@ -43,6 +43,7 @@
 from dagster.daemon import get_default_daemon_logger
 from dagster.daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
 from dagster.seven.compat.pendulum import create_pendulum_time, to_timezone
+from dagster.utils.error import SerializableErrorInfo
 
 
 @solid
@@ -1290,6 +1291,62 @@ def test_large_sensor():
             )
 
 
+def test_threaded_sensors(monkeypatch):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+
+    def fake_sleep(s):
+        pendulum.set_test_now(pendulum.now().add(seconds=s))
+
+    with instance_with_sensors(overrides={"sensors": {"use_threads": True, "num_workers": 4}}) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        assert instance.sensor_settings == {"use_threads": True, "num_workers": 4}
+
+        with pendulum.test(freeze_datetime):
+            success_sensor = external_repo.get_external_sensor("always_on_sensor")
+            skip_sensor = external_repo.get_external_sensor("simple_sensor")
+            failing_sensor = external_repo.get_external_sensor("error_sensor")
+            for external_sensor in [success_sensor, skip_sensor, failing_sensor]:
+                instance.start_sensor(external_sensor)
+
+            # a single iteration of the loop, which evaluates each sensor on a worker thread
+            monkeypatch.setattr(time, "sleep", fake_sleep)
+            results = list(
+                execute_sensor_iteration_loop(
+                    instance,
+                    workspace,
+                    get_default_daemon_logger("SensorDaemon"),
+                    until=freeze_datetime.add(seconds=1).timestamp(),
+                )
+            )
+            monkeypatch.undo()
+
+            # the error of the failing sensor is surfaced by the loop
+            errors = [result for result in results if isinstance(result, SerializableErrorInfo)]
+            assert len(errors) == 1
+            assert "womp womp" in errors[0].to_string()
+
+            wait_for_all_runs_to_start(instance)
+            assert instance.get_runs_count() == 1
+
+            # a failing sensor does not affect the ticks of the other sensors
+            for external_sensor, expected_status in [
+                (success_sensor, TickStatus.SUCCESS),
+                (skip_sensor, TickStatus.SKIPPED),
+                (failing_sensor, TickStatus.FAILURE),
+            ]:
+                ticks = instance.get_ticks(
+                    external_sensor.get_external_origin_id(), external_sensor.selector_id
+                )
+                assert len(ticks) == 1
+                validate_tick(ticks[0], external_sensor, freeze_datetime, expected_status)
+
+
 def test_cursor_sensor():
     freeze_datetime = to_timezone(
         create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
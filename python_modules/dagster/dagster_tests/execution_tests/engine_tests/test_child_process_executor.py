@@ -1,9 +1,11 @@
 import multiprocessing
 import os
 import time
+from contextlib import contextmanager
 
 import pytest
 
+from dagster._check import CheckError
 from dagster.core.executor.child_process_executor import (
     ChildProcessCommand,
     ChildProcessCrashException,
@@ -11,6 +13,8 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    enter_worker_context,
     execute_child_process_command,
 )
 from dagster.utils import segfault
@@ -51,6 +55,22 @@ def execute(self):
         yield 1
 
 
+_worker_contexts = []
+
+
+@contextmanager
+def _worker_context():
+    _worker_contexts.append(os.getpid())
+    yield len(_worker_contexts)
+
+
+class EnterWorkerContextCommand(ChildProcessCommand):  # pylint: disable=no-init
+    def execute(self):
+        if not _worker_contexts:
+            enter_worker_context(_worker_context())
+        yield len(_worker_contexts)
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -106,3 +126,22 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+def test_worker_context():
+    worker = ChildProcessWorker(multiprocessing)
+    try:
+        for _ in range(3):
+            events = [
+                event
+                for event in worker.execute_command(EnterWorkerContextCommand())
+                if event and not isinstance(event, ChildProcessEvent)
+            ]
+            # the context entered by the first command is kept for the later ones
+            assert events == [1]
+        assert worker.num_tasks == 3
+    finally:
+        worker.shutdown()
+
+    with pytest.raises(CheckError, match="worker process"):
+        enter_worker_context(_worker_context())
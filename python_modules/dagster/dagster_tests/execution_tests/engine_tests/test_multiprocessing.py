@@ -21,6 +21,7 @@
     solid,
 )
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
+from dagster.core.executor.multiprocess import DELEGATE_MARKER
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.test_utils import default_mode_def_for_test, instance_for_test
@@ -67,6 +68,102 @@ def test_explicit_spawn():
         assert result.result_for_solid("adder").output_value() == 11
 
 
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        pipe = reconstructable(define_diamond_pipeline)
+        result = execute_pipeline(
+            pipe,
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 2,
+                            "worker_pool": {"max_tasks_per_worker": 3},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("adder").output_value() == 11
+
+        step_pids = {
+            event.step_key: next(
+                entry.entry_data.text
+                for entry in event.event_specific_data.metadata_entries
+                if entry.label == "pid"
+            )
+            for event in result.event_list
+            if event.is_engine_event and event.event_specific_data.marker_end == DELEGATE_MARKER
+        }
+        assert len(step_pids) == 4
+        # steps share worker processes rather than each getting a new one
+        assert len(set(step_pids.values())) < 4
+        assert os.getpid() not in {int(pid) for pid in step_pids.values()}
+
+
+@pytest.mark.parametrize("executor_name", ["in_process", "multiprocess"])
+def test_event_batching_execution(executor_name):
+    def _stored_step_event_types(instance, run_id):
+        return sorted(
+            (event.step_key, event.dagster_event_type.value)
+            for event in instance.all_logs(run_id)
+            if event.is_dagster_event and event.step_key
+        )
+
+    pipe = reconstructable(define_diamond_pipeline)
+    run_config = {"execution": {executor_name: {}}}
+
+    with instance_for_test() as instance:
+        unbatched_result = execute_pipeline(pipe, run_config=run_config, instance=instance)
+        unbatched_event_types = _stored_step_event_types(instance, unbatched_result.run_id)
+
+    with instance_for_test(
+        overrides={"event_batching": {"max_batch_size": 1000, "max_batch_interval_seconds": 60.0}}
+    ) as instance:
+        batched_result = execute_pipeline(pipe, run_config=run_config, instance=instance)
+        assert batched_result.success
+        assert batched_result.result_for_solid("adder").output_value() == 11
+
+        assert _stored_step_event_types(instance, batched_result.run_id) == unbatched_event_types
+        assert instance.get_run_by_id(batched_result.run_id).is_success
+
+
+@solid
+def wait_for_logged_message(context):
+    context.log.info("logged while computing")
+
+    # the buffered message is written once the batch interval elapses, without another event
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        if any(
+            event.user_message == "logged while computing"
+            for event in context.instance.all_logs(context.run_id)
+        ):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pipeline
+def wait_for_logged_message_pipeline():
+    wait_for_logged_message()
+
+
+def test_event_batching_flushes_on_interval():
+    with instance_for_test(
+        overrides={"event_batching": {"max_batch_size": 1000, "max_batch_interval_seconds": 0.1}}
+    ) as instance:
+        result = execute_pipeline(
+            wait_for_logged_message_pipeline,
+            run_config={"execution": {"in_process": {}}},
+            instance=instance,
+        )
+        assert result.success
+        assert result.result_for_solid("wait_for_logged_message").output_value()
+
+
 @pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
 def test_forkserver_execution():
     with instance_for_test() as instance:
@@ -428,12 +525,13 @@ def sys_exit_pipeline():
 
 
 @pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
-def test_crash_multiprocessing():
+@pytest.mark.parametrize("multiprocess_config", [{}, {"worker_pool": {}}])
+def test_crash_multiprocessing(multiprocess_config):
     with instance_for_test() as instance:
         result = execute_pipeline(
             reconstructable(sys_exit_pipeline),
             run_config={
-                "execution": {"multiprocess": {}},
+                "execution": {"multiprocess": {"config": multiprocess_config}},
             },
             instance=instance,
             raise_on_error=False,
@@ -17,6 +17,7 @@ class TestStepHandler(StepHandler):
     # are left alive when the test ends. Non-test step handlers should not keep their own state in memory.
     processes = []  # type: ignore
     launch_step_count = 0  # type: ignore
+    launched_step_keys = []  # type: ignore
     saw_baz_op = False
     check_step_health_count = 0  # type: ignore
     terminate_step_count = 0  # type: ignore
@@ -34,6 +35,9 @@ def launch_step(self, step_handler_context):
             assert step_handler_context.step_tags["baz_op"] == {"foo": "bar"}
 
         TestStepHandler.launch_step_count += 1
+        TestStepHandler.launched_step_keys.append(
+            step_handler_context.execute_step_args.step_keys_to_execute
+        )
         print("TestStepHandler Launching Step!")  # pylint: disable=print-call
         TestStepHandler.processes.append(
             subprocess.Popen(step_handler_context.execute_step_args.get_command_args())
@@ -52,6 +56,7 @@ def terminate_step(self, step_handler_context):
     def reset(cls):
         cls.processes = []
         cls.launch_step_count = 0
+        cls.launched_step_keys = []
         cls.check_step_health_count = 0
         cls.terminate_step_count = 0
         cls.verify_step_count = 0
@@ -195,6 +200,29 @@ def test_execute_intervals():
     assert TestStepHandler.check_step_health_count >= 3
 
 
+def test_execute_steps_per_launch():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {"steps_per_launch": 2, "check_step_health_interval_seconds": 0}
+                }
+            },
+        )
+        TestStepHandler.wait_for_processes()
+
+    assert result.success
+    # both bar_op steps are ready at the start of the run, so they are launched together
+    assert sorted(sorted(step_keys) for step_keys in TestStepHandler.launched_step_keys) == [
+        ["bar_op", "bar_op_2"],
+        ["baz_op"],
+    ]
+    assert TestStepHandler.check_step_health_count >= 2
+
+
 @op
 def slow_op(_):
     time.sleep(2)
@@ -271,3 +299,22 @@ def test_execute_verify_step():
     )
     assert result.success
     assert TestStepHandler.verify_step_count == 3
+
+
+def test_execute_wait_for_events():
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(foo_job),
+            instance=instance,
+            run_config={"execution": {"config": {"wait_for_events": True}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+        # the executor stops watching the run's event log once it is done
+        assert not instance.event_log_storage._watchers[  # pylint: disable=protected-access
+            result.run_id
+        ]
+
+    assert result.success
+    assert TestStepHandler.launch_step_count == 3
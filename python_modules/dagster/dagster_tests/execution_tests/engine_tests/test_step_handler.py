@@ -1,6 +1,10 @@
-from dagster import pipeline
+import threading
+import time
+
+from dagster import DagsterEvent, pipeline
 from dagster.core.definitions.reconstruct import reconstructable
-from dagster.core.executor.step_delegating import StepHandlerContext
+from dagster.core.events import DagsterEventType, EngineEventData
+from dagster.core.executor.step_delegating import StepHandler, StepHandlerContext
 from dagster.core.test_utils import create_run_for_test, instance_for_test
 from dagster.grpc.types import ExecuteStepArgs
 
@@ -30,3 +34,70 @@ def test_step_handler_context():
 
         assert ctx.execute_step_args == args
         assert ctx.pipeline_run == run
+
+
+class SlowStepHandler(StepHandler):
+    max_concurrent_requests = 4
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    @property
+    def name(self):
+        return "SlowStepHandler"
+
+    def launch_step(self, step_handler_context):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.2)
+        with self._lock:
+            self.active -= 1
+
+        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        return [
+            DagsterEvent(
+                event_type_value=DagsterEventType.ENGINE_EVENT.value,
+                pipeline_name="foo_pipline",
+                step_key=step_key,
+                message=f"Launched {step_key}",
+                event_specific_data=EngineEventData(),
+            )
+        ]
+
+    def check_step_health(self, step_handler_context):
+        return []
+
+    def terminate_step(self, step_handler_context):
+        return []
+
+
+def test_launch_steps_concurrently():
+    recon_pipeline = reconstructable(foo_pipline)
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance)
+        step_keys = [f"step_{i}" for i in range(8)]
+        contexts = [
+            StepHandlerContext(
+                instance=instance,
+                execute_step_args=ExecuteStepArgs(
+                    pipeline_origin=recon_pipeline.get_python_origin(),
+                    pipeline_run_id=run.run_id,
+                    step_keys_to_execute=[step_key],
+                    instance_ref=None,
+                ),
+                step_tags={step_key: {}},
+                pipeline_run=run,
+            )
+            for step_key in step_keys
+        ]
+
+        handler = SlowStepHandler()
+        events = handler.launch_steps(contexts)
+
+        # events are returned in the order of the contexts
+        assert [event.step_key for event in events] == step_keys
+        assert 1 < handler.max_active <= SlowStepHandler.max_concurrent_requests
+        assert handler.check_steps_health(contexts) == []
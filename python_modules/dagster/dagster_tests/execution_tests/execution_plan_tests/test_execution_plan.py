@@ -2,7 +2,14 @@
 
 from dagster import DagsterInstance, Int, Output, OutputDefinition
 from dagster import _check as check
-from dagster import composite_solid, execute_pipeline, lambda_solid, pipeline, solid
+from dagster import (
+    composite_solid,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+    reconstructable,
+    solid,
+)
 from dagster.core.definitions.pipeline_base import InMemoryPipeline
 from dagster.core.errors import (
     DagsterInvalidConfigError,
@@ -13,10 +20,23 @@
 from dagster.core.execution.plan.outputs import StepOutputHandle
 from dagster.core.execution.plan.plan import should_skip_step
 from dagster.core.execution.retries import RetryMode
+from dagster.core.execution.step_scheduling import StepSchedulingPolicy
 from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.test_utils import default_mode_def_for_test, instance_for_test
 from dagster.core.utils import make_new_run_id
 
 
+@solid(tags={"dagster/slots/db-connections": "1"})
+def query(_):
+    pass
+
+
+@pipeline(mode_defs=[default_mode_def_for_test])
+def slot_limited_pipeline():
+    for i in range(3):
+        query.alias(f"query_{i}")()
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -333,6 +353,136 @@ def priorities():
         _ = [active_execution.mark_skipped(step.key) for step in steps]
 
 
+def test_critical_path_scheduling():
+    @lambda_solid
+    def start():
+        return 1
+
+    @lambda_solid
+    def add_one(num):
+        return num + 1
+
+    @solid(tags={"dagster/priority": "1"})
+    def urgent(_):
+        pass
+
+    @pipeline
+    def uneven():
+        start.alias("a_short")()
+        add_one.alias("b_mid_2")(start.alias("b_mid_1")())
+        add_one.alias("c_long_3")(add_one.alias("c_long_2")(start.alias("c_long_1")()))
+        urgent()
+
+    plan = create_execution_plan(uneven)
+
+    with plan.start(RetryMode.DISABLED) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["urgent", "a_short", "b_mid_1", "c_long_1"]
+        while not active_execution.is_complete:
+            _ = [active_execution.mark_skipped(step.key) for step in steps]
+            steps = active_execution.get_steps_to_skip()
+
+    with plan.start(
+        RetryMode.DISABLED, scheduling_policy=StepSchedulingPolicy.CRITICAL_PATH
+    ) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["urgent", "c_long_1", "b_mid_1", "a_short"]
+        while not active_execution.is_complete:
+            _ = [active_execution.mark_skipped(step.key) for step in steps]
+            steps = active_execution.get_steps_to_skip()
+
+
+def test_slot_limits():
+    @solid(tags={"dagster/slots/memory_gb": "8", "dagster/priority": "1"})
+    def big(_):
+        pass
+
+    @solid(tags={"dagster/slots/memory_gb": "4"})
+    def medium(_):
+        pass
+
+    @solid(tags={"dagster/slots/memory_gb": "32", "dagster/slots/db": "1"})
+    def huge(_):
+        pass
+
+    @solid
+    def small(_):
+        pass
+
+    @pipeline
+    def memory_hungry():
+        big()
+        big.alias("big_2")()
+        medium()
+        huge()
+        small()
+
+    plan = create_execution_plan(memory_hungry)
+
+    with plan.start(RetryMode.DISABLED, slot_limits={"memory_gb": 12}) as active_execution:
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["big", "medium", "small"]
+
+        # freeing up memory lets the next big step in, but not alongside another big step
+        active_execution.mark_success("medium")
+        active_execution.mark_success("small")
+        assert active_execution.get_steps_to_execute() == []
+        active_execution.mark_success("big")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["big_2"]
+
+        # a step that needs more than the limit runs once nothing else holds the slot
+        assert active_execution.get_steps_to_execute() == []
+        active_execution.mark_success("big_2")
+        assert [step.key for step in active_execution.get_steps_to_execute(limit=1)] == ["huge"]
+        active_execution.mark_success("huge")
+
+    with plan.start(RetryMode.DISABLED, slot_limits={"memory_gb": 12}) as active_execution:
+        steps = active_execution.get_steps_to_execute(limit=2)
+        assert [step.key for step in steps] == ["big", "medium"]
+        _ = [active_execution.mark_skipped(step.key) for step in steps]
+        steps = active_execution.get_steps_to_execute(limit=2)
+        assert [step.key for step in steps] == ["big_2", "small"]
+        _ = [active_execution.mark_skipped(step.key) for step in steps]
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["huge"]
+        _ = [active_execution.mark_skipped(step.key) for step in steps]
+
+
+def test_slot_limits_multiprocess():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(slot_limited_pipeline),
+            run_config={
+                "execution": {
+                    "multiprocess": {
+                        "config": {
+                            "max_concurrent": 4,
+                            "step_scheduling": {
+                                "policy": "critical_path",
+                                "slot_limits": {"db-connections": 1},
+                            },
+                        }
+                    }
+                }
+            },
+            instance=instance,
+        )
+        assert result.success
+
+        # steps that share the single db connection never overlap
+        spans = sorted(
+            (event.timestamp, event.dagster_event.event_type_value)
+            for event in instance.all_logs(result.run_id)
+            if event.is_dagster_event
+            and event.dagster_event.event_type_value in ("STEP_START", "STEP_SUCCESS")
+            and event.step_key.startswith("query")
+        )
+        in_flight = 0
+        for _, event_type in spans:
+            in_flight += 1 if event_type == "STEP_START" else -1
+            assert in_flight <= 1
+
+
 def test_executor_not_created_for_execute_plan():
     instance = DagsterInstance.ephemeral()
     pipe = define_diamond_pipeline()
@@ -25,6 +25,7 @@
     FromUnresolvedStepOutput,
 )
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.instance import DagsterInstance
 from dagster.core.instance.ref import InstanceRef
 from dagster.core.snap.execution_plan_snapshot import snapshot_from_execution_plan
@@ -181,6 +182,45 @@ def _validate_execution_plan(plan):
     assert not optional_output.is_required
 
 
+def test_rebuild_step_subset_from_snapshot():
+    the_pipeline = InMemoryPipeline(dynamic_pipeline)
+    run_config = {"solids": {"emit": {"inputs": {"range_input": 3}}}}
+    plan_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(the_pipeline, run_config=run_config),
+        dynamic_pipeline.get_pipeline_snapshot_id(),
+    )
+    known_state = KnownExecutionState(
+        dynamic_mappings={"emit": {"result": ["0", "1", "2"]}},
+    )
+
+    for step_keys in [["echo"], ["multiply_inputs[1]"], ["sum_numbers"]]:
+        built_plan = create_execution_plan(
+            the_pipeline,
+            run_config=run_config,
+            step_keys_to_execute=step_keys,
+            known_state=known_state,
+        )
+        rebuilt_plan = ExecutionPlan.rebuild_from_snapshot(
+            "dynamic_pipeline",
+            plan_snapshot,
+            step_keys_to_execute=step_keys,
+            known_state=known_state,
+        )
+
+        assert rebuilt_plan.step_keys_to_execute == built_plan.step_keys_to_execute == step_keys
+        assert rebuilt_plan.known_state == known_state
+        assert [step.key for step in rebuilt_plan.get_steps_to_execute_in_topo_order()] == [
+            step.key for step in built_plan.get_steps_to_execute_in_topo_order()
+        ]
+        assert {
+            step_input.name: step_input.source
+            for step_input in rebuilt_plan.get_step_by_key(step_keys[0]).step_inputs
+        } == {
+            step_input.name: step_input.source
+            for step_input in built_plan.get_step_by_key(step_keys[0]).step_inputs
+        }
+
+
 # Verify that an previously generated execution plan snapshot can still execute a
 # pipeline successfully
 def test_execution_plan_snapshot_backcompat():
@@ -19,10 +19,13 @@
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
     deserialize_value,
+    deserialize_value_from_bytes,
+    is_binary_serialized,
     pack_inner_value,
     register_serdes_enum_fallbacks,
     register_serdes_tuple_fallbacks,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_inner_value,
 )
 from dagster.serdes.utils import hash_str
@@ -718,3 +721,109 @@ class Thing(NamedTuple):  # pylint: disable=unused-variable
 
     assert wmap.get_serialized_name("Thing") == "SerializedThing"
     assert wmap.get_deserialized_name("SerializedThing") == "Thing"
+
+
+def test_binary_serdes_roundtrip():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Color(Enum):
+        RED = 1
+
+    @_whitelist_for_serdes(whitelist_map=wmap, storage_name="SerializedThing")
+    class Thing(NamedTuple):
+        name: str
+        color: Color
+        tags: Set[str]
+        nested: dict
+
+    thing = Thing("foo", Color.RED, {"a", "b"}, {"items": [1, 2.5, None, True], "empty": {}})
+
+    serialized = serialize_value_to_bytes(thing, whitelist_map=wmap)
+    assert is_binary_serialized(serialized)
+    assert not is_binary_serialized(serialize_value(thing, whitelist_map=wmap).encode("utf-8"))
+
+    assert deserialize_value_from_bytes(serialized, whitelist_map=wmap) == thing
+    assert deserialize_value_from_bytes(serialized, whitelist_map=wmap) == deserialize_value(
+        serialize_value(thing, whitelist_map=wmap), whitelist_map=wmap
+    )
+
+
+def test_binary_serdes_errors():
+    serialized = serialize_value_to_bytes({"foo": "bar"})
+
+    with pytest.raises(DeserializationError, match="not serialized with the binary serdes"):
+        deserialize_value_from_bytes(b'{"foo": "bar"}')
+
+    with pytest.raises(DeserializationError, match="Unsupported binary serdes format version"):
+        deserialize_value_from_bytes(serialized[:4] + bytes([99]) + serialized[5:])
+
+    with pytest.raises(DeserializationError, match="Could not decode"):
+        deserialize_value_from_bytes(serialized[:-1])
+
+
+def test_compiled_serializers_track_registrations():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple):
+        name: str
+        tags: dict
+
+    thing = Thing("foo", {})
+    assert (
+        serialize_value(thing, whitelist_map=wmap)
+        == '{"__class__": "Thing", "name": "foo", "tags": {}}'
+    )
+    assert (
+        deserialize_value(serialize_value(thing, whitelist_map=wmap), whitelist_map=wmap) == thing
+    )
+
+    class SkipEmptyTagsSerializer(DefaultNamedTupleSerializer):
+        @classmethod
+        def skip_when_empty(cls):
+            return {"tags"}
+
+    # re-registering the class replaces the cached pack function
+    _whitelist_for_serdes(whitelist_map=wmap, serializer=SkipEmptyTagsSerializer)(Thing)
+    assert serialize_value(thing, whitelist_map=wmap) == '{"__class__": "Thing", "name": "foo"}'
+
+    wmap.register_serialized_name("Thing", "RenamedThing")
+    assert (
+        serialize_value(thing, whitelist_map=wmap) == '{"__class__": "RenamedThing", "name": "foo"}'
+    )
+
+    with pytest.raises(DeserializationError):
+        deserialize_value('{"__class__": "RenamedThing", "name": "foo"}', whitelist_map=wmap)
+
+    wmap.register_deserialized_name("RenamedThing", "Thing")
+    assert (
+        deserialize_value(
+            '{"__class__": "RenamedThing", "name": "foo", "tags": {}}', whitelist_map=wmap
+        )
+        == thing
+    )
+
+
+def test_unpack_errors_leave_value_intact():
+    wmap = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=wmap)
+    class Thing(NamedTuple):
+        name: str
+        child: object
+
+    val = {
+        "__class__": "Thing",
+        "name": "foo",
+        "child": {"__class__": "Thing", "name": "bar", "child": {"__class__": "Unknown"}},
+    }
+    with pytest.raises(DeserializationError, match=re.escape(".child.child")):
+        unpack_inner_value(val, whitelist_map=wmap, descent_path="")
+
+    # the walk that reports the descent path of the error does not mutate the value it was given
+    assert val == {
+        "__class__": "Thing",
+        "name": "foo",
+        "child": {"__class__": "Thing", "name": "bar", "child": {"__class__": "Unknown"}},
+    }
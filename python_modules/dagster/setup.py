@@ -92,12 +92,14 @@ def get_version() -> str:
         ],
         extras_require={
             "docker": ["docker"],
+            "msgpack": ["msgpack>=1.0"],
             "test": [
                 "coverage==5.3",
                 "docker",
                 "freezegun>=0.3.15",
                 "grpcio-tools==1.32.0",
                 "mock==3.0.5",
+                "msgpack>=1.0",
                 "objgraph",
                 "protobuf==3.13.0",  # without this, pip will install the most up-to-date protobuf
                 "pytest-cov==2.10.1",
@@ -1,12 +1,22 @@
 import io
 import pickle
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union
 
+from botocore.exceptions import ClientError
+
 from dagster import Field, InputContext, MemoizableIOManager, OutputContext, StringSource
 from dagster import _check as check
 from dagster import io_manager
 from dagster.utils import PICKLE_PROTOCOL
 
+# S3 rejects multipart uploads with parts smaller than this, other than the last part
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+# the most bytes read from a streaming response body at a time
+STREAM_READ_SIZE = 1024 * 1024
+
 
 class PickledObjectS3IOManager(MemoizableIOManager):
     def __init__(
@@ -14,9 +24,22 @@ def __init__(
         s3_bucket,
         s3_session,
         s3_prefix=None,
+        part_size=DEFAULT_PART_SIZE,
+        download_concurrency=1,
+        upload_concurrency=1,
     ):
         self.bucket = check.str_param(s3_bucket, "s3_bucket")
         self.s3_prefix = check.str_param(s3_prefix, "s3_prefix")
+        self.part_size = check.int_param(part_size, "part_size")
+        check.param_invariant(
+            self.part_size >= MIN_PART_SIZE,
+            "part_size",
+            f"S3 multipart uploads require parts of at least {MIN_PART_SIZE} bytes",
+        )
+        self.download_concurrency = check.int_param(download_concurrency, "download_concurrency")
+        check.param_invariant(self.download_concurrency >= 1, "download_concurrency")
+        self.upload_concurrency = check.int_param(upload_concurrency, "upload_concurrency")
+        check.param_invariant(self.upload_concurrency >= 1, "upload_concurrency")
         self.s3 = s3_session
         self.s3.list_objects(Bucket=self.bucket, Prefix=self.s3_prefix, MaxKeys=1)
 
@@ -38,24 +61,36 @@ def _has_object(self, key):
         check.str_param(key, "key")
         check.param_invariant(len(key) > 0, "key")
 
-        found_object = False
-
+        # head_object only fetches the metadata of the object, rather than starting to download it
         try:
-            self.s3.get_object(Bucket=self.bucket, Key=key)
-            found_object = True
-        except self.s3.exceptions.NoSuchKey:
-            found_object = False
+            self.s3.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
 
-        return found_object
+        return True
 
     def _uri_for_key(self, key):
         check.str_param(key, "key")
         return "s3://" + self.bucket + "/" + "{key}".format(key=key)
 
+    def _open_object(self, key) -> io.RawIOBase:
+        if self.download_concurrency > 1:
+            size = self.s3.head_object(Bucket=self.bucket, Key=key)["ContentLength"]
+            return _RangedObjectReader(
+                self.s3, self.bucket, key, size, self.part_size, self.download_concurrency
+            )
+
+        return _StreamingBodyReader(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"])
+
     def load_input(self, context):
         key = self._get_path(context)
         context.log.debug(f"Loading S3 object from: {self._uri_for_key(key)}")
-        obj = pickle.loads(self.s3.get_object(Bucket=self.bucket, Key=key)["Body"].read())
+
+        # unpickle the object as it is downloaded, rather than reading the whole body first
+        with io.BufferedReader(self._open_object(key)) as reader:
+            obj = pickle.load(reader)
 
         return obj
 
@@ -67,16 +102,226 @@ def handle_output(self, context, obj):
             context.log.warning(f"Removing existing S3 key: {key}")
             self._rm_object(key)
 
-        pickled_obj = pickle.dumps(obj, PICKLE_PROTOCOL)
-        pickled_obj_bytes = io.BytesIO(pickled_obj)
-        self.s3.upload_fileobj(pickled_obj_bytes, self.bucket, key)
+        # pickle the object straight into the upload, so that only the parts being uploaded and
+        # the part being filled are held in memory
+        writer = _MultipartUploadWriter(
+            self.s3, self.bucket, key, self.part_size, self.upload_concurrency
+        )
+        try:
+            pickle.dump(obj, writer, PICKLE_PROTOCOL)
+            # parts uploaded on the thread pool surface their errors here
+            writer.close()
+        except BaseException:
+            writer.abort()
+            raise
+
+
+class _MultipartUploadWriter:
+    """A write-only file object that uploads the bytes written to it to an S3 key in parts of
+    ``part_size`` bytes, keeping up to ``max_concurrency`` parts in flight on a thread pool. Objects
+    that fit in a single part are uploaded with ``put_object``.
+    """
+
+    def __init__(self, s3, bucket, key, part_size, max_concurrency=1):
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._part_count = 0
+        self._parts = []
+        self._executor = None
+        self._pending = deque()
+
+    def write(self, data) -> int:
+        view = memoryview(data).cast("B")
+        size = len(view)
+        while view:
+            count = min(len(view), self._part_size - len(self._buffer))
+            self._buffer += view[:count]
+            view = view[count:]
+            if len(self._buffer) == self._part_size:
+                self._upload_part()
+        return size
+
+    def _send_part(self, part_number, body):
+        response = self._s3.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    def _upload_part(self):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                "UploadId"
+            ]
+
+        self._part_count += 1
+        body, self._buffer = self._buffer, bytearray()
+        if self._max_concurrency == 1:
+            self._parts.append(self._send_part(self._part_count, body))
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="s3_multipart_upload"
+            )
+        # wait for the oldest part before sending another, so that at most max_concurrency parts
+        # are held in memory
+        if len(self._pending) == self._max_concurrency:
+            self._parts.append(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(self._send_part, self._part_count, body))
+
+    def _shutdown(self):
+        if self._executor is not None:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def close(self):
+        if self._upload_id is None:
+            self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=self._buffer)
+            return
+
+        if self._buffer:
+            self._upload_part()
+        try:
+            while self._pending:
+                self._parts.append(self._pending.popleft().result())
+        finally:
+            self._shutdown()
+        self._s3.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    def abort(self):
+        self._shutdown()
+        if self._upload_id is not None:
+            self._s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+
+
+class _StreamingBodyReader(io.RawIOBase):
+    """A raw file object over the body of a single ``get_object`` response."""
+
+    def __init__(self, body):
+        self._body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self._body.read(min(len(b), STREAM_READ_SIZE))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        self._body.close()
+        super().close()
+
+
+class _RangedObjectReader(io.RawIOBase):
+    """A raw file object over an S3 object of ``size`` bytes that downloads it in ranges of
+    ``part_size`` bytes, keeping up to ``max_concurrency`` ranges in flight on a thread pool.
+    """
+
+    def __init__(self, s3, bucket, key, size, part_size, max_concurrency):
+        self._s3 = s3
+        self._bucket = bucket
+        self._key = key
+        self._size = size
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._range_starts = iter(range(0, size, part_size))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="s3_ranged_download"
+        )
+        self._pending = deque()
+        self._chunk = memoryview(b"")
+        self._schedule()
+
+    def _fetch(self, start):
+        end = min(start + self._part_size, self._size) - 1
+        response = self._s3.get_object(
+            Bucket=self._bucket, Key=self._key, Range=f"bytes={start}-{end}"
+        )
+        return response["Body"].read()
+
+    def _schedule(self):
+        while len(self._pending) < self._max_concurrency:
+            start = next(self._range_starts, None)
+            if start is None:
+                break
+            self._pending.append(self._executor.submit(self._fetch, start))
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if not self._chunk:
+            if not self._pending:
+                return 0
+            self._chunk = memoryview(self._pending.popleft().result())
+            self._schedule()
+
+        count = min(len(b), len(self._chunk))
+        b[:count] = self._chunk[:count]
+        self._chunk = self._chunk[count:]
+        return count
+
+    def close(self):
+        for future in self._pending:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        super().close()
+
+
+_PICKLE_IO_MANAGER_CONFIG_SCHEMA = {
+    "s3_bucket": Field(StringSource),
+    "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
+    "part_size": Field(
+        int,
+        is_required=False,
+        default_value=DEFAULT_PART_SIZE,
+        description=(
+            "The size in bytes of the parts that objects are uploaded in, and of the ranges they "
+            "are downloaded in when download_concurrency is greater than 1. At least 5 MiB."
+        ),
+    ),
+    "download_concurrency": Field(
+        int,
+        is_required=False,
+        default_value=1,
+        description=(
+            "The number of ranges of an object to download concurrently when loading it. By "
+            "default, objects are streamed with a single request."
+        ),
+    ),
+    "upload_concurrency": Field(
+        int,
+        is_required=False,
+        default_value=1,
+        description=(
+            "The number of parts of an object to upload concurrently when storing it. By "
+            "default, parts are uploaded one at a time."
+        ),
+    ),
+}
 
 
 @io_manager(
-    config_schema={
-        "s3_bucket": Field(StringSource),
-        "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
-    },
+    config_schema=_PICKLE_IO_MANAGER_CONFIG_SCHEMA,
     required_resource_keys={"s3"},
 )
 def s3_pickle_io_manager(init_context):
@@ -84,6 +329,8 @@ def s3_pickle_io_manager(init_context):
 
     Serializes objects via pickling. Suitable for objects storage for distributed executors, so long
     as each execution node has network connectivity and credentials for S3 and the backing bucket.
+    Objects are pickled into a multipart upload and unpickled as they are downloaded, so the
+    pickled bytes are never held in memory all at once.
 
     Attach this resource definition to your job to make it available to your ops.
 
@@ -102,11 +349,20 @@ def my_job():
                 config:
                     s3_bucket: my-cool-bucket
                     s3_prefix: good/prefix-for-files-
+                    download_concurrency: 8
+                    upload_concurrency: 8
     """
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3IOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3IOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        part_size=init_context.resource_config["part_size"],
+        download_concurrency=init_context.resource_config["download_concurrency"],
+        upload_concurrency=init_context.resource_config["upload_concurrency"],
+    )
     return pickled_io_manager
 
 
@@ -116,10 +372,7 @@ def _get_path(self, context: Union[InputContext, OutputContext]) -> str:
 
 
 @io_manager(
-    config_schema={
-        "s3_bucket": Field(StringSource),
-        "s3_prefix": Field(StringSource, is_required=False, default_value="dagster"),
-    },
+    config_schema=_PICKLE_IO_MANAGER_CONFIG_SCHEMA,
     required_resource_keys={"s3"},
 )
 def s3_pickle_asset_io_manager(init_context):
@@ -130,6 +383,8 @@ def s3_pickle_asset_io_manager(init_context):
 
     Serializes objects via pickling. Suitable for objects storage for distributed executors, so long
     as each execution node has network connectivity and credentials for S3 and the backing bucket.
+    Objects are pickled into a multipart upload and unpickled as they are downloaded, so the
+    pickled bytes are never held in memory all at once.
 
     Attach this resource definition to your job to make it available to your ops.
 
@@ -153,5 +408,12 @@ def s3_pickle_asset_io_manager(init_context):
     s3_session = init_context.resources.s3
     s3_bucket = init_context.resource_config["s3_bucket"]
     s3_prefix = init_context.resource_config.get("s3_prefix")  # s3_prefix is optional
-    pickled_io_manager = PickledObjectS3AssetIOManager(s3_bucket, s3_session, s3_prefix=s3_prefix)
+    pickled_io_manager = PickledObjectS3AssetIOManager(
+        s3_bucket,
+        s3_session,
+        s3_prefix=s3_prefix,
+        part_size=init_context.resource_config["part_size"],
+        download_concurrency=init_context.resource_config["download_concurrency"],
+        upload_concurrency=init_context.resource_config["upload_concurrency"],
+    )
     return pickled_io_manager
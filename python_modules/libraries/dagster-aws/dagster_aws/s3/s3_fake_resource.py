@@ -19,14 +19,23 @@ def __init__(self, buckets=None):
         from unittest import mock
 
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
+        self.multipart_uploads = {}
         self.mock_extras = mock.MagicMock()
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
 
     def head_object(self, Bucket, Key, *args, **kwargs):
+        if not self.has_object(Bucket, Key):
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
         self.mock_extras.head_object(*args, **kwargs)
-        return {"ContentLength": len(self.buckets.get(Bucket, {}).get(Key, b""))}
+        return {"ContentLength": len(self.buckets[Bucket][Key])}
+
+    def list_objects(self, Bucket, Prefix, *args, **kwargs):
+        self.mock_extras.list_objects(*args, **kwargs)
+        keys = sorted(key for key in self.buckets.get(Bucket, {}) if key.startswith(Prefix))
+        return {"Contents": [{"Key": key} for key in keys], "IsTruncated": False}
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
@@ -38,15 +47,47 @@ def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
-        self.buckets[Bucket][Key] = Body.read()
+        self.buckets[Bucket][Key] = (
+            bytes(Body) if isinstance(Body, (bytes, bytearray)) else Body.read()
+        )
 
-    def get_object(self, Bucket, Key, *args, **kwargs):
+    def delete_object(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.delete_object(*args, **kwargs)
+        self.buckets.get(Bucket, {}).pop(Key, None)
+
+    def get_object(self, Bucket, Key, *args, Range=None, **kwargs):
         if not self.has_object(Bucket, Key):
             raise ClientError({}, None)
 
         self.mock_extras.get_object(*args, **kwargs)
+        if Range:
+            start, end = Range[len("bytes=") :].split("-")
+            return {"Body": io.BytesIO(self.buckets[Bucket][Key][int(start) : int(end) + 1])}
+
         return {"Body": self._get_byte_stream(Bucket, Key)}
 
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self.mock_extras.upload_part(*args, **kwargs)
+        self.multipart_uploads[UploadId][PartNumber] = bytes(Body)
+        return {"ETag": f"{UploadId}-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, *args, **kwargs):
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        self.multipart_uploads.pop(UploadId, None)
+
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
         self.buckets[bucket][key] = fileobj.read()
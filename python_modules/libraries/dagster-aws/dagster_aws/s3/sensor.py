@@ -1,11 +1,36 @@
 import boto3
 
 import dagster._check as check
+import dagster.seven as seven
 
 MAX_KEYS = 1000
 
+# the modes of iter_new_s3_keys
+KEY_ORDER_MODE = "key"
+LAST_MODIFIED_MODE = "last_modified"
+
+
+def _list_objects(s3_session, bucket, prefix, start_after=""):
+    """Yield the summaries of the objects under a prefix in key order, fetching a page at a time."""
+    kwargs = dict(
+        Bucket=bucket, Delimiter="", MaxKeys=MAX_KEYS, Prefix=prefix, StartAfter=start_after
+    )
+
+    while True:
+        response = s3_session.list_objects_v2(**kwargs)
+        yield from response.get("Contents", [])
+        if not response.get("IsTruncated"):
+            return
+
+        kwargs["ContinuationToken"] = response["NextContinuationToken"]
+
 
 def get_s3_keys(bucket, prefix="", since_key=None, s3_session=None):
+    """Return the keys under a prefix in order of last modification, after ``since_key``.
+
+    This lists and sorts every object under the prefix, so for large prefixes prefer
+    :py:func:`iter_new_s3_keys`, which only lists what is new since the last sensor tick.
+    """
     check.str_param(bucket, "bucket")
     check.str_param(prefix, "prefix")
     check.opt_str_param(since_key, "since_key")
@@ -13,24 +38,10 @@ def get_s3_keys(bucket, prefix="", since_key=None, s3_session=None):
     if not s3_session:
         s3_session = boto3.resource("s3", use_ssl=True, verify=True).meta.client
 
-    cursor = ""
-    contents = []
-
-    while True:
-        response = s3_session.list_objects_v2(
-            Bucket=bucket,
-            Delimiter="",
-            MaxKeys=MAX_KEYS,
-            Prefix=prefix,
-            StartAfter=cursor,
-        )
-        contents.extend(response.get("Contents", []))
-        if response["KeyCount"] < MAX_KEYS:
-            break
-
-        cursor = response["Contents"][-1]["Key"]
-
-    sorted_keys = [obj["Key"] for obj in sorted(contents, key=lambda x: x["LastModified"])]
+    contents = [
+        (obj["LastModified"], obj["Key"]) for obj in _list_objects(s3_session, bucket, prefix)
+    ]
+    sorted_keys = [key for _, key in sorted(contents, key=lambda x: x[0])]
 
     if not since_key or since_key not in sorted_keys:
         return sorted_keys
@@ -40,3 +51,83 @@ def get_s3_keys(bucket, prefix="", since_key=None, s3_session=None):
             return sorted_keys[idx + 1 :]
 
     return []
+
+
+def iter_new_s3_keys(bucket, prefix="", cursor=None, mode=KEY_ORDER_MODE, s3_session=None):
+    """Incrementally list the keys under a prefix that are new since a sensor cursor.
+
+    Keys are yielded in key order as they are listed, so memory use does not grow with the size of
+    the prefix. Each key is yielded along with the cursor to store once the key has been handled:
+
+    .. code-block:: python
+
+        @sensor(job=my_job)
+        def my_s3_sensor(context):
+            for s3_key, cursor in iter_new_s3_keys("my_s3_bucket", cursor=context.cursor):
+                yield RunRequest(run_key=s3_key, run_config={})
+                context.update_cursor(cursor)
+
+    Args:
+        bucket (str): The bucket to list.
+        prefix (str): The prefix to list the keys under.
+        cursor (Optional[str]): The cursor yielded along with the last key that was handled, or
+            None to list every key under the prefix.
+        mode (str): How new keys are found. In ``"key"`` mode, the listing starts after the key of
+            the cursor, so only new keys are listed, which requires keys to be written in
+            lexicographic order (e.g. keys that start with a timestamp). In ``"last_modified"``
+            mode, the whole prefix is listed and the keys that were modified after the high-water
+            mark kept in the cursor are yielded. The cursor only advances past the high-water mark
+            of a listing with the last key of that listing.
+        s3_session (Optional[botocore.client.S3]): The S3 client to list the keys with.
+
+    Yields:
+        Tuple[str, Optional[str]]: Each new key, along with the cursor to store after handling it.
+    """
+    check.str_param(bucket, "bucket")
+    check.str_param(prefix, "prefix")
+    check.opt_str_param(cursor, "cursor")
+    check.param_invariant(mode in (KEY_ORDER_MODE, LAST_MODIFIED_MODE), "mode")
+
+    if not s3_session:
+        s3_session = boto3.resource("s3", use_ssl=True, verify=True).meta.client
+
+    if mode == KEY_ORDER_MODE:
+        for obj in _list_objects(s3_session, bucket, prefix, start_after=cursor or ""):
+            yield obj["Key"], obj["Key"]
+        return
+
+    # the cursor holds the latest modification time seen so far, and the keys modified at that time
+    # since S3 only reports modification times to the second
+    if cursor:
+        cursor_data = seven.json.loads(cursor)
+        high_water_mark, high_water_mark_keys = cursor_data["last_modified"], cursor_data["keys"]
+    else:
+        high_water_mark, high_water_mark_keys = None, []
+
+    seen_keys = set(high_water_mark_keys)
+    new_high_water_mark, new_high_water_mark_keys = high_water_mark, set(high_water_mark_keys)
+    previous_key = None
+    for obj in _list_objects(s3_session, bucket, prefix):
+        key = obj["Key"]
+        last_modified = obj["LastModified"].timestamp()
+        if high_water_mark is not None and (
+            last_modified < high_water_mark
+            or (last_modified == high_water_mark and key in seen_keys)
+        ):
+            continue
+
+        if new_high_water_mark is None or last_modified > new_high_water_mark:
+            new_high_water_mark, new_high_water_mark_keys = last_modified, {key}
+        elif last_modified == new_high_water_mark:
+            new_high_water_mark_keys.add(key)
+
+        # hold back the last key, so that the new high-water mark is only stored once the whole
+        # prefix has been listed
+        if previous_key is not None:
+            yield previous_key, cursor
+        previous_key = key
+
+    if previous_key is not None:
+        yield previous_key, seven.json.dumps(
+            {"last_modified": new_high_water_mark, "keys": sorted(new_high_water_mark_keys)}
+        )
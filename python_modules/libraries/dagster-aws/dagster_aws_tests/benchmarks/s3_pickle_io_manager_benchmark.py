@@ -0,0 +1,151 @@
+"""Benchmarks the peak memory and the time of storing and loading a large output with the S3 pickle
+IO manager, against a local stand-in for S3 that keeps objects on disk so that only the memory used
+by the IO manager itself is measured.
+
+Run with:
+
+    python -m dagster_aws_tests.benchmarks.s3_pickle_io_manager_benchmark [--size-mb N]
+"""
+import argparse
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from dagster_aws.s3 import S3FakeSession
+from dagster_aws.s3.io_manager import MIN_PART_SIZE, PickledObjectS3IOManager
+
+from dagster import build_input_context, build_output_context
+from dagster.core.utils import make_new_run_id
+from dagster.utils import PICKLE_PROTOCOL
+
+
+class _DiskS3Session(S3FakeSession):
+    """S3FakeSession that writes object and part bodies to files in a directory."""
+
+    def __init__(self, directory):
+        super().__init__()
+        self._directory = directory
+
+    def _path(self, *parts):
+        return os.path.join(
+            self._directory, "_".join(str(part) for part in parts).replace("/", "_")
+        )
+
+    def _write(self, path, body):
+        with open(path, "wb") as f:
+            if isinstance(body, (bytes, bytearray)):
+                f.write(body)
+            else:
+                shutil.copyfileobj(body, f)
+
+    def put_object(self, Bucket, Key, Body, *args, **kwargs):
+        self._write(self._path(Bucket, Key), Body)
+        self.buckets[Bucket][Key] = None
+
+    def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
+        self.put_object(bucket, key, fileobj)
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self._write(self._path(UploadId, PartNumber), Body)
+        self.multipart_uploads[UploadId][PartNumber] = None
+        return {"ETag": f"{UploadId}-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        with open(self._path(Bucket, Key), "wb") as f:
+            for part in MultipartUpload["Parts"]:
+                with open(self._path(UploadId, part["PartNumber"]), "rb") as part_file:
+                    shutil.copyfileobj(part_file, f)
+        del self.multipart_uploads[UploadId]
+        self.buckets[Bucket][Key] = None
+
+    def head_object(self, Bucket, Key, *args, **kwargs):
+        if not self.has_object(Bucket, Key):
+            return super().head_object(Bucket, Key, *args, **kwargs)
+
+        return {"ContentLength": os.path.getsize(self._path(Bucket, Key))}
+
+    def get_object(self, Bucket, Key, *args, Range=None, **kwargs):
+        if Range is None:
+            body = open(self._path(Bucket, Key), "rb")  # pylint: disable=consider-using-with
+            return {"Body": body}
+
+        start, end = (int(offset) for offset in Range[len("bytes=") :].split("-"))
+        with open(self._path(Bucket, Key), "rb") as f:
+            f.seek(start)
+            return {"Body": io.BytesIO(f.read(end - start + 1))}
+
+
+def _previous_handle_output(s3, bucket, key, obj):
+    # the previous implementation, which pickled the whole object in memory before uploading it
+    s3.upload_fileobj(io.BytesIO(pickle.dumps(obj, PICKLE_PROTOCOL)), bucket, key)
+
+
+def _previous_load_input(s3, bucket, key):
+    # the previous implementation, which read the whole body before unpickling it
+    return pickle.loads(s3.get_object(Bucket=bucket, Key=key)["Body"].read())
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return f"{peak / 2**20:8.1f}MiB peak {elapsed * 1e3:8.0f}ms"
+
+
+def benchmark(size_mb, part_size_mb, download_concurrency, upload_concurrency):
+    payload = os.urandom(size_mb * 2**20)
+
+    with tempfile.TemporaryDirectory() as directory:
+        s3 = _DiskS3Session(directory)
+        io_manager = PickledObjectS3IOManager(
+            "bucket",
+            s3,
+            s3_prefix="dagster",
+            part_size=max(part_size_mb * 2**20, MIN_PART_SIZE),
+            download_concurrency=download_concurrency,
+            upload_concurrency=upload_concurrency,
+        )
+        output_context = build_output_context(
+            step_key="step", name="result", run_id=make_new_run_id()
+        )
+        input_context = build_input_context(upstream_output=output_context)
+        key = io_manager._get_path(output_context)  # pylint: disable=protected-access
+
+        print(  # pylint: disable=print-call
+            f"S3 pickle IO manager, {size_mb}MiB output, {part_size_mb}MiB parts, "
+            f"download_concurrency={download_concurrency}, upload_concurrency={upload_concurrency}"
+        )
+        print(  # pylint: disable=print-call
+            "  handle_output, in memory: "
+            f"{_measure(lambda: _previous_handle_output(s3, 'bucket', key, payload))}"
+        )
+        print(  # pylint: disable=print-call
+            "  handle_output, streamed:  "
+            f"{_measure(lambda: io_manager.handle_output(output_context, payload))}"
+        )
+        print(  # pylint: disable=print-call
+            "  load_input, in memory:    "
+            f"{_measure(lambda: _previous_load_input(s3, 'bucket', key))}"
+        )
+        print(  # pylint: disable=print-call
+            "  load_input, streamed:     "
+            f"{_measure(lambda: io_manager.load_input(input_context))}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--part-size-mb", type=int, default=8)
+    parser.add_argument("--download-concurrency", type=int, default=1)
+    parser.add_argument("--upload-concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    benchmark(args.size_mb, args.part_size_mb, args.download_concurrency, args.upload_concurrency)
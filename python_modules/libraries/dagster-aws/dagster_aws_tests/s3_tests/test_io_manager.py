@@ -1,4 +1,11 @@
-from dagster_aws.s3.io_manager import s3_pickle_asset_io_manager, s3_pickle_io_manager
+import os
+
+from dagster_aws.s3.io_manager import (
+    MIN_PART_SIZE,
+    PickledObjectS3IOManager,
+    s3_pickle_asset_io_manager,
+    s3_pickle_io_manager,
+)
 from dagster_aws.s3.utils import construct_s3_client
 
 from dagster import (
@@ -60,6 +67,54 @@ def test_s3_pickle_io_manager_execution(mock_s3_bucket):
     assert len(list(mock_s3_bucket.objects.all())) == 2
 
 
+def test_s3_pickle_io_manager_multipart(mock_s3_bucket):
+    payload = os.urandom(2 * MIN_PART_SIZE + 1024)
+
+    @op
+    def return_payload():
+        return payload
+
+    @op
+    def payload_size(payload):
+        return len(payload)
+
+    @job(resource_defs={"io_manager": s3_pickle_io_manager, "s3": s3_test_resource})
+    def large_output_job():
+        payload_size(return_payload())
+
+    for concurrency in [1, 4]:
+        run_config = {
+            "resources": {
+                "io_manager": {
+                    "config": {
+                        "s3_bucket": mock_s3_bucket.name,
+                        "part_size": MIN_PART_SIZE,
+                        "download_concurrency": concurrency,
+                        "upload_concurrency": concurrency,
+                    }
+                }
+            }
+        }
+        result = large_output_job.execute_in_process(run_config)
+
+        assert result.output_for_node("return_payload") == payload
+        assert result.output_for_node("payload_size") == len(payload)
+
+        objects = list(mock_s3_bucket.objects.filter(Prefix=f"dagster/storage/{result.run_id}"))
+        assert len(objects) == 2
+        assert max(o.size for o in objects) > len(payload)
+
+
+def test_s3_pickle_io_manager_has_object(mock_s3_bucket):
+    io_manager = PickledObjectS3IOManager(
+        mock_s3_bucket.name, construct_s3_client(max_attempts=5), s3_prefix="dagster"
+    )
+
+    assert not io_manager._has_object("dagster/missing")  # pylint: disable=protected-access
+    mock_s3_bucket.put_object(Key="dagster/present", Body=b"foo")
+    assert io_manager._has_object("dagster/present")  # pylint: disable=protected-access
+
+
 def define_multiple_output_job():
     @op(
         out={
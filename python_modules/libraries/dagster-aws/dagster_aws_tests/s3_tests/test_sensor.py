@@ -0,0 +1,84 @@
+from dagster_aws.s3.sensor import LAST_MODIFIED_MODE, MAX_KEYS, get_s3_keys, iter_new_s3_keys
+
+
+def _put_keys(bucket, keys):
+    for key in keys:
+        bucket.put_object(Key=key, Body=b"foo")
+
+
+def test_get_s3_keys(mock_s3_bucket):
+    _put_keys(mock_s3_bucket, ["foo/a", "foo/b", "bar/c"])
+    s3_session = mock_s3_bucket.meta.client
+
+    assert set(get_s3_keys(mock_s3_bucket.name, s3_session=s3_session)) == {
+        "foo/a",
+        "foo/b",
+        "bar/c",
+    }
+    assert set(get_s3_keys(mock_s3_bucket.name, prefix="foo", s3_session=s3_session)) == {
+        "foo/a",
+        "foo/b",
+    }
+
+
+def test_iter_new_s3_keys(mock_s3_bucket):
+    keys = [f"key_{i:05d}" for i in range(MAX_KEYS + 5)]
+    _put_keys(mock_s3_bucket, keys)
+    s3_session = mock_s3_bucket.meta.client
+
+    new_keys = list(iter_new_s3_keys(mock_s3_bucket.name, s3_session=s3_session))
+    assert [key for key, _ in new_keys] == keys
+    assert [cursor for _, cursor in new_keys] == keys
+
+    assert list(iter_new_s3_keys(mock_s3_bucket.name, cursor=keys[-1], s3_session=s3_session)) == []
+
+    _put_keys(mock_s3_bucket, ["key_99999"])
+    assert list(iter_new_s3_keys(mock_s3_bucket.name, cursor=keys[-1], s3_session=s3_session)) == [
+        ("key_99999", "key_99999")
+    ]
+
+
+def test_iter_new_s3_keys_last_modified(mock_s3_bucket):
+    _put_keys(mock_s3_bucket, ["b", "c", "d"])
+    s3_session = mock_s3_bucket.meta.client
+
+    new_keys = list(
+        iter_new_s3_keys(mock_s3_bucket.name, mode=LAST_MODIFIED_MODE, s3_session=s3_session)
+    )
+    assert [key for key, _ in new_keys] == ["b", "c", "d"]
+    # the cursor only advances with the last key of the listing
+    assert [cursor for _, cursor in new_keys[:-1]] == [None, None]
+    cursor = new_keys[-1][1]
+
+    assert (
+        list(
+            iter_new_s3_keys(
+                mock_s3_bucket.name,
+                cursor=cursor,
+                mode=LAST_MODIFIED_MODE,
+                s3_session=s3_session,
+            )
+        )
+        == []
+    )
+
+    # keys that sort before the keys that were already seen are still found
+    _put_keys(mock_s3_bucket, ["a"])
+    new_keys = list(
+        iter_new_s3_keys(
+            mock_s3_bucket.name, cursor=cursor, mode=LAST_MODIFIED_MODE, s3_session=s3_session
+        )
+    )
+    assert [key for key, _ in new_keys] == ["a"]
+
+    assert (
+        list(
+            iter_new_s3_keys(
+                mock_s3_bucket.name,
+                cursor=new_keys[-1][1],
+                mode=LAST_MODIFIED_MODE,
+                s3_session=s3_session,
+            )
+        )
+        == []
+    )
@@ -27,13 +27,37 @@
 from dagster.core.definitions.metadata import RawMetadataValue
 from dagster.core.errors import DagsterInvalidSubsetError
 
+# the file in the dbt target directory that the manifest digest is cached in
+MANIFEST_DIGEST_FILENAME = "dagster_manifest_digest.json"
+
+# bump whenever the contents of the manifest digest change, so that older digests are rebuilt
+_MANIFEST_DIGEST_VERSION = 2
+
+# the fields of each model and source that are kept in the manifest digest
+_MANIFEST_DIGEST_NODE_FIELDS = (
+    "unique_id",
+    "resource_type",
+    "package_name",
+    "name",
+    "alias",
+    "identifier",
+    "source_name",
+    "database",
+    "schema",
+    "fqn",
+    "raw_sql",
+    "description",
+    "columns",
+    "config",
+    "meta",
+    "tags",
+)
 
-def _load_manifest_for_project(
-    project_dir: str, profiles_dir: str, target_dir: str, select: str
-) -> Tuple[Mapping[str, Any], DbtCliOutput]:
+
+def _run_dbt_ls(project_dir: str, profiles_dir: str, target_dir: str, select: str) -> DbtCliOutput:
     # running "dbt ls" regenerates the manifest.json, which includes a superset of the actual
     # "dbt ls" output
-    cli_output = execute_cli(
+    return execute_cli(
         executable="dbt",
         command="ls",
         log=get_dagster_logger(),
@@ -48,11 +72,142 @@ def _load_manifest_for_project(
         ignore_handled_error=False,
         target_path=target_dir,
     )
+
+
+def _selected_unique_ids_from_ls_output(cli_output: DbtCliOutput) -> Set[str]:
+    return set(filter(None, (line.get("unique_id") for line in cli_output.logs)))
+
+
+def _load_manifest_for_project(
+    project_dir: str, profiles_dir: str, target_dir: str, select: str
+) -> Tuple[Mapping[str, Any], DbtCliOutput]:
+    cli_output = _run_dbt_ls(project_dir, profiles_dir, target_dir, select)
     manifest_path = os.path.join(target_dir, "manifest.json")
     with open(manifest_path, "r", encoding="utf8") as f:
         return json.load(f), cli_output
 
 
+def _get_project_fingerprint(project_dir: str, profiles_dir: str, target_dir: str) -> str:
+    """Fingerprints the files that dbt parses a project from by their paths, sizes and modification
+    times, so that a changed project is detected without reading any of its files.
+    """
+    # dbt writes to the target and log directories on every invocation
+    excluded_dirs = {
+        os.path.abspath(path)
+        for path in (
+            target_dir,
+            os.path.join(project_dir, "target"),
+            os.path.join(project_dir, "logs"),
+        )
+    }
+
+    fingerprint = hashlib.sha1()
+    paths = [os.path.join(profiles_dir, "profiles.yml")]
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if not name.startswith(".")
+            and os.path.abspath(os.path.join(root, name)) not in excluded_dirs
+        )
+        paths.extend(os.path.join(root, name) for name in sorted(files))
+
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        fingerprint.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+
+    return fingerprint.hexdigest()
+
+
+def _digest_manifest_nodes(manifest_json: Mapping[str, Any]) -> Dict[str, Mapping[str, Any]]:
+    """Keeps only the fields of the manifest's nodes that are needed to build assets from them."""
+    dbt_nodes: Dict[str, Mapping[str, Any]] = {}
+    for unique_id, node_info in {**manifest_json["nodes"], **manifest_json["sources"]}.items():
+        if node_info["resource_type"] not in ["source", "model"]:
+            # other nodes are only ever looked up to be skipped as dependencies
+            dbt_nodes[unique_id] = {"resource_type": node_info["resource_type"]}
+            continue
+
+        dbt_nodes[unique_id] = {
+            **{
+                field: node_info[field]
+                for field in _MANIFEST_DIGEST_NODE_FIELDS
+                if field in node_info
+            },
+            "depends_on": {"nodes": node_info.get("depends_on", {}).get("nodes", [])},
+        }
+
+    return dbt_nodes
+
+
+def _read_manifest_digest(digest_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(digest_path, "r", encoding="utf8") as f:
+            digest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(digest, dict) or digest.get("version") != _MANIFEST_DIGEST_VERSION:
+        return None
+
+    return digest
+
+
+def _write_manifest_digest(digest_path: str, digest: Mapping[str, Any]):
+    # write to a temporary file first, so that concurrent loads never read a partial digest
+    tmp_path = f"{digest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf8") as f:
+        json.dump(digest, f)
+    os.replace(tmp_path, digest_path)
+
+
+def _load_manifest_digest_for_project(
+    project_dir: str, profiles_dir: str, target_dir: str, select: str
+) -> Tuple[Mapping[str, Any], AbstractSet[str]]:
+    """Loads the nodes of a project and the unique ids of the models that a selection string selects
+    from the manifest digest cached in the target directory, only running "dbt ls" and parsing the
+    manifest.json when the project, the manifest or the selection string is new to the digest.
+
+    The digest is keyed by the fingerprint of the project files and keeps the result of each
+    selection string that has been resolved. The manifest.json itself is not part of the key: dbt
+    rewrites it with new metadata (e.g. generated_at, invocation_id) on every invocation, even when
+    the project has not changed.
+    """
+    manifest_path = os.path.join(target_dir, "manifest.json")
+    digest_path = os.path.join(target_dir, MANIFEST_DIGEST_FILENAME)
+
+    project_fingerprint = _get_project_fingerprint(project_dir, profiles_dir, target_dir)
+    digest = _read_manifest_digest(digest_path)
+    is_digest_current = digest is not None and digest["project_fingerprint"] == project_fingerprint
+    if digest is not None and is_digest_current and select in digest["selections"]:
+        return digest["nodes"], set(digest["selections"][select])
+
+    cli_output = _run_dbt_ls(project_dir, profiles_dir, target_dir, select)
+    selected_unique_ids = _selected_unique_ids_from_ls_output(cli_output)
+
+    with open(manifest_path, "r", encoding="utf8") as f:
+        manifest_json = json.load(f)
+
+    # the regenerated manifest.json only differs from the previous one in its metadata when the
+    # project has not changed, so the selections resolved against the previous one still hold
+    selections = digest["selections"] if digest is not None and is_digest_current else {}
+    selections[select] = sorted(selected_unique_ids)
+    dbt_nodes = _digest_manifest_nodes(manifest_json)
+    _write_manifest_digest(
+        digest_path,
+        {
+            "version": _MANIFEST_DIGEST_VERSION,
+            "project_fingerprint": project_fingerprint,
+            "nodes": dbt_nodes,
+            "selections": selections,
+        },
+    )
+    return dbt_nodes, selected_unique_ids
+
+
 def _select_unique_ids_from_manifest_json(
     manifest_json: Mapping[str, Any], select: str
 ) -> AbstractSet[str]:
@@ -283,6 +438,7 @@ def load_assets_from_dbt_project(
     io_manager_key: Optional[str] = None,
     node_info_to_asset_key: Callable[[Mapping[str, Any]], AssetKey] = _get_node_asset_key,
     use_build_command: bool = False,
+    use_manifest_cache: bool = False,
 ) -> Sequence[AssetsDefinition]:
     """
     Loads a set of DBT models from a DBT project into Dagster assets.
@@ -309,6 +465,14 @@ def load_assets_from_dbt_project(
             default, the asset key will simply be the name of the dbt model.
         use_build_command: (bool): Flag indicating if you want to use `dbt build` as the core computation
             for this asset, rather than `dbt run`.
+        use_manifest_cache: (bool): Flag indicating if you want to cache the parts of the project's
+            manifest.json that are needed to build the assets, along with the models that each
+            selection string selects, in the target directory. When neither the project files nor
+            the profiles.yml have changed since the cache was written, the assets are built from the
+            cache without running `dbt ls` or parsing the manifest.json. Changes that dbt picks up
+            from outside these files, such as environment variables, are not detected. The node
+            info passed to `node_info_to_asset_key` and `runtime_metadata_fn` then only contains
+            the fields of the node that are kept in the cache.
 
     """
     check.str_param(project_dir, "project_dir")
@@ -317,14 +481,19 @@ def load_assets_from_dbt_project(
     )
     target_dir = check.opt_str_param(target_dir, "target_dir", os.path.join(project_dir, "target"))
 
-    manifest_json, cli_output = _load_manifest_for_project(
-        project_dir, profiles_dir, target_dir, select or "*"
-    )
-    selected_unique_ids: Set[str] = set(
-        filter(None, (line.get("unique_id") for line in cli_output.logs))
-    )
+    check.bool_param(use_manifest_cache, "use_manifest_cache")
+
+    if use_manifest_cache:
+        dbt_nodes, selected_unique_ids = _load_manifest_digest_for_project(
+            project_dir, profiles_dir, target_dir, select or "*"
+        )
+    else:
+        manifest_json, cli_output = _load_manifest_for_project(
+            project_dir, profiles_dir, target_dir, select or "*"
+        )
+        selected_unique_ids = _selected_unique_ids_from_ls_output(cli_output)
+        dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
 
-    dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
     return [
         _dbt_nodes_to_assets(
             dbt_nodes,
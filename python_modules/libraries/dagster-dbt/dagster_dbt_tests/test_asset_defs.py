@@ -1,9 +1,16 @@
 import json
+import os
+import shutil
 from unittest.mock import MagicMock
 
 import pytest
 from dagster_dbt import dbt_cli_resource
-from dagster_dbt.asset_defs import load_assets_from_dbt_manifest, load_assets_from_dbt_project
+from dagster_dbt.asset_defs import (
+    MANIFEST_DIGEST_FILENAME,
+    load_assets_from_dbt_manifest,
+    load_assets_from_dbt_project,
+)
+from dagster_dbt.cli.types import DbtCliOutput
 from dagster_dbt.errors import DagsterDbtCliFatalRuntimeError
 from dagster_dbt.types import DbtOutput
 
@@ -219,6 +226,70 @@ def foo():
     assert len(foo.get_all_jobs()) == 2
 
 
+def test_load_from_project_manifest_cache(tmp_path, monkeypatch):
+    project_dir = str(tmp_path / "project")
+    target_dir = os.path.join(project_dir, "target")
+    os.makedirs(os.path.join(project_dir, "models"))
+    with open(os.path.join(project_dir, "models", "sort_by_calories.sql"), "w") as f:
+        f.write("select 1")
+
+    manifest_path = file_relative_path(__file__, "sample_manifest.json")
+    with open(manifest_path, "r", encoding="utf8") as f:
+        manifest_json = json.load(f)
+
+    ls_calls = []
+
+    def execute_cli(flags_dict, **_kwargs):
+        # stand in for "dbt ls", which regenerates the manifest.json
+        ls_calls.append(flags_dict["select"])
+        os.makedirs(target_dir, exist_ok=True)
+        shutil.copy(manifest_path, os.path.join(target_dir, "manifest.json"))
+        selected = (
+            manifest_json["nodes"]
+            if flags_dict["select"] == "*"
+            else ["model.dagster_dbt_test_project.sort_by_calories"]
+        )
+        return DbtCliOutput(
+            command="dbt ls",
+            return_code=0,
+            raw_output="",
+            logs=[{"unique_id": unique_id} for unique_id in selected],
+            result={},
+        )
+
+    monkeypatch.setattr("dagster_dbt.asset_defs.execute_cli", execute_cli)
+
+    def load(select=None):
+        return load_assets_from_dbt_project(project_dir, select=select, use_manifest_cache=True)
+
+    dbt_assets = load()
+    assert ls_calls == ["*"]
+    assert os.path.exists(os.path.join(target_dir, MANIFEST_DIGEST_FILENAME))
+    assert_assets_match_project(dbt_assets)
+
+    # unchanged project, resolved from the cache
+    assert_assets_match_project(load())
+    assert ls_calls == ["*"]
+
+    # a new selection string runs "dbt ls", but keeps the selections already in the cache
+    assert set(load(select="sort_by_calories")[0].asset_keys_by_output_name) == {"sort_by_calories"}
+    assert ls_calls == ["*", "sort_by_calories"]
+    assert_assets_match_project(load())
+    assert ls_calls == ["*", "sort_by_calories"]
+
+    # a changed project file invalidates the cache
+    with open(os.path.join(project_dir, "models", "sort_by_calories.sql"), "w") as f:
+        f.write("select 2")
+    assert_assets_match_project(load())
+    assert ls_calls == ["*", "sort_by_calories", "*"]
+
+    # a manifest.json rewritten with new metadata by "dbt run" or "dbt build" does not
+    with open(os.path.join(target_dir, "manifest.json"), "w", encoding="utf8") as f:
+        json.dump({**manifest_json, "metadata": {"invocation_id": "other"}}, f)
+    assert_assets_match_project(load())
+    assert ls_calls == ["*", "sort_by_calories", "*"]
+
+
 def test_dbt_ls_fail_fast():
     with pytest.raises(DagsterDbtCliFatalRuntimeError):
         load_assets_from_dbt_project("bad_project_dir", "bad_config_dir")
@@ -4,7 +4,7 @@
 from dagster_docker.utils import DOCKER_CONFIG_SCHEMA, validate_docker_config, validate_docker_image
 
 import dagster._check as check
-from dagster import executor
+from dagster import Field, executor
 from dagster.core.definitions.executor_definition import multiple_process_executor_requirements
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData, MetadataEntry
 from dagster.core.execution.plan.objects import StepFailureData
@@ -27,6 +27,13 @@
         DOCKER_CONFIG_SCHEMA,
         {
             "retries": get_retries_config(),
+            "wait_for_events": Field(
+                bool,
+                is_required=False,
+                default_value=False,
+                description="Whether to wake up the executor as soon as a step reports a new event, "
+                "rather than polling the event log at a fixed interval.",
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -53,6 +60,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
             network: ...
             networks: ...
             container_kwargs: ...
+            wait_for_events: ...
 
     If you're using the DockerRunLauncher, configuration set on the containers created by the run
     launcher will also be set on the containers that are created for each step.
@@ -66,6 +74,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
     networks = check.opt_list_elem(config, "networks", of_type=str)
     container_kwargs = check.opt_dict_elem(config, "container_kwargs", key_type=str)
     retries = check.dict_elem(config, "retries", key_type=str)
+    wait_for_events = check.bool_param(config.get("wait_for_events", False), "wait_for_events")
 
     validate_docker_config(network, networks, container_kwargs)
 
@@ -82,6 +91,7 @@ def docker_executor(init_context: InitExecutorContext) -> Executor:
     return StepDelegatingExecutor(
         DockerStepHandler(image, container_context),
         retries=check.not_none(RetryMode.from_config(retries)),
+        wait_for_events=wait_for_events,
     )
 
 
@@ -153,14 +163,15 @@ def _get_client(self, docker_container_context: DockerContainerContext):
             )
         return client
 
-    def _get_container_name(self, run_id, step_key):
-        return f"dagster-step-{hash_str(run_id + step_key)}"
+    def _get_container_name(self, run_id, step_keys):
+        # steps launched together run in the same container
+        return f"dagster-step-{hash_str(run_id + ','.join(step_keys))}"
 
     def _create_step_container(self, client, container_context, step_image, execute_step_args):
         return client.containers.create(
             step_image,
             name=self._get_container_name(
-                execute_step_args.pipeline_run_id, execute_step_args.step_keys_to_execute[0]
+                execute_step_args.pipeline_run_id, execute_step_args.step_keys_to_execute
             ),
             detach=True,
             network=container_context.networks[0] if len(container_context.networks) else None,
@@ -195,8 +206,6 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> List[DagsterE
         step_keys_to_execute = check.not_none(
             step_handler_context.execute_step_args.step_keys_to_execute
         )
-        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
-        step_key = step_keys_to_execute[0]
 
         events = [
             DagsterEvent(
@@ -211,42 +220,49 @@ def launch_step(self, step_handler_context: StepHandlerContext) -> List[DagsterE
                     ],
                 ),
             )
+            for step_key in step_keys_to_execute
         ]
 
         step_container.start()
 
         return events
 
+    def _step_failure_events(
+        self, step_handler_context: StepHandlerContext, message: str
+    ) -> List[DagsterEvent]:
+        return [
+            DagsterEvent(
+                event_type_value=DagsterEventType.STEP_FAILURE.value,
+                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+                step_key=step_key,
+                message=message,
+                event_specific_data=StepFailureData(
+                    error=None,
+                    user_failure_data=None,
+                ),
+            )
+            for step_key in check.not_none(
+                step_handler_context.execute_step_args.step_keys_to_execute
+            )
+        ]
+
     def check_step_health(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
-        step_keys_to_execute = check.not_none(
-            step_handler_context.execute_step_args.step_keys_to_execute
-        )
-        step_key = step_keys_to_execute[0]
         container_context = self._get_docker_container_context(step_handler_context)
 
         client = self._get_client(container_context)
 
         container_name = self._get_container_name(
             step_handler_context.execute_step_args.pipeline_run_id,
-            step_key,
+            step_handler_context.execute_step_args.step_keys_to_execute,
         )
 
         try:
             container = client.containers.get(container_name)
 
         except Exception as e:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Error when checking on step container health: {e}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
-                )
-            ]
+            return self._step_failure_events(
+                step_handler_context, f"Error when checking on step container health: {e}"
+            )
 
         if container.status == "running":
             return []
@@ -254,35 +270,19 @@ def check_step_health(self, step_handler_context: StepHandlerContext) -> List[Da
         try:
             container_info = container.wait(timeout=0.1)
         except Exception as e:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Container status is {container.status}. Hit exception attempting to get its return code: {e}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
-                )
-            ]
+            return self._step_failure_events(
+                step_handler_context,
+                f"Container status is {container.status}. Hit exception attempting to get its return code: {e}",
+            )
 
         ret_code = container_info.get("StatusCode")
         if ret_code == 0:
             return []
 
-        return [
-            DagsterEvent(
-                event_type_value=DagsterEventType.STEP_FAILURE.value,
-                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                step_key=step_key,
-                message=f"Container status is {container.status}. Return code is {str(ret_code)}.",
-                event_specific_data=StepFailureData(
-                    error=None,
-                    user_failure_data=None,
-                ),
-            )
-        ]
+        return self._step_failure_events(
+            step_handler_context,
+            f"Container status is {container.status}. Return code is {str(ret_code)}.",
+        )
 
     def terminate_step(self, step_handler_context: StepHandlerContext) -> List[DagsterEvent]:
         container_context = self._get_docker_container_context(step_handler_context)
@@ -290,8 +290,6 @@ def terminate_step(self, step_handler_context: StepHandlerContext) -> List[Dagst
         step_keys_to_execute = check.not_none(
             step_handler_context.execute_step_args.step_keys_to_execute
         )
-        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
-        step_key = step_keys_to_execute[0]
 
         events = [
             DagsterEvent(
@@ -301,6 +299,7 @@ def terminate_step(self, step_handler_context: StepHandlerContext) -> List[Dagst
                 message="Stopping Docker container for step",
                 event_specific_data=EngineEventData(),
             )
+            for step_key in step_keys_to_execute
         ]
 
         client = self._get_client(container_context)
@@ -309,7 +308,7 @@ def terminate_step(self, step_handler_context: StepHandlerContext) -> List[Dagst
             container = client.containers.get(
                 self._get_container_name(
                     step_handler_context.execute_step_args.pipeline_run_id,
-                    step_keys_to_execute[0],
+                    step_keys_to_execute,
                 )
             )
             container.stop()
@@ -318,7 +317,7 @@ def terminate_step(self, step_handler_context: StepHandlerContext) -> List[Dagst
                 DagsterEvent(
                     event_type_value=DagsterEventType.ENGINE_EVENT.value,
                     pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
+                    step_key=step_keys_to_execute[0],
                     message=f"Hit error while terminating Docker container:\n{e}",
                     event_specific_data=EngineEventData(),
                 )
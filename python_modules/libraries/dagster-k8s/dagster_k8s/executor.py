@@ -1,4 +1,5 @@
-from typing import List, Optional, cast
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, cast
 
 import kubernetes
 from dagster_k8s.launcher import K8sRunLauncher
@@ -25,7 +26,7 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
-from .utils import delete_job
+from .utils import delete_job, sanitize_k8s_label
 
 
 @executor(
@@ -41,6 +42,21 @@
                 description="Limit on the number of pods that will run concurrently within the scope "
                 "of a Dagster run. Note that this limit is per run, not global.",
             ),
+            "steps_per_launch": Field(
+                IntSource,
+                is_required=False,
+                default_value=1,
+                description="Maximum number of ready steps that are executed together in a single "
+                "pod. Grouping several small steps reduces the number of Kubernetes jobs that are "
+                "created for runs that fan out to many steps.",
+            ),
+            "wait_for_events": Field(
+                bool,
+                is_required=False,
+                default_value=False,
+                description="Whether to wake up the executor as soon as a step reports a new event, "
+                "rather than polling the event log at a fixed interval.",
+            ),
         },
     ),
     requirements=multiple_process_executor_requirements(),
@@ -71,11 +87,19 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
             env_vars: ...
             job_image: ... # leave out if using userDeployments
             max_concurrent: ...
+            steps_per_launch: ...
+            wait_for_events: ...
 
     `max_concurrent` limits the number of pods that will execute concurrently for one run. By default
     there is no limit- it will maximally parallel as allowed by the DAG. Note that this is not a
     global limit.
 
+    `steps_per_launch` groups steps that are ready at the same time so that up to that many steps
+    execute one after another in the same pod. By default each step is launched in its own pod.
+
+    `wait_for_events` makes the executor watch the run's event log and react to step events as soon
+    as they are stored, instead of polling for them at a fixed interval.
+
     Configuration set on the Kubernetes Jobs and Pods created by the `K8sRunLauncher` will also be
     set on Kubernetes Jobs and Pods created by the `k8s_job_executor`.
     """
@@ -113,6 +137,8 @@ def k8s_job_executor(init_context: InitExecutorContext) -> Executor:
         retries=RetryMode.from_config(init_context.executor_config["retries"]),  # type: ignore
         max_concurrent=check.opt_int_elem(exc_cfg, "max_concurrent"),
         should_verify_step=True,
+        steps_per_launch=check.opt_int_elem(exc_cfg, "steps_per_launch") or 1,
+        wait_for_events=exc_cfg.get("wait_for_events", False),  # type: ignore
     )
 
 
@@ -159,29 +185,29 @@ def _get_container_context(self, step_handler_context: StepHandlerContext):
     def _batch_api(self):
         return self._fixed_k8s_client_batch_api or kubernetes.client.BatchV1Api()
 
+    def _get_step_keys(self, step_handler_context: StepHandlerContext) -> List[str]:
+        return cast(List[str], step_handler_context.execute_step_args.step_keys_to_execute)
+
     def _get_k8s_step_job_name(self, step_handler_context):
-        step_key = step_handler_context.execute_step_args.step_keys_to_execute[0]
+        step_keys = self._get_step_keys(step_handler_context)
 
         name_key = get_k8s_job_name(
             step_handler_context.execute_step_args.pipeline_run_id,
-            step_key,
+            ",".join(step_keys),
         )
 
         if step_handler_context.execute_step_args.known_state:
             retry_state = step_handler_context.execute_step_args.known_state.get_retry_state()
-            if retry_state.get_attempt_count(step_key):
-                return "dagster-step-%s-%d" % (name_key, retry_state.get_attempt_count(step_key))
+            attempt_count = max(retry_state.get_attempt_count(step_key) for step_key in step_keys)
+            if attempt_count:
+                return "dagster-step-%s-%d" % (name_key, attempt_count)
 
         return "dagster-step-%s" % (name_key)
 
     def launch_step(self, step_handler_context: StepHandlerContext):
-        events = []
-
-        step_keys_to_execute = cast(
-            List[str], step_handler_context.execute_step_args.step_keys_to_execute
-        )
-        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
-        step_key = step_keys_to_execute[0]
+        step_keys = self._get_step_keys(step_handler_context)
+        # steps launched together run in the same pod, which is configured from the first step
+        step_key = step_keys[0]
 
         job_name = self._get_k8s_step_job_name(step_handler_context)
         pod_name = job_name
@@ -206,6 +232,13 @@ def launch_step(self, step_handler_context: StepHandlerContext):
             frozentags(step_handler_context.step_tags[step_key])
         )
 
+        labels = {
+            "dagster/job": step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+            "dagster/run-id": step_handler_context.execute_step_args.pipeline_run_id,
+        }
+        if len(step_keys) == 1:
+            labels["dagster/op"] = step_key
+
         job = construct_dagster_k8s_job(
             job_config=job_config,
             args=args,
@@ -213,39 +246,48 @@ def launch_step(self, step_handler_context: StepHandlerContext):
             pod_name=pod_name,
             component="step_worker",
             user_defined_k8s_config=user_defined_k8s_config,
-            labels={
-                "dagster/job": step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                "dagster/op": step_key,
-                "dagster/run-id": step_handler_context.execute_step_args.pipeline_run_id,
-            },
+            labels=labels,
         )
 
-        events.append(
+        events = [
             DagsterEvent(
                 event_type_value=DagsterEventType.ENGINE_EVENT.value,
                 pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                step_key=step_key,
-                message=f"Executing step {step_key} in Kubernetes job {job_name}",
+                step_key=key,
+                message=f"Executing step {key} in Kubernetes job {job_name}",
                 event_specific_data=EngineEventData(
                     [
-                        MetadataEntry("Step key", value=step_key),
+                        MetadataEntry("Step key", value=key),
                         MetadataEntry("Kubernetes Job name", value=job_name),
                     ],
                 ),
             )
-        )
+            for key in step_keys
+        ]
 
         self._batch_api.create_namespaced_job(body=job, namespace=container_context.namespace)
 
         return events
 
-    def check_step_health(self, step_handler_context: StepHandlerContext):
-        step_keys_to_execute = cast(
-            List[str], step_handler_context.execute_step_args.step_keys_to_execute
-        )
-        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
-        step_key = step_keys_to_execute[0]
+    def _job_health_events(self, step_handler_context: StepHandlerContext, job, job_name):
+        if not job.status.failed:
+            return []
+
+        return [
+            DagsterEvent(
+                event_type_value=DagsterEventType.STEP_FAILURE.value,
+                pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
+                step_key=step_key,
+                message=f"Discovered failed Kubernetes job {job_name} for step {step_key}",
+                event_specific_data=StepFailureData(
+                    error=None,
+                    user_failure_data=None,
+                ),
+            )
+            for step_key in self._get_step_keys(step_handler_context)
+        ]
 
+    def check_step_health(self, step_handler_context: StepHandlerContext):
         job_name = self._get_k8s_step_job_name(step_handler_context)
 
         container_context = self._get_container_context(step_handler_context)
@@ -253,27 +295,46 @@ def check_step_health(self, step_handler_context: StepHandlerContext):
         job = self._batch_api.read_namespaced_job(
             namespace=container_context.namespace, name=job_name
         )
-        if job.status.failed:
-            return [
-                DagsterEvent(
-                    event_type_value=DagsterEventType.STEP_FAILURE.value,
-                    pipeline_name=step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
-                    step_key=step_key,
-                    message=f"Discovered failed Kubernetes job {job_name} for step {step_key}",
-                    event_specific_data=StepFailureData(
-                        error=None,
-                        user_failure_data=None,
-                    ),
+        return self._job_health_events(step_handler_context, job, job_name)
+
+    def check_steps_health(self, step_handler_contexts: Sequence[StepHandlerContext]):
+        # list the step jobs of each run with a single request, instead of reading each job
+        contexts_by_run_and_namespace: Dict[tuple, List[StepHandlerContext]] = defaultdict(list)
+        for step_handler_context in step_handler_contexts:
+            container_context = self._get_container_context(step_handler_context)
+            contexts_by_run_and_namespace[
+                (
+                    step_handler_context.execute_step_args.pipeline_run_id,
+                    container_context.namespace,
                 )
-            ]
-        return []
+            ].append(step_handler_context)
 
-    def terminate_step(self, step_handler_context: StepHandlerContext):
-        step_keys_to_execute = cast(
-            List[str], step_handler_context.execute_step_args.step_keys_to_execute
-        )
-        assert len(step_keys_to_execute) == 1, "Launching multiple steps is not currently supported"
+        events = []
+        unlisted_contexts = []
+        for (run_id, namespace), contexts in contexts_by_run_and_namespace.items():
+            jobs = self._batch_api.list_namespaced_job(
+                namespace=namespace,
+                label_selector=(
+                    f"dagster/run-id={sanitize_k8s_label(run_id)},"
+                    "app.kubernetes.io/component=step_worker"
+                ),
+            )
+            jobs_by_name = {job.metadata.name: job for job in jobs.items}
+            for step_handler_context in contexts:
+                job_name = self._get_k8s_step_job_name(step_handler_context)
+                if job_name in jobs_by_name:
+                    events.extend(
+                        self._job_health_events(
+                            step_handler_context, jobs_by_name[job_name], job_name
+                        )
+                    )
+                else:
+                    unlisted_contexts.append(step_handler_context)
+
+        # fall back to reading each job that was not listed individually
+        return events + super().check_steps_health(unlisted_contexts)
 
+    def terminate_step(self, step_handler_context: StepHandlerContext):
         job_name = self._get_k8s_step_job_name(step_handler_context)
         container_context = self._get_container_context(step_handler_context)
 
@@ -118,7 +118,12 @@ def test_executor_init_container_context(
         InitExecutorContext(
             job=InMemoryPipeline(bar),
             executor_def=k8s_job_executor,
-            executor_config={"env_vars": ["FOO_TEST"], "retries": {}, "max_concurrent": 4},
+            executor_config={
+                "env_vars": ["FOO_TEST"],
+                "retries": {},
+                "max_concurrent": 4,
+                "wait_for_events": True,
+            },
             instance=k8s_run_launcher_instance,
         )
     )
@@ -147,6 +152,7 @@ def test_executor_init_container_context(
         ]
     )
     assert executor._max_concurrent == 4
+    assert executor._wait_for_events
     assert sorted(
         executor._step_handler._get_container_context(step_handler_context).resources
     ) == sorted(
@@ -348,3 +354,84 @@ def test_step_handler_with_container_context(
 
         assert envs["FOO_TEST"] == "bar"
         assert envs["BAZ_TEST"] == "blergh"
+
+
+def test_step_handler_multiple_steps(kubeconfig_file, k8s_instance):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    run = create_run_for_test(k8s_instance, pipeline_name="bar")
+    events = handler.launch_steps(
+        [
+            StepHandlerContext(
+                k8s_instance,
+                ExecuteStepArgs(
+                    reconstructable(bar).get_python_origin(), run.run_id, ["foo_solid", "baz_solid"]
+                ),
+                {"foo_solid": {}, "baz_solid": {}},
+            )
+        ]
+    )
+
+    # both steps execute in the same job
+    assert [event.step_key for event in events] == ["foo_solid", "baz_solid"]
+    mock_method_calls = mock_k8s_client_batch_api.method_calls
+    assert len(mock_method_calls) == 1
+    method_name, _args, kwargs = mock_method_calls[0]
+    assert method_name == "create_namespaced_job"
+    execute_step_args = kwargs["body"].spec.template.spec.containers[0].args[-1]
+    assert "foo_solid" in execute_step_args
+    assert "baz_solid" in execute_step_args
+
+
+def test_step_handler_check_steps_health(kubeconfig_file, k8s_instance):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    handler = K8sStepHandler(
+        image="bizbuz",
+        container_context=K8sContainerContext(namespace="foo"),
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+    )
+
+    run = create_run_for_test(k8s_instance, pipeline_name="bar")
+    contexts = [
+        StepHandlerContext(
+            k8s_instance,
+            ExecuteStepArgs(reconstructable(bar).get_python_origin(), run.run_id, [step_key]),
+            {step_key: {}},
+        )
+        for step_key in ["healthy", "failed", "unlisted"]
+    ]
+    # pylint: disable=protected-access
+    job_names = [handler._get_k8s_step_job_name(context) for context in contexts]
+
+    def _job(name, failed):
+        job = mock.MagicMock()
+        job.metadata.name = name
+        job.status.failed = failed
+        return job
+
+    mock_k8s_client_batch_api.list_namespaced_job.return_value = mock.MagicMock(
+        items=[_job(job_names[0], None), _job(job_names[1], 1)]
+    )
+    mock_k8s_client_batch_api.read_namespaced_job.return_value = _job(job_names[2], None)
+
+    events = handler.check_steps_health(contexts)
+    assert [(event.event_type_value, event.step_key) for event in events] == [
+        ("STEP_FAILURE", "failed")
+    ]
+
+    # the jobs of the run are listed with a single request, only the job that was not listed is
+    # read individually
+    mock_k8s_client_batch_api.list_namespaced_job.assert_called_once()
+    assert mock_k8s_client_batch_api.list_namespaced_job.call_args[1]["namespace"] == "foo"
+    mock_k8s_client_batch_api.read_namespaced_job.assert_called_once_with(
+        namespace="foo", name=job_names[2]
+    )
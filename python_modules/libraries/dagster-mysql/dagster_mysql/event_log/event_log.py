@@ -5,7 +5,7 @@
     AssetKeyTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
-    SqlPollingEventWatcher,
+    SqlMultiplexedPollingEventWatcher,
 )
 from dagster.core.storage.event_log.base import EventLogCursor
 from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
@@ -51,7 +51,7 @@ def __init__(self, mysql_url, inst_data=None):
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
         self._disposed = False
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = SqlMultiplexedPollingEventWatcher(self)
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -121,32 +121,36 @@ def create_clean_storage(conn_string):
         MySQLEventLogStorage.wipe_storage(conn_string)
         return MySQLEventLogStorage(conn_string)
 
-    def store_asset_event(self, event):
+    def _transaction_connection(self, conn):
+        # the engine autocommits each statement, so opt this connection into a transaction
+        return conn.execution_options(isolation_level="READ COMMITTED")
+
+    def _should_write_asset_key_index_cols(self):
+        return self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+
+    def _update_asset_entry(self, conn, event, values):
         # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
         # See SqlEventLogStorage.store_asset_event method for more details
-
-        values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
-        with self.index_connection() as conn:
-            if values:
+        if values:
+            conn.execute(
+                db.dialects.mysql.insert(AssetKeyTable)
+                .values(
+                    asset_key=event.dagster_event.asset_key.to_string(),
+                    **values,
+                )
+                .on_duplicate_key_update(
+                    **values,
+                )
+            )
+        else:
+            try:
                 conn.execute(
-                    db.dialects.mysql.insert(AssetKeyTable)
-                    .values(
+                    db.dialects.mysql.insert(AssetKeyTable).values(
                         asset_key=event.dagster_event.asset_key.to_string(),
-                        **values,
-                    )
-                    .on_duplicate_key_update(
-                        **values,
                     )
                 )
-            else:
-                try:
-                    conn.execute(
-                        db.dialects.mysql.insert(AssetKeyTable).values(
-                            asset_key=event.dagster_event.asset_key.to_string(),
-                        )
-                    )
-                except db.exc.IntegrityError:
-                    pass
+            except db.exc.IntegrityError:
+                pass
 
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
@@ -158,10 +162,12 @@ def index_connection(self):
         return self._connect()
 
     def has_secondary_index(self, name):
+        # only applied migrations are cached, so that a migration applied by another process (e.g.
+        # `dagster instance reindex`) is picked up without restarting this one
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                MySQLEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(MySQLEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):
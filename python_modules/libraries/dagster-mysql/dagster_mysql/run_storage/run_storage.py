@@ -120,6 +120,10 @@ def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
 
+    def _transaction_connection(self, conn):
+        # the engine autocommits each statement, so opt this connection into a transaction
+        return conn.execution_options(isolation_level="READ COMMITTED")
+
     def has_built_index(self, migration_name):
         if migration_name not in self._index_migration_cache:
             self._index_migration_cache[migration_name] = super(
@@ -5,6 +5,7 @@
 from dagster_mysql.event_log import MySQLEventLogStorage
 from dagster_tests.core_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
+    _stats_records,
     create_test_event_log_record,
 )
 
@@ -81,6 +82,27 @@ def watch_two(event, _cursor):
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
 
+    def test_store_events_failure_rolls_back_batch(self, storage, monkeypatch):
+        run_id = "foo"
+        events = _stats_records(run_id)
+
+        def _fail_update_asset_entry(*_args, **_kwargs):
+            raise Exception("failed to update the asset index")
+
+        # fail once the event rows and step stats of the batch have been written
+        monkeypatch.setattr(storage, "_update_asset_entry", _fail_update_asset_entry)
+        with pytest.raises(Exception, match="failed to update the asset index"):
+            storage.store_events(events)
+
+        assert len(storage.get_logs_for_run(run_id)) == 0
+        assert storage.get_step_stats_for_run(run_id) == []
+        assert storage.all_asset_keys() == []
+
+        monkeypatch.undo()
+        storage.store_events(events)
+        assert len(storage.get_logs_for_run(run_id)) == len(events)
+        assert len(storage.all_asset_keys()) == 3
+
     def test_load_from_config(self, hostname):
         url_cfg = """
         event_log_storage:
@@ -12,10 +12,16 @@
     StrictColumnsWithMetadata,
     all_unique_validator,
     categorical_column_validator_factory,
+    categorical_mask,
+    column_range_mask,
     column_range_validation_factory,
+    column_regex_validation_factory,
     dtype_in_set_validation_factory,
+    non_null_mask,
     non_null_validation,
     nonnull,
+    regex_mask,
+    unique_mask,
 )
 from .data_frame import (
     DataFrame,
@@ -47,4 +53,10 @@
     "nonnull",
     "non_null_validation",
     "categorical_column_validator_factory",
+    "column_regex_validation_factory",
+    "column_range_mask",
+    "categorical_mask",
+    "non_null_mask",
+    "unique_mask",
+    "regex_mask",
 ]
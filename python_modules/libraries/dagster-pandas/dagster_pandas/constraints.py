@@ -1,8 +1,10 @@
+import re
 import sys
 from collections import defaultdict
 from datetime import datetime
 from functools import wraps
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -394,6 +396,147 @@ def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+def _values_of_type_mask(column, types):
+    """
+    Whether each value of a column is an instance of types, as seen by a validation function applied to
+    each value. pandas boxes all the values of a column with a numpy dtype to the same python type, apart
+    from missing values, so only one value of each kind needs to be checked.
+    """
+    if column.dtype == object or not isinstance(column.dtype, np.dtype):
+        return column.map(lambda x: isinstance(x, types)).astype(bool)
+
+    null = column.isnull()
+    values, missing_values = column[~null], column[null]
+    values_of_type = len(values) > 0 and isinstance(values.iloc[:1].astype(object).iloc[0], types)
+    missing_values_of_type = len(missing_values) > 0 and isinstance(
+        missing_values.iloc[:1].astype(object).iloc[0], types
+    )
+    return pd.Series(np.where(null, missing_values_of_type, values_of_type), index=column.index)
+
+
+def _range_bounds(minim, maxim):
+    if minim is None:
+        if isinstance(maxim, datetime):
+            minim = datetime.min
+        else:
+            minim = -1 * (sys.maxsize - 1)
+    if maxim is None:
+        if isinstance(minim, datetime):
+            maxim = datetime.max
+        else:
+            maxim = sys.maxsize
+    return minim, maxim
+
+
+def column_range_mask(column, minim=None, maxim=None, ignore_missing_vals=False):
+    """
+    vectorized check that the values of a column are of the type of the bounds and within them
+    Args:
+        column(Union[pd.Series, np.ndarray]): the values to check
+        minim(Optional[Comparable]): the low end of the range
+        maxim(Optional[Comparable]): the high end of the range
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a boolean pd.Series that is True for the values that pass the check
+    """
+    column = pd.Series(column)
+    low, high = _range_bounds(minim, maxim)
+
+    def in_range(x):
+        return isinstance(x, (type(low), type(high))) and (x <= high) and (x >= low)
+
+    valid = None
+    if column.dtype != object and isinstance(column.dtype, np.dtype):
+        valid = _values_of_type_mask(column, (type(low), type(high)))
+        try:
+            # unset bounds are left out, since they may not be comparable with the column (e.g.
+            # datetime.min is out of the range of datetime64[ns] values)
+            if valid.any() and minim is not None:
+                valid &= column >= minim
+            if valid.any() and maxim is not None:
+                valid &= column <= maxim
+        except (TypeError, ValueError):
+            valid = None
+
+    if valid is None:
+        # the values of object columns, or bounds that pandas can't compare, are compared one at a time
+        valid = column.map(in_range).astype(bool)
+
+    if ignore_missing_vals:
+        valid |= column.isnull()
+    return valid
+
+
+def categorical_mask(column, categories, ignore_missing_vals=False):
+    """
+    vectorized check that the values of a column are in some set
+    Args:
+        column(Union[pd.Series, np.ndarray]): the values to check
+        categories(Union[Sequence, set]): the set of allowed values
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a boolean pd.Series that is True for the values that pass the check
+    """
+    column = pd.Series(column)
+    valid = column.isin(list(categories))
+    if ignore_missing_vals:
+        valid |= column.isnull()
+    return valid
+
+
+def non_null_mask(column):
+    """
+    vectorized check that the values of a column are not null
+    Args:
+        column(Union[pd.Series, np.ndarray]): the values to check
+
+    Returns: a boolean pd.Series that is True for the values that pass the check
+    """
+    return pd.Series(column).notnull()
+
+
+def unique_mask(column, ignore_missing_vals=False):
+    """
+    vectorized check that the values of a column are not duplicates of earlier values
+    Args:
+        column(Union[pd.Series, np.ndarray]): the values to check
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a boolean pd.Series that is True for the values that pass the check
+    """
+    column = pd.Series(column)
+    valid = ~column.duplicated()
+    if ignore_missing_vals:
+        valid |= column.isnull()
+    return valid
+
+
+def regex_mask(column, regex, ignore_missing_vals=False):
+    """
+    vectorized check that the values of a column are strings that fully match a regex
+    Args:
+        column(Union[pd.Series, np.ndarray]): the values to check
+        regex(Union[str, re.Pattern]): the regex that values must match
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a boolean pd.Series that is True for the values that pass the check
+    """
+    column = pd.Series(column)
+    # string columns tend to repeat values, so the regex is only run over the distinct values
+    codes, uniques = pd.factorize(column)
+    try:
+        unique_valid = pd.Series(uniques).str.fullmatch(regex).fillna(False).to_numpy(dtype=bool)
+    except AttributeError:
+        # only columns that hold strings have a .str accessor
+        unique_valid = np.zeros(len(uniques), dtype=bool)
+    # missing values have a code of -1, which picks the False appended at the end
+    valid = pd.Series(np.append(unique_valid, False)[codes], index=column.index)
+
+    if ignore_missing_vals:
+        valid |= column.isnull()
+    return valid
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """
     Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
@@ -424,9 +567,9 @@ def validate(self, data, *columns, **kwargs):
             if not res[0]:
                 offending_columns.add(column)
                 if not res[1].get("actual") is None:
-                    offending_values[column] = [x.item() for x in res[1].get("actual").to_numpy()]
+                    offending_values[column] = res[1].get("actual").to_numpy().tolist()
                 else:
-                    offending_values[column] = [x.item() for x in relevant_data[column].to_numpy()]
+                    offending_values[column] = relevant_data[column].to_numpy().tolist()
         if len(offending_columns) == 0 and not self.raise_or_typecheck:
             return TypeCheck(success=True)
         elif len(offending_columns) > 0:
@@ -451,6 +594,9 @@ class ColumnConstraintWithMetadata(ConstraintWithMetadata):
     you want to apply to multiple columns of your dataframe
     The main difference from the base class in terms of construction is that now, your validation_fns should operate on
     individual values.
+    If the validation_fn has a ``vectorized`` attribute, that is called with each whole column instead, and should
+    return a boolean pd.Series that is True for the values that pass validation. The validation functions returned by
+    the factories in this module all have one.
     args:
         description (str): description of the constraint
         validation_fn (Callable[[Any], Tuple[bool, dict[str, Union[dict,list, str, set]]]]:
@@ -473,12 +619,11 @@ def validate(self, data, *columns, **kwargs):
         offending = {}
         offending_values = {}
         # TODO:  grab metadata from here
-        inverse_validation = lambda x: not self.validation_fn(x)[0]
         for column in columns:
-            results = relevant_data[relevant_data[column].apply(inverse_validation)]
-            if len(results.index.tolist()) > 0:
-                offending[column] = ["row " + str(i) for i in (results.index.tolist())]
-                offending_values[column] = results[column].tolist()
+            invalid = ~self._valid_mask(relevant_data[column])
+            if invalid.any():
+                offending[column] = ["row " + str(i) for i in relevant_data.index[invalid].tolist()]
+                offending_values[column] = relevant_data[column][invalid].tolist()
         if len(offending) == 0:
             if not self.raise_or_typecheck:
                 return TypeCheck(success=True)
@@ -497,6 +642,12 @@ def validate(self, data, *columns, **kwargs):
             else:
                 return exc.return_as_typecheck()
 
+    def _valid_mask(self, column):
+        vectorized = getattr(self.validation_fn, "vectorized", None)
+        if vectorized is not None:
+            return vectorized(column).to_numpy(dtype=bool)
+        return column.apply(lambda x: self.validation_fn(x)[0]).to_numpy(dtype=bool)
+
 
 class MultiColumnConstraintWithMetadata(ColumnConstraintWithMetadata):
     """
@@ -632,6 +783,9 @@ def non_null_validation(x):
     return not pd.isnull(x), {}
 
 
+non_null_validation.vectorized = non_null_mask
+
+
 def all_unique_validator(column, ignore_missing_vals=False):
     """
     validates that all values in an iterable are unique
@@ -664,9 +818,7 @@ def create_dataframe(_):
             metadata['actual'] == {'bar': {'all_unique_validator': [10.0]}}
     """
     column = pd.Series(column)
-    duplicated = column.duplicated()
-    if ignore_missing_vals:
-        duplicated = apply_ignore_missing_data_to_mask(duplicated, column)
+    duplicated = ~unique_mask(column, ignore_missing_vals=ignore_missing_vals)
     return not duplicated.any(), {"actual": column[duplicated]}
 
 
@@ -690,6 +842,11 @@ def nvalidator(val):
 
     nvalidator.__doc__ += " and ensures no values are null"
 
+    # wraps copies the vectorized form of func, which needs the null check added
+    vectorized = getattr(func, "vectorized", None)
+    if vectorized is not None:
+        nvalidator.vectorized = lambda column: vectorized(column) & non_null_mask(column)
+
     return nvalidator
 
 
@@ -730,16 +887,8 @@ def create_dataframe(_):
             metadata['actual'] == {'foo': {'in_range_validation_fn': [7]}}
 
     """
-    if minim is None:
-        if isinstance(maxim, datetime):
-            minim = datetime.min
-        else:
-            minim = -1 * (sys.maxsize - 1)
-    if maxim is None:
-        if isinstance(minim, datetime):
-            maxim = datetime.max
-        else:
-            maxim = sys.maxsize
+    vectorized = lambda column: column_range_mask(column, minim, maxim, ignore_missing_vals)
+    minim, maxim = _range_bounds(minim, maxim)
 
     def in_range_validation_fn(x):
         if ignore_missing_vals and pd.isnull(x):
@@ -751,6 +900,7 @@ def in_range_validation_fn(x):
     )
     if ignore_missing_vals:
         in_range_validation_fn.__doc__ += ", ignoring nulls"
+    in_range_validation_fn.vectorized = vectorized
 
     return in_range_validation_fn
 
@@ -806,10 +956,69 @@ def categorical_validation_fn(x):
     )
     if ignore_missing_vals:
         categorical_validation_fn.__doc__ += ", ignoring nulls"
+    categorical_validation_fn.vectorized = lambda column: categorical_mask(
+        column, categories, ignore_missing_vals
+    )
 
     return categorical_validation_fn
 
 
+def column_regex_validation_factory(regex, ignore_missing_vals=False):
+    """
+    factory for validators testing if values are strings that fully match a regex
+    Args:
+        regex(Union[str, re.Pattern]): the regex that values must match
+        ignore_missing_vals(Optional[bool]): whether to ignore nulls
+
+    Returns: a validation function for this constraint
+
+    Usage:
+        pass returned functions as column validators to
+        :py:class:'~dagster_pandas.constraints.ColumnConstraintWithMetadata'
+        or :py:class:'~dagster_pandas.constraints.MultiColumnConstraintWithMetadata'
+
+    Example:
+        .. code-block:: python
+            regex_validation_fn = column_regex_validation_factory(r"[a-z]+")
+            column_validator = MultiColumnConstraintWithMetadata(
+                "confirms values are lowercase words",
+                {'foo': [regex_validation_fn]},
+                ColumnWithMetadataException,
+                raise_or_typecheck=False,
+            )
+            ntype = create_structured_dataframe_type(
+                "WordType",
+                columns_validator=column_validator
+            )
+            @op(out={'basic_dataframe': Out(dagster_type=ntype)})
+            def create_dataframe(_):
+                yield Output(
+                    DataFrame({'foo': ['a', 'b', 'C'], 'bar': [9, 10, 10]}),
+                    output_name='basic_dataframe',
+                )
+            #will fail with
+            metadata['offending'] == {'foo': {'regex_validation_fn': ['row 2']}}
+            metadata['actual'] == {'foo': {'regex_validation_fn': ['C']}}
+
+    """
+
+    pattern = re.compile(regex)
+
+    def regex_validation_fn(x):
+        if ignore_missing_vals and pd.isnull(x):
+            return True, {}
+        return isinstance(x, str) and pattern.fullmatch(x) is not None, {}
+
+    regex_validation_fn.__doc__ = "checks whether values fully match the regex {}".format(
+        pattern.pattern
+    )
+    if ignore_missing_vals:
+        regex_validation_fn.__doc__ += ", ignoring nulls"
+    regex_validation_fn.vectorized = lambda column: regex_mask(column, pattern, ignore_missing_vals)
+
+    return regex_validation_fn
+
+
 def dtype_in_set_validation_factory(datatypes, ignore_missing_vals=False):
     """
     factory for testing if the dtype of a val falls within some allowed set
@@ -860,6 +1069,14 @@ def dtype_in_set_validation_fn(x):
     if ignore_missing_vals:
         dtype_in_set_validation_fn.__doc__ += ", ignoring nulls"
 
+    def vectorized(column):
+        valid = _values_of_type_mask(column, datatypes)
+        if ignore_missing_vals:
+            valid |= column.isnull()
+        return valid
+
+    dtype_in_set_validation_fn.vectorized = vectorized
+
     return dtype_in_set_validation_fn
 
 
@@ -0,0 +1,80 @@
+"""Benchmarks validating a large dataframe with a MultiColumnConstraintWithMetadata built from the
+validator factories, with the vectorized validators against validating one value at a time.
+
+Run with:
+
+    python -m dagster_pandas_tests.benchmarks.constraints_benchmark [--rows N]
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+from dagster_pandas.constraints import (
+    ColumnWithMetadataException,
+    MultiColumnConstraintWithMetadata,
+    categorical_column_validator_factory,
+    column_range_validation_factory,
+    column_regex_validation_factory,
+    non_null_validation,
+)
+from pandas import DataFrame
+
+from dagster import ExperimentalWarning
+
+
+def _per_value(validation_fn):
+    # a copy of the validation function without its vectorized form
+    def per_value_fn(x):
+        return validation_fn(x)
+
+    per_value_fn.__name__ = validation_fn.__name__
+    per_value_fn.__doc__ = validation_fn.__doc__
+    return per_value_fn
+
+
+def _validator(fn_and_columns_dict):
+    return MultiColumnConstraintWithMetadata(
+        "benchmark",
+        fn_and_columns_dict,
+        ColumnWithMetadataException,
+        raise_or_typecheck=False,
+    )
+
+
+def benchmark(rows):
+    rng = np.random.default_rng(0)
+    dataframe = DataFrame(
+        {
+            "amount": rng.integers(0, 1000, rows),
+            "category": rng.choice(["a", "b", "c", "d"], rows),
+            "code": rng.choice(["ab12", "cd34", "ef5"], rows),
+        }
+    )
+    fn_and_columns_dict = {
+        "amount": [column_range_validation_factory(0, 990), non_null_validation],
+        "category": [categorical_column_validator_factory(["a", "b", "c"])],
+        "code": [column_regex_validation_factory(r"[a-z]{2}\d{2}")],
+    }
+
+    vectorized = _validator(fn_and_columns_dict)
+    per_value = _validator(
+        {column: [_per_value(fn) for fn in fns] for column, fns in fn_and_columns_dict.items()}
+    )
+
+    print(f"MultiColumnConstraintWithMetadata.validate, {rows} rows")  # pylint: disable=print-call
+    for name, validator in [("per value", per_value), ("vectorized", vectorized)]:
+        start = time.perf_counter()
+        result = validator.validate(dataframe)
+        elapsed = time.perf_counter() - start
+        assert not result.success
+        print(f"  {name:<12}{elapsed * 1e3:10.0f}ms")  # pylint: disable=print-call
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", category=ExperimentalWarning)
+    benchmark(args.rows)
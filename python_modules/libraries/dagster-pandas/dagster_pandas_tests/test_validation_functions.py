@@ -1,12 +1,18 @@
+from datetime import datetime
+
+import pytest
 from dagster_pandas.constraints import (
     all_unique_validator,
     categorical_column_validator_factory,
     column_range_validation_factory,
+    column_regex_validation_factory,
     dtype_in_set_validation_factory,
     non_null_validation,
     nonnull,
+    unique_mask,
 )
 from numpy import nan as NaN
+from pandas import Series
 
 
 def test_unique():
@@ -52,3 +58,52 @@ def test_categorical():
     assert testfunc("b")[0]
     assert testfunc(NaN)[0]
     assert not testfunc("c")[0]
+
+
+def test_regex():
+    testfunc = column_regex_validation_factory(r"[a-z]+", ignore_missing_vals=True)
+    assert testfunc("abc")[0]
+    assert testfunc(NaN)[0]
+    assert not testfunc("abc1")[0]
+    assert not testfunc(1)[0]
+
+
+VALIDATION_FNS = [
+    non_null_validation,
+    column_range_validation_factory(minim=0, maxim=10),
+    column_range_validation_factory(minim=0.5, ignore_missing_vals=True),
+    column_range_validation_factory(minim=datetime(2020, 1, 1)),
+    column_range_validation_factory(maxim=datetime(2020, 1, 1), ignore_missing_vals=True),
+    categorical_column_validator_factory([1, 2, "a"]),
+    categorical_column_validator_factory(["a", "b"], ignore_missing_vals=True),
+    dtype_in_set_validation_factory((int, float)),
+    dtype_in_set_validation_factory(str, ignore_missing_vals=True),
+    nonnull(dtype_in_set_validation_factory((int, float))),
+    nonnull(column_range_validation_factory(minim=2, ignore_missing_vals=True)),
+    column_regex_validation_factory(r"[a-z]+"),
+    column_regex_validation_factory(r"a.", ignore_missing_vals=True),
+]
+
+COLUMNS = [
+    Series([1, 2, 3, 20, -1]),
+    Series([0.5, NaN, 2.5, 11.0]),
+    Series([True, False]),
+    Series(["a", "ab", None, "1", "c"]),
+    Series([1, "a", 2.5, None, 7]),
+    Series([datetime(2019, 1, 1), datetime(2021, 1, 1), None]),
+    Series([], dtype="float64"),
+    Series([None, NaN], dtype=object),
+]
+
+
+@pytest.mark.parametrize("validation_fn", VALIDATION_FNS)
+@pytest.mark.parametrize("column", COLUMNS)
+def test_vectorized_validation_matches_values(validation_fn, column):
+    expected = [bool(validation_fn(value)[0]) for value in column.astype(object)]
+    assert validation_fn.vectorized(column).tolist() == expected
+
+
+def test_vectorized_unique():
+    column = Series([0, 1, NaN, 1, NaN])
+    assert unique_mask(column).tolist() == [True, True, True, False, False]
+    assert unique_mask(column, ignore_missing_vals=True).tolist() == [True, True, True, False, True]
@@ -12,6 +12,12 @@
 )
 from dagster.core.storage.event_log.base import EventLogCursor
 from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster.core.storage.event_log.schema import StepStatsTable
+from dagster.core.storage.event_log.sql_event_log import (
+    group_events_by_run_id,
+    is_asset_index_event,
+    is_step_stats_event,
+)
 from dagster.core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -151,67 +157,96 @@ def store_event(self, event):
                 """NOTIFY {channel}, %s; """.format(channel=CHANNEL_NAME),
                 (res[0] + "_" + str(res[1]),),
             )
+            if is_step_stats_event(event) and self._should_write_step_stats():
+                self._cache_step_stats_rows(self._update_step_stats(conn, event.run_id, [event]))
 
-        if (
-            event.is_dagster_event
-            and (
-                event.dagster_event.is_step_materialization
-                or event.dagster_event.is_asset_observation
-                or event.dagster_event.is_asset_materialization_planned
-            )
-            and event.dagster_event.asset_key
-        ):
+        if is_asset_index_event(event):
             self.store_asset_event(event)
 
-    def store_asset_event(self, event):
-        check.inst_param(event, "event", EventLogEntry)
-        if not event.is_dagster_event or not event.dagster_event.asset_key:
+    def store_events(self, events):
+        """Store a batch of events with a single multi-row insert, writing their step stats and
+        asset key index rows in the same transaction, and notifying watchers of each inserted event
+        in one round trip.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
             return
 
-        # We switched to storing the entire event record of the last materialization instead of just
-        # the AssetMaterialization object, so that we have access to metadata like timestamp,
-        # pipeline, run_id, etc.
-        #
-        # This should make certain asset queries way more performant, without having to do extra
-        # queries against the event log.
-        #
-        # This should be accompanied by a schema change in 0.12.0, renaming `last_materialization`
-        # to `last_materialization_event`, for clarity.  For now, we should do some back-compat.
-        #
-        # https://github.com/dagster-io/dagster/issues/3945
-
-        # The AssetKeyTable contains a `last_materialization_timestamp` column that is exclusively
-        # used to determine if an asset exists (last materialization timestamp > wipe timestamp).
-        # This column is used nowhere else, and as of AssetObservation/AssetMaterializationPlanned
-        # event creation, we want to extend this functionality to ensure that assets with any event
-        # (observation, materialization, or materialization planned) yielded with timestamp
-        # > wipe timestamp display in Dagit.
-
-        # As of the following PRs, we update last_materialization_timestamp to store the timestamp
-        # of the latest asset observation, materialization, or materialization_planned that has occurred.
-        # https://github.com/dagster-io/dagster/pull/6885
-        # https://github.com/dagster-io/dagster/pull/7319
-
-        # The AssetKeyTable also contains a `last_run_id` column that is updated upon asset
-        # materialization. This column was not being used until the below PR. This new change
-        # writes to the column upon `ASSET_MATERIALIZATION_PLANNED` events to fetch the last
-        # run id for a set of assets in one roundtrip call to event log storage.
-        # https://github.com/dagster-io/dagster/pull/7319
-
-        values = self._get_asset_entry_values(event, self.has_secondary_index(ASSET_KEY_INDEX_COLS))
-        with self.index_connection() as conn:
-            query = db.dialects.postgresql.insert(AssetKeyTable).values(
-                asset_key=event.dagster_event.asset_key.to_string(),
-                **values,
-            )
-            if values:
-                query = query.on_conflict_do_update(
-                    index_elements=[AssetKeyTable.c.asset_key],
-                    set_=dict(**values),
+        write_step_stats = (
+            self._should_write_step_stats()
+            if any(is_step_stats_event(event) for event in events)
+            else False
+        )
+        asset_events = [event for event in events if is_asset_index_event(event)]
+        write_asset_key_index_cols = (
+            self._should_write_asset_key_index_cols() if asset_events else False
+        )
+
+        step_stats_rows = {}
+        with self._connect() as conn:
+            conn = self._transaction_connection(conn)
+            with conn.begin():
+                result = conn.execute(
+                    SqlEventLogStorageTable.insert()  # pylint: disable=no-value-for-parameter
+                    .values([self._get_event_insert_values(event) for event in events])
+                    .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+                )
+                rows = result.fetchall()
+                result.close()
+                if write_step_stats:
+                    for run_id, run_events in group_events_by_run_id(events).items():
+                        step_stats_rows.update(self._update_step_stats(conn, run_id, run_events))
+                for event in asset_events:
+                    self._update_asset_entry(
+                        conn, event, self._get_asset_entry_values(event, write_asset_key_index_cols)
+                    )
+                # notifications issued in a transaction are only delivered once it commits, so
+                # watchers never see events whose step stats or asset index rows are missing
+                conn.execute(
+                    " ".join(["NOTIFY {channel}, %s;".format(channel=CHANNEL_NAME)] * len(rows)),
+                    tuple(run_id + "_" + str(event_id) for run_id, event_id in rows),
                 )
-            else:
-                query = query.on_conflict_do_nothing()
-            conn.execute(query)
+        self._cache_step_stats_rows(step_stats_rows)
+
+    def _transaction_connection(self, conn):
+        # the engine autocommits each statement, so opt this connection into a transaction
+        return conn.execution_options(isolation_level="READ COMMITTED")
+
+    def _should_write_asset_key_index_cols(self):
+        return self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+
+    def _update_asset_entry(self, conn, event, values):
+        # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
+        # See SqlEventLogStorage.store_asset_event method for more details
+        query = db.dialects.postgresql.insert(AssetKeyTable).values(
+            asset_key=event.dagster_event.asset_key.to_string(),
+            **values,
+        )
+        if values:
+            query = query.on_conflict_do_update(
+                index_elements=[AssetKeyTable.c.asset_key],
+                set_=dict(**values),
+            )
+        else:
+            query = query.on_conflict_do_nothing()
+        conn.execute(query)
+
+    def _insert_step_stats_row(self, conn, run_id, step_key, stats_body):
+        # a failed insert would abort the enclosing transaction, so skip conflicting rows instead
+        result = conn.execute(
+            db.dialects.postgresql.insert(StepStatsTable)
+            .values(run_id=run_id, step_key=step_key, stats_body=stats_body, version=0)
+            .on_conflict_do_nothing(
+                index_elements=[StepStatsTable.c.run_id, StepStatsTable.c.step_key]
+            )
+            .returning(StepStatsTable.c.id)
+        )
+        row = result.fetchone()
+        result.close()
+        return row[0] if row else None
 
     def _connect(self):
         return create_pg_connection(self._engine, pg_alembic_config(__file__), "event log")
@@ -223,10 +258,12 @@ def index_connection(self):
         return self._connect()
 
     def has_secondary_index(self, name):
+        # only applied migrations are cached, so that a migration applied by another process (e.g.
+        # `dagster instance reindex`) is picked up without restarting this one
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                PostgresEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(PostgresEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):
@@ -129,6 +129,10 @@ def upgrade(self):
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
 
+    def _transaction_connection(self, conn):
+        # the engine autocommits each statement, so opt this connection into a transaction
+        return conn.execution_options(isolation_level="READ COMMITTED")
+
     def has_built_index(self, migration_name):
         if migration_name not in self._index_migration_cache:
             self._index_migration_cache[migration_name] = super(
@@ -163,6 +167,13 @@ def add_daemon_heartbeat(self, daemon_heartbeat):
                 )
             )
 
+    def _tag_value_as_integer(self, value):
+        # casting a value that is not an integer fails the whole query in postgres, so only cast
+        # values that look like integers that fit in a bigint
+        return db.case(
+            [(value.op("~")(r"^-?[0-9]{1,18}$"), db.cast(value, db.BigInteger))], else_=0
+        )
+
     def alembic_version(self):
         alembic_config = pg_alembic_config(__file__)
         with self.connect() as conn: